@@ -0,0 +1,232 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A local SQLite store of benchmark results, for spotting regressions by
+comparing a run with the runs before it.
+"""
+
+import math
+import os
+import sqlite3
+import statistics
+import time
+from types import TracebackType
+
+from typing_extensions import Self
+
+#: Where the history is kept unless told otherwise
+DEFAULT_HISTORY = os.path.join(
+    os.path.expanduser("~"), ".cache", "spinnaker_graph_front_end",
+    "benchmarks.sqlite3")
+
+#: The measure that holds the peak resident set size, in kilobytes
+PEAK_RSS = "peak_rss_kb"
+
+_DDL = """
+    CREATE TABLE IF NOT EXISTS benchmark_run(
+        run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp FLOAT NOT NULL,
+        description TEXT);
+    CREATE TABLE IF NOT EXISTS benchmark_result(
+        run_id INTEGER NOT NULL REFERENCES benchmark_run(run_id),
+        graph TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        measure TEXT NOT NULL,
+        value FLOAT NOT NULL,
+        PRIMARY KEY (run_id, graph, size, measure));
+    """
+
+
+class Regression(object):
+    """
+    A measure that got worse than it was in earlier runs.
+    """
+
+    __slots__ = ("_graph", "_measure", "_previous", "_size", "_value")
+
+    def __init__(self, graph: str, size: int, measure: str, value: float,
+                 previous: float):
+        """
+        :param graph: The graph benchmarked
+        :param size: The size of the graph
+        :param measure: What was measured
+        :param value: The value in the run being checked
+        :param previous: The median value of the earlier runs
+        """
+        self._graph = graph
+        self._size = size
+        self._measure = measure
+        self._value = value
+        self._previous = previous
+
+    @property
+    def graph(self) -> str:
+        """
+        The graph benchmarked.
+        """
+        return self._graph
+
+    @property
+    def size(self) -> int:
+        """
+        The size of the graph.
+        """
+        return self._size
+
+    @property
+    def measure(self) -> str:
+        """
+        What was measured.
+        """
+        return self._measure
+
+    @property
+    def value(self) -> float:
+        """
+        The value in the run being checked.
+        """
+        return self._value
+
+    @property
+    def previous(self) -> float:
+        """
+        The median value of the earlier runs.
+        """
+        return self._previous
+
+    @property
+    def ratio(self) -> float:
+        """
+        How many times the earlier value the value now is.
+        """
+        return self._value / self._previous if self._previous else math.inf
+
+    def __str__(self) -> str:
+        return (f"{self._graph} at {self._size}: {self._measure} "
+                f"{self._value:.1f} was {self._previous:.1f} "
+                f"({self.ratio:.2f}x)")
+
+
+class BenchmarkHistory(object):
+    """
+    The results of earlier benchmark runs, kept in an SQLite database.
+
+    Each result is a named measure, such as the wall time of an algorithm
+    in milliseconds or the peak RSS, of a graph at a size in a run.
+    """
+
+    __slots__ = ("_db", )
+
+    def __init__(self, path: str = DEFAULT_HISTORY):
+        """
+        :param path: The database file; made if needed
+        """
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path)
+        self._db.executescript(_DDL)
+
+    def start_run(self, description: str | None = None) -> int:
+        """
+        Start recording a run of the benchmarks.
+
+        :param description: What is being benchmarked, such as a commit
+        :return: The ID of the run
+        """
+        with self._db:
+            cursor = self._db.execute(
+                "INSERT INTO benchmark_run(timestamp, description) "
+                "VALUES(?, ?)", (time.time(), description))
+        assert cursor.lastrowid is not None
+        return cursor.lastrowid
+
+    def add_results(self, run_id: int, graph: str, size: int,
+                    measures: dict[str, float]) -> None:
+        """
+        Record the measures of a graph at a size.
+
+        :param run_id: The run, from :py:meth:`start_run`
+        :param graph: The graph benchmarked
+        :param size: The size of the graph
+        :param measures: The value of each measure, by name
+        """
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO benchmark_result("
+                "run_id, graph, size, measure, value) VALUES(?, ?, ?, ?, ?)",
+                [(run_id, graph, size, measure, value)
+                 for measure, value in measures.items()])
+
+    def get_results(self, run_id: int) -> dict[tuple[str, int, str], float]:
+        """
+        Get the results of a run.
+
+        :param run_id: The run
+        :return: The value of each measure, by graph, size and measure
+        """
+        return {(graph, size, measure): value
+                for graph, size, measure, value in self._db.execute(
+                    "SELECT graph, size, measure, value "
+                    "FROM benchmark_result WHERE run_id = ?", (run_id, ))}
+
+    def compare(self, run_id: int, n_previous: int = 5,
+                threshold: float = 1.25, min_difference: float = 50.0
+                ) -> list[Regression]:
+        """
+        Find the measures of a run that are worse than in the runs before
+        it.
+
+        Each measure is compared with the median of its value in up to
+        `n_previous` earlier runs that measured it.
+
+        :param run_id: The run to check
+        :param n_previous: How many earlier runs to compare with
+        :param threshold:
+            How many times the earlier value a measure must be to count
+        :param min_difference:
+            How much bigger than the earlier value a measure must be to
+            count, to ignore noise in small values
+        :return: The measures that got worse, worst first
+        """
+        regressions: list[Regression] = []
+        for (graph, size, measure), value in self.get_results(
+                run_id).items():
+            previous = [row[0] for row in self._db.execute(
+                "SELECT value FROM benchmark_result "
+                "WHERE graph = ? AND size = ? AND measure = ? "
+                "AND run_id < ? ORDER BY run_id DESC LIMIT ?",
+                (graph, size, measure, run_id, n_previous))]
+            if not previous:
+                continue
+            median = statistics.median(previous)
+            if (value > median * threshold and
+                    value - median > min_difference):
+                regressions.append(
+                    Regression(graph, size, measure, value, median))
+        regressions.sort(key=lambda regression: -regression.ratio)
+        return regressions
+
+    def close(self) -> None:
+        """
+        Close the database.
+        """
+        self._db.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: type | None, exc_val: Exception | None,
+                 exc_tb: TracebackType | None) -> None:
+        self.close()
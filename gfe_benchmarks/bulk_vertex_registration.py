@@ -0,0 +1,104 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compares adding machine vertices one at a time with adding them in bulk,
+and shows that adding a batch does not slow down as the graph grows.
+
+Only graph construction is timed; nothing is mapped or run, so this works
+on a virtual board.
+"""
+
+import time
+
+from pacman.model.graphs.machine import SimpleMachineVertex
+from pacman.model.resources import ConstantSDRAM
+
+import spinnaker_graph_front_end as front_end
+
+#: The numbers of vertices to compare at
+SIZES = (10_000, 100_000, 1_000_000)
+
+#: The number of vertices in each batch when adding in batches
+BATCH_SIZE = 1_000
+
+
+def _make_vertices(n_vertices: int) -> list[SimpleMachineVertex]:
+    return [SimpleMachineVertex(ConstantSDRAM(0), label=f"v{index}")
+            for index in range(n_vertices)]
+
+
+def time_per_vertex(n_vertices: int) -> float:
+    """
+    Time adding vertices with one call per vertex.
+
+    :param n_vertices: How many vertices to add
+    :return: The time taken, in seconds
+    """
+    vertices = _make_vertices(n_vertices)
+    front_end.setup()
+    start = time.perf_counter()
+    for vertex in vertices:
+        front_end.add_machine_vertex_instance(vertex)
+    elapsed = time.perf_counter() - start
+    front_end.stop()
+    return elapsed
+
+
+def time_bulk(n_vertices: int) -> float:
+    """
+    Time adding vertices with a single bulk call.
+
+    :param n_vertices: How many vertices to add
+    :return: The time taken, in seconds
+    """
+    vertices = _make_vertices(n_vertices)
+    front_end.setup()
+    start = time.perf_counter()
+    front_end.add_machine_vertex_instances(vertices)
+    elapsed = time.perf_counter() - start
+    front_end.stop()
+    return elapsed
+
+
+def time_batches(n_vertices: int, batch_size: int = BATCH_SIZE) -> list[float]:
+    """
+    Time adding vertices with one bulk call per batch, into a graph that
+    grows by a batch each time.
+
+    :param n_vertices: How many vertices to add
+    :param batch_size: How many vertices to add in each call
+    :return: The time taken by each batch, in seconds, in order
+    """
+    vertices = _make_vertices(n_vertices)
+    front_end.setup()
+    times = []
+    for first in range(0, n_vertices, batch_size):
+        start = time.perf_counter()
+        front_end.add_machine_vertex_instances(
+            vertices[first:first + batch_size])
+        times.append(time.perf_counter() - start)
+    front_end.stop()
+    return times
+
+
+if __name__ == "__main__":
+    for size in SIZES:
+        loop_time = time_per_vertex(size)
+        bulk_time = time_bulk(size)
+        print(f"{size:>9} vertices: per vertex {loop_time:.3f}s, "
+              f"bulk {bulk_time:.3f}s, ratio {loop_time / bulk_time:.2f}")
+        batch_times = time_batches(size)
+        print(f"{size:>9} vertices in batches of {BATCH_SIZE}: first batch"
+              f" {batch_times[0]:.4f}s, last batch {batch_times[-1]:.4f}s")
@@ -0,0 +1,173 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compares the peak RSS of holding machine edges in a compact edge store with
+that of holding one labelled edge object per edge.
+
+Each way is measured in a process of its own, so that its peak RSS is its
+own; what is reported is how much the peak grew while the edges were made.
+The ``store`` and ``objects`` ways only build the edges, so they work
+anywhere; the ``*_graph`` ways also add them to the graph of a virtual
+board, where the graph keeps one edge object per edge whichever way they
+were built.
+
+With a million edges between a thousand vertices, the ``store`` peak grows
+by about 25 bytes per edge, of which the store keeps 8, and the
+``objects`` peak by about 200.
+Once in the graph, the edges of either way cost over 250 bytes each, and
+those from the store only save the space of their labels, so the saving is
+in holding and working out the edges before they are added, not in the
+peak RSS of mapping them.
+
+Run from this directory so that its configuration is used::
+
+    python compact_edge_memory.py --edges 1000000
+"""
+
+import argparse
+import multiprocessing
+import resource
+import sys
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy
+
+from pacman.model.graphs.machine import MachineEdge, SimpleMachineVertex
+from pacman.model.resources import ConstantSDRAM
+
+import spinnaker_graph_front_end as front_end
+from spinnaker_graph_front_end.utilities import CompactEdgeStore
+
+#: The numbers of edges to compare at
+SIZES = (100_000, 1_000_000)
+
+#: The number of vertices the edges join
+N_VERTICES = 1000
+
+
+def _peak_rss_kb() -> int:
+    # Kilobytes on Linux, but bytes on macOS
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak_rss //= 1024
+    return peak_rss
+
+
+def _indices(n_edges: int) -> tuple[numpy.ndarray, numpy.ndarray]:
+    rng = numpy.random.default_rng(0)
+    return (rng.integers(N_VERTICES, size=n_edges),
+            rng.integers(N_VERTICES, size=n_edges))
+
+
+def _vertices() -> list[SimpleMachineVertex]:
+    return [SimpleMachineVertex(ConstantSDRAM(0), label=f"v{index}")
+            for index in range(N_VERTICES)]
+
+
+def _edges(vertices: list[SimpleMachineVertex], pre: numpy.ndarray,
+           post: numpy.ndarray) -> Iterator[MachineEdge]:
+    for index, (p, q) in enumerate(zip(pre.tolist(), post.tolist())):
+        yield MachineEdge(vertices[p], vertices[q], label=f"edge{index}")
+
+
+def _store(n_edges: int) -> tuple[int, object]:
+    store = CompactEdgeStore()
+    store.add_vertices(_vertices())
+    pre, post = _indices(n_edges)
+    start = _peak_rss_kb()
+    store.add_edges("STATE", pre, post)
+    return _peak_rss_kb() - start, store
+
+
+def _objects(n_edges: int) -> tuple[int, object]:
+    vertices = _vertices()
+    pre, post = _indices(n_edges)
+    start = _peak_rss_kb()
+    edges = list(_edges(vertices, pre, post))
+    return _peak_rss_kb() - start, edges
+
+
+def _store_graph(n_edges: int) -> tuple[int, object]:
+    front_end.setup()
+    store = CompactEdgeStore()
+    store.add_vertices(_vertices())
+    front_end.add_machine_vertex_instances(store.vertices)
+    pre, post = _indices(n_edges)
+    start = _peak_rss_kb()
+    store.add_edges("STATE", pre, post)
+    front_end.add_compact_edges(store)
+    grown = _peak_rss_kb() - start
+    front_end.stop()
+    return grown, None
+
+
+def _objects_graph(n_edges: int) -> tuple[int, object]:
+    front_end.setup()
+    vertices = _vertices()
+    front_end.add_machine_vertex_instances(vertices)
+    pre, post = _indices(n_edges)
+    start = _peak_rss_kb()
+    for edge in _edges(vertices, pre, post):
+        front_end.add_machine_edge_instance(edge, "STATE")
+    grown = _peak_rss_kb() - start
+    front_end.stop()
+    return grown, None
+
+
+#: The ways of holding edges that can be measured, by name
+WAYS: dict[str, Callable[[int], tuple[int, object]]] = {
+    "store": _store,
+    "objects": _objects,
+    "store_graph": _store_graph,
+    "objects_graph": _objects_graph,
+}
+
+
+def measure(way: str, n_edges: int) -> int:
+    """
+    Measure how much the peak RSS grows while edges are made one way.
+    The peak RSS is of the whole process, so call this in a fresh process.
+
+    :param way: The name of the way, from :py:data:`WAYS`
+    :param n_edges: The number of edges to make
+    :return: The growth of the peak RSS, in kilobytes
+    """
+    # What was made is only let go of once it has been measured
+    grown, _made = WAYS[way](n_edges)
+    return grown
+
+
+def main() -> None:
+    """
+    Measure the ways named on the command line at each size.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--ways", nargs="+", choices=sorted(WAYS),
+                        default=list(WAYS))
+    parser.add_argument("--edges", nargs="+", type=int, default=SIZES)
+    args = parser.parse_args()
+    context = multiprocessing.get_context("spawn")
+    for n_edges in args.edges:
+        for way in args.ways:
+            with ProcessPoolExecutor(1, mp_context=context) as executor:
+                grown = executor.submit(measure, way, n_edges).result()
+            print(f"{way:>14} {n_edges:>9} edges: peak RSS grew "
+                  f"{grown / 1024:.1f}MB, {grown * 1024 / n_edges:.1f} "
+                  "bytes per edge")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Times how mapping and data specification generation scale with the size of
+the graph, for each of the graphs in
+:py:data:`~gfe_benchmarks.scaling_graphs.GRAPHS`.
+
+Each graph is built and run at each size on a virtual board, in a process
+of its own so that its peak RSS is its own.
+The wall time of each algorithm of the mapping and loading stages is read
+from the phase timings of the run.
+The results are added to a local history, and any measure that is worse
+than in the runs before is reported.
+
+Run from this directory so that its configuration is used::
+
+    python mapping_scaling.py --sizes 100 1000 --description "my change"
+"""
+
+import argparse
+import multiprocessing
+import resource
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from spinn_front_end_common.interface.provenance import TimerCategory
+
+import spinnaker_graph_front_end as front_end
+
+from gfe_benchmarks.benchmark_history import (
+    DEFAULT_HISTORY, PEAK_RSS, BenchmarkHistory)
+from gfe_benchmarks.scaling_graphs import GRAPHS
+
+#: The numbers of cores to build each graph at
+SIZES = (100, 400, 1600, 6400)
+
+#: The stages whose algorithms are timed
+STAGES = (TimerCategory.MAPPING.category_name,
+          TimerCategory.LOADING.category_name)
+
+
+def measure_graph(graph: str, size: int) -> dict[str, float]:
+    """
+    Build and run a graph, then measure the time taken by each algorithm
+    of the mapping and loading stages, and the peak RSS.
+
+    The peak RSS is of the whole process, so call this in a fresh process.
+
+    :param graph: The name of the graph, from
+        :py:data:`~gfe_benchmarks.scaling_graphs.GRAPHS`
+    :param size: The number of cores to build it at
+    :return: The time in milliseconds of each algorithm and the total of
+        each stage, by ``stage/algorithm`` and stage, and the peak RSS in
+        kilobytes
+    """
+    front_end.setup()
+    GRAPHS[graph](size)
+    front_end.run(1)
+    measures: dict[str, float] = {}
+    for timing in front_end.phase_timings():
+        if timing.category not in STAGES or timing.skip_reason is not None:
+            continue
+        name = f"{timing.category}/{timing.algorithm}"
+        measures[name] = measures.get(name, 0.0) + timing.wall_time_ms
+        measures[timing.category] = (
+            measures.get(timing.category, 0.0) + timing.wall_time_ms)
+    front_end.stop()
+    # Kilobytes on Linux, but bytes on macOS
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak_rss //= 1024
+    measures[PEAK_RSS] = peak_rss
+    return measures
+
+
+def run_benchmarks(
+        graphs: list[str], sizes: list[int], history: BenchmarkHistory,
+        description: str | None = None) -> int:
+    """
+    Measure each graph at each size, each in a new process, and add the
+    results to the history.
+
+    :param graphs: The names of the graphs to measure
+    :param sizes: The numbers of cores to build each graph at
+    :param history: Where to keep the results
+    :param description: What is being benchmarked, such as a commit
+    :return: The ID of the run in the history
+    """
+    run_id = history.start_run(description)
+    context = multiprocessing.get_context("spawn")
+    for graph in graphs:
+        for size in sizes:
+            with ProcessPoolExecutor(1, mp_context=context) as executor:
+                measures = executor.submit(measure_graph, graph, size).result()
+            history.add_results(run_id, graph, size, measures)
+            stages = ", ".join(f"{stage} {measures.get(stage, 0.0):.0f}ms"
+                               for stage in STAGES)
+            print(f"{graph:>16} {size:>6} cores: {stages}, "
+                  f"peak RSS {measures[PEAK_RSS] / 1024:.0f}MB")
+    return run_id
+
+
+def main() -> None:
+    """
+    Run the benchmarks named on the command line, and report regressions.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--graphs", nargs="+", choices=sorted(GRAPHS),
+                        default=list(GRAPHS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=SIZES)
+    parser.add_argument("--history", default=DEFAULT_HISTORY)
+    parser.add_argument("--description")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="ratio to earlier runs that counts as worse")
+    args = parser.parse_args()
+
+    with BenchmarkHistory(args.history) as history:
+        run_id = run_benchmarks(
+            args.graphs, args.sizes, history, args.description)
+        regressions = history.compare(run_id, threshold=args.threshold)
+    for regression in regressions:
+        print(f"Regression: {regression}")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,393 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Parameterised graphs for the scaling benchmarks, each built at a given
+number of cores.
+
+The vertices write a small data specification but are never loaded, so the
+graphs can be mapped on a virtual board.
+"""
+
+import math
+from collections.abc import Callable, Iterable
+from enum import IntEnum
+
+import numpy
+
+from spinn_utilities.overrides import overrides
+
+from spinn_machine.tags import IPTag, ReverseIPTag
+
+from pacman.model.graphs import AbstractSupportsSDRAMEdges
+from pacman.model.graphs.application import ApplicationEdge, ApplicationVertex
+from pacman.model.graphs.common import Slice
+from pacman.model.graphs.machine import (
+    AbstractSDRAMPartition, ConstantSDRAMMachinePartition, MachineVertex,
+    SDRAMMachineEdge)
+from pacman.model.partitioner_splitters import AbstractSplitterCommon
+from pacman.model.placements import Placement
+from pacman.model.resources import AbstractSDRAM, ConstantSDRAM
+from pacman.utilities.utility_objs import ChipCounter
+
+from spinn_front_end_common.abstract_models.impl import (
+    MachineDataSpecableVertex,
+)
+from spinn_front_end_common.data import FecDataView
+from spinn_front_end_common.interface.ds import DataSpecificationGenerator
+from spinn_front_end_common.utilities.constants import (
+    BYTES_PER_WORD, SYSTEM_BYTES_REQUIREMENT)
+
+import spinnaker_graph_front_end as front_end
+from spinnaker_graph_front_end.utilities import SimulatorVertex
+
+#: The partition of the multicast edges of every graph
+PARTITION_ID = "benchmark"
+
+#: The number of parameter words each vertex writes
+PARAMETER_WORDS = 64
+
+#: The number of stages in each SDRAM pipeline; all on one chip
+PIPELINE_STAGES = 8
+
+#: The number of bytes each stage of a pipeline passes on
+PIPELINE_SDRAM = 1024
+
+#: The number of random targets of each vertex of a sparse graph
+SPARSE_FAN_OUT = 10
+
+
+class BenchmarkRegions(IntEnum):
+    """
+    The regions written by a :py:class:`BenchmarkVertex`.
+    """
+    #: The simulation interface
+    SYSTEM = 0
+    #: The routing key, then the parameters
+    PARAMETERS = 1
+    #: The SDRAM each stage of a pipeline reads from
+    SDRAM_IN = 2
+    #: The SDRAM each stage of a pipeline writes to
+    SDRAM_OUT = 3
+
+
+class BenchmarkVertex(SimulatorVertex, MachineDataSpecableVertex):
+    """
+    A core that writes its routing key and some parameters.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, label: str | None = None,
+                 vertex_slice: Slice | None = None) -> None:
+        """
+        :param label: The label of the vertex
+        :param vertex_slice: The atoms of the application vertex on the core
+        """
+        super().__init__(label, "benchmark.aplx", vertex_slice)
+
+    @property
+    @overrides(MachineVertex.sdram_required)
+    def sdram_required(self) -> AbstractSDRAM:
+        return ConstantSDRAM(
+            SYSTEM_BYTES_REQUIREMENT + (PARAMETER_WORDS + 1) * BYTES_PER_WORD)
+
+    def generate_parameters_region(
+            self, spec: DataSpecificationGenerator) -> None:
+        """
+        Reserve and write the routing key and parameters.
+
+        :param spec: The data specification being built
+        """
+        spec.reserve_memory_region(
+            region=BenchmarkRegions.PARAMETERS,
+            size=(PARAMETER_WORDS + 1) * BYTES_PER_WORD, label="parameters")
+        spec.switch_write_focus(BenchmarkRegions.PARAMETERS)
+        key = FecDataView.get_routing_infos().get_single_key_from(self)
+        spec.write_value(0xFFFFFFFF if key is None else key)
+        spec.write_array(numpy.arange(PARAMETER_WORDS, dtype="uint32"))
+
+    @overrides(MachineDataSpecableVertex.generate_machine_data_specification)
+    def generate_machine_data_specification(
+            self, spec: DataSpecificationGenerator, placement: Placement,
+            iptags: Iterable[IPTag] | None,
+            reverse_iptags: Iterable[ReverseIPTag] | None) -> None:
+        # pylint: disable=arguments-differ
+        self.generate_system_region(spec, BenchmarkRegions.SYSTEM)
+        self.generate_parameters_region(spec)
+        spec.end_specification()
+
+
+class PipelineStageVertex(BenchmarkVertex, AbstractSupportsSDRAMEdges):
+    """
+    A stage of an SDRAM pipeline, which reads from the SDRAM written by the
+    stage before it and writes to SDRAM read by the stage after it.
+    """
+
+    __slots__ = ("_sdram_in", "_sdram_out")
+
+    def __init__(self, label: str, vertex_slice: Slice,
+                 app_vertex: "PipelineVertex") -> None:
+        """
+        :param label: The label of the vertex
+        :param vertex_slice: The stage of the pipeline
+        :param app_vertex: The pipeline
+        """
+        super().__init__(label, vertex_slice)
+        self._app_vertex = app_vertex
+        self._sdram_in: AbstractSDRAMPartition | None = None
+        self._sdram_out: AbstractSDRAMPartition | None = None
+
+    def set_sdram_partitions(
+            self, sdram_in: AbstractSDRAMPartition | None,
+            sdram_out: AbstractSDRAMPartition | None) -> None:
+        """
+        Set the SDRAM the stage reads from and writes to.
+
+        :param sdram_in: What the stage reads, or `None` if it is first
+        :param sdram_out: What the stage writes, or `None` if it is last
+        """
+        self._sdram_in = sdram_in
+        self._sdram_out = sdram_out
+
+    @property
+    @overrides(MachineVertex.sdram_required)
+    def sdram_required(self) -> AbstractSDRAM:
+        sdram = super().sdram_required + ConstantSDRAM(
+            4 * BYTES_PER_WORD)
+        if self._sdram_out is not None:
+            sdram += ConstantSDRAM(self._sdram_out.total_sdram_requirements())
+        return sdram
+
+    @overrides(AbstractSupportsSDRAMEdges.sdram_requirement)
+    def sdram_requirement(self, sdram_machine_edge: SDRAMMachineEdge) -> int:
+        return PIPELINE_SDRAM
+
+    def _write_sdram_region(
+            self, spec: DataSpecificationGenerator, region: BenchmarkRegions,
+            partition: AbstractSDRAMPartition | None) -> None:
+        spec.reserve_memory_region(
+            region=region, size=2 * BYTES_PER_WORD, label=region.name)
+        spec.switch_write_focus(region)
+        if partition is None:
+            spec.write_array([0, 0])
+        else:
+            spec.write_value(partition.get_sdram_base_address_for(self))
+            spec.write_value(partition.get_sdram_size_of_region_for(self))
+
+    @overrides(MachineDataSpecableVertex.generate_machine_data_specification)
+    def generate_machine_data_specification(
+            self, spec: DataSpecificationGenerator, placement: Placement,
+            iptags: Iterable[IPTag] | None,
+            reverse_iptags: Iterable[ReverseIPTag] | None) -> None:
+        # pylint: disable=arguments-differ
+        self.generate_system_region(spec, BenchmarkRegions.SYSTEM)
+        self.generate_parameters_region(spec)
+        self._write_sdram_region(
+            spec, BenchmarkRegions.SDRAM_IN, self._sdram_in)
+        self._write_sdram_region(
+            spec, BenchmarkRegions.SDRAM_OUT, self._sdram_out)
+        spec.end_specification()
+
+
+class PipelineVertex(ApplicationVertex[PipelineStageVertex]):
+    """
+    A pipeline of cores on one chip, each passing data to the next through
+    SDRAM; split by :py:class:`PipelineSplitter`.
+    """
+
+    __slots__ = ("_n_stages", )
+
+    def __init__(self, n_stages: int = PIPELINE_STAGES,
+                 label: str | None = None) -> None:
+        """
+        :param n_stages: The number of stages, each on a core
+        :param label: The label of the vertex
+        """
+        self._n_stages = n_stages
+        super().__init__(label, splitter=PipelineSplitter())
+
+    @property
+    @overrides(ApplicationVertex.n_atoms)
+    def n_atoms(self) -> int:
+        return self._n_stages
+
+
+class PipelineSplitter(AbstractSplitterCommon[PipelineVertex]):
+    """
+    Makes a core for each stage of a pipeline, joined by SDRAM edges.
+    """
+
+    __slots__ = ("_partitions", "_stages")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._stages: list[PipelineStageVertex] = []
+        self._partitions: list[ConstantSDRAMMachinePartition] = []
+
+    @overrides(AbstractSplitterCommon.create_machine_vertices)
+    def create_machine_vertices(self, chip_counter: ChipCounter) -> None:
+        pipeline = self.governed_app_vertex
+        for stage in range(pipeline.n_atoms):
+            vertex = PipelineStageVertex(
+                f"{pipeline.label}:{stage}", Slice(stage, stage), pipeline)
+            self._stages.append(vertex)
+            pipeline.remember_machine_vertex(vertex)
+        for pre, post in zip(self._stages, self._stages[1:]):
+            partition: ConstantSDRAMMachinePartition = (
+                ConstantSDRAMMachinePartition("sdram", pre))
+            partition.add_edge(SDRAMMachineEdge(
+                pre, post, f"{pre.label}->{post.label}"))
+            self._partitions.append(partition)
+        ends: list[ConstantSDRAMMachinePartition | None] = [None]
+        ends.extend(self._partitions)
+        ends.append(None)
+        for vertex, sdram_in, sdram_out in zip(self._stages, ends, ends[1:]):
+            vertex.set_sdram_partitions(sdram_in, sdram_out)
+        # All the stages must fit on one chip together
+        chip_counter.add_core(sum(
+            (vertex.sdram_required for vertex in self._stages[1:]),
+            self._stages[0].sdram_required))
+
+    @overrides(AbstractSplitterCommon.get_in_coming_slices)
+    def get_in_coming_slices(self) -> list[Slice]:
+        return [self._stages[0].vertex_slice]
+
+    @overrides(AbstractSplitterCommon.get_out_going_slices)
+    def get_out_going_slices(self) -> list[Slice]:
+        return [self._stages[-1].vertex_slice]
+
+    @overrides(AbstractSplitterCommon.get_in_coming_vertices)
+    def get_in_coming_vertices(
+            self, partition_id: str) -> list[PipelineStageVertex]:
+        return self._stages[:1]
+
+    @overrides(AbstractSplitterCommon.get_out_going_vertices)
+    def get_out_going_vertices(
+            self, partition_id: str) -> list[PipelineStageVertex]:
+        return self._stages[-1:]
+
+    @overrides(AbstractSplitterCommon.machine_vertices_for_recording)
+    def machine_vertices_for_recording(
+            self, variable_to_record: str) -> list[PipelineStageVertex]:
+        return []
+
+    @overrides(AbstractSplitterCommon.get_internal_sdram_partitions)
+    def get_internal_sdram_partitions(
+            self) -> list[ConstantSDRAMMachinePartition]:
+        return self._partitions
+
+    @overrides(AbstractSplitterCommon.reset_called)
+    def reset_called(self) -> None:
+        self._stages = []
+        self._partitions = []
+
+
+def _add_vertices(n_vertices: int) -> list[BenchmarkVertex]:
+    vertices = [BenchmarkVertex(f"v{index}") for index in range(n_vertices)]
+    front_end.add_machine_vertex_instances(vertices)
+    return vertices
+
+
+def build_lattice(n_cores: int) -> int:
+    """
+    Build a square lattice with edges to the 8 cells around each cell,
+    wrapping at the edges.
+
+    :param n_cores: About how many cores to use
+    :return: The number of multicast edges
+    """
+    side = max(math.isqrt(n_cores), 2)
+    lattice = front_end.add_lattice(
+        lambda x, y: BenchmarkVertex(f"v{x},{y}"), (side, side),
+        PARTITION_ID)
+    return len(lattice.pre_indices)
+
+
+def build_random_sparse(n_cores: int, seed: int = 42) -> int:
+    """
+    Build a graph in which each vertex sends to
+    :py:data:`SPARSE_FAN_OUT` other vertices picked at random.
+
+    :param n_cores: How many cores to use
+    :param seed: The seed of the random choice
+    :return: The number of multicast edges
+    """
+    vertices = _add_vertices(n_cores)
+    rng = numpy.random.default_rng(seed)
+    fan_out = min(SPARSE_FAN_OUT, n_cores - 1)
+    pre = numpy.repeat(numpy.arange(n_cores), fan_out)
+    post = (pre + rng.integers(1, n_cores, len(pre))) % n_cores
+    # Each edge only once
+    pairs = numpy.unique(numpy.stack((pre, post), axis=1), axis=0)
+    front_end.add_machine_edges(
+        vertices, pairs[:, 0], pairs[:, 1], PARTITION_ID)
+    return len(pairs)
+
+
+def build_fan_in(n_cores: int) -> int:
+    """
+    Build a star in which every vertex sends to the one in the middle.
+
+    :param n_cores: How many cores to use
+    :return: The number of multicast edges
+    """
+    vertices = _add_vertices(n_cores)
+    leaves = numpy.arange(1, n_cores)
+    front_end.add_machine_edges(
+        vertices, leaves, numpy.zeros_like(leaves), PARTITION_ID)
+    return len(leaves)
+
+
+def build_fan_out(n_cores: int) -> int:
+    """
+    Build a star in which the vertex in the middle sends to every other
+    vertex.
+
+    :param n_cores: How many cores to use
+    :return: The number of multicast edges
+    """
+    vertices = _add_vertices(n_cores)
+    leaves = numpy.arange(1, n_cores)
+    front_end.add_machine_edges(
+        vertices, numpy.zeros_like(leaves), leaves, PARTITION_ID)
+    return len(leaves)
+
+
+def build_sdram_pipelines(n_cores: int) -> int:
+    """
+    Build pipelines of :py:data:`PIPELINE_STAGES` cores joined by SDRAM
+    edges, each pipeline sending to the next by multicast.
+
+    :param n_cores: About how many cores to use
+    :return: The number of multicast edges
+    """
+    pipelines = [PipelineVertex(label=f"p{index}")
+                 for index in range(max(n_cores // PIPELINE_STAGES, 1))]
+    front_end.add_vertex_instances(pipelines)
+    for pre, post in zip(pipelines, pipelines[1:]):
+        front_end.add_edge_instance(
+            ApplicationEdge(pre, post), PARTITION_ID)
+    return len(pipelines) - 1
+
+
+#: The graphs that can be benchmarked, by name; each builds the graph at
+#: a number of cores and returns the number of multicast edges
+GRAPHS: dict[str, Callable[[int], int]] = {
+    "lattice": build_lattice,
+    "random_sparse": build_random_sparse,
+    "fan_in": build_fan_in,
+    "fan_out": build_fan_out,
+    "sdram_pipelines": build_sdram_pipelines,
+}
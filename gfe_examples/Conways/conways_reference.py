@@ -0,0 +1,139 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A NumPy Game of Life, to check what the Conways examples record and to
+compare their speed with.
+"""
+
+import time
+from collections.abc import Iterable
+
+import numpy
+from numpy.typing import ArrayLike, NDArray
+
+from spinnaker_graph_front_end.utilities import Boundary, Neighbourhood
+
+
+def initial_board(shape: tuple[int, int],
+                  alive: Iterable[tuple[int, int]]) -> NDArray[numpy.bool_]:
+    """
+    Make a board with some cells alive.
+
+    :param shape: The (width, height) of the board
+    :param alive: The (x, y) of each cell that is alive
+    :return: The board, indexed by [x, y]
+    """
+    board = numpy.zeros(shape, dtype=numpy.bool_)
+    for x, y in alive:
+        board[x, y] = True
+    return board
+
+
+def neighbour_counts(
+        board: NDArray[numpy.bool_],
+        boundary: Boundary = Boundary.WRAP) -> NDArray[numpy.uint8]:
+    """
+    Count the alive neighbours of each cell.
+
+    :param board: The board, indexed by [x, y]
+    :param boundary: What happens at the edges of the board
+    :return: The number of alive cells of the 8 around each cell
+    """
+    width, height = board.shape
+    if boundary == Boundary.WRAP:
+        cells = board.view(numpy.uint8)
+    else:
+        # Pad with dead cells, so that what wraps around is dead
+        cells = numpy.zeros((width + 2, height + 2), dtype=numpy.uint8)
+        cells[1:-1, 1:-1] = board
+    counts = numpy.zeros_like(cells)
+    for dx, dy in Neighbourhood.MOORE.value:
+        counts += numpy.roll(cells, (dx, dy), axis=(0, 1))
+    if boundary == Boundary.WRAP:
+        return counts
+    return counts[1:-1, 1:-1]
+
+
+def life_step(board: NDArray[numpy.bool_],
+              boundary: Boundary = Boundary.WRAP) -> NDArray[numpy.bool_]:
+    """
+    Work out the next state of every cell.
+
+    :param board: The board, indexed by [x, y]
+    :param boundary: What happens at the edges of the board
+    :return: The next board
+    """
+    counts = neighbour_counts(board, boundary)
+    return (counts == 3) | (board & (counts == 2))
+
+
+def expected_states(
+        initial: ArrayLike, n_steps: int,
+        boundary: Boundary = Boundary.WRAP) -> NDArray[numpy.bool_]:
+    """
+    Work out the states the examples should record.
+
+    As in the examples, the state recorded on the first timestep is the
+    state after the first update of the initial state.
+
+    :param initial: The initial board, indexed by [x, y]
+    :param n_steps: The number of timesteps
+    :param boundary: What happens at the edges of the board
+    :return: The states, indexed by [time, x, y]
+    """
+    board = numpy.asarray(initial, dtype=numpy.bool_)
+    states = numpy.empty((n_steps, *board.shape), dtype=numpy.bool_)
+    for step in range(n_steps):
+        board = life_step(board, boundary)
+        states[step] = board
+    return states
+
+
+def diff_states(expected: NDArray[numpy.bool_],
+                recorded: ArrayLike) -> NDArray[numpy.intp]:
+    """
+    Find where recorded states differ from the expected ones.
+
+    :param expected: The expected states, indexed by [time, x, y]
+    :param recorded: The recorded states, indexed by [time, x, y]
+    :return: The (time, x, y) of each cell that differs
+    :raises ValueError: If the states are not the same shape
+    """
+    recorded_array = numpy.asarray(recorded, dtype=numpy.bool_)
+    if recorded_array.shape != expected.shape:
+        raise ValueError(
+            f"Recorded states of shape {recorded_array.shape} cannot be "
+            f"compared with expected states of shape {expected.shape}")
+    return numpy.argwhere(recorded_array != expected)
+
+
+def host_cell_updates_per_second(
+        initial: ArrayLike, n_steps: int,
+        boundary: Boundary = Boundary.WRAP) -> float:
+    """
+    Measure how fast the host updates cells, to compare with a run on
+    SpiNNaker.
+
+    :param initial: The initial board, indexed by [x, y]
+    :param n_steps: The number of timesteps to run for
+    :param boundary: What happens at the edges of the board
+    :return: The number of cells updated per second
+    """
+    board = numpy.asarray(initial, dtype=numpy.bool_)
+    start = time.perf_counter()
+    for _ in range(n_steps):
+        board = life_step(board, boundary)
+    elapsed = time.perf_counter() - start
+    return board.size * n_steps / elapsed if elapsed else float("inf")
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from enum import IntEnum
 
 from spinn_utilities.overrides import overrides
@@ -41,7 +41,10 @@ from spinn_front_end_common.utilities.helpful_functions import (
     n_word_struct,
 )
 
-from spinnaker_graph_front_end.utilities import SimulatorVertex
+from spinnaker_graph_front_end.utilities import (
+    AbstractLatticeVertex,
+    SimulatorVertex,
+)
 
 
 # Regions for populations
@@ -53,7 +56,8 @@ class DataRegions(IntEnum):
     RESULTS = 4
 
 
-class ConwayBasicCell(SimulatorVertex, MachineDataSpecableVertex):
+class ConwayBasicCell(
+        SimulatorVertex, MachineDataSpecableVertex, AbstractLatticeVertex):
     """
     Cell which represents a cell within the 2d fabric.
     """
@@ -84,6 +88,18 @@ class ConwayBasicCell(SimulatorVertex, MachineDataSpecableVertex):
             raise ValueError("Cannot add self as neighbour!")
         self._neighbours.add(neighbour)
 
+    @overrides(AbstractLatticeVertex.set_lattice_neighbours)
+    def set_lattice_neighbours(
+            self, neighbours: Sequence[MachineVertex]) -> None:
+        self._neighbours.clear()
+        for neighbour in neighbours:
+            assert isinstance(neighbour, ConwayBasicCell)
+            self.add_neighbour(neighbour)
+
+    @overrides(SimulatorVertex.get_data_specification_parameters)
+    def get_data_specification_parameters(self) -> object | None:
+        return (self._state, sorted(n.state for n in self._neighbours))
+
     @overrides(
         MachineDataSpecableVertex.generate_machine_data_specification)
     def generate_machine_data_specification(
@@ -16,8 +16,6 @@ import os
 
 from spinn_utilities.config_holder import get_config_bool
 
-from pacman.model.graphs.machine import MachineEdge
-
 import spinnaker_graph_front_end as front_end
 
 from gfe_examples.Conways.partitioned_example_a_no_vis_no_buffer.\
@@ -37,54 +35,24 @@ cores = front_end.get_number_of_available_cores_on_machine()
 if cores <= (MAX_X_SIZE_OF_FABRIC * MAX_Y_SIZE_OF_FABRIC):
     raise KeyError("Don't have enough cores to run simulation")
 
-# contain the vertices for the connection aspect
-vertices: dict[tuple[int, int], ConwayBasicCell] = {}
-
 active_states = [(2, 2), (3, 2), (3, 3), (4, 3), (2, 4)]
 
-# build vertices
-for x in range(MAX_X_SIZE_OF_FABRIC):
-    for y in range(MAX_Y_SIZE_OF_FABRIC):
-        vert = ConwayBasicCell(
-            f"cell{(x * MAX_X_SIZE_OF_FABRIC) + y}",
-            (x, y) in active_states)
-        vertices[x, y] = vert
-        front_end.add_machine_vertex_instance(vert)
+# build the wrap-around fabric of cells, each with edges to its 8 neighbours
+lattice = front_end.add_lattice(
+    lambda x, y: ConwayBasicCell(
+        f"cell{(x * MAX_X_SIZE_OF_FABRIC) + y}", (x, y) in active_states),
+    (MAX_X_SIZE_OF_FABRIC, MAX_Y_SIZE_OF_FABRIC),
+    ConwayBasicCell.PARTITION_ID)
 
 # verify the initial state
 output = ""
 for y in range(MAX_X_SIZE_OF_FABRIC - 1, 0, -1):
     for x in range(MAX_Y_SIZE_OF_FABRIC):
-        output += "X" if vertices[x, y].state else " "
+        output += "X" if lattice.vertex_at(x, y).state else " "
     output += "\n"
 print(output)
 print("\n\n")
 
-# build edges
-for x in range(MAX_X_SIZE_OF_FABRIC):
-    for y in range(MAX_Y_SIZE_OF_FABRIC):
-
-        positions = [
-            (x, (y + 1) % MAX_Y_SIZE_OF_FABRIC, "N"),
-            ((x + 1) % MAX_X_SIZE_OF_FABRIC,
-                (y + 1) % MAX_Y_SIZE_OF_FABRIC, "NE"),
-            ((x + 1) % MAX_X_SIZE_OF_FABRIC, y, "E"),
-            ((x + 1) % MAX_X_SIZE_OF_FABRIC,
-                (y - 1) % MAX_Y_SIZE_OF_FABRIC, "SE"),
-            (x, (y - 1) % MAX_Y_SIZE_OF_FABRIC, "S"),
-            ((x - 1) % MAX_X_SIZE_OF_FABRIC,
-                (y - 1) % MAX_Y_SIZE_OF_FABRIC, "SW"),
-            ((x - 1) % MAX_X_SIZE_OF_FABRIC, y, "W"),
-            ((x - 1) % MAX_X_SIZE_OF_FABRIC,
-                (y + 1) % MAX_Y_SIZE_OF_FABRIC, "NW")]
-
-        for (dest_x, dest_y, compass) in positions:
-            front_end.add_machine_edge_instance(
-                MachineEdge(
-                    vertices[x, y], vertices[dest_x, dest_y],
-                    label=compass), ConwayBasicCell.PARTITION_ID)
-            vertices[dest_x, dest_y].add_neighbour(vertices[x, y])
-
 # run the simulation
 front_end.run(runtime)
 
@@ -95,7 +63,7 @@ recorded_data = {}
 if not get_config_bool("Machine", "virtual_board"):
     for x in range(MAX_X_SIZE_OF_FABRIC):
         for y in range(MAX_Y_SIZE_OF_FABRIC):
-            recorded_data[x, y] = vertices[x, y].get_data()
+            recorded_data[x, y] = lattice.vertex_at(x, y).get_data()
 
     # visualise it in text form (bad but no vis this time)
     for time in range(runtime):
@@ -12,26 +12,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from enum import IntEnum
 
+import numpy
+from numpy.typing import NDArray
+
 from spinn_utilities.overrides import overrides
 
 from spinn_machine.tags import IPTag, ReverseIPTag
 
 from pacman.model.graphs.machine import MachineVertex
 from pacman.model.placements import Placement
-from pacman.model.resources import VariableSDRAM
+from pacman.model.resources import AbstractSDRAM, ConstantSDRAM
 
 from spinn_front_end_common.abstract_models.impl import (
     MachineDataSpecableVertex,
 )
 from spinn_front_end_common.data import FecDataView
 from spinn_front_end_common.interface.buffer_management. \
-    recording_utilities import (
-        get_recording_data_constant_size,
-        get_recording_header_size,
-    )
+    recording_utilities import get_recording_data_constant_size
 from spinn_front_end_common.interface.buffer_management.buffer_models import (
     AbstractReceiveBuffersToHost,
 )
@@ -45,10 +45,17 @@ from spinn_front_end_common.utilities.data_utils import (
 )
 from spinn_front_end_common.utilities.helpful_functions import (
     locate_memory_region_for_placement,
-    n_word_struct,
 )
 
-from spinnaker_graph_front_end.utilities import SimulatorVertex
+from spinnaker_graph_front_end.utilities import (
+    AbstractEmulatedVertex,
+    AbstractLatticeVertex,
+    EmulatedCore,
+    SimulatorVertex,
+    packed_recording_sdram,
+    packed_recording_size,
+    recording_region_size,
+)
 
 
 # Regions for populations
@@ -67,7 +74,8 @@ class Channels(IntEnum):
 
 class ConwayBasicCell(
         SimulatorVertex, MachineDataSpecableVertex,
-        AbstractReceiveBuffersToHost):
+        AbstractReceiveBuffersToHost, AbstractLatticeVertex,
+        AbstractEmulatedVertex):
     """
     Cell which represents a cell within the 2d fabric.
     """
@@ -78,24 +86,51 @@ class ConwayBasicCell(
     STATE_DATA_SIZE = 1 * BYTES_PER_WORD  # 0 or 1 based off dead or alive
     # alive states, dead states
     NEIGHBOUR_INITIAL_STATES_SIZE = 2 * BYTES_PER_WORD
-    RECORDING_ELEMENT_SIZE = STATE_DATA_SIZE  # A recording of the state
+    RECORDING_ELEMENT_BITS = 1  # A recording of the state, packed
 
-    def __init__(self, label: str, state: bool) -> None:
+    def __init__(self, label: str, state: bool,
+                 recording_interval: int = 1,
+                 recording_windowed: bool = False) -> None:
         """
         :param label:
         :param state:
+        :param recording_interval:
+            How many timesteps there are per record of the state
+        :param recording_windowed:
+            Whether each record is whether the cell was alive at any time
+            in its interval, rather than at the start of it
         """
         super().__init__(label, "conways_cell.aplx")
 
         # app specific data items
         self._state = bool(state)
         self._neighbours: set[ConwayBasicCell] = set()
+        self._recording_interval = recording_interval
+        self._recording_windowed = recording_windowed
+
+        # state when emulated on the host
+        self._emulated_key = 0
+        self._emulated_state = False
+        self._alive_in_window = False
 
     def add_neighbour(self, neighbour: "ConwayBasicCell") -> None:
         if neighbour == self:
             raise ValueError("Cannot add self as neighbour!")
         self._neighbours.add(neighbour)
 
+    @overrides(AbstractLatticeVertex.set_lattice_neighbours)
+    def set_lattice_neighbours(
+            self, neighbours: Sequence[MachineVertex]) -> None:
+        self._neighbours.clear()
+        for neighbour in neighbours:
+            assert isinstance(neighbour, ConwayBasicCell)
+            self.add_neighbour(neighbour)
+
+    @overrides(SimulatorVertex.get_data_specification_parameters)
+    def get_data_specification_parameters(self) -> object | None:
+        return (self._state, sorted(n.state for n in self._neighbours),
+                self._recording_interval, self._recording_windowed)
+
     @overrides(MachineDataSpecableVertex.generate_machine_data_specification)
     def generate_machine_data_specification(
             self, spec: DataSpecificationGenerator, placement: Placement,
@@ -121,10 +156,12 @@ class ConwayBasicCell(
             size=self.NEIGHBOUR_INITIAL_STATES_SIZE, label="neighour_states")
 
         # get recorded buffered regions sorted
+        n_records = self.get_recording_channel_n_records(
+            Channels.STATE_LOG, FecDataView.get_max_run_time_steps())
         self.generate_recording_region(
             spec, DataRegions.RESULTS,
-            [self.RECORDING_ELEMENT_SIZE *
-             FecDataView.get_max_run_time_steps()])
+            [packed_recording_size(n_records, self.RECORDING_ELEMENT_BITS)],
+            write_rates=True)
 
         # write key needed to transmit with
         r_infos = FecDataView.get_routing_infos()
@@ -148,10 +185,58 @@ class ConwayBasicCell(
         # End-of-Spec:
         spec.end_specification()
 
-    def get_data(self) -> list[bool]:
+    @overrides(AbstractEmulatedVertex.emulation_start)
+    def emulation_start(self, core: EmulatedCore) -> None:
+        key = FecDataView.get_routing_infos().get_single_key_from(self)
+        self._emulated_key = 0 if key is None else key
+        self._emulated_state = self._state
+        self._alive_in_window = False
+
+    @overrides(AbstractEmulatedVertex.emulation_step)
+    def emulation_step(
+            self, core: EmulatedCore, timestep: int,
+            keys: NDArray[numpy.uint32],
+            payloads: NDArray[numpy.uint32]) -> None:
+        # As the binary: the first state comes from the initial states
+        if timestep == 0:
+            n_alive = sum(n.state for n in self._neighbours)
+        else:
+            n_alive = int(numpy.count_nonzero(payloads))
+        self._emulated_state = n_alive == 3 or (
+            self._emulated_state and n_alive == 2)
+        core.send(self._emulated_key, int(self._emulated_state))
+
+        self._alive_in_window |= self._emulated_state
+        step_in_interval = timestep % self._recording_interval
+        if self._recording_windowed:
+            if step_in_interval == self._recording_interval - 1:
+                core.record(Channels.STATE_LOG, self._alive_in_window)
+                self._alive_in_window = False
+        elif step_in_interval == 0:
+            core.record(Channels.STATE_LOG, self._emulated_state)
+            self._alive_in_window = False
+
+    @overrides(SimulatorVertex.get_recording_channel_interval)
+    def get_recording_channel_interval(self, recording_id: int) -> int:
+        return self._recording_interval
+
+    @overrides(SimulatorVertex.is_recording_channel_windowed)
+    def is_recording_channel_windowed(self, recording_id: int) -> bool:
+        return self._recording_windowed
+
+    @overrides(SimulatorVertex.is_recording_channel_packed)
+    def is_recording_channel_packed(self, recording_id: int) -> bool:
+        # The state is recorded as one bit per timestep
+        return True
+
+    def get_state_array(self) -> NDArray[numpy.bool_]:
+        """
+        Get the recorded state of the cell.
+
+        :return: Whether the cell was alive on each recorded timestep
+        """
         # for buffering output info is taken form the buffer manager
-        # get raw data, convert to list of booleans
-        raw_data, data_missing = self.get_recording_channel_data(
+        states, data_missing = self.get_recording_channel_array(
             Channels.STATE_LOG)
 
         # do check for missing data
@@ -159,24 +244,23 @@ class ConwayBasicCell(
             placement = self.placement
             print("missing_data from "
                   f"({placement.x}, {placement.y}, {placement.p}); ")
+        return states
 
-        # return the data, converted to list of booleans
-        return [
-            bool(element) for element in
-            n_word_struct(len(raw_data) // BYTES_PER_WORD).unpack(raw_data)]
+    def get_data(self) -> list[bool]:
+        return self.get_state_array().tolist()
 
     @property
     @overrides(MachineVertex.sdram_required)
-    def sdram_required(self) -> VariableSDRAM:
+    def sdram_required(self) -> AbstractSDRAM:
         fixed_sdram = (
             SYSTEM_BYTES_REQUIREMENT +
             self.TRANSMISSION_DATA_SIZE +
             self.STATE_DATA_SIZE +
             self.NEIGHBOUR_INITIAL_STATES_SIZE +
-            get_recording_header_size(len(Channels)) +
+            recording_region_size(len(Channels), write_rates=True) +
             get_recording_data_constant_size(len(Channels)))
-        per_timestep_sdram = self.RECORDING_ELEMENT_SIZE
-        return VariableSDRAM(fixed_sdram, per_timestep_sdram)
+        return ConstantSDRAM(fixed_sdram) + packed_recording_sdram(
+            self.RECORDING_ELEMENT_BITS, self._recording_interval)
 
     @property
     def state(self) -> bool:
@@ -16,14 +16,16 @@ import os
 
 from spinn_utilities.config_holder import get_config_bool
 
-from pacman.model.graphs.machine import MachineEdge
-
 import spinnaker_graph_front_end as front_end
 
+from gfe_examples.Conways.conways_reference import (
+    diff_states, expected_states, initial_board)
 from gfe_examples.Conways.partitioned_example_b_no_vis_buffer.\
-    conways_basic_cell import ConwayBasicCell
+    conways_basic_cell import Channels, ConwayBasicCell
 
 runtime = 50
+# record the state on every timestep
+recording_interval = 1
 MAX_X_SIZE_OF_FABRIC = 7
 MAX_Y_SIZE_OF_FABRIC = 7
 n_chips = (MAX_X_SIZE_OF_FABRIC * MAX_Y_SIZE_OF_FABRIC) // 15
@@ -37,76 +39,62 @@ cores = front_end.get_number_of_available_cores_on_machine()
 if cores <= (MAX_X_SIZE_OF_FABRIC * MAX_Y_SIZE_OF_FABRIC):
     raise KeyError("Don't have enough cores to run simulation")
 
-# contain the vertices for the connection aspect
-vertices = {}
-
 active_states = [(2, 2), (3, 2), (3, 3), (4, 3), (2, 4)]
 
-# build vertices
-for x in range(MAX_X_SIZE_OF_FABRIC):
-    for y in range(MAX_Y_SIZE_OF_FABRIC):
-        vert = ConwayBasicCell(
-            f"cell{(x * MAX_X_SIZE_OF_FABRIC) + y}",
-            (x, y) in active_states)
-        vertices[x, y] = vert
-        front_end.add_machine_vertex_instance(vert)
+# build the wrap-around fabric of cells, each with edges to its 8 neighbours
+lattice = front_end.add_lattice(
+    lambda x, y: ConwayBasicCell(
+        f"cell{(x * MAX_X_SIZE_OF_FABRIC) + y}", (x, y) in active_states,
+        recording_interval),
+    (MAX_X_SIZE_OF_FABRIC, MAX_Y_SIZE_OF_FABRIC),
+    ConwayBasicCell.PARTITION_ID)
 
 # verify the initial state
 output = ""
 for y in range(MAX_X_SIZE_OF_FABRIC - 1, 0, -1):
     for x in range(MAX_Y_SIZE_OF_FABRIC):
-        output += "X" if vertices[x, y].state else " "
+        output += "X" if lattice.vertex_at(x, y).state else " "
     output += "\n"
 print(output)
 print("\n\n")
 
-# build edges
-for x in range(MAX_X_SIZE_OF_FABRIC):
-    for y in range(MAX_Y_SIZE_OF_FABRIC):
-
-        positions = [
-            (x, (y + 1) % MAX_Y_SIZE_OF_FABRIC, "N"),
-            ((x + 1) % MAX_X_SIZE_OF_FABRIC,
-                (y + 1) % MAX_Y_SIZE_OF_FABRIC, "NE"),
-            ((x + 1) % MAX_X_SIZE_OF_FABRIC, y, "E"),
-            ((x + 1) % MAX_X_SIZE_OF_FABRIC,
-                (y - 1) % MAX_Y_SIZE_OF_FABRIC, "SE"),
-            (x, (y - 1) % MAX_Y_SIZE_OF_FABRIC, "S"),
-            ((x - 1) % MAX_X_SIZE_OF_FABRIC,
-                (y - 1) % MAX_Y_SIZE_OF_FABRIC, "SW"),
-            ((x - 1) % MAX_X_SIZE_OF_FABRIC, y, "W"),
-            ((x - 1) % MAX_X_SIZE_OF_FABRIC,
-                (y + 1) % MAX_Y_SIZE_OF_FABRIC, "NW")]
-
-        for (dest_x, dest_y, compass) in positions:
-            front_end.add_machine_edge_instance(
-                MachineEdge(
-                    vertices[x, y], vertices[dest_x, dest_y],
-                    label=compass), ConwayBasicCell.PARTITION_ID)
-            vertices[dest_x, dest_y].add_neighbour(vertices[x, y])
-
 # run the simulation
 front_end.run(runtime)
 
-# get recorded data
-recorded_data = {}
-
-if not get_config_bool("Machine", "virtual_board"):
-    # get the data per vertex
-    for x in range(MAX_X_SIZE_OF_FABRIC):
-        for y in range(MAX_Y_SIZE_OF_FABRIC):
-            recorded_data[x, y] = vertices[x, y].get_data()
+if (not get_config_bool("Machine", "virtual_board") or
+        get_config_bool("Machine", "emulate_virtual_board")):
+    # get the data of all the vertices at once, as [x, y, time]
+    recordings, missing = front_end.get_recordings(
+        lattice.vertices, Channels.STATE_LOG)
+    if missing:
+        print(f"missing data from {missing}")
+    recorded_data = front_end.stack_recordings(
+        lattice.vertices, recordings).reshape(
+            MAX_X_SIZE_OF_FABRIC, MAX_Y_SIZE_OF_FABRIC, -1)
 
     # visualise it in text form (bad but no vis this time)
-    for time in range(runtime):
+    timesteps = lattice.vertex_at(0, 0).get_recording_channel_timesteps(
+        Channels.STATE_LOG, recorded_data.shape[2])
+    for record, time in enumerate(timesteps):
         print(f"at time {time}")
         output = ""
         for y in range(MAX_X_SIZE_OF_FABRIC - 1, 0, -1):
             for x in range(MAX_Y_SIZE_OF_FABRIC):
-                output += "X" if recorded_data[x, y][time] else " "
+                output += "X" if recorded_data[x, y][record] else " "
             output += "\n"
         print(output)
         print("\n\n")
 
+    # check against the states worked out on the host
+    expected = expected_states(initial_board(
+        (MAX_X_SIZE_OF_FABRIC, MAX_Y_SIZE_OF_FABRIC), active_states),
+        runtime)[timesteps]
+    differences = diff_states(expected, recorded_data.transpose(2, 0, 1))
+    if len(differences):
+        print(f"{len(differences)} cell states differ from the reference, "
+              f"first at (time, x, y) = {tuple(differences[0])}")
+    else:
+        print("All cell states match the reference")
+
 # clear the machine
 front_end.stop()
@@ -38,6 +38,22 @@ int dead_states_recieved_this_tick = 0;
 //! recorded data items
 uint32_t size_written = 0;
 
+//! The states not yet recorded, packed one bit per timestep
+static uint32_t packed_states = 0;
+
+//! The number of states recorded since the last pause
+static uint32_t n_states_recorded = 0;
+
+//! The number of timesteps per record of the state
+static uint32_t recording_interval = 1;
+
+//! Whether each record is whether the cell was alive at any time in the
+//! interval, rather than at the start of it
+static uint32_t recording_windowed = 0;
+
+//! Whether the cell has been alive so far in the current interval
+static uint32_t alive_in_window = 0;
+
 //! control value, which says how many timer ticks to run for before exiting
 static uint32_t simulation_ticks = 0;
 static uint32_t time = 0;
@@ -81,6 +97,12 @@ typedef struct transmission_region {
     uint32_t my_key;
 } transmission_region_t;
 
+//! the rates of the recording channels, after the recording header
+typedef struct recording_rate {
+    uint32_t interval;
+    uint32_t windowed;
+} recording_rate_t;
+
 //! definitions of each element in the initial state region
 typedef struct state {
     uint32_t initial_state;
@@ -191,6 +213,43 @@ void next_state(void) {
     }
 }
 
+//! \brief record the current state as the next bit of the packed states if
+//!        this timestep ends a recording interval, recording the word when
+//!        it is full
+void record_state(void) {
+    alive_in_window |= (my_state == ALIVE);
+    uint32_t step_in_interval = time % recording_interval;
+    if (recording_windowed) {
+        if (step_in_interval != recording_interval - 1) {
+            return;
+        }
+    } else if (step_in_interval != 0) {
+        return;
+    }
+    uint32_t alive = recording_windowed ? alive_in_window : my_state == ALIVE;
+    alive_in_window = 0;
+    if (alive) {
+        packed_states |= 1u << (n_states_recorded & 31);
+    }
+    n_states_recorded++;
+    if ((n_states_recorded & 31) == 0) {
+        recording_record(0, &packed_states, sizeof(uint32_t));
+        packed_states = 0;
+    }
+}
+
+//! \brief record any partly filled word of packed states, then the number
+//!        of states recorded since the last pause so that the host can
+//!        unpack them
+void record_end_of_run(void) {
+    if ((n_states_recorded & 31) != 0) {
+        recording_record(0, &packed_states, sizeof(uint32_t));
+        packed_states = 0;
+    }
+    recording_record(0, &n_states_recorded, sizeof(uint32_t));
+    n_states_recorded = 0;
+}
+
 /****f* conways.c/update
  *
  * SUMMARY
@@ -214,6 +273,8 @@ void update(uint ticks, uint b) {
         // fall into the pause resume mode of operating
         simulation_handle_pause_resume(NULL);
 
+        record_end_of_run();
+
         // Finalise any recordings that are in progress, writing back the final
         // amounts of samples recorded to SDRAM
         if (recording_flags > 0) {
@@ -232,7 +293,7 @@ void update(uint ticks, uint b) {
     if (time == 0) {
         next_state();
         send_state();
-        recording_record(0, &my_state, 4);
+        record_state();
         log_debug("Send my first state!");
     } else {
         read_input_buffer();
@@ -246,7 +307,7 @@ void update(uint ticks, uint b) {
 
         send_state();
 
-        recording_record(0, &my_state, 4);
+        record_state();
     }
 }
 
@@ -310,6 +371,14 @@ static bool initialize(uint32_t *timer_period) {
     log_info("input_buffer initialised");
 
     void *recording_region = data_specification_get_region(RECORDED_DATA, data);
+
+    // the rate of each channel follows the count and 3 words per channel
+    uint32_t *recording_header = recording_region;
+    recording_rate_t *rates = (recording_rate_t *)
+            &recording_header[1 + 3 * recording_header[0]];
+    recording_interval = rates[0].interval;
+    recording_windowed = rates[0].windowed;
+
     bool success = recording_initialize(&recording_region, &recording_flags);
     log_info("Recording flags = 0x%08x", recording_flags);
     return success;
@@ -0,0 +1,111 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+from numpy.typing import ArrayLike, NDArray
+
+from spinn_utilities.overrides import overrides
+
+from pacman.exceptions import PacmanInvalidParameterException
+from pacman.model.graphs.application import ApplicationVertex
+
+from spinnaker_graph_front_end.utilities import get_recordings
+
+from .conways_tile import MAX_TILE_HEIGHT, Channels, ConwayTile
+from .conways_tile_splitter import ConwayTileSplitter
+
+
+class ConwayBoard(ApplicationVertex[ConwayTile]):
+    """
+    A whole Game of Life board that wraps around at its edges, split into
+    tiles of cells that each run on a core.
+
+    Add it to the graph with an edge from the board to itself in the
+    :py:attr:`ConwayTile.PARTITION_ID` partition, over which the tiles
+    exchange the cells at their edges.
+    """
+
+    __slots__ = ("_initial_board", "_tile_shape")
+
+    def __init__(self, initial_board: ArrayLike,
+                 tile_shape: tuple[int, int],
+                 label: str | None = None) -> None:
+        """
+        :param initial_board:
+            Whether each cell is alive at the start, indexed by [x, y]
+        :param tile_shape: The (width, height) in cells of each tile
+        :param label: The label of the board
+        :raises PacmanInvalidParameterException:
+            If the tiles do not fit the board, or are too high
+        """
+        board = numpy.array(initial_board, dtype=numpy.bool_)
+        if board.ndim != 2:
+            raise PacmanInvalidParameterException(
+                "initial_board", str(board.shape), "The board must be 2D")
+        tile_width, tile_height = tile_shape
+        if not 0 < tile_height <= MAX_TILE_HEIGHT or tile_width <= 0:
+            raise PacmanInvalidParameterException(
+                "tile_shape", str(tile_shape),
+                f"Tiles must be at most {MAX_TILE_HEIGHT} cells high")
+        if board.shape[0] % tile_width or board.shape[1] % tile_height:
+            raise PacmanInvalidParameterException(
+                "tile_shape", str(tile_shape),
+                f"The tiles must divide the board of shape {board.shape}")
+        super().__init__(label, tile_shape, ConwayTileSplitter())
+        self._initial_board = board
+        self._tile_shape = (tile_width, tile_height)
+
+    @property
+    @overrides(ApplicationVertex.n_atoms)
+    def n_atoms(self) -> int:
+        return self._initial_board.size
+
+    @property
+    @overrides(ApplicationVertex.atoms_shape)
+    def atoms_shape(self) -> tuple[int, ...]:
+        return self._initial_board.shape
+
+    @property
+    def initial_board(self) -> NDArray[numpy.bool_]:
+        """
+        Whether each cell is alive at the start, indexed by [x, y].
+        """
+        return self._initial_board
+
+    @property
+    def tile_shape(self) -> tuple[int, int]:
+        """
+        The (width, height) in cells of each tile.
+        """
+        return self._tile_shape
+
+    def get_states(self) -> tuple[NDArray[numpy.bool_], list[ConwayTile]]:
+        """
+        Get the recorded states of the whole board.
+
+        :return:
+            The states, indexed by [time, x, y], and the tiles with data
+            missing
+        """
+        tiles = list(self.machine_vertices)
+        recordings, missing = get_recordings(tiles, Channels.STATE_LOG)
+        n_records = min((len(data) for data in recordings.values()),
+                        default=0)
+        states = numpy.zeros(
+            (n_records, *self._initial_board.shape), dtype=numpy.bool_)
+        for tile in tiles:
+            x, y = tile.vertex_slice.start
+            states[:, x:x + tile.width, y:y + tile.height] = \
+                recordings[tile][:n_records]
+        return states, [tile for tile in tiles if tile in missing]
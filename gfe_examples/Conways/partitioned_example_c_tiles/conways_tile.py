@@ -0,0 +1,326 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Iterable
+from enum import IntEnum
+
+import numpy
+from numpy.typing import NDArray
+
+from spinn_utilities.overrides import overrides
+
+from spinn_machine.tags import IPTag, ReverseIPTag
+
+from pacman.model.graphs.application import ApplicationVertex
+from pacman.model.graphs.common import MDSlice
+from pacman.model.graphs.machine import MachineVertex
+from pacman.model.placements import Placement
+from pacman.model.resources import AbstractSDRAM, ConstantSDRAM
+
+from spinn_front_end_common.abstract_models.impl import (
+    MachineDataSpecableVertex,
+)
+from spinn_front_end_common.data import FecDataView
+from spinn_front_end_common.interface.buffer_management. \
+    recording_utilities import get_recording_data_constant_size
+from spinn_front_end_common.interface.buffer_management.buffer_models import (
+    AbstractReceiveBuffersToHost,
+)
+from spinn_front_end_common.interface.ds import DataSpecificationGenerator
+from spinn_front_end_common.utilities.constants import (
+    BYTES_PER_WORD,
+    SYSTEM_BYTES_REQUIREMENT,
+)
+from spinn_front_end_common.utilities.data_utils import (
+    generate_system_data_region,
+)
+from spinn_front_end_common.utilities.helpful_functions import (
+    locate_memory_region_for_placement,
+)
+
+from spinnaker_graph_front_end.utilities import (
+    AbstractEmulatedVertex,
+    EmulatedCore,
+    Neighbourhood,
+    SimulatorVertex,
+    packed_recording_sdram,
+    packed_recording_size,
+    recording_region_size,
+)
+
+#: The most rows a tile can have, so that a column and the cells above and
+#: below it fit in a word
+MAX_TILE_HEIGHT = 30
+
+#: The directions of the neighbouring tiles, in the order the binary reads
+#: their keys
+DIRECTIONS: tuple[tuple[int, int], ...] = Neighbourhood.MOORE.value
+
+
+# Regions for populations
+class DataRegions(IntEnum):
+    SYSTEM = 0
+    PARAMS = 1
+    STATE = 2
+    RESULTS = 3
+
+
+# Channels for doing recording in
+class Channels(IntEnum):
+    STATE_LOG = 0
+
+
+def _to_words(bits: NDArray[numpy.bool_]) -> NDArray[numpy.uint32]:
+    # Bit i of word j is bit 32 * j + i
+    packed = numpy.packbits(bits, bitorder="little")
+    words = numpy.zeros(-(-len(packed) // BYTES_PER_WORD), dtype="<u4")
+    words.view(numpy.uint8)[:len(packed)] = packed
+    return words
+
+
+def _from_word(word: int, n_bits: int) -> NDArray[numpy.bool_]:
+    return ((int(word) >> numpy.arange(n_bits)) & 1).astype(numpy.bool_)
+
+
+class ConwayTile(
+        SimulatorVertex, MachineDataSpecableVertex,
+        AbstractReceiveBuffersToHost, AbstractEmulatedVertex):
+    """
+    A rectangular block of the cells of a Game of Life board, run on one
+    core.
+
+    The cells are kept as one word per column, with the cells of the
+    neighbouring tiles around the block (the halo) in the bits and columns
+    around it.  On each timestep, the tile sends the words of its left and
+    right columns and of its bottom and top rows to the 8 tiles around it,
+    which take from them the halo cells they need.
+    """
+
+    PARTITION_ID = "STATE"
+
+    # has key, key, width, height, and a key and mask per neighbour
+    PARAMS_SIZE = (4 + 2 * len(DIRECTIONS)) * BYTES_PER_WORD
+
+    def __init__(self, label: str, vertex_slice: MDSlice,
+                 app_vertex: ApplicationVertex,
+                 initial: NDArray[numpy.bool_]) -> None:
+        """
+        :param label: The label of the tile
+        :param vertex_slice: The cells of the board in the tile
+        :param app_vertex: The board the tile is part of
+        :param initial:
+            The initial state of the cells of the tile and its halo,
+            indexed by [x, y]
+        """
+        super().__init__(label, "conways_tile.aplx", vertex_slice)
+        self._app_vertex = app_vertex
+        self._initial = initial
+        self._neighbours: dict[tuple[int, int], ConwayTile] = {}
+
+        # state when emulated on the host
+        self._cells = initial.copy()
+        self._emulated_key = 0
+        self._neighbour_keys: list[tuple[int, int, tuple[int, int]]] = []
+
+    @property
+    def width(self) -> int:
+        """
+        The number of columns of cells in the tile.
+        """
+        return self.vertex_slice.shape[0]
+
+    @property
+    def height(self) -> int:
+        """
+        The number of rows of cells in the tile.
+        """
+        return self.vertex_slice.shape[1]
+
+    @property
+    def n_row_words(self) -> int:
+        """
+        The number of words, so the number of packets, for a row.
+        """
+        return -(-self.width // 32)
+
+    @property
+    def n_packets(self) -> int:
+        """
+        The number of packets the tile sends on each timestep.
+        """
+        return 2 + 2 * self.n_row_words
+
+    def set_neighbours(
+            self, neighbours: dict[tuple[int, int], "ConwayTile"]) -> None:
+        """
+        Set the tiles around this one.
+
+        :param neighbours: The tile in each of the :py:data:`DIRECTIONS`
+        """
+        self._neighbours = dict(neighbours)
+
+    @property
+    def neighbours(self) -> list["ConwayTile"]:
+        """
+        The distinct tiles around this one, which may include itself on a
+        small board.
+        """
+        return list(dict.fromkeys(self._neighbours.values()))
+
+    @overrides(MachineVertex.get_n_keys_for_partition)
+    def get_n_keys_for_partition(self, partition_id: str) -> int:
+        return self.n_packets
+
+    @overrides(SimulatorVertex.get_data_specification_parameters)
+    def get_data_specification_parameters(self) -> object | None:
+        return self._initial.tobytes()
+
+    def _state_words(self) -> NDArray[numpy.uint32]:
+        # Bit 0 of each column is the cell below the tile
+        weights = numpy.left_shift(
+            numpy.uint32(1), numpy.arange(self.height + 2, dtype=numpy.uint32))
+        return (self._initial.astype(numpy.uint32) * weights).sum(
+            axis=1, dtype=numpy.uint32)
+
+    @overrides(MachineDataSpecableVertex.generate_machine_data_specification)
+    def generate_machine_data_specification(
+            self, spec: DataSpecificationGenerator, placement: Placement,
+            iptags: Iterable[IPTag] | None,
+            reverse_iptags: Iterable[ReverseIPTag] | None) -> None:
+        # pylint: disable=arguments-differ
+        generate_system_data_region(spec, DataRegions.SYSTEM, self)
+
+        spec.reserve_memory_region(
+            region=DataRegions.PARAMS, size=self.PARAMS_SIZE, label="params")
+        spec.reserve_memory_region(
+            region=DataRegions.STATE,
+            size=(self.width + 2) * BYTES_PER_WORD, label="state")
+        self.generate_recording_region(
+            spec, DataRegions.RESULTS,
+            [packed_recording_size(FecDataView.get_max_run_time_steps(),
+                                   self.width * self.height)])
+
+        r_infos = FecDataView.get_routing_infos()
+        key = r_infos.get_key_from(self, self.PARTITION_ID)
+        spec.switch_write_focus(DataRegions.PARAMS)
+        spec.write_value(int(key is not None))
+        spec.write_value(0 if key is None else key)
+        spec.write_value(self.width)
+        spec.write_value(self.height)
+        for direction in DIRECTIONS:
+            info = r_infos.get_info_from(
+                self._neighbours[direction], self.PARTITION_ID)
+            spec.write_value(info.key)
+            spec.write_value(info.mask)
+
+        spec.switch_write_focus(DataRegions.STATE)
+        spec.write_array(self._state_words())
+
+        spec.end_specification()
+
+    @property
+    @overrides(MachineVertex.sdram_required)
+    def sdram_required(self) -> AbstractSDRAM:
+        fixed_sdram = (
+            SYSTEM_BYTES_REQUIREMENT + self.PARAMS_SIZE +
+            (self.width + 2) * BYTES_PER_WORD +
+            recording_region_size(len(Channels)) +
+            get_recording_data_constant_size(len(Channels)))
+        return ConstantSDRAM(fixed_sdram) + packed_recording_sdram(
+            self.width * self.height)
+
+    @overrides(SimulatorVertex.is_recording_channel_packed)
+    def is_recording_channel_packed(self, recording_id: int) -> bool:
+        return True
+
+    @overrides(SimulatorVertex.get_recording_channel_shape)
+    def get_recording_channel_shape(
+            self, recording_id: int) -> tuple[int, ...]:
+        return (self.width, self.height)
+
+    @overrides(AbstractReceiveBuffersToHost.get_recorded_region_ids)
+    def get_recorded_region_ids(self) -> list[int]:
+        return [Channels.STATE_LOG]
+
+    @overrides(AbstractReceiveBuffersToHost.get_recording_region_base_address)
+    def get_recording_region_base_address(self, placement: Placement) -> int:
+        return locate_memory_region_for_placement(
+            placement, DataRegions.RESULTS)
+
+    @overrides(AbstractEmulatedVertex.emulation_start)
+    def emulation_start(self, core: EmulatedCore) -> None:
+        r_infos = FecDataView.get_routing_infos()
+        key = r_infos.get_key_from(self, self.PARTITION_ID)
+        self._emulated_key = 0 if key is None else key
+        self._neighbour_keys = []
+        for direction in DIRECTIONS:
+            info = r_infos.get_info_from(
+                self._neighbours[direction], self.PARTITION_ID)
+            self._neighbour_keys.append((info.key, info.mask, direction))
+        self._cells = self._initial.copy()
+
+    def _receive(self, index: int, payload: int,
+                 direction: tuple[int, int]) -> None:
+        # As receive_data in the binary
+        cells = self._cells
+        width, height = self.width, self.height
+        top_rows = 2 + self.n_row_words
+        if index < 2:
+            # A column from the left (0) or right (1) of the sender
+            column = _from_word(payload, height)
+            dx, dy = direction
+            if dy == 0 and dx == 1 - 2 * index:
+                cells[0 if dx < 0 else width + 1, 1:height + 1] = column
+            elif dx == 1 - 2 * index:
+                x = 0 if dx < 0 else width + 1
+                if dy < 0:
+                    cells[x, 0] = column[height - 1]
+                else:
+                    cells[x, height + 1] = column[0]
+        elif direction[0] == 0:
+            # A row from the bottom or top of the sender
+            is_top = index >= top_rows
+            if is_top != (direction[1] < 0):
+                return
+            start = 32 * (index - (top_rows if is_top else 2))
+            n_bits = min(32, width - start)
+            y = 0 if is_top else height + 1
+            cells[1 + start:1 + start + n_bits, y] = _from_word(
+                payload, n_bits)
+
+    @overrides(AbstractEmulatedVertex.emulation_step)
+    def emulation_step(
+            self, core: EmulatedCore, timestep: int,
+            keys: NDArray[numpy.uint32],
+            payloads: NDArray[numpy.uint32]) -> None:
+        if timestep > 0:
+            for key, payload in zip(keys.tolist(), payloads.tolist()):
+                for base, mask, direction in self._neighbour_keys:
+                    if key & mask == base:
+                        self._receive(key & ~mask, payload, direction)
+
+        cells = self._cells
+        width, height = self.width, self.height
+        counts = sum(
+            cells[1 + dx:width + 1 + dx, 1 + dy:height + 1 + dy].astype(
+                numpy.uint8)
+            for dx, dy in DIRECTIONS)
+        inner = cells[1:width + 1, 1:height + 1]
+        inner[:] = (counts == 3) | (inner & (counts == 2))
+
+        words = [_to_words(inner[0])[0], _to_words(inner[-1])[0]]
+        words.extend(_to_words(inner[:, 0]))
+        words.extend(_to_words(inner[:, -1]))
+        core.send(self._emulated_key + numpy.arange(len(words)), words)
+        core.record(Channels.STATE_LOG, inner)
@@ -0,0 +1,123 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+import numpy
+
+from spinn_utilities.overrides import overrides
+
+from pacman.model.graphs import AbstractVertex
+from pacman.model.graphs.application import ApplicationVertex
+from pacman.model.graphs.common import MDSlice, Slice
+from pacman.model.graphs.machine import MachineVertex
+from pacman.model.partitioner_splitters import AbstractSplitterCommon
+from pacman.utilities.utility_objs import ChipCounter
+
+from .conways_tile import DIRECTIONS, ConwayTile
+
+if TYPE_CHECKING:
+    from .conways_board import ConwayBoard
+
+
+class ConwayTileSplitter(AbstractSplitterCommon["ConwayBoard"]):
+    """
+    Splits a board into tiles of the same shape, each of which exchanges
+    the cells at its edges with the 8 tiles around it, wrapping around the
+    edges of the board.
+    """
+
+    __slots__ = ("_tiles", )
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._tiles: list[ConwayTile] = []
+
+    @property
+    def tiles(self) -> Sequence[ConwayTile]:
+        """
+        The tiles, in the order of the atoms of the board they hold.
+        """
+        return self._tiles
+
+    @overrides(AbstractSplitterCommon.create_machine_vertices)
+    def create_machine_vertices(self, chip_counter: ChipCounter) -> None:
+        board: "ConwayBoard" = self.governed_app_vertex
+        width, height = board.atoms_shape
+        tile_width, tile_height = board.tile_shape
+        n_tiles_x = width // tile_width
+        n_tiles_y = height // tile_height
+        n_cells = tile_width * tile_height
+
+        # Each tile starts with the cells around it, wrapping at the edges
+        padded = numpy.pad(board.initial_board, 1, mode="wrap")
+        grid: dict[tuple[int, int], ConwayTile] = {}
+        for tile_y in range(n_tiles_y):
+            for tile_x in range(n_tiles_x):
+                x, y = tile_x * tile_width, tile_y * tile_height
+                lo_atom = len(self._tiles) * n_cells
+                tile = ConwayTile(
+                    f"{board.label}:{tile_x},{tile_y}",
+                    MDSlice(lo_atom, lo_atom + n_cells - 1,
+                            (tile_width, tile_height), (x, y),
+                            board.atoms_shape),
+                    board,
+                    padded[x:x + tile_width + 2, y:y + tile_height + 2])
+                grid[tile_x, tile_y] = tile
+                self._tiles.append(tile)
+                board.remember_machine_vertex(tile)
+                chip_counter.add_core(tile.sdram_required)
+
+        for (tile_x, tile_y), tile in grid.items():
+            tile.set_neighbours({
+                (dx, dy): grid[(tile_x + dx) % n_tiles_x,
+                               (tile_y + dy) % n_tiles_y]
+                for dx, dy in DIRECTIONS})
+
+    @overrides(AbstractSplitterCommon.get_in_coming_slices)
+    def get_in_coming_slices(self) -> list[Slice]:
+        return [tile.vertex_slice for tile in self._tiles]
+
+    @overrides(AbstractSplitterCommon.get_out_going_slices)
+    def get_out_going_slices(self) -> list[Slice]:
+        return [tile.vertex_slice for tile in self._tiles]
+
+    @overrides(AbstractSplitterCommon.get_in_coming_vertices)
+    def get_in_coming_vertices(self, partition_id: str) -> list[ConwayTile]:
+        return self._tiles
+
+    @overrides(AbstractSplitterCommon.get_out_going_vertices)
+    def get_out_going_vertices(self, partition_id: str) -> list[ConwayTile]:
+        return self._tiles
+
+    @overrides(
+        AbstractSplitterCommon.get_source_specific_in_coming_vertices)
+    def get_source_specific_in_coming_vertices(
+            self, source_vertex: ApplicationVertex, partition_id: str
+            ) -> Sequence[tuple[MachineVertex, Sequence[AbstractVertex]]]:
+        # Only the tiles around each tile send to it
+        if source_vertex != self.governed_app_vertex:
+            return super().get_source_specific_in_coming_vertices(
+                source_vertex, partition_id)
+        return [(tile, tile.neighbours) for tile in self._tiles]
+
+    @overrides(AbstractSplitterCommon.machine_vertices_for_recording)
+    def machine_vertices_for_recording(
+            self, variable_to_record: str) -> list[ConwayTile]:
+        return self._tiles
+
+    @overrides(AbstractSplitterCommon.reset_called)
+    def reset_called(self) -> None:
+        self._tiles = []
@@ -0,0 +1,80 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+from spinn_utilities.config_holder import get_config_bool
+
+from pacman.model.graphs.application import ApplicationEdge
+
+import spinnaker_graph_front_end as front_end
+
+from gfe_examples.Conways.conways_reference import (
+    diff_states, expected_states, initial_board)
+from gfe_examples.Conways.partitioned_example_c_tiles.conways_board import (
+    ConwayBoard)
+from gfe_examples.Conways.partitioned_example_c_tiles.conways_tile import (
+    ConwayTile)
+
+runtime = 50
+# a board of 64 x 60 cells, in tiles of 32 x 30 cells, each on a core
+BOARD_SHAPE = (64, 60)
+TILE_SHAPE = (32, 30)
+
+# set up the front end
+front_end.setup(
+    n_chips_required=1, model_binary_folder=os.path.dirname(__file__))
+
+# some gliders, one crossing each edge between tiles
+active_states = [
+    (x + dx, y + dy)
+    for x, y in [(2, 2), (30, 10), (12, 27), (45, 40), (60, 57)]
+    for dx, dy in [(0, 0), (1, 0), (1, 1), (2, 1), (0, 2)]]
+initial = initial_board(BOARD_SHAPE, active_states)
+
+# the board sends the cells at the edges of each tile to the tiles around it
+board = ConwayBoard(initial, TILE_SHAPE, label="board")
+front_end.add_vertex_instance(board)
+front_end.add_edge_instance(
+    ApplicationEdge(board, board), ConwayTile.PARTITION_ID)
+
+# run the simulation
+front_end.run(runtime)
+
+if (not get_config_bool("Machine", "virtual_board") or
+        get_config_bool("Machine", "emulate_virtual_board")):
+    # get the states of the whole board, as [time, x, y]
+    states, missing = board.get_states()
+    if missing:
+        print(f"missing data from {missing}")
+
+    # visualise the last state in text form
+    output = ""
+    for y in range(BOARD_SHAPE[1] - 1, -1, -1):
+        output += "".join(
+            "X" if states[-1, x, y] else " " for x in range(BOARD_SHAPE[0]))
+        output += "\n"
+    print(output)
+
+    # check against the states worked out on the host
+    differences = diff_states(
+        expected_states(initial, len(states)), states)
+    if len(differences):
+        print(f"{len(differences)} cell states differ from the reference, "
+              f"first at (time, x, y) = {tuple(differences[0])}")
+    else:
+        print("All cell states match the reference")
+
+# clear the machine
+front_end.stop()
@@ -0,0 +1,437 @@
+/*
+ * Copyright (c) 2026 The University of Manchester
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     https://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+//! \file
+//! \brief A rectangular tile of the cells of a Game of Life board.
+//!
+//! The cells are kept one word per column, with bit y + 1 being the cell in
+//! row y; bit 0 and bit height + 1 hold the cells of the tiles below and
+//! above, and the first and last columns those of the tiles to the left and
+//! right. Each timestep, the tile sends its left and right columns and its
+//! bottom and top rows, and takes the cells it needs from what the 8 tiles
+//! around it sent on the previous timestep.
+
+//! imports
+#include "spin1_api.h"
+#include "common-typedefs.h"
+#include <data_specification.h>
+#include <simulation.h>
+#include <debug.h>
+#include <circular_buffer.h>
+#include <recording.h>
+
+//! The number of tiles around a tile
+#define N_NEIGHBOURS 8
+
+//! The number of bits in a word
+#define WORD_BITS 32
+
+//! human readable definitions of each region in SDRAM
+typedef enum regions_e {
+    SYSTEM_REGION,
+    PARAMS,
+    STATE,
+    RECORDED_DATA
+} regions_e;
+
+//! values for the priority for each callback
+typedef enum callback_priorities {
+    MC_PACKET = -1,
+    SDP = 1,
+    TIMER = 2,
+    DMA = 3
+} callback_priorities;
+
+//! The index of each packet sent by a tile, relative to its key
+typedef enum packet_index {
+    //! The left column of the tile
+    LEFT_COLUMN = 0,
+    //! The right column of the tile
+    RIGHT_COLUMN = 1,
+    //! The first word of the bottom row of the tile; the words of the top
+    //! row follow those of the bottom row
+    FIRST_ROW_WORD = 2
+} packet_index;
+
+//! The key and mask of the packets from a neighbouring tile
+typedef struct neighbour_key {
+    uint32_t key;
+    uint32_t mask;
+} neighbour_key_t;
+
+//! definitions of each element in the parameters region
+typedef struct params_region {
+    uint32_t has_key;
+    uint32_t my_key;
+    uint32_t width;
+    uint32_t height;
+    //! In the order of the directions below
+    neighbour_key_t neighbours[N_NEIGHBOURS];
+} params_region_t;
+
+//! The x offsets of the tiles around a tile
+static const int32_t neighbour_dx[N_NEIGHBOURS] = {0, 1, 1, 1, 0, -1, -1, -1};
+
+//! The y offsets of the tiles around a tile
+static const int32_t neighbour_dy[N_NEIGHBOURS] = {1, 1, 0, -1, -1, -1, 0, 1};
+
+/*! multicast routing key to communicate with neighbours */
+static uint32_t my_key;
+
+//! The keys and masks of the packets from the tiles around
+static neighbour_key_t neighbours[N_NEIGHBOURS];
+
+//! The size of the tile in cells
+static uint32_t width;
+static uint32_t height;
+
+//! The number of words in a row of the tile
+static uint32_t n_row_words;
+
+//! The mask of the bits of a column that are cells of the tile
+static uint32_t inner_mask;
+
+//! The columns of the tile, with the cells around it
+static uint32_t *columns;
+
+//! The next states of the cells of the columns
+static uint32_t *next_columns;
+
+/*! buffer used to store the keys and payloads received */
+static circular_buffer input_buffer;
+
+//! The states not yet recorded, packed one bit per cell per timestep
+static uint32_t packed_states = 0;
+
+//! The number of states recorded since the last pause
+static uint32_t n_states_recorded = 0;
+
+//! control value, which says how many timer ticks to run for before exiting
+static uint32_t simulation_ticks = 0;
+static uint32_t time = 0;
+data_specification_metadata_t *data = NULL;
+
+//! The recording flags
+static uint32_t recording_flags = 0;
+
+//! int as a bool to represent if this simulation should run forever
+static uint32_t infinite_run;
+
+//! \brief store a received packet until the next timestep
+//! \param[in] key: packet routing key - provided by the RTS
+//! \param[in] payload: packet payload - provided by the RTS
+void receive_data(uint key, uint payload) {
+    if (!circular_buffer_add(input_buffer, key) ||
+            !circular_buffer_add(input_buffer, payload)) {
+        log_info("Could not add state");
+    }
+}
+
+//! \brief take the cells around the tile from a packet sent by the tile in
+//!        one direction
+//! \param[in] direction: which of the tiles around sent it
+//! \param[in] index: which packet of the tile it is
+//! \param[in] payload: the cells in the packet
+static void apply_halo(uint32_t direction, uint32_t index, uint32_t payload) {
+    int32_t dx = neighbour_dx[direction];
+    int32_t dy = neighbour_dy[direction];
+    if (index <= RIGHT_COLUMN) {
+        // The tile to the left needs the right column, and the other way
+        if (dx != 1 - 2 * (int32_t) index) {
+            return;
+        }
+        uint32_t x = (dx < 0) ? 0 : width + 1;
+        if (dy == 0) {
+            columns[x] = (columns[x] & ~inner_mask) | (payload << 1);
+        } else if (dy < 0) {
+            // The corner below takes the top cell of the column
+            columns[x] = (columns[x] & ~1u) | ((payload >> (height - 1)) & 1);
+        } else {
+            // The corner above takes the bottom cell of the column
+            uint32_t bit = 1u << (height + 1);
+            columns[x] = (columns[x] & ~bit) | ((payload & 1) ? bit : 0);
+        }
+        return;
+    }
+
+    // The tile below needs the top row, and the one above the bottom row
+    bool is_top = index >= FIRST_ROW_WORD + n_row_words;
+    if (dx != 0 || is_top != (dy < 0)) {
+        return;
+    }
+    uint32_t start = WORD_BITS *
+            (index - FIRST_ROW_WORD - (is_top ? n_row_words : 0));
+    uint32_t shift = is_top ? 0 : height + 1;
+    uint32_t bit = 1u << shift;
+    for (uint32_t i = 0; i < WORD_BITS && start + i < width; i++) {
+        uint32_t *column = &columns[1 + start + i];
+        *column = (*column & ~bit) | (((payload >> i) & 1) << shift);
+    }
+}
+
+//! \brief apply the packets received on the previous timestep
+void read_input_buffer(void) {
+    uint cpsr = spin1_int_disable();
+    uint32_t key, payload;
+    while (circular_buffer_get_next(input_buffer, &key) &&
+            circular_buffer_get_next(input_buffer, &payload)) {
+        // A tile can be in more than one direction on a small board
+        for (uint32_t n = 0; n < N_NEIGHBOURS; n++) {
+            if ((key & neighbours[n].mask) == neighbours[n].key) {
+                apply_halo(n, key & ~neighbours[n].mask, payload);
+            }
+        }
+    }
+    spin1_mode_restore(cpsr);
+}
+
+//! \brief work out the next states of all the cells, 32 rows at a time,
+//!        by adding up the 8 neighbours of each cell with bitwise logic
+void next_state(void) {
+    for (uint32_t x = 1; x <= width; x++) {
+        uint32_t left = columns[x - 1];
+        uint32_t centre = columns[x];
+        uint32_t right = columns[x + 1];
+        uint32_t inputs[N_NEIGHBOURS] = {
+            left << 1, left, left >> 1, centre << 1,
+            centre >> 1, right << 1, right, right >> 1
+        };
+
+        // The count in binary, with s2 set for any count of 4 or more
+        uint32_t s0 = 0, s1 = 0, s2 = 0;
+        for (uint32_t n = 0; n < N_NEIGHBOURS; n++) {
+            uint32_t carry0 = s0 & inputs[n];
+            s0 ^= inputs[n];
+            uint32_t carry1 = s1 & carry0;
+            s1 ^= carry0;
+            s2 |= carry1;
+        }
+
+        // Alive with 3, or with 2 if already alive
+        next_columns[x] = s1 & ~s2 & (s0 | centre) & inner_mask;
+    }
+    for (uint32_t x = 1; x <= width; x++) {
+        columns[x] = (columns[x] & ~inner_mask) | next_columns[x];
+    }
+}
+
+//! \brief send a packet, waiting until it can be sent
+//! \param[in] index: which packet of the tile it is
+//! \param[in] payload: the cells in the packet
+static inline void send_packet(uint32_t index, uint32_t payload) {
+    while (!spin1_send_mc_packet(my_key + index, payload, WITH_PAYLOAD)) {
+        spin1_delay_us(1);
+    }
+}
+
+//! \brief send the cells at the edges of the tile to the tiles around it
+void send_state(void) {
+    send_packet(LEFT_COLUMN, (columns[1] & inner_mask) >> 1);
+    send_packet(RIGHT_COLUMN, (columns[width] & inner_mask) >> 1);
+    for (uint32_t word = 0; word < n_row_words; word++) {
+        uint32_t bottom = 0, top = 0;
+        uint32_t start = word * WORD_BITS;
+        for (uint32_t i = 0; i < WORD_BITS && start + i < width; i++) {
+            uint32_t column = columns[1 + start + i];
+            bottom |= ((column >> 1) & 1) << i;
+            top |= ((column >> height) & 1) << i;
+        }
+        send_packet(FIRST_ROW_WORD + word, bottom);
+        send_packet(FIRST_ROW_WORD + n_row_words + word, top);
+    }
+}
+
+//! \brief record the cells of the tile, column by column, as the next bits
+//!        of the packed states, recording each word when it is full
+void record_state(void) {
+    for (uint32_t x = 1; x <= width; x++) {
+        uint32_t cells = (columns[x] & inner_mask) >> 1;
+        uint32_t offset = n_states_recorded & (WORD_BITS - 1);
+        packed_states |= cells << offset;
+        n_states_recorded += height;
+        if (offset + height >= WORD_BITS) {
+            recording_record(0, &packed_states, sizeof(uint32_t));
+            // The bits that did not fit start the next word
+            packed_states = (offset == 0) ? 0 : cells >> (WORD_BITS - offset);
+        }
+    }
+}
+
+//! \brief record any partly filled word of packed states, then the number
+//!        of states recorded since the last pause so that the host can
+//!        unpack them
+void record_end_of_run(void) {
+    if ((n_states_recorded & (WORD_BITS - 1)) != 0) {
+        recording_record(0, &packed_states, sizeof(uint32_t));
+        packed_states = 0;
+    }
+    recording_record(0, &n_states_recorded, sizeof(uint32_t));
+    n_states_recorded = 0;
+}
+
+/****f* conways_tile.c/update
+ *
+ * SUMMARY
+ *
+ * SYNOPSIS
+ *  void update (uint ticks, uint b)
+ *
+ * SOURCE
+ */
+void update(uint ticks, uint b) {
+    use(b);
+    use(ticks);
+
+    time++;
+
+    log_debug("on tick %d of %d", time, simulation_ticks);
+
+    // check that the run time hasn't already elapsed and thus needs to be
+    // killed
+    if ((infinite_run != TRUE) && (time >= simulation_ticks)) {
+        // fall into the pause resume mode of operating
+        simulation_handle_pause_resume(NULL);
+
+        record_end_of_run();
+
+        // Finalise any recordings that are in progress, writing back the final
+        // amounts of samples recorded to SDRAM
+        if (recording_flags > 0) {
+            log_info("updating recording regions");
+            recording_finalise();
+        }
+
+        log_info("Simulation complete.");
+
+        // switch to state where host is ready to read
+        simulation_ready_to_read();
+
+        return;
+    }
+
+    // The first state comes from the initial cells around the tile
+    if (time > 0) {
+        read_input_buffer();
+    }
+    next_state();
+    send_state();
+    record_state();
+}
+
+static bool initialize(uint32_t *timer_period) {
+    log_info("Initialise: started");
+
+    // Get the address this core's DTCM data starts at from SRAM
+    data = data_specification_get_data_address();
+
+    // Read the header
+    if (!data_specification_read_header(data)) {
+        log_error("failed to read the data spec header");
+        return false;
+    }
+
+    // Get the timing details and set up the simulation interface
+    if (!simulation_initialise(
+            data_specification_get_region(SYSTEM_REGION, data),
+            APPLICATION_NAME_HASH, timer_period, &simulation_ticks,
+            &infinite_run, &time, SDP, DMA)) {
+        return false;
+    }
+
+    // read the key, shape and the keys of the tiles around
+    params_region_t *params = data_specification_get_region(PARAMS, data);
+    if (!params->has_key) {
+        log_error(
+            "this conways tile can't affect anything, deduced as an error,"
+            "please fix the application fabric and try again");
+        return false;
+    }
+    my_key = params->my_key;
+    width = params->width;
+    height = params->height;
+    n_row_words = (width + WORD_BITS - 1) / WORD_BITS;
+    inner_mask = ((1u << height) - 1) << 1;
+    for (uint32_t n = 0; n < N_NEIGHBOURS; n++) {
+        neighbours[n] = params->neighbours[n];
+    }
+    log_info("my key is %d; I have %d x %d cells", my_key, width, height);
+
+    // copy the initial cells, with those around the tile, into DTCM
+    uint32_t *state_sdram = data_specification_get_region(STATE, data);
+    uint32_t columns_size = (width + 2) * sizeof(uint32_t);
+    columns = spin1_malloc(columns_size);
+    next_columns = spin1_malloc(columns_size);
+    if (columns == NULL || next_columns == NULL) {
+        log_error("Could not allocate the columns");
+        return false;
+    }
+    spin1_memcpy(columns, state_sdram, columns_size);
+
+    // initialise my input_buffer for receiving a timestep of packets twice
+    // over, a key and a payload each
+    uint32_t n_packets = 2 + 2 * n_row_words;
+    input_buffer = circular_buffer_initialize(
+            2 * 2 * N_NEIGHBOURS * n_packets);
+    if (input_buffer == 0) {
+        return false;
+    }
+    log_info("input_buffer initialised");
+
+    void *recording_region = data_specification_get_region(RECORDED_DATA, data);
+    bool success = recording_initialize(&recording_region, &recording_flags);
+    log_info("Recording flags = 0x%08x", recording_flags);
+    return success;
+}
+
+/****f* conways_tile.c/c_main
+ *
+ * SUMMARY
+ *  This function is called at application start-up.
+ *  It is used to register event callbacks and begin the simulation.
+ *
+ * SYNOPSIS
+ *  int c_main()
+ *
+ * SOURCE
+ */
+void c_main(void) {
+    log_info("starting conways_tile");
+
+    // Load DTCM data
+    uint32_t timer_period;
+
+    // initialise the model
+    if (!initialize(&timer_period)) {
+        log_error("Error in initialisation - exiting!");
+        rt_error(RTE_SWERR);
+    }
+
+    // set timer tick value to configured value
+    log_info("setting timer to execute every %d microseconds", timer_period);
+    spin1_set_timer_tick(timer_period);
+
+    // register callbacks
+    spin1_callback_on(MCPL_PACKET_RECEIVED, receive_data, MC_PACKET);
+    spin1_callback_on(TIMER_TICK, update, TIMER);
+
+    // start execution
+    log_info("Starting\n");
+
+    // Start the time at "-1" so that the first tick will be 0
+    time = UINT32_MAX;
+
+    simulation_run();
+}
@@ -70,6 +70,10 @@ class HelloWorldVertex(
             get_recording_header_size(len(Channels)) +
             self._string_data_size)
 
+    @overrides(SimulatorVertex.get_data_specification_parameters)
+    def get_data_specification_parameters(self) -> object | None:
+        return self._string_data_size
+
     @overrides(MachineDataSpecableVertex.generate_machine_data_specification)
     def generate_machine_data_specification(
             self, spec: DataSpecificationGenerator, placement: Placement,
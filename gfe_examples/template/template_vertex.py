@@ -95,6 +95,10 @@ class TemplateVertex(
 
     # remember to override iptags and/or reverse_iptags if required
 
+    @overrides(SimulatorVertex.get_data_specification_parameters)
+    def get_data_specification_parameters(self) -> object | None:
+        return self._recording_size
+
     @overrides(MachineDataSpecableVertex.generate_machine_data_specification)
     def generate_machine_data_specification(
             self, spec: DataSpecificationGenerator, placement: Placement,
@@ -45,6 +45,21 @@ class TestScripts(ScriptChecker):
     def test_gfe_examples_hello_world_untimed_hello_world_vertex(self) -> None:
         self.check_script("gfe_examples/hello_world_untimed/hello_world_vertex.py")
 
+    def test_gfe_examples_Conways_conways_reference(self) -> None:
+        self.check_script("gfe_examples/Conways/conways_reference.py")
+
+    def test_gfe_examples_Conways_partitioned_example_c_tiles_conways_tiled(self) -> None:
+        self.check_script("gfe_examples/Conways/partitioned_example_c_tiles/conways_tiled.py")
+
+    def test_gfe_examples_Conways_partitioned_example_c_tiles_conways_tile(self) -> None:
+        self.check_script("gfe_examples/Conways/partitioned_example_c_tiles/conways_tile.py")
+
+    def test_gfe_examples_Conways_partitioned_example_c_tiles_conways_tile_splitter(self) -> None:
+        self.check_script("gfe_examples/Conways/partitioned_example_c_tiles/conways_tile_splitter.py")
+
+    def test_gfe_examples_Conways_partitioned_example_c_tiles_conways_board(self) -> None:
+        self.check_script("gfe_examples/Conways/partitioned_example_c_tiles/conways_board.py")
+
     def test_gfe_examples_Conways_partitioned_example_b_no_vis_buffer_conways_partitioned(self) -> None:
         self.check_script("gfe_examples/Conways/partitioned_example_b_no_vis_buffer/conways_partitioned.py")
 
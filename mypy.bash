@@ -27,4 +27,4 @@ spalloc="../spalloc/spalloc_client"
 fec="../SpiNNFrontEndCommon/spinn_front_end_common"
 test_base="../TestBase/spinnaker_testbase"
 
-mypy $utils $machine $man $pacman $spalloc $fec $test_base spinnaker_graph_front_end gfe_integration_tests gfe_examples
+mypy $utils $machine $man $pacman $spalloc $fec $test_base spinnaker_graph_front_end gfe_integration_tests gfe_examples gfe_benchmarks
@@ -34,4 +34,4 @@ else
     python3 -m pip install --upgrade mypy
 fi
 
-mypy --disallow-untyped-defs spinnaker_graph_front_end gfe_integration_tests gfe_examples
+mypy --disallow-untyped-defs spinnaker_graph_front_end gfe_integration_tests gfe_examples gfe_benchmarks
@@ -28,7 +28,7 @@ else
 fi
 
 echo ruff using ruff_ignore.toml
-ruff check spinnaker_graph_front_end gfe_examples gfe_integration_tests \
+ruff check spinnaker_graph_front_end gfe_examples gfe_integration_tests gfe_benchmarks \
      --target-version py310 --config ../SupportScripts/actions/ruff/ruff_ignore.toml --fix
 echo flake8
-flake8 spinnaker_graph_front_end gfe_examples gfe_integration_tests
\ No newline at end of file
+flake8 spinnaker_graph_front_end gfe_examples gfe_integration_tests gfe_benchmarks
\ No newline at end of file
@@ -42,74 +42,169 @@ The general usage pattern for this API something like is::
     gfe.stop()
 
     # Analyse/render the results; totally application-specific!
+    # Recordings can be read again later from the run directory, with
+    # gfe.open_recordings(run_dir)
 
 It is possible to use GFE-style vertices in a neural graph (e.g., to simulate
 the external world). Talk to the SpiNNaker team for more details.
 """
 
+import importlib
 import logging
 import os
 import sys
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Sequence
 from types import ModuleType
+from typing import TYPE_CHECKING, TypeVar
 
 from typing_extensions import Never
 
 from spinn_utilities.log import FormatAdapter
-from spinn_utilities.socket_address import SocketAddress
 
-from spinn_machine import Machine
-
-from pacman.model.graphs.application import ApplicationEdge, ApplicationVertex
-from pacman.model.graphs.machine import MachineEdge, MachineVertex
-from pacman.model.routing_info import RoutingInfo
-from pacman.model.tags import Tags
-
-from spinn_front_end_common.data import FecDataView
-from spinn_front_end_common.interface.buffer_management import BufferManager
-from spinn_front_end_common.utility_models import (
-    ReverseIpTagMultiCastSource as _RIPTMCS,
-)
-
-from spinnaker_graph_front_end import spinnaker as gfe_file
 from spinnaker_graph_front_end._version import (
     __version__,
     __version_month__,
     __version_name__,
     __version_year__,
 )
-from spinnaker_graph_front_end.spinnaker import SpiNNaker
+
+# Most of what the front end uses is imported when first needed, so that
+# importing it stays quick
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike
+
+    from spinn_utilities.socket_address import SocketAddress
+
+    from spinn_machine import Machine
+
+    from pacman.model.graphs import AbstractVertex
+    from pacman.model.graphs.application import (
+        ApplicationEdge, ApplicationVertex)
+    from pacman.model.graphs.machine import MachineEdge, MachineVertex
+    from pacman.model.routing_info import RoutingInfo
+    from pacman.model.tags import Tags
+
+    from spinn_front_end_common.data import FecDataView
+    from spinn_front_end_common.interface.buffer_management import (
+        BufferManager)
+
+    from spinnaker_graph_front_end.mapping_cache import MappingCache
+    from spinnaker_graph_front_end.phase_timings import PhaseTiming
+    from spinnaker_graph_front_end.recording_reader import open_recordings
+    from spinnaker_graph_front_end.reverse_ip_tag_multicast_source import (
+        ReverseIpTagMultiCastSource)
+    from spinnaker_graph_front_end.run_future import RunFuture
+    from spinnaker_graph_front_end.spinnaker import SpiNNaker
+    from spinnaker_graph_front_end.utilities import (
+        Boundary,
+        CompactEdgeStore,
+        Lattice,
+        Neighbourhood,
+    )
+    from spinnaker_graph_front_end.utilities.recordings import (
+        get_recordings,
+        iter_recordings,
+        stack_recordings,
+    )
 
 logger = FormatAdapter(logging.getLogger(__name__))
 
 
 __all__ = [
     'ReverseIpTagMultiCastSource',
+    'add_compact_edges',
     'add_edge_instance',
+    'add_lattice',
+    'add_machine_edges',
+    'add_machine_vertex_instances',
     'add_socket_address',
     'add_vertex_instance',
+    'add_vertex_instances',
     'buffer_manager',
+    'export_run_bundle',
     'get_number_of_available_cores_on_machine',
+    'get_recordings',
     'has_ran',
     'is_allocated_machine',
+    'iter_recordings',
+    'load_run_bundle',
     'machine',
+    'mapping_cache',
+    'open_recordings',
+    'phase_timings',
     'placements',
+    'reset',
     'routing_infos',
     'run',
+    'run_async',
+    'run_until_complete_async',
     'setup',
+    'stack_recordings',
     'stop',
 ]
 # Cache of the simulator created by setup
-__simulator: SpiNNaker | None = None
+__simulator: "SpiNNaker | None" = None
+# The future of the last run started in the background
+__run_future: "RunFuture | None" = None
+
+#: Type of the vertices in a bulk addition
+_V = TypeVar("_V", bound="AbstractVertex")
+#: Type of the vertices in a lattice
+_MV = TypeVar("_MV", bound="MachineVertex")
+
+#: The public attributes that are only imported when first used, with the
+#: module each is imported from
+_LAZY_ATTRIBUTES = {
+    "ReverseIpTagMultiCastSource":
+        "spinnaker_graph_front_end.reverse_ip_tag_multicast_source",
+    "get_recordings": "spinnaker_graph_front_end.utilities.recordings",
+    "iter_recordings": "spinnaker_graph_front_end.utilities.recordings",
+    "open_recordings": "spinnaker_graph_front_end.recording_reader",
+    "SpiNNaker": "spinnaker_graph_front_end.spinnaker",
+    "stack_recordings": "spinnaker_graph_front_end.utilities.recordings",
+}
+
+# Modules (rather than names in them) that are imported when first used
+_LAZY_MODULES = {
+    "gfe_file": "spinnaker_graph_front_end.spinnaker",
+}
+
+
+def __getattr__(name: str) -> object:
+    value: object
+    if name in _LAZY_MODULES:
+        value = importlib.import_module(_LAZY_MODULES[name])
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    else:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}")
+    # Later lookups find it without coming here again
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_LAZY_MODULES))
+
+
+def _data_view() -> "type[FecDataView]":
+    """
+    Get the view of the data of the simulation; FEC is imported the first
+    time this is called.
+    """
+    from spinn_front_end_common.data import FecDataView
+    return FecDataView
 
 
 def setup(model_binary_module: ModuleType | None = None,
           model_binary_folder: str | None = None,
-          database_socket_addresses: Iterable[SocketAddress] | None = (),
+          database_socket_addresses: "Iterable[SocketAddress] | None" = (),
           n_chips_required: int | None = None,
           n_boards_required: int | None = None,
           time_scale_factor: int | None = None,
-          *, timestep: int | None = None) -> None:
+          *, timestep: int | None = None,
+          allocate_in_background: bool | None = None) -> None:
     """
     Set up a graph, ready to have vertices and edges added to it, and the
     simulator engine that will execute the graph.
@@ -142,48 +237,83 @@ def setup(model_binary_module: ModuleType | None = None,
     :param timestep:
         the time step of the simulations in microseconds;
         if `None`, the configuration value is used
+    :param allocate_in_background:
+        whether to start getting a real machine (allocating and booting it)
+        in the background, so that the graph can be built meanwhile; the
+        first call that needs the machine waits for it. With spalloc or a
+        remote URL, ``n_boards_required`` or ``n_chips_required`` must be
+        given too. If `None`, the configuration value is used
     :raise ~spinn_front_end_common.utilities.exceptions.ConfigurationException:
         if mutually exclusive options are given.
     """
+    from spinnaker_graph_front_end.spinnaker import SpiNNaker
     # pylint: disable=global-statement
     global __simulator
     # pylint: disable=redefined-outer-name
     logger.info(
         "SpiNNaker graph front end (c) {}, University of Manchester",
         __version_year__)
-    parent_dir = os.path.split(os.path.split(gfe_file.__file__)[0])[0]
+    parent_dir = os.path.split(os.path.split(__file__)[0])[0]
     logger.info(
         "Release version {}({}) - {} {}. Installed in folder {}",
         __version__, __version_name__, __version_month__, __version_year__,
         parent_dir)
 
     # add the directories where the binaries are located
+    view = _data_view()
     if model_binary_module is not None:
         _file = model_binary_module.__file__
         assert _file is not None
-        FecDataView.register_binary_search_path(
-            os.path.dirname(_file))
+        view.register_binary_search_path(os.path.dirname(_file))
     elif model_binary_folder is not None:
-        FecDataView.register_binary_search_path(model_binary_folder)
+        view.register_binary_search_path(model_binary_folder)
     else:
         file_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
-        FecDataView.register_binary_search_path(file_dir)
+        view.register_binary_search_path(file_dir)
 
     # set up the spinnaker object; after this, _sim() returns this object
     __simulator = SpiNNaker(
         n_chips_required=n_chips_required,
         n_boards_required=n_boards_required,
         timestep=timestep,
-        time_scale_factor=time_scale_factor)
-    FecDataView.add_database_socket_addresses(database_socket_addresses)
+        time_scale_factor=time_scale_factor,
+        allocate_in_background=allocate_in_background)
+    view.add_database_socket_addresses(database_socket_addresses)
 
 
-def __get_simulator() -> SpiNNaker:
-    FecDataView.check_valid_simulator()
+def __get_simulator() -> "SpiNNaker":
+    _data_view().check_valid_simulator()
     assert __simulator is not None
     return __simulator
 
 
+def __check_no_background_run(action: str) -> None:
+    """
+    Check that no run started in the background is still going on.
+
+    :param action: What was about to be done, to say in the error
+    :raises ConfigurationException:
+        If a run started in the background has not finished
+    """
+    if __run_future is not None and not __run_future.done():
+        from spinn_front_end_common.utilities.exceptions import (
+            ConfigurationException)
+        raise ConfigurationException(
+            "Wait for the run going on in the background to finish before "
+            f"{action}")
+
+
+def _graph_view() -> "type[FecDataView]":
+    """
+    Get the view of the data of the simulation to change the graph through.
+
+    :raises ConfigurationException:
+        If a run started in the background has not finished
+    """
+    __check_no_background_run("changing the graph")
+    return _data_view()
+
+
 def run(duration: int | None = None) -> None:
     """
     Run a simulation for a number of microseconds.
@@ -191,6 +321,7 @@ def run(duration: int | None = None) -> None:
     :param duration:
         the number of microseconds the application code should run for
     """
+    __check_no_background_run("running again")
     __get_simulator().run(duration)
 
 
@@ -203,17 +334,73 @@ def run_until_complete(n_steps: int | None = None) -> None:
         requested to run for the given number of steps.  The host will
         still wait until the simulation itself says it has completed
     """
+    __check_no_background_run("running again")
     __get_simulator().run_until_complete(n_steps)
 
 
+def __start_run(run: Callable[[], None],
+                stop: Callable[[], None] | None) -> "RunFuture":
+    from spinnaker_graph_front_end.run_future import start_run
+    # pylint: disable=global-statement
+    global __run_future
+    __check_no_background_run("running again")
+    __run_future = start_run(run, stop)
+    return __run_future
+
+
+def run_async(duration: int | None = None) -> "RunFuture":
+    """
+    Start running a simulation for a number of microseconds in the
+    background, as :py:func:`run` does, and return at once.
+
+    The future finishes when the run does, and raises whatever the run
+    raised. It can be waited for with a timeout, or awaited in
+    :py:mod:`asyncio`. A run for ever is stopped by :py:func:`stop_run` or
+    by cancelling the future.
+
+    :param duration:
+        the number of microseconds the application code should run for
+    :return: The future of the run
+    """
+    simulator = __get_simulator()
+    return __start_run(
+        lambda: simulator.run(duration),
+        simulator.stop_run if duration is None else None)
+
+
+def run_until_complete_async(n_steps: int | None = None) -> "RunFuture":
+    """
+    Start running until the simulation is complete in the background, as
+    :py:func:`run_until_complete` does, and return at once.
+
+    :param n_steps:
+        If not ``None``, this specifies that the simulation should be
+        requested to run for the given number of steps.  The host will
+        still wait until the simulation itself says it has completed
+    :return: The future of the run
+    """
+    simulator = __get_simulator()
+    return __start_run(
+        lambda: simulator.run_until_complete(n_steps), None)
+
+
 def stop() -> None:
     """
     Do any necessary cleaning up before exiting. Unregisters the controller.
     """
-    # pylint: disable=global-variable-undefined
+    __check_no_background_run("stopping")
     __get_simulator().stop()
 
 
+def reset() -> None:
+    """
+    Reset the simulation to the start of time, so that the next run starts
+    again from timestep zero. The graph may be changed before it.
+    """
+    __check_no_background_run("resetting")
+    __get_simulator().reset()
+
+
 def stop_run() -> None:
     """
     Stop a request to run forever.
@@ -221,21 +408,72 @@ def stop_run() -> None:
     __get_simulator().stop_run()
 
 
-def add_vertex_instance(vertex_to_add: ApplicationVertex) -> None:
+def add_vertex_instance(vertex_to_add: "ApplicationVertex") -> None:
     """
     Add an existing application vertex to the unpartitioned graph.
 
     :param vertex_to_add:
         vertex instance to add to the graph
     """
-    FecDataView.add_vertex(vertex_to_add)
+    _graph_view().add_vertex(vertex_to_add)
+
+
+def add_vertex_instances(
+        vertices_to_add: "Iterable[ApplicationVertex]") -> None:
+    """
+    Add several existing application vertices to the unpartitioned graph.
+
+    All the vertices are checked before any of them is added, so a bad
+    vertex part way through leaves the graph as it was.
+
+    :param vertices_to_add:
+        vertex instances to add to the graph, in the order to add them
+    :raises ~pacman.exceptions.PacmanInvalidParameterException:
+        If any of the vertices is not an ApplicationVertex
+    :raises ~pacman.exceptions.PacmanAlreadyExistsException:
+        If a vertex appears more than once or is already in the
+        graph
+    """
+    from pacman.model.graphs.application import ApplicationVertex
+    vertices = _check_new_vertices(vertices_to_add, ApplicationVertex)
+    view = _graph_view()
+    view.check_valid_simulator()
+    for vertex in vertices:
+        view.add_vertex(vertex)
+
+
+def _check_new_vertices(
+        vertices: Iterable[_V], vertex_type: type[_V]) -> list[_V]:
+    """
+    Check, in a single pass, that a batch of vertices can be added.
+
+    :param vertices: The vertices about to be added
+    :param vertex_type: The type each of the vertices must have
+    :return: The vertices as a list, in their original order
+    """
+    from pacman.exceptions import (
+        PacmanAlreadyExistsException, PacmanInvalidParameterException)
+    checked: list[_V] = list()
+    seen: set[_V] = set()
+    for vertex in vertices:
+        if not isinstance(vertex, vertex_type):
+            raise PacmanInvalidParameterException(
+                "vertex", str(vertex.__class__),
+                f"Only a {vertex_type.__name__} can be added")
+        # A vertex already in the graph would only be rejected once the
+        # vertices before it had been added
+        if vertex in seen or vertex.has_been_added_to_graph():
+            raise PacmanAlreadyExistsException("vertex", vertex.label)
+        seen.add(vertex)
+        checked.append(vertex)
+    return checked
 
 
 def _new_edge_label() -> str:
-    return f"Edge {FecDataView.get_next_none_labelled_edge_number()}"
+    return f"Edge {_data_view().get_next_none_labelled_edge_number()}"
 
 
-def add_edge_instance(edge: ApplicationEdge, partition_id: str) -> None:
+def add_edge_instance(edge: "ApplicationEdge", partition_id: str) -> None:
     """
     Add an edge to the unpartitioned graph.
 
@@ -244,20 +482,49 @@ def add_edge_instance(edge: ApplicationEdge, partition_id: str) -> None:
     :param partition_id:
         The ID of the partition that the edge belongs to.
     """
-    FecDataView.add_edge(edge, partition_id)
+    _graph_view().add_edge(edge, partition_id)
 
 
-def add_machine_vertex_instance(machine_vertex: MachineVertex) -> None:
+def add_machine_vertex_instance(machine_vertex: "MachineVertex") -> None:
     """
     Add a machine vertex instance to the graph.
 
     :param machine_vertex:
         The vertex to add
     """
-    FecDataView.add_machine_vertex(machine_vertex)
+    _graph_view().add_machine_vertex(machine_vertex)
+    # So that adding it again in a batch is refused before anything is added
+    machine_vertex.set_added_to_graph()
 
 
-def add_machine_edge_instance(edge: MachineEdge, partition_id: str) -> None:
+def add_machine_vertex_instances(
+        machine_vertices: "Iterable[MachineVertex]") -> None:
+    """
+    Add several machine vertex instances to the graph.
+
+    This is equivalent to calling :py:func:`add_machine_vertex_instance`
+    for each vertex, but all the vertices are checked before any of them
+    is added, so a bad vertex part way through leaves the graph as it was.
+
+    :param machine_vertices:
+        The vertices to add, in the order to add them
+    :raises ~pacman.exceptions.PacmanInvalidParameterException:
+        If any of the vertices is not a MachineVertex
+    :raises ~pacman.exceptions.PacmanAlreadyExistsException:
+        If a vertex appears more than once or is already in the
+        graph
+    """
+    from pacman.model.graphs.machine import MachineVertex
+    view = _graph_view()
+    view.check_valid_simulator()
+    vertices = _check_new_vertices(machine_vertices, MachineVertex)
+    for vertex in vertices:
+        view.add_machine_vertex(vertex)
+        vertex.set_added_to_graph()
+
+
+def add_machine_edge_instance(
+        edge: "MachineEdge", partition_id: str) -> None:
     """
     Add a machine edge instance to the graph.
 
@@ -266,7 +533,119 @@ def add_machine_edge_instance(edge: MachineEdge, partition_id: str) -> None:
     :param partition_id:
         The ID of the partition that the edge belongs to.
     """
-    FecDataView.add_machine_edge(edge, partition_id)
+    _graph_view().add_machine_edge(edge, partition_id)
+
+
+def add_machine_edges(
+        vertices: "Sequence[MachineVertex]", pre_indices: "ArrayLike",
+        post_indices: "ArrayLike", partition_id: str,
+        labeller: Callable[[int], str] | None = None) -> None:
+    """
+    Add a batch of machine edges to the graph, described by two arrays of
+    indices into a sequence of (already added) vertices.
+
+    Edge *i* goes from ``vertices[pre_indices[i]]`` to
+    ``vertices[post_indices[i]]``.
+    The indices are all checked before any edge is added.
+
+    :param vertices:
+        The vertices that the indices refer to
+    :param pre_indices:
+        For each edge, the index of the vertex at its start
+    :param post_indices:
+        For each edge, the index of the vertex at its end
+    :param partition_id:
+        The ID of the partition that the edges belong to.
+    :param labeller:
+        Makes the label of an edge from the edge's position in the arrays;
+        only called if the label is needed.
+        If `None`, the edges have no labels.
+    :raises ~pacman.exceptions.PacmanInvalidParameterException:
+        If the indices are not integers, are out of range or the two arrays
+        are different lengths
+    """
+    from spinnaker_graph_front_end.utilities import IndexedMachineEdge
+    from spinnaker_graph_front_end.utilities.compact_edge_store import (
+        check_edge_indices)
+    pre, post = check_edge_indices(len(vertices), pre_indices, post_indices)
+    view = _graph_view()
+    view.check_valid_simulator()
+    for index, (pre_index, post_index) in enumerate(
+            zip(pre.tolist(), post.tolist())):
+        view.add_machine_edge(
+            IndexedMachineEdge(
+                vertices[pre_index], vertices[post_index], index, labeller),
+            partition_id)
+
+
+def add_compact_edges(store: "CompactEdgeStore") -> None:
+    """
+    Add all the edges held in a compact edge store to the graph.
+
+    The vertices of the store must already have been added to the graph.
+    Each edge is handed over as a view made from the store's index arrays
+    as it is added.
+
+    .. note::
+        The graph keeps each edge it is given as an object of its own, as
+        it does for edges added one at a time, so once added the edges
+        take as much memory as any others, less their labels; this does
+        not lower the peak memory use of mapping.
+        The store only saves memory while the edges are being worked out,
+        and for anything that uses the store itself instead of the graph;
+        ``gfe_benchmarks/compact_edge_memory.py`` measures both.
+
+    :param store: The edges to add
+    """
+    view = _graph_view()
+    view.check_valid_simulator()
+    for partition_id in store.partition_ids:
+        for edge in store.iterate_edges(partition_id):
+            view.add_machine_edge(edge, partition_id)
+
+
+def add_lattice(
+        vertex_factory: Callable[[int, int], _MV], shape: tuple[int, int],
+        partition_id: str,
+        neighbourhood: "Neighbourhood | ArrayLike | None" = None,
+        boundary: "Boundary | None" = None,
+        labeller: Callable[[int], str] | None = None) -> "Lattice[_MV]":
+    """
+    Build a 2D lattice of machine vertices, each with edges to its
+    neighbours, and add it to the graph.
+
+    The vertices are made by calling ``vertex_factory(x, y)`` for each cell,
+    and the edges are worked out with array operations and added in bulk.
+    Each vertex that is an
+    :py:class:`~spinnaker_graph_front_end.utilities.AbstractLatticeVertex`
+    is then given the list of vertices that send to it.
+
+    :param vertex_factory: Makes the vertex for the cell at (x, y)
+    :param shape: The (width, height) of the lattice
+    :param partition_id: The ID of the partition that the edges belong to.
+    :param neighbourhood:
+        A standard neighbourhood, or a sequence of (dx, dy) offsets;
+        by default the Moore neighbourhood
+    :param boundary:
+        What to do at the edges of the lattice; by default it wraps
+    :param labeller:
+        Makes the label of an edge from its index in the lattice's edge
+        arrays; only called if the label is needed.
+    :return: The lattice, for looking up vertices by position
+    """
+    from spinnaker_graph_front_end.utilities import (
+        Boundary, Lattice, Neighbourhood)
+    __check_no_background_run("changing the graph")
+    lattice = Lattice.build(
+        vertex_factory, shape,
+        Neighbourhood.MOORE if neighbourhood is None else neighbourhood,
+        Boundary.WRAP if boundary is None else boundary)
+    add_machine_vertex_instances(lattice.vertices)
+    add_machine_edges(
+        lattice.vertices, lattice.pre_indices, lattice.post_indices,
+        partition_id, labeller)
+    lattice.set_neighbours()
+    return lattice
 
 
 def add_socket_address(database_ack_port_num: int | None,
@@ -282,7 +661,7 @@ def add_socket_address(database_ack_port_num: int | None,
     :param database_notify_port_num:
         port that the external device will be notified on.
     """
-    FecDataView.add_database_socket_port(
+    _graph_view().add_database_socket_port(
         database_ack_port_num, database_notify_host, database_notify_port_num)
 
 
@@ -298,14 +677,14 @@ def has_ran() -> bool:
     """
     :returns: True if and only if the simulation has already run.
     """
-    return FecDataView.is_ran_ever()
+    return _data_view().is_ran_ever()
 
 
-def routing_infos() -> RoutingInfo:
+def routing_infos() -> "RoutingInfo":
     """
     :returns: The information about how messages are routed on the machine.
     """
-    return FecDataView.get_routing_infos()
+    return _data_view().get_routing_infos()
 
 
 def placements() -> Never:
@@ -332,21 +711,21 @@ def placements() -> Never:
         "https://spinnakermanchester.github.io/common_pages/GlobalData.html")
 
 
-def tags() -> Tags:
+def tags() -> "Tags":
     """
     :returns: The IPTAGs allocated on the machine.
     """
-    return FecDataView.get_tags()
+    return _data_view().get_tags()
 
 
-def buffer_manager() -> BufferManager:
+def buffer_manager() -> "BufferManager":
     """
     :returns: The buffer manager being used for loading/extracting buffers.
     """
-    return FecDataView.get_buffer_manager()
+    return _data_view().get_buffer_manager()
 
 
-def machine() -> Machine:
+def machine() -> "Machine":
     """
     :returns: The model of the attached/allocated machine.
     """
@@ -359,16 +738,53 @@ def machine() -> Machine:
     return __get_simulator().get_machine()
 
 
-def is_allocated_machine() -> bool:
+def mapping_cache() -> "MappingCache | None":
     """
-    :return: True if and only if a machine is allocated.
+    :returns: The on-disk cache of the placements and tags of mappings,
+        which also counts its hits, misses and evictions; `None` if the
+        cache is turned off. Routing is not cached.
+    """
+    return __get_simulator().mapping_cache
+
+
+def export_run_bundle(directory: str) -> None:
+    """
+    Write what the last run loaded onto the machine into a directory, as a
+    run bundle that :py:func:`load_run_bundle` can run again.
+
+    :param directory: Where to write the bundle; must not already exist or
+        must be empty
+    """
+    __get_simulator().export_run_bundle(directory)
+
+
+def load_run_bundle(directory: str) -> None:
+    """
+    Run a run bundle written by :py:func:`export_run_bundle` instead of a
+    graph. Call after :py:func:`setup` and before :py:func:`run`, without
+    adding any vertices; the run then loads the bundle without mapping or
+    generating any data.
+
+    :param directory: The directory of the bundle
     """
-    return FecDataView.has_machine()
+    __check_no_background_run("loading a run bundle")
+    __get_simulator().load_run_bundle(directory)
+
 
+def phase_timings() -> "list[PhaseTiming]":
+    """
+    Get how long each phase and algorithm of every run so far took.
+    Steps timed by the graph front end also have the CPU time they took
+    and the number of bytes and objects they handled.
 
-class ReverseIpTagMultiCastSource(_RIPTMCS):
+    :returns: The timings, in the order the algorithms ran
     """
-    For full documentation see
-    :py:class:`~spinn_front_end_common.utility_models.ReverseIpTagMultiCastSource`.
+    from spinnaker_graph_front_end.phase_timings import get_phase_timings
+    return get_phase_timings()
+
+
+def is_allocated_machine() -> bool:
+    """
+    :return: True if and only if a machine is allocated.
     """
-    __slots__ = ()
+    return _data_view().has_machine()
@@ -0,0 +1,301 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Keeping a spalloc job between a stop and the next setup.
+
+The job is recorded in a session file.
+Whoever reattaches to the job claims the file by renaming it, so that no
+one else can also use or destroy the job.
+
+While the process that kept the job runs, spinnman keeps the job alive,
+until the idle timeout runs out and the job is destroyed.
+Once that process ends, spalloc only holds the job until the keepalive
+interval it was created with runs out, so a later process can only reuse
+it within that interval.
+"""
+
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+
+from spinn_utilities.log import FormatAdapter
+
+from spinnman.spalloc import SpallocClient, SpallocJob
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+# The jobs kept by this process, and the timers that destroy them, by token
+_kept_jobs: dict[str, tuple[SpallocJob, threading.Timer]] = {}
+_kept_lock = threading.Lock()
+
+
+class BoardSession(object):
+    """
+    A spalloc job kept for reuse, and what it was allocated for.
+    """
+
+    __slots__ = ("_cookies", "_expires", "_headers", "_job_url", "_request",
+                 "_service_url", "_token")
+
+    def __init__(
+            self, service_url: str, job_url: str, cookies: dict[str, str],
+            headers: dict[str, str], request: dict[str, str | int | None],
+            expires: float, token: str | None = None):
+        """
+        :param service_url: The URL of the spalloc service
+        :param job_url: The URL of the job, ending in a ``/``
+        :param cookies: The cookies of the session the job was made in
+        :param headers: The headers of the session the job was made in
+        :param request: What the job was allocated for; it is only reused
+            for the same request
+        :param expires: When to destroy the job if it has not been reused,
+            as a :py:func:`time.time`
+        :param token: Identifies this keeping of the job; a new one is made
+            if not given
+        """
+        self._service_url = service_url
+        self._job_url = job_url
+        self._cookies = dict(cookies)
+        self._headers = dict(headers)
+        self._request = dict(request)
+        self._expires = expires
+        self._token = token if token is not None else secrets.token_hex(8)
+
+    @property
+    def service_url(self) -> str:
+        """
+        The URL of the spalloc service.
+        """
+        return self._service_url
+
+    @property
+    def job_url(self) -> str:
+        """
+        The URL of the job.
+        """
+        return self._job_url
+
+    @property
+    def cookies(self) -> dict[str, str]:
+        """
+        The cookies of the session the job was made in.
+        """
+        return dict(self._cookies)
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """
+        The headers of the session the job was made in.
+        """
+        return dict(self._headers)
+
+    @property
+    def request(self) -> dict[str, str | int | None]:
+        """
+        What the job was allocated for.
+        """
+        return dict(self._request)
+
+    @property
+    def expires(self) -> float:
+        """
+        When the job is destroyed if it has not been reused.
+        """
+        return self._expires
+
+    @property
+    def expired(self) -> bool:
+        """
+        Whether the idle timeout of the job has run out.
+        """
+        return time.time() >= self._expires
+
+    @property
+    def token(self) -> str:
+        """
+        Identifies this keeping of the job.
+        """
+        return self._token
+
+    def to_json(self) -> str:
+        """
+        :return: The session as JSON, as stored in the session file
+        """
+        return json.dumps({
+            "service_url": self._service_url, "job_url": self._job_url,
+            "cookies": self._cookies, "headers": self._headers,
+            "request": self._request, "expires": self._expires,
+            "token": self._token})
+
+    @classmethod
+    def from_json(cls, text: str) -> "BoardSession":
+        """
+        :param text: A session as made by :py:meth:`to_json`
+        :return: The session
+        :raises ValueError: If the text is not a session
+        """
+        try:
+            data = json.loads(text)
+            return cls(
+                data["service_url"], data["job_url"], data["cookies"],
+                data["headers"], data["request"], float(data["expires"]),
+                data["token"])
+        except (KeyError, TypeError) as ex:
+            raise ValueError(f"Not a board session: {ex}") from ex
+
+    def __str__(self) -> str:
+        return f"BoardSession({self._job_url})"
+
+
+def save_session(path: str, session: BoardSession) -> None:
+    """
+    Write a session file, replacing any there was.
+
+    The file holds the session cookies, so only its owner can read it.
+
+    :param path: The session file
+    :param session: The session to keep
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                      0o600), "w", encoding="utf-8") as f:
+        f.write(session.to_json())
+    os.replace(temp_path, path)
+
+
+def read_session(path: str) -> BoardSession | None:
+    """
+    Read a session file without claiming it.
+
+    :param path: The session file
+    :return: The session, or `None` if there is no readable session file
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            return BoardSession.from_json(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def _take_session_file(path: str) -> BoardSession | None:
+    claimed_path = f"{path}.{os.getpid()}.claimed"
+    try:
+        os.replace(path, claimed_path)
+    except OSError:
+        return None
+    session = read_session(claimed_path)
+    os.remove(claimed_path)
+    return session
+
+
+def claim_session(path: str) -> BoardSession | None:
+    """
+    Take the session out of the session file, so that no one else can.
+
+    A session whose idle timeout has run out is destroyed instead.
+
+    :param path: The session file
+    :return: The session, or `None` if there is no session to reuse
+    """
+    session = _take_session_file(path)
+    if session is not None and session.expired:
+        destroy_job(session, "idle timeout")
+        return None
+    return session
+
+
+def destroy_job(session: BoardSession, reason: str) -> None:
+    """
+    Destroy the job, logging rather than raising if that fails, as the job
+    is then gone or will be once its keepalive runs out.
+
+    :param session: The session of the job
+    :param reason: Why the job is destroyed
+    """
+    job = take_kept_job(session.token)
+    try:
+        if job is None:
+            job = SpallocClient.open_job_from_database(
+                session.service_url, session.job_url, session.cookies,
+                session.headers)
+        job.destroy(reason)
+    except Exception as ex:  # pylint: disable=broad-except
+        logger.warning("Could not destroy the kept job {}: {}",
+                       session.job_url, ex)
+
+
+def keep_job(path: str, session: BoardSession, job: SpallocJob) -> None:
+    """
+    Record a job in the session file for the next setup, in this process or
+    a later one, to reuse.
+    The job is destroyed when the idle timeout of the session runs out,
+    unless it has been reused by then.
+
+    :param path: The session file
+    :param session: The session of the job
+    :param job: The job, which spinnman keeps alive until it is destroyed
+    """
+    timer = threading.Timer(
+        max(0.0, session.expires - time.time()), _expire,
+        (path, session.token))
+    timer.daemon = True
+    with _kept_lock:
+        _kept_jobs[session.token] = (job, timer)
+    save_session(path, session)
+    timer.start()
+
+
+def take_kept_job(token: str) -> SpallocJob | None:
+    """
+    Take back a job kept by this process, so that it is not destroyed when
+    its idle timeout runs out.
+
+    :param token: The token of the session of the job
+    :return: The job, or `None` if this process did not keep it
+    """
+    with _kept_lock:
+        kept = _kept_jobs.pop(token, None)
+    if kept is None:
+        return None
+    job, timer = kept
+    timer.cancel()
+    return job
+
+
+def _expire(path: str, token: str) -> None:
+    """
+    Destroy a job kept by this process once its idle timeout has run out,
+    unless it has been reused.
+
+    :param path: The session file
+    :param token: The token of the session of the job
+    """
+    session = _take_session_file(path)
+    if session is None:
+        # Claimed, here or by another process, which now looks after the job
+        return
+    if session.token != token:
+        # Replaced, so no one else can reuse this job; put the other back
+        save_session(path, session)
+    job = take_kept_job(token)
+    if job is not None:
+        try:
+            job.destroy("idle timeout")
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.warning("Could not destroy the kept job {}: {}", job, ex)
@@ -0,0 +1,235 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Running a mapped graph on the host instead of on SpiNNaker.
+"""
+
+import logging
+from collections import defaultdict
+
+import numpy
+from numpy.typing import NDArray
+
+from spinn_utilities.log import FormatAdapter
+
+from pacman.model.graphs import AbstractVertex
+from pacman.model.graphs.application import ApplicationVertex
+from pacman.model.graphs.machine import MachineVertex
+
+from spinn_front_end_common.data import FecDataView
+from spinn_front_end_common.interface.buffer_management.buffer_models import (
+    AbstractReceiveBuffersToHost,
+)
+from spinn_front_end_common.interface.buffer_management.storage_objects \
+    import BufferDatabase
+
+from spinnaker_graph_front_end.utilities.emulated_vertex import (
+    WORD, AbstractEmulatedVertex, EmulatedCore)
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+#: A route: the key and mask it matches, and the indices of the target cores
+_Route = tuple[int, int, NDArray[numpy.intp]]
+
+
+def _machine_sources(
+        sources: list[AbstractVertex], partition_id: str
+        ) -> list[MachineVertex]:
+    machine_sources: list[MachineVertex] = []
+    for source in sources:
+        if isinstance(source, ApplicationVertex):
+            machine_sources.extend(
+                source.splitter.get_out_going_vertices(partition_id))
+        elif isinstance(source, MachineVertex):
+            machine_sources.append(source)
+    return machine_sources
+
+
+def _targets() -> dict[tuple[MachineVertex, str], set[MachineVertex]]:
+    """
+    Work out where the packets from each machine partition go, as the
+    router would.
+
+    :return: The target vertices of each source vertex and partition ID
+    """
+    targets: dict[tuple[MachineVertex, str], set[MachineVertex]] = \
+        defaultdict(set)
+    for partition in FecDataView.iterate_partitions():
+        pre = partition.pre_vertex
+        for edge in partition.edges:
+            for target, sources in edge.post_vertex.splitter.\
+                    get_source_specific_in_coming_vertices(
+                        pre, partition.identifier):
+                for source in _machine_sources(
+                        list(sources), partition.identifier):
+                    targets[source, partition.identifier].add(target)
+    for app_vertex in FecDataView.iterate_vertices():
+        for m_partition in \
+                app_vertex.splitter.get_internal_multicast_partitions():
+            for m_edge in m_partition.edges:
+                targets[m_partition.pre_vertex, m_partition.identifier].add(
+                    m_edge.post_vertex)
+    return targets
+
+
+class HostEmulator(object):
+    """
+    Runs the vertices of a mapped graph on the host, one timestep at a
+    time.
+
+    Each vertex that is an
+    :py:class:`~spinnaker_graph_front_end.utilities.AbstractEmulatedVertex`
+    is stepped in placement order.
+    The multicast packets sent on a timestep are delivered on the next one
+    to the targets that the routing keys of the partitions of their sender
+    lead to.
+    At the end of each run, what the vertices recorded is stored where the
+    buffer manager reads the recordings of the machine from.
+    """
+
+    __slots__ = ("_cores", "_inboxes", "_n_dropped", "_routes")
+
+    def __init__(self) -> None:
+        placements = sorted(
+            FecDataView.iterate_placements_by_vertex_type(
+                AbstractEmulatedVertex),
+            key=lambda pl: (pl.x, pl.y, pl.p))
+        self._cores = [EmulatedCore(placement) for placement in placements]
+        index = {placement.vertex: i for i, placement in enumerate(placements)}
+
+        n_not_emulated = FecDataView.get_n_placements() - len(placements)
+        if n_not_emulated:
+            logger.warning(
+                "{} placed vertices cannot be emulated on the host and will "
+                "do nothing", n_not_emulated)
+
+        routing_infos = FecDataView.get_routing_infos()
+        self._routes: list[list[_Route]] = [[] for _ in self._cores]
+        for (source, partition_id), targets in _targets().items():
+            target_indices = sorted(
+                index[target] for target in targets if target in index)
+            if source not in index or not target_indices:
+                continue
+            info = routing_infos.get_info_from(source, partition_id)
+            self._routes[index[source]].append(
+                (info.key, info.mask,
+                 numpy.array(target_indices, dtype=numpy.intp)))
+
+        empty = numpy.zeros(0, dtype=WORD)
+        self._inboxes: list[tuple[NDArray[numpy.uint32],
+                                  NDArray[numpy.uint32]]] = [
+            (empty, empty) for _ in self._cores]
+        self._n_dropped = 0
+
+        for core in self._cores:
+            self.__vertex(core).emulation_start(core)
+
+    @staticmethod
+    def __vertex(core: EmulatedCore) -> AbstractEmulatedVertex:
+        vertex = core.placement.vertex
+        assert isinstance(vertex, AbstractEmulatedVertex)
+        return vertex
+
+    @property
+    def n_dropped(self) -> int:
+        """
+        The number of packets sent with keys that no route matched.
+        """
+        return self._n_dropped
+
+    def run(self, first_step: int, end_step: int | None) -> int:
+        """
+        Run the vertices for some timesteps, then pause them.
+
+        :param first_step: The first timestep to run
+        :param end_step:
+            The timestep to stop before, or `None` to run until a stop is
+            requested
+        :return: The timestep that the run stopped before
+        """
+        n_dropped = self._n_dropped
+        timestep = first_step
+        while (timestep < end_step if end_step is not None
+               else not FecDataView.is_stop_already_requested()):
+            for core, (keys, payloads) in zip(self._cores, self._inboxes):
+                self.__vertex(core).emulation_step(
+                    core, timestep, keys, payloads)
+            self.__deliver()
+            timestep += 1
+        for core in self._cores:
+            self.__vertex(core).emulation_pause(core)
+        if self._n_dropped > n_dropped:
+            logger.warning(
+                "{} packets were dropped as no route matched their keys",
+                self._n_dropped - n_dropped)
+        return timestep
+
+    def __deliver(self) -> None:
+        received_keys: list[list[NDArray[numpy.uint32]]] = [
+            [] for _ in self._cores]
+        received_payloads: list[list[NDArray[numpy.uint32]]] = [
+            [] for _ in self._cores]
+        for core, routes in zip(self._cores, self._routes):
+            keys, payloads = core.take_sent()
+            if not len(keys):
+                continue
+            routed = numpy.zeros(len(keys), dtype=numpy.bool_)
+            for key, mask, targets in routes:
+                matched = (keys & mask) == key
+                if not matched.any():
+                    continue
+                routed |= matched
+                for target in targets:
+                    received_keys[target].append(keys[matched])
+                    received_payloads[target].append(payloads[matched])
+            self._n_dropped += int(numpy.count_nonzero(~routed))
+
+        empty = numpy.zeros(0, dtype=WORD)
+        self._inboxes = [
+            (numpy.concatenate(keys), numpy.concatenate(payloads))
+            if keys else (empty, empty)
+            for keys, payloads in zip(received_keys, received_payloads)]
+
+    @property
+    def n_cores(self) -> int:
+        """
+        The number of cores being emulated.
+        """
+        return len(self._cores)
+
+    def store_recordings(self) -> int:
+        """
+        Store what the vertices recorded in the last run as an extraction
+        of the recorded data.
+
+        :return: The number of bytes stored
+        """
+        n_bytes = 0
+        with BufferDatabase() as db:
+            db.start_new_extraction()
+            for core in self._cores:
+                recordings = core.take_recordings()
+                vertex = core.placement.vertex
+                recording_ids = set(recordings)
+                if isinstance(vertex, AbstractReceiveBuffersToHost):
+                    recording_ids.update(vertex.get_recorded_region_ids())
+                placement = core.placement
+                for recording_id in sorted(recording_ids):
+                    data = recordings.get(recording_id, b"")
+                    db.store_recording(
+                        placement.x, placement.y, placement.p, recording_id,
+                        False, data)
+                    n_bytes += len(data)
+        return n_bytes
@@ -0,0 +1,161 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Getting the machine in the background while the graph is built.
+"""
+
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from spinn_utilities.typing.coords import XY
+    from spinn_machine import Machine
+    from spinnman.spalloc import MachineAllocationController
+    from spinnman.transceiver import Transceiver
+
+#: Type of what the allocation gets
+T = TypeVar("T")
+
+
+class AllocatedMachine(object):
+    """
+    A machine got without telling the simulation about it, so that the
+    simulation can take it on in its own thread once it is needed.
+    """
+
+    __slots__ = ("_connections", "_controller", "_ipaddress", "_machine",
+                 "_transceiver")
+
+    def __init__(
+            self, ipaddress: str, transceiver: "Transceiver",
+            machine: "Machine",
+            controller: "MachineAllocationController | None" = None,
+            connections: "dict[XY, str] | None" = None):
+        """
+        :param ipaddress: The IP address of the Ethernet chip at 0, 0
+        :param transceiver: How to talk to the machine
+        :param machine: The machine, as the transceiver found it
+        :param controller: What controls the allocation, if it was allocated
+        :param connections:
+            The addresses of the boards, if the allocation said what they
+            are
+        """
+        self._ipaddress = ipaddress
+        self._transceiver = transceiver
+        self._machine = machine
+        self._controller = controller
+        self._connections = connections
+
+    @property
+    def ipaddress(self) -> str:
+        """
+        The IP address of the Ethernet chip at 0, 0.
+        """
+        return self._ipaddress
+
+    @property
+    def transceiver(self) -> "Transceiver":
+        """
+        How to talk to the machine.
+        """
+        return self._transceiver
+
+    @property
+    def machine(self) -> "Machine":
+        """
+        The machine, as the transceiver found it.
+        """
+        return self._machine
+
+    @property
+    def controller(self) -> "MachineAllocationController | None":
+        """
+        What controls the allocation, if it was allocated.
+        """
+        return self._controller
+
+    @property
+    def connections(self) -> "dict[XY, str] | None":
+        """
+        The addresses of the boards, if the allocation said what they are.
+        """
+        return self._connections
+
+
+class BackgroundAllocation(Generic[T]):
+    """
+    Runs the allocation (and boot) of a machine in a thread of its own, so
+    that the caller can carry on until it needs the machine.
+    """
+
+    __slots__ = ("_allocation_time", "_future", "_wait_time")
+
+    def __init__(self, allocate: Callable[[], T]):
+        """
+        :param allocate: Allocates the machine; called once, in the thread
+        """
+        self._allocation_time: float | None = None
+        self._wait_time = 0.0
+        executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="gfe-allocation")
+        self._future: Future[T] = executor.submit(self._allocate, allocate)
+        # The thread ends once the allocation is done
+        executor.shutdown(wait=False)
+
+    def _allocate(self, allocate: Callable[[], T]) -> T:
+        start = time.perf_counter()
+        try:
+            return allocate()
+        finally:
+            self._allocation_time = time.perf_counter() - start
+
+    @property
+    def done(self) -> bool:
+        """
+        Whether the allocation has finished, whether or not it worked.
+        """
+        return self._future.done()
+
+    @property
+    def allocation_time(self) -> float | None:
+        """
+        How many seconds the allocation took, or `None` if not finished.
+        """
+        return self._allocation_time
+
+    @property
+    def wait_time(self) -> float:
+        """
+        How many seconds have been spent waiting for the allocation.
+        """
+        return self._wait_time
+
+    def wait(self, timeout: float | None = None) -> T:
+        """
+        Wait for the allocation to finish.
+
+        :param timeout: The most seconds to wait, or `None` to wait for as
+            long as it takes
+        :return: What the allocation got
+        :raises TimeoutError: If the timeout runs out first
+        :raises Exception: Whatever the allocation raised
+        """
+        start = time.perf_counter()
+        try:
+            return self._future.result(timeout)
+        finally:
+            self._wait_time += time.perf_counter() - start
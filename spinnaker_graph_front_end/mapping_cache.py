@@ -0,0 +1,351 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+An on-disk cache of the results of mapping, so that running an unchanged
+graph on an unchanged machine does not have to place it again.
+
+Only the placements and tags are cached; routing is still done in full.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from collections.abc import Sequence
+
+from spinn_utilities.config_holder import get_config_str
+from spinn_utilities.log import FormatAdapter
+
+from spinn_machine.tags import IPTag, ReverseIPTag
+
+from pacman.model.graphs import AbstractVertex
+from pacman.model.graphs.machine import MachineVertex
+from pacman.model.placements import Placement, Placements
+from pacman.model.tags import Tags
+
+from spinn_front_end_common.data import FecDataView
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+
+from ._version import __version__ as version
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+#: The file extension of a cache entry
+_EXTENSION = ".mapping"
+
+# Change this if the format of an entry changes
+_FORMAT = 1
+
+
+def mapping_vertices(system_placements: Placements) -> list[MachineVertex]:
+    """
+    Get the vertices that a cache entry refers to by index.
+
+    These are the machine vertices of the graph, in graph order, followed
+    by the vertices placed by the system before the placer runs.
+
+    :param system_placements: The placements made by the system
+    :return: The vertices in index order
+    """
+    vertices = list(FecDataView.iterate_machine_vertices())
+    vertices.extend(placement.vertex
+                    for placement in system_placements.placements)
+    return vertices
+
+
+def mapping_fingerprint(system_placements: Placements) -> str:
+    """
+    Work out a hash of everything that placement and tag allocation
+    depend on.
+
+    This covers the structure of the graph, the resources each machine
+    vertex asks for, the machine, the system placements and the placer
+    configuration.
+    Vertices are identified by their index in graph order, as the entry
+    refers to them, so labels play no part; a graph rebuilt in a different
+    order gets a different fingerprint.
+    The edges of an application graph are between application vertices,
+    which are indexed after the machine vertices.
+
+    :param system_placements: The placements made by the system
+    :return: The hex digest of the fingerprint
+    """
+    digest = hashlib.sha256()
+
+    def add(*values: object) -> None:
+        digest.update(repr(values).encode())
+
+    add(_FORMAT, version, get_config_str("Mapping", "placer"))
+    index: dict[AbstractVertex, int] = {}
+    for vertex in FecDataView.iterate_machine_vertices():
+        index[vertex] = len(index)
+        sdram = vertex.sdram_required
+        add(type(vertex).__qualname__, sdram.fixed, sdram.per_timestep,
+            vertex.get_fixed_location(), list(vertex.iptags),
+            list(vertex.reverse_iptags))
+    for app_vertex in FecDataView.iterate_vertices():
+        index[app_vertex] = len(index)
+        add(type(app_vertex).__qualname__, app_vertex.n_atoms,
+            app_vertex.get_fixed_location())
+    for partition in FecDataView.iterate_partitions():
+        add(index[partition.pre_vertex], partition.identifier,
+            [index[edge.post_vertex] for edge in partition.edges])
+    for chip in FecDataView.get_machine().chips:
+        add(chip.x, chip.y, chip.n_placable_processors, chip.sdram,
+            chip.ip_address, sorted(link.source_link_id
+                                    for link in chip.router.links))
+    for placement in system_placements.placements:
+        add(type(placement.vertex).__qualname__, placement.x, placement.y,
+            placement.p)
+    return digest.hexdigest()
+
+
+class CachedMapping(object):
+    """
+    The placements and tags of a mapping, with the vertices replaced by
+    their index in :py:func:`mapping_vertices`.
+    """
+
+    __slots__ = ("_ip_tags", "_placements", "_reverse_ip_tags")
+
+    def __init__(
+            self, placements: Sequence[tuple[int, int, int, int]],
+            ip_tags: Sequence[tuple[int, tuple]],
+            reverse_ip_tags: Sequence[tuple[int, tuple]]):
+        """
+        :param placements: (vertex index, x, y, p) of each placement
+        :param ip_tags: (vertex index, IPTag arguments) of each IP tag
+        :param reverse_ip_tags:
+            (vertex index, ReverseIPTag arguments) of each reverse IP tag
+        """
+        self._placements = placements
+        self._ip_tags = ip_tags
+        self._reverse_ip_tags = reverse_ip_tags
+
+    @classmethod
+    def from_data(cls, vertices: Sequence[MachineVertex]) -> "CachedMapping":
+        """
+        Make an entry from the current placements and tags.
+
+        :param vertices: The vertices in index order
+        :return: The entry
+        """
+        index = {vertex: i for i, vertex in enumerate(vertices)}
+        n_graph = FecDataView.get_n_machine_vertices()
+        placements = [
+            (index[placement.vertex], placement.x, placement.y, placement.p)
+            for placement in FecDataView.iterate_placemements()
+            if index.get(placement.vertex, n_graph) < n_graph]
+        tags = FecDataView.get_tags()
+        ip_tags = list()
+        reverse_ip_tags = list()
+        for i, vertex in enumerate(vertices):
+            for ip_tag in tags.get_ip_tags_for_vertex(vertex) or ():
+                ip_tags.append((i, (
+                    ip_tag.board_address, ip_tag.destination_x,
+                    ip_tag.destination_y, ip_tag.tag, ip_tag.ip_address,
+                    ip_tag.port, ip_tag.strip_sdp,
+                    ip_tag.traffic_identifier)))
+            for r_tag in tags.get_reverse_ip_tags_for_vertex(vertex) or ():
+                reverse_ip_tags.append((i, (
+                    r_tag.board_address, r_tag.tag, r_tag.port,
+                    r_tag.destination_x, r_tag.destination_y,
+                    r_tag.destination_p, r_tag.sdp_port)))
+        return cls(placements, ip_tags, reverse_ip_tags)
+
+    def placements(self, vertices: Sequence[MachineVertex],
+                   system_placements: Placements) -> Placements:
+        """
+        Rebuild the placements.
+
+        :param vertices: The vertices in index order
+        :param system_placements: The placements made by the system
+        :return: The system placements plus the cached placements
+        """
+        placements = Placements(system_placements.placements)
+        placements.add_placements(
+            Placement(vertices[i], x, y, p)
+            for i, x, y, p in self._placements)
+        return placements
+
+    def tags(self, vertices: Sequence[MachineVertex]) -> Tags:
+        """
+        Rebuild the tags.
+
+        :param vertices: The vertices in index order
+        :return: The cached tags
+        """
+        tags = Tags()
+        for i, args in self._ip_tags:
+            tags.add_ip_tag(IPTag(*args), vertices[i])
+        for i, args in self._reverse_ip_tags:
+            tags.add_reverse_ip_tag(ReverseIPTag(*args), vertices[i])
+        return tags
+
+
+def _check_private(directory: str) -> None:
+    """
+    Check that only the user can write to a directory.
+
+    :param directory: The directory to check
+    :raises ConfigurationException: If someone else could write to it
+    """
+    # Neither owners nor modes mean this on Windows
+    if not hasattr(os, "getuid"):
+        return
+    stat = os.stat(directory)
+    if stat.st_uid != os.getuid() or stat.st_mode & 0o022:
+        raise ConfigurationException(
+            f"The mapping cache directory {directory} can be written to by "
+            "other users, who could then run code as you through it; make "
+            "it private or use another directory")
+
+
+class MappingCache(object):
+    """
+    A directory of cached mappings, one file per fingerprint.
+
+    When the files take up more than the allowed space, the least recently
+    used ones are deleted.
+
+    .. warning::
+        Entries are pickled, and loading a pickle can run any code that
+        whoever wrote it chose, so the directory must only be writable by
+        the user. Where the platform can tell, a directory that anyone
+        else could write to is refused.
+    """
+
+    __slots__ = ("_directory", "_evictions", "_hits", "_max_bytes",
+                 "_misses")
+
+    def __init__(self, directory: str, max_bytes: int):
+        """
+        :param directory: Where to keep the cache; made if needed, only
+            accessible by the user
+        :param max_bytes: The most space the cache may use on disk
+        :raises ConfigurationException:
+            If the directory is not private to the user
+        """
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        _check_private(directory)
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def directory(self) -> str:
+        """
+        The directory the cache is kept in.
+        """
+        return self._directory
+
+    @property
+    def hits(self) -> int:
+        """
+        The number of lookups that found an entry.
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        The number of lookups that did not find an entry.
+        """
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """
+        The number of entries deleted to keep within the size limit.
+        """
+        return self._evictions
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, key + _EXTENSION)
+
+    def load(self, key: str) -> CachedMapping | None:
+        """
+        Look up an entry, marking it as recently used if found.
+
+        An entry that cannot be read is treated as missing.
+
+        :param key: The fingerprint of the mapping
+        :return: The entry, or `None` if there is no usable entry
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+            os.utime(path)
+        except FileNotFoundError:
+            entry = None
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Ignoring unreadable mapping cache entry {}", path)
+            entry = None
+        if not isinstance(entry, CachedMapping):
+            self._misses += 1
+            return None
+        self._hits += 1
+        return entry
+
+    def store(self, key: str, entry: CachedMapping) -> None:
+        """
+        Save an entry, then evict old entries if the cache is too big.
+
+        :param key: The fingerprint of the mapping
+        :param entry: The entry to save
+        """
+        handle, temp = tempfile.mkstemp(dir=self._directory)
+        with os.fdopen(handle, "wb") as f:
+            pickle.dump(entry, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(temp, self._path(key))
+        self.evict(keep=key)
+
+    def evict(self, keep: str | None = None) -> int:
+        """
+        Delete the least recently used entries until the cache fits in its
+        size limit.
+
+        :param keep: The fingerprint of an entry never to delete
+        :return: The number of entries deleted
+        """
+        entries = list()
+        for name in os.listdir(self._directory):
+            if name.endswith(_EXTENSION):
+                stat = os.stat(os.path.join(self._directory, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        deleted = 0
+        for _, size, name in sorted(entries):
+            if total <= self._max_bytes:
+                break
+            if name == f"{keep}{_EXTENSION}":
+                continue
+            os.remove(os.path.join(self._directory, name))
+            total -= size
+            deleted += 1
+        self._evictions += deleted
+        return deleted
+
+    def clear(self) -> None:
+        """
+        Delete every entry.
+        """
+        for name in os.listdir(self._directory):
+            if name.endswith(_EXTENSION):
+                os.remove(os.path.join(self._directory, name))
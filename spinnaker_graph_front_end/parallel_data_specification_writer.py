@@ -0,0 +1,368 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Generation of data specifications shared out over a pool of worker
+processes, and remembered between runs.
+"""
+
+import hashlib
+import logging
+import multiprocessing
+import os
+import sqlite3
+import time
+from collections import defaultdict
+from typing import Any, cast
+
+from spinn_utilities.config_holder import (
+    get_config_str, get_report_path, set_config)
+from spinn_utilities.log import FormatAdapter
+from spinn_utilities.progress_bar import ProgressBar
+
+from pacman.model.graphs import AbstractVertex
+from pacman.model.graphs.machine import MachineVertex
+from pacman.model.placements import Placement
+
+from spinn_front_end_common.abstract_models import (
+    AbstractGeneratesDataSpecification,
+    AbstractHasAssociatedBinary,
+    AbstractRewritesDataSpecification,
+)
+from spinn_front_end_common.data import FecDataView
+from spinn_front_end_common.interface.ds import DsSqlliteDatabase
+from spinn_front_end_common.interface.interface_functions import (
+    graph_data_specification_writer)
+
+from spinnaker_graph_front_end.utilities import SimulatorVertex
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+#: The name of the report of how long each phase took
+TIMINGS_REPORT = "data_specification_timings.rpt"
+
+#: What the data specification of a core holds: its regions, as (region
+#: number, size, reference, label, content, content debug), and its
+#: references to the regions of other cores, as (region number, reference,
+#: label)
+_CoreRows = tuple[list[tuple[Any, ...]], list[tuple[Any, ...]]]
+
+# The placements of each worker; set before the workers are forked so that
+# they inherit it, and so that no vertex has to be pickled
+_shards: list[list[Placement]] = []
+
+_REGIONS = """
+    SELECT region_num, size, reference_num, region_label, content,
+        content_debug
+    FROM region
+    WHERE x = ? AND y = ? AND p = ?
+    ORDER BY rowid
+    """
+
+_REFERENCES = """
+    SELECT region_num, reference_num, ref_label
+    FROM reference
+    WHERE x = ? AND y = ? AND p = ?
+    ORDER BY rowid
+    """
+
+
+def _read_core(ds_db: DsSqlliteDatabase, placement: Placement) -> _CoreRows:
+    """
+    :param ds_db: The database to read from
+    :param placement: The placement of the core
+    :return: What the data specification of the core holds
+    """
+    xyp = (placement.x, placement.y, placement.p)
+    return ([_row(row) for row in ds_db.cursor().execute(_REGIONS, xyp)],
+            [_row(row) for row in ds_db.cursor().execute(_REFERENCES, xyp)])
+
+
+def _row(row: sqlite3.Row) -> tuple[Any, ...]:
+    # Blobs may be read as memory views, which cannot be sent between
+    # processes
+    return tuple(bytes(value) if isinstance(value, memoryview) else value
+                 for value in row)
+
+
+def _write_core(ds_db: DsSqlliteDatabase, placement: Placement,
+                rows: _CoreRows) -> None:
+    """
+    Write the data specification of a core, as the writer of FEC would.
+
+    :param ds_db: The database to write to
+    :param placement: The placement of the core
+    :param rows: What the data specification of the core holds
+    """
+    x, y, p = placement.x, placement.y, placement.p
+    ds_db.set_core(
+        x, y, p, cast(AbstractHasAssociatedBinary, placement.vertex))
+    regions, references = rows
+    for region_num, size, reference, label, content, debug in regions:
+        ds_db.set_memory_region(x, y, p, region_num, size, reference, label)
+        if content is not None:
+            ds_db.set_region_content(x, y, p, region_num, content, debug)
+    for region_num, reference, label in references:
+        ds_db.set_reference(x, y, p, region_num, reference, label)
+
+
+def _generate_shard(shard: int) -> list[_CoreRows]:
+    """
+    Generate the data specifications of the placements of one worker with
+    the writer of FEC, into a database of the worker's own, so that each
+    data specification is checked just as the serial writer checks it.
+    As the placements are sharded by chip, the SDRAM of each chip and the
+    references between its cores are all checked in one worker.
+
+    :param shard: Which of the shards to generate
+    :return: What the data specification of each placement holds, in order
+    """
+    placements = _shards[shard]
+    option = get_config_str("Reports", "path_dataspec_database")
+    set_config("Reports", "path_dataspec_database",
+               f"ds(reset_str)_shard{shard}.sqlite3")
+    try:
+        path = get_report_path("path_dataspec_database")
+        try:
+            graph_data_specification_writer(placements)
+            with DsSqlliteDatabase(path) as ds_db:
+                return [_read_core(ds_db, placement)
+                        for placement in placements]
+        finally:
+            if os.path.exists(path):
+                os.remove(path)
+    finally:
+        set_config("Reports", "path_dataspec_database", option)
+
+
+class DataSpecificationCache(object):
+    """
+    Remembers the data specification of each vertex between runs, with a
+    digest of what it was made from, so that it need not be generated
+    again if the digest has not changed.
+
+    Only :py:class:`~spinnaker_graph_front_end.utilities.SimulatorVertex`
+    vertices that say what parameters their data specification depends on
+    are remembered.
+
+    .. note::
+        Data specifications are only written when FEC needs them generated
+        again: on the first run, after a reset and after a change to the
+        graph.
+        Each of these loads the data of every core onto the machine again,
+        so what is saved is the time taken to generate the reused
+        specifications, not that of writing or loading them.
+        Changes between runs without a reset are made by vertices that are
+        :py:class:`~spinn_front_end_common.abstract_models.AbstractRewritesDataSpecification`,
+        without writing data specifications at all.
+    """
+
+    __slots__ = ("_entries", "_n_reused")
+
+    def __init__(self) -> None:
+        self._entries: dict[MachineVertex, tuple[str, _CoreRows]] = {}
+        self._n_reused = 0
+
+    @property
+    def n_reused(self) -> int:
+        """
+        The number of data specifications reused by the last write.
+        """
+        return self._n_reused
+
+    @staticmethod
+    def digest(placement: Placement) -> str | None:
+        """
+        Work out a digest of the inputs to the data specification of a
+        placed vertex: where it is placed, its routing keys and tags, the
+        timing of the simulation and the parameters of the vertex.
+
+        :param placement: The placement of the vertex
+        :return: The digest, or `None` if the vertex cannot be cached
+        """
+        vertex = placement.vertex
+        if not isinstance(vertex, SimulatorVertex):
+            return None
+        parameters = vertex.get_data_specification_parameters()
+        if parameters is None:
+            return None
+        routing_infos = FecDataView.get_routing_infos()
+        keys = []
+        sources: list[AbstractVertex] = [vertex]
+        if vertex.app_vertex is not None:
+            sources.append(vertex.app_vertex)
+        for source in sources:
+            try:
+                for partition_id in sorted(
+                        routing_infos.get_partitions_from(source)):
+                    info = routing_infos.get_info_from(source, partition_id)
+                    keys.append((partition_id, info.key, info.mask))
+            except KeyError:
+                pass
+        tags = FecDataView.get_tags()
+        inputs = (
+            type(vertex).__qualname__, vertex.label,
+            placement.x, placement.y, placement.p, keys,
+            tags.get_ip_tags_for_vertex(vertex),
+            tags.get_reverse_ip_tags_for_vertex(vertex),
+            FecDataView.get_max_run_time_steps(),
+            FecDataView.get_simulation_time_step_us(),
+            FecDataView.get_time_scale_factor(), parameters)
+        return hashlib.sha256(repr(inputs).encode()).hexdigest()
+
+    def get(self, vertex: MachineVertex,
+            digest: str | None) -> _CoreRows | None:
+        """
+        :param vertex: The vertex to look up
+        :param digest: The digest of the inputs of the vertex now
+        :return: The remembered data specification of the vertex, or `None` if
+            there are none or they were made from different inputs
+        """
+        if digest is None or vertex not in self._entries:
+            return None
+        old_digest, rows = self._entries[vertex]
+        return rows if old_digest == digest else None
+
+    def replace(self, entries: dict[MachineVertex, tuple[str, _CoreRows]],
+                n_reused: int) -> None:
+        """
+        Replace all the remembered data specifications.
+
+        :param entries: The digest and data specification of each vertex
+        :param n_reused: How many of them were reused rather than generated
+        """
+        self._entries = entries
+        self._n_reused = n_reused
+
+
+def parallel_data_specification_writer(
+        n_workers: int,
+        spec_cache: DataSpecificationCache | None = None) -> str:
+    """
+    Generate the data specifications of every placed vertex, optionally
+    using a pool of worker processes, and write them into the data
+    specification database.
+
+    With more than one worker, the placements are sharded by chip, so all
+    the cores of a chip are generated by the same worker.
+    Each worker generates its placements with the writer of FEC into a
+    database of its own, which checks them as the serial writer does.
+    The results are written to the database in placement order whichever
+    worker finishes first, so the database is the same as the one
+    the serial writer makes.
+    The workers are forked, so they see the graph as it is when this is
+    called, but any changes a vertex makes to itself while generating are
+    lost.
+    Where processes cannot be forked, the data specifications are generated
+    in this process instead.
+
+    With a cache, the placements on a chip are not generated again if none
+    of their inputs have changed since the last write; their remembered
+    specifications are written instead.
+    If any placement on a chip has changed, the whole chip is generated
+    again, so that its SDRAM is checked as a whole.
+    The database still holds every placement, as it is loaded in full.
+
+    A report of how long each phase took is written to the run folder.
+
+    :param n_workers:
+        The number of worker processes to use; 1 to generate in this process
+    :param spec_cache:
+        Where to remember data specifications between writes, if anywhere
+    :return: Path to DSG targets database
+    :raises ConfigurationException:
+        If the DSG asks to use more SDRAM than is available.
+    """
+    timings: dict[str, float] = {}
+    start = time.perf_counter()
+    placements = [
+        placement for placement in FecDataView.iterate_placemements()
+        if isinstance(placement.vertex, AbstractGeneratesDataSpecification)]
+    digests: list[str | None] = [None] * len(placements)
+    rows_of: list[_CoreRows | None] = [None] * len(placements)
+    if spec_cache is not None:
+        for i, placement in enumerate(placements):
+            digests[i] = spec_cache.digest(placement)
+            rows_of[i] = spec_cache.get(placement.vertex, digests[i])
+        timings["digest"] = time.perf_counter() - start
+    changed = {(placements[i].x, placements[i].y)
+               for i, rows in enumerate(rows_of) if rows is None}
+    to_generate = [i for i, placement in enumerate(placements)
+                   if (placement.x, placement.y) in changed]
+    n_reused = len(placements) - len(to_generate)
+
+    if n_workers > 1 and "fork" not in multiprocessing.get_all_start_methods():
+        logger.warning(
+            "Data specifications generated in this process as processes"
+            " cannot be forked on this platform")
+        n_workers = 1
+
+    start = time.perf_counter()
+    by_chip: dict[tuple[int, int], list[int]] = defaultdict(list)
+    for i in to_generate:
+        by_chip[placements[i].x, placements[i].y].append(i)
+    sharded: list[list[int]] = [[] for _ in range(n_workers)]
+    for i, chip in enumerate(sorted(by_chip)):
+        sharded[i % n_workers].extend(by_chip[chip])
+    _shards[:] = [[placements[i] for i in shard] for shard in sharded]
+    try:
+        if n_workers > 1:
+            context = multiprocessing.get_context("fork")
+            with context.Pool(n_workers) as pool:
+                shard_results = pool.map(_generate_shard, range(n_workers))
+        else:
+            shard_results = [_generate_shard(0)]
+    finally:
+        _shards.clear()
+    for shard, results in zip(sharded, shard_results):
+        for i, generated in zip(shard, results):
+            rows_of[i] = generated
+    timings["generate"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    path = get_report_path("path_dataspec_database")
+    with DsSqlliteDatabase(path) as ds_db:
+        ds_db.write_session_credentials_to_db()
+        ds_db.set_info()
+        progress = ProgressBar(
+            len(placements), "Writing data specifications in order")
+        for placement, rows in progress.over(zip(placements, rows_of)):
+            _write_core(ds_db, placement, rows or ([], []))
+    timings["merge"] = time.perf_counter() - start
+
+    for placement in placements:
+        if isinstance(placement.vertex, AbstractRewritesDataSpecification):
+            placement.vertex.set_reload_required(False)
+
+    if spec_cache is not None:
+        spec_cache.replace({
+            placement.vertex: (digest, rows or ([], []))
+            for placement, digest, rows in zip(placements, digests, rows_of)
+            if digest is not None}, n_reused)
+
+    _write_timings(n_workers, len(placements), n_reused, timings)
+    return path
+
+
+def _write_timings(n_workers: int, n_placements: int, n_reused: int,
+                   timings: dict[str, float]) -> None:
+    report = os.path.join(FecDataView.get_run_dir_path(), TIMINGS_REPORT)
+    with open(report, "w", encoding="utf-8") as f:
+        f.write(f"Data specifications of {n_placements} cores written;"
+                f" {n_placements - n_reused} generated by {n_workers}"
+                f" workers and {n_reused} reused\n")
+        for phase, seconds in timings.items():
+            f.write(f"{phase}: {seconds:.6f}s\n")
+    logger.info("Data specification phases: {}", ", ".join(
+        f"{phase} {seconds:.3f}s" for phase, seconds in timings.items()))
@@ -0,0 +1,339 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Structured timings of the phases and algorithms of each run, read from the
+global provenance database.
+"""
+
+import json
+import logging
+import os
+import time
+from collections import defaultdict
+from datetime import timedelta
+from sqlite3 import DatabaseError
+
+from spinn_utilities.config_holder import get_timestamp_path
+from spinn_utilities.log import FormatAdapter
+from spinn_utilities.overrides import overrides
+
+from spinn_front_end_common.interface.provenance import (
+    FecTimer, GlobalProvenance, TimerWork)
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+#: The measures of a :py:class:`PhaseTimer` beyond the wall time, by the ID
+#: of the timing in the ``timer_provenance`` table
+_MEASURES_DDL = """
+    CREATE TABLE IF NOT EXISTS gfe_timer_measures(
+        timer_id INTEGER PRIMARY KEY,
+        cpu_time FLOAT NOT NULL,
+        n_bytes INTEGER,
+        n_objects INTEGER)
+    """
+
+# The global provenance databases known to have the measures table
+_measured_databases: set[str] = set()
+
+
+class PhaseTimer(FecTimer):
+    """
+    A :py:class:`~spinn_front_end_common.interface.provenance.FecTimer`
+    that also measures the CPU time this process takes, and can be told how
+    many bytes the algorithm moved and how many objects it handled.
+    """
+
+    __slots__ = ("_cpu_start", "_n_bytes", "_n_objects")
+
+    def __init__(self, algorithm: str, work: TimerWork):
+        """
+        :param algorithm: Name of algorithm being timed
+        :param work: Type of work being timed
+        """
+        super().__init__(algorithm, work)
+        self._cpu_start = time.process_time()
+        self._n_bytes: int | None = None
+        self._n_objects: int | None = None
+
+    @overrides(FecTimer.__enter__)
+    def __enter__(self) -> "PhaseTimer":
+        self._cpu_start = time.process_time()
+        super().__enter__()
+        return self
+
+    def add_bytes(self, n_bytes: int) -> None:
+        """
+        Count bytes moved by the algorithm.
+
+        :param n_bytes: The number of bytes
+        """
+        self._n_bytes = (self._n_bytes or 0) + n_bytes
+
+    def add_objects(self, n_objects: int) -> None:
+        """
+        Count objects (vertices, placements, cores...) handled by the
+        algorithm.
+
+        :param n_objects: The number of objects
+        """
+        self._n_objects = (self._n_objects or 0) + n_objects
+
+    @overrides(FecTimer._insert_timing)
+    def _insert_timing(
+            self, time_taken: timedelta, skip_reason: str | None) -> None:
+        cpu_time = (time.process_time() - self._cpu_start) * 1000.0
+        if self._category_id is None:
+            return
+        database_file = GlobalProvenance.get_global_provenace_path()
+        # As with the tables of FEC, made when the database is
+        created = not os.path.exists(database_file)
+        try:
+            with GlobalProvenance(database_file) as db:
+                db.insert_timing(
+                    self._category_id, self._algorithm, self._work,
+                    time_taken, skip_reason)
+                timer_id = db.lastrowid
+                if created or database_file not in _measured_databases:
+                    db.cursor().execute(_MEASURES_DDL)
+                    _measured_databases.add(database_file)
+                db.cursor().execute(
+                    """
+                    INSERT INTO gfe_timer_measures(
+                        timer_id, cpu_time, n_bytes, n_objects)
+                    VALUES(?, ?, ?, ?)
+                    """,
+                    [timer_id, cpu_time, self._n_bytes, self._n_objects])
+        except DatabaseError as ex:
+            logger.error(f"Timer data error {ex}")
+
+
+class PhaseTiming(object):
+    """
+    The timing of one algorithm of a phase of a run.
+    """
+
+    __slots__ = (
+        "_algorithm", "_category", "_cpu_time_ms", "_machine_on", "_n_bytes",
+        "_n_loop", "_n_objects", "_n_reset", "_n_run", "_skip_reason",
+        "_wall_time_ms", "_work")
+
+    def __init__(
+            self, category: str, algorithm: str, work: str, machine_on: bool,
+            wall_time_ms: float, cpu_time_ms: float | None,
+            n_bytes: int | None, n_objects: int | None, n_run: int,
+            n_loop: int | None, n_reset: int, skip_reason: str | None):
+        """
+        :param category: The phase the algorithm ran in
+        :param algorithm: The name of the algorithm
+        :param work: The type of work the algorithm did
+        :param machine_on: Whether the machine was on
+        :param wall_time_ms: The elapsed time the algorithm took
+        :param cpu_time_ms: The CPU time the algorithm took, if measured
+        :param n_bytes: The bytes the algorithm moved, if counted
+        :param n_objects: The objects the algorithm handled, if counted
+        :param n_run: The number of the run
+        :param n_loop: The number of the loop of an auto-paused run
+        :param n_reset: The number of resets before the run
+        :param skip_reason: Why the algorithm was skipped or failed, if it
+            was
+        """
+        self._category = category
+        self._algorithm = algorithm
+        self._work = work
+        self._machine_on = bool(machine_on)
+        self._wall_time_ms = wall_time_ms
+        self._cpu_time_ms = cpu_time_ms
+        self._n_bytes = n_bytes
+        self._n_objects = n_objects
+        self._n_run = n_run
+        self._n_loop = n_loop
+        self._n_reset = n_reset
+        self._skip_reason = skip_reason
+
+    @property
+    def category(self) -> str:
+        """
+        The phase the algorithm ran in, such as ``Mapping Stage``.
+        """
+        return self._category
+
+    @property
+    def algorithm(self) -> str:
+        """
+        The name of the algorithm.
+        """
+        return self._algorithm
+
+    @property
+    def work(self) -> str:
+        """
+        The type of work the algorithm did, such as ``Loading Data``.
+        """
+        return self._work
+
+    @property
+    def machine_on(self) -> bool:
+        """
+        Whether the machine was on while the phase ran.
+        """
+        return self._machine_on
+
+    @property
+    def wall_time_ms(self) -> float:
+        """
+        The elapsed time the algorithm took, in milliseconds.
+        """
+        return self._wall_time_ms
+
+    @property
+    def cpu_time_ms(self) -> float | None:
+        """
+        The CPU time of this process the algorithm took, in milliseconds,
+        or `None` if it was not measured.
+        """
+        return self._cpu_time_ms
+
+    @property
+    def n_bytes(self) -> int | None:
+        """
+        The bytes the algorithm moved, or `None` if they were not counted.
+        """
+        return self._n_bytes
+
+    @property
+    def n_objects(self) -> int | None:
+        """
+        The objects the algorithm handled, or `None` if they were not
+        counted.
+        """
+        return self._n_objects
+
+    @property
+    def n_run(self) -> int:
+        """
+        The number of the run, counting from 1.
+        """
+        return self._n_run
+
+    @property
+    def n_loop(self) -> int | None:
+        """
+        The number of the loop of an auto-paused run, if in one.
+        """
+        return self._n_loop
+
+    @property
+    def n_reset(self) -> int:
+        """
+        The number of resets before the run.
+        """
+        return self._n_reset
+
+    @property
+    def skip_reason(self) -> str | None:
+        """
+        Why the algorithm was skipped or failed, or `None` if it ran.
+        """
+        return self._skip_reason
+
+    def as_dict(self) -> dict[str, object]:
+        """
+        Get the timing as a dictionary, as written to the JSON report.
+
+        :return: The value of each property, by name
+        """
+        return {name[1:]: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return (f"PhaseTiming({self._category!r}, {self._algorithm!r}, "
+                f"{self._wall_time_ms} ms)")
+
+
+def get_phase_timings(
+        database_file: str | None = None) -> list[PhaseTiming]:
+    """
+    Get the timings of every algorithm of every run so far, in the order
+    they ran.
+
+    :param database_file:
+        The global provenance database to read; by default the one of the
+        current simulation
+    :return: The timings
+    """
+    with GlobalProvenance(database_file) as db:
+        rows = db.run_query(
+            """
+            SELECT timer_id, category, algorithm, work, machine_on,
+                time_taken, n_run, n_loop, n_reset, skip_reason
+            FROM full_timer_view
+            ORDER BY timer_id
+            """)
+        # Only made once something has been measured
+        measures: dict[
+            int, tuple[float | None, int | None, int | None]] = {}
+        if db.run_query(
+                """
+                SELECT name FROM sqlite_master
+                WHERE type = 'table' AND name = 'gfe_timer_measures'
+                """):
+            for timer_id, cpu_time, n_bytes, n_objects in db.run_query(
+                    """
+                    SELECT timer_id, cpu_time, n_bytes, n_objects
+                    FROM gfe_timer_measures
+                    """):
+                measures[timer_id] = (cpu_time, n_bytes, n_objects)
+    return [
+        PhaseTiming(
+            category, algorithm, work, machine_on, time_taken,
+            *measures.get(timer_id, (None, None, None)),
+            n_run, n_loop, n_reset, skip_reason)
+        for (timer_id, category, algorithm, work, machine_on, time_taken,
+             n_run, n_loop, n_reset, skip_reason) in rows]
+
+
+def get_phase_totals(timings: list[PhaseTiming]) -> dict[str, float]:
+    """
+    Add up the wall time of the algorithms of each phase.
+
+    :param timings: The timings, as from :py:func:`get_phase_timings`
+    :return: The total wall time in milliseconds of each phase
+    """
+    totals: dict[str, float] = defaultdict(float)
+    for timing in timings:
+        totals[timing.category] += timing.wall_time_ms
+    return dict(totals)
+
+
+def write_phase_timings(
+        path: str | None = None, database_file: str | None = None) -> str:
+    """
+    Write the timings of every run so far as JSON.
+
+    :param path:
+        Where to write them; by default ``tpath_phase_timings`` in the
+        report folder of the simulation
+    :param database_file:
+        The global provenance database to read; by default the one of the
+        current simulation
+    :return: The path written to
+    """
+    if path is None:
+        path = get_timestamp_path("tpath_phase_timings")
+    timings = get_phase_timings(database_file)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "timings": [timing.as_dict() for timing in timings],
+            "totals_ms": get_phase_totals(timings)}, f, indent=1)
+    return path
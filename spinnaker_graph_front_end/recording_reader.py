@@ -0,0 +1,224 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Reading the recordings of a run that is over, from its run directory,
+without a machine or the graph that made them.
+"""
+
+import os
+import re
+
+from numpy.typing import NDArray
+
+from spinn_front_end_common.interface.buffer_management.storage_objects \
+    import BufferDatabase
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+
+from spinnaker_graph_front_end.recording_store import (
+    INDEX, RECORDINGS_DIRECTORY, ChannelDescription, RecordingStore,
+    recordings_directory)
+from spinnaker_graph_front_end.utilities.simulator_vertex import (
+    packed_recording_array, recording_array)
+
+#: By default, the most bytes of recordings to keep mapped into memory
+DEFAULT_RAM_BUDGET = 256 * 1024 * 1024
+
+# What a core recorded in a channel after the extractions in the store
+_UNSPILLED = """
+    SELECT content, missing_data
+    FROM recording_region_view NATURAL JOIN recording_data
+    WHERE x = ? AND y = ? AND processor = ? AND local_region_index = ?
+        AND extraction_id > ?
+    ORDER BY extraction_id
+    """
+
+
+class RunRecordings(object):
+    """
+    The recordings of a run, read from the recording store of its run
+    directory. Nothing is read until a channel is asked for, and then only
+    that channel is mapped into memory.
+
+    Anything the run extracted but did not spill into the store is read
+    from the buffer database of the run instead; if that was not kept, what
+    was not spilled is reported as lost. Nothing in the run directory is
+    changed by reading it.
+    """
+
+    __slots__ = ("_by_core", "_by_label", "_store")
+
+    def __init__(self, directory: str,
+                 ram_budget: int = DEFAULT_RAM_BUDGET):
+        """
+        :param directory: The directory of the recording store
+        :param ram_budget: The most bytes to keep mapped into memory
+        :raises ConfigurationException: If there is no store there
+        """
+        if not os.path.isfile(os.path.join(directory, INDEX)):
+            raise ConfigurationException(
+                f"{directory} is not the recordings of a run")
+        self._store = RecordingStore(directory, ram_budget, read_only=True)
+        self._by_core: dict[
+            tuple[int, int, int, int], ChannelDescription] = {}
+        self._by_label: dict[str, list[tuple[int, int, int]]] = {}
+        for description in self._store.get_descriptions():
+            x, y, p, channel, label = description[:5]
+            self._by_core[x, y, p, channel] = description
+            if label is not None:
+                cores = self._by_label.setdefault(label, [])
+                if (x, y, p) not in cores:
+                    cores.append((x, y, p))
+
+    @property
+    def directory(self) -> str:
+        """
+        The directory of the recording store.
+        """
+        return self._store.directory
+
+    @property
+    def labels(self) -> list[str]:
+        """
+        The labels of the vertices that recorded anything.
+        """
+        return sorted(self._by_label)
+
+    def get_cores(self, label: str) -> list[tuple[int, int, int]]:
+        """
+        Get where the vertices with a label were placed.
+
+        :param label: The label of the vertex
+        :return: The X and Y coordinates of the chip and the processor ID
+            of each core; more than one if the label is not unique
+        :raises KeyError: If no vertex with the label recorded anything
+        """
+        return list(self._by_label[label])
+
+    def get_channels(self, x: int, y: int, p: int) -> list[int]:
+        """
+        Get the channels that a core recorded in.
+
+        :param x: The X coordinate of the chip of the core
+        :param y: The Y coordinate of the chip of the core
+        :param p: The processor ID of the core
+        :return: The recording channels, in order
+        """
+        return sorted(channel for (cx, cy, cp, channel) in self._by_core
+                      if (cx, cy, cp) == (x, y, p))
+
+    def get(self, label: str, channel: int) -> tuple[NDArray, bool]:
+        """
+        Get what the vertex with a label recorded in a channel.
+
+        :param label: The label of the vertex
+        :param channel: Which recording channel
+        :return: The data, with one row per record, and whether any data
+            was lost
+        :raises KeyError: If no vertex with the label recorded anything
+        :raises ConfigurationException:
+            If more than one vertex has the label
+        """
+        cores = self.get_cores(label)
+        if len(cores) > 1:
+            raise ConfigurationException(
+                f"{len(cores)} vertices are labelled {label}; get the "
+                "recording by core instead")
+        [(x, y, p)] = cores
+        return self.get_on_core(x, y, p, channel)
+
+    def get_on_core(self, x: int, y: int, p: int,
+                    channel: int) -> tuple[NDArray, bool]:
+        """
+        Get what a core recorded in a channel. If the channel was spilled
+        and is not packed bits, the array is a read-only view of the store;
+        nothing is copied.
+
+        :param x: The X coordinate of the chip of the core
+        :param y: The Y coordinate of the chip of the core
+        :param p: The processor ID of the core
+        :param channel: Which recording channel
+        :return: The data, with one row per record, and whether any data
+            was lost
+        :raises KeyError: If the core did not record in the channel
+        """
+        _, _, _, _, _, dtype, shape, packed = self._by_core[x, y, p, channel]
+        try:
+            data, missing = self._store.get_recording(x, y, p, channel)
+        except LookupError:
+            # Not spilled, or described but not extracted
+            data, missing = memoryview(b""), False
+        unspilled, lost = self.__read_unspilled(
+            x, y, p, channel, self._store.get_last_extraction_id(
+                x, y, p, channel))
+        if unspilled:
+            data = memoryview(bytes(data) + unspilled)
+        missing = missing or lost
+        if packed:
+            return packed_recording_array(data, shape), missing
+        return recording_array(data, dtype, shape), missing
+
+    def __read_unspilled(self, x: int, y: int, p: int, channel: int,
+                         after_id: int) -> tuple[bytes, bool]:
+        """
+        Read what a core recorded in a channel from the buffer database of
+        the run, after the extractions that were spilled.
+
+        :param x: The X coordinate of the chip of the core
+        :param y: The Y coordinate of the chip of the core
+        :param p: The processor ID of the core
+        :param channel: Which recording channel
+        :param after_id: The last extraction of the channel in the store
+        :return: The data, and whether any was lost
+        """
+        source = self._store.buffer_database
+        if source is None or not os.path.isfile(source):
+            # Gone, so all is lost unless it was spilled
+            return b"", not after_id
+        with BufferDatabase(source, read_only=True) as db:
+            rows = list(db.cursor().execute(
+                _UNSPILLED, (x, y, p, channel, after_id)))
+        return (b"".join(bytes(row["content"]) for row in rows),
+                any(row["missing_data"] for row in rows))
+
+
+def _reset_number(name: str) -> int | None:
+    match = re.fullmatch(re.escape(RECORDINGS_DIRECTORY) + r"(\d*)", name)
+    if match is None:
+        return None
+    return int(match.group(1) or 0)
+
+
+def open_recordings(run_dir: str, reset_number: int | None = None,
+                    ram_budget: int = DEFAULT_RAM_BUDGET) -> RunRecordings:
+    """
+    Open the recordings of a run that is over.
+
+    :param run_dir: The run directory of the run, in the reports
+    :param reset_number:
+        How many times the simulation had been reset before the recordings
+        were made; by default, the last
+    :param ram_budget: The most bytes to keep mapped into memory
+    :return: The recordings
+    :raises ConfigurationException: If the run has no recordings
+    """
+    if reset_number is None:
+        numbers = [
+            number for number in map(_reset_number, os.listdir(run_dir))
+            if number is not None]
+        if not numbers:
+            raise ConfigurationException(f"{run_dir} has no recordings")
+        reset_number = max(numbers)
+    return RunRecordings(
+        recordings_directory(run_dir, reset_number), ram_budget)
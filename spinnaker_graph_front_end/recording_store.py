@@ -0,0 +1,499 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A store of recordings on disk, which the recorded data is spilled into
+after each extraction, and read back from by mapping it into memory.
+
+Each recording channel of each core is appended to a file of its own, and
+an index says where each extraction of it is in that file. Only what is
+in the index is read, so the store can be read while it is being written,
+even from another process. The index also describes each channel, with
+the label of the vertex that recorded it and the type of what it holds,
+so that the store can be read without the graph, as by
+:py:class:`~spinnaker_graph_front_end.recording_reader.RunRecordings`.
+"""
+
+import json
+import mmap
+import os
+import pathlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import numpy
+from numpy.lib.format import descr_to_dtype, dtype_to_descr
+
+from spinn_front_end_common.interface.buffer_management.storage_objects \
+    import BufferDatabase
+
+#: The directory of the store of a run, in the run directory
+RECORDINGS_DIRECTORY = "recordings"
+
+#: The name of the index in the directory of a store
+INDEX = "index.sqlite3"
+
+_INDEX_DDL = """
+    CREATE TABLE IF NOT EXISTS chunk(
+        x INTEGER NOT NULL,
+        y INTEGER NOT NULL,
+        p INTEGER NOT NULL,
+        channel INTEGER NOT NULL,
+        extraction_id INTEGER NOT NULL,
+        end_step INTEGER NOT NULL,
+        file_offset INTEGER NOT NULL,
+        length INTEGER NOT NULL,
+        missing INTEGER NOT NULL,
+        PRIMARY KEY (x, y, p, channel, extraction_id));
+    CREATE TABLE IF NOT EXISTS channel(
+        x INTEGER NOT NULL,
+        y INTEGER NOT NULL,
+        p INTEGER NOT NULL,
+        channel INTEGER NOT NULL,
+        label TEXT,
+        dtype TEXT NOT NULL,
+        shape TEXT NOT NULL,
+        packed INTEGER NOT NULL,
+        PRIMARY KEY (x, y, p, channel));
+    CREATE INDEX IF NOT EXISTS channel_label ON channel(label);
+    CREATE TABLE IF NOT EXISTS source(
+        source_id INTEGER PRIMARY KEY CHECK (source_id = 0),
+        buffer_database TEXT NOT NULL);
+    """
+
+# The extractions not yet in the store, in the order they were made
+_NEW_RECORDINGS = """
+    SELECT recording_region_id, x, y, processor, local_region_index,
+        extraction_id, run_timestep, content, missing_data
+    FROM recording_region_view NATURAL JOIN recording_data
+        NATURAL JOIN extraction
+    WHERE extraction_id > ?
+    ORDER BY extraction_id, x, y, processor, local_region_index
+    """
+
+# Empties out of the buffer database a recording that is in the store; the
+# row is kept, so that the buffer manager still knows what was extracted
+_PRUNE_RECORDING = """
+    UPDATE recording_data SET content = CAST('' AS BLOB), content_len = 0
+    WHERE recording_region_id = ? AND extraction_id = ?
+    """
+
+
+#: How a channel is described: the core, the channel, the label of the
+#: vertex, the type and shape of each record, and whether it is packed bits
+ChannelDescription = tuple[
+    int, int, int, int, str | None, numpy.dtype, tuple[int, ...], bool]
+
+
+def _file_name(x: int, y: int, p: int, channel: int) -> str:
+    return f"{x}_{y}_{p}_{channel}.dat"
+
+
+def recordings_directory(run_dir: str, reset_number: int = 0) -> str:
+    """
+    Get where the store of the recordings of a run is kept. Each reset
+    starts the recordings again, so has a store of its own.
+
+    :param run_dir: The run directory
+    :param reset_number: How many times the simulation had been reset
+    :return: The directory of the store
+    """
+    return os.path.join(run_dir, RECORDINGS_DIRECTORY + (
+        str(reset_number) if reset_number else ""))
+
+
+class RecordingStore(object):
+    """
+    Recordings kept in files under a directory, and read back as views of
+    those files mapped into memory.
+
+    At most a budget of bytes is kept mapped by the store; the least
+    recently read channels are unmapped to stay within it. A view handed
+    out keeps its mapping alive until the view itself is released.
+    """
+
+    __slots__ = ("_db", "_db_lock", "_directory", "_lock", "_mapped",
+                 "_n_mapped", "_ram_budget", "_read_only")
+
+    def __init__(self, directory: str, ram_budget: int,
+                 buffer_database: str | None = None, read_only: bool = False):
+        """
+        :param directory: Where the store is kept; made if it does not
+            exist
+        :param ram_budget: The most bytes to keep mapped into memory
+        :param buffer_database:
+            The database the buffer manager extracts into, to fill the
+            store from; by default, that which the store was last made
+            with
+        :param read_only:
+            Whether to only read the store, which must exist, without
+            changing anything under its directory
+        """
+        self._directory = directory
+        self._ram_budget = ram_budget
+        self._read_only = read_only
+        self._mapped: OrderedDict[
+            tuple[int, int, int, int], tuple[mmap.mmap, int]] = OrderedDict()
+        self._n_mapped = 0
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        self._db_lock = threading.RLock()
+        if read_only:
+            return
+        os.makedirs(directory, exist_ok=True)
+        with self._index() as db, db:
+            db.executescript(_INDEX_DDL)
+            if buffer_database is not None:
+                # Relative, so that the run directory can be moved
+                db.execute(
+                    "INSERT OR REPLACE INTO source(source_id, "
+                    "buffer_database) VALUES(0, ?)", (os.path.relpath(
+                        buffer_database, directory), ))
+
+    @contextmanager
+    def _index(self) -> Iterator[sqlite3.Connection]:
+        """
+        Use the connection to the index, which is made the first time and
+        kept. The store can be used by several threads, but only one uses
+        the connection at once.
+
+        :return: The connection
+        """
+        with self._db_lock:
+            if self._db is None:
+                path = os.path.join(self._directory, INDEX)
+                if self._read_only:
+                    uri = pathlib.Path(os.path.abspath(path)).as_uri()
+                    self._db = sqlite3.connect(
+                        f"{uri}?mode=ro", uri=True, check_same_thread=False)
+                else:
+                    self._db = sqlite3.connect(
+                        path, check_same_thread=False)
+            yield self._db
+
+    def close(self) -> None:
+        """
+        Close the connection to the index. Views handed out stay usable,
+        and the store connects again if it is used after this.
+        """
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    @property
+    def directory(self) -> str:
+        """
+        Where the store is kept.
+        """
+        return self._directory
+
+    @property
+    def buffer_database(self) -> str | None:
+        """
+        The database the store is filled from, or `None` if not known.
+        """
+        with self._index() as db:
+            for (path, ) in db.execute(
+                    "SELECT buffer_database FROM source"):
+                return os.path.normpath(os.path.join(self._directory, path))
+        return None
+
+    @property
+    def n_mapped(self) -> int:
+        """
+        How many bytes the store keeps mapped into memory.
+        """
+        return self._n_mapped
+
+    @property
+    def last_extraction_id(self) -> int:
+        """
+        The last extraction of the recorded data in the store, or 0 if
+        there is none.
+        """
+        with self._index() as db:
+            [(last_id, )] = db.execute(
+                "SELECT coalesce(max(extraction_id), 0) FROM chunk")
+        return int(last_id)
+
+    def get_last_extraction_id(
+            self, x: int, y: int, p: int, channel: int) -> int:
+        """
+        Get the last extraction of what a core recorded in a channel that
+        is in the store.
+
+        :param x: The X coordinate of the chip of the core
+        :param y: The Y coordinate of the chip of the core
+        :param p: The processor ID of the core
+        :param channel: Which recording channel
+        :return: The ID of the extraction, or 0 if there is none
+        """
+        with self._index() as db:
+            [(last_id, )] = db.execute(
+                """
+                SELECT coalesce(max(extraction_id), 0) FROM chunk
+                WHERE x = ? AND y = ? AND p = ? AND channel = ?
+                """, (x, y, p, channel))
+        return int(last_id)
+
+    def spill(self, buffer_database: str | None = None,
+              prune: bool = False) -> int:
+        """
+        Append the extractions of recorded data that are not yet in the
+        store.
+
+        The recordings are read one at a time through one cursor, so only
+        one is held in memory at once, and each is indexed in a transaction
+        of its own once it is appended.
+
+        :param buffer_database:
+            The database the buffer manager extracts into; by default that
+            the store was made with, or if none, that of this run
+        :param prune:
+            Whether to empty each recording out of the buffer database once
+            it is in the store, so that it is not kept on disk twice;
+            anything else reading the buffer database then finds it empty
+        :return: The number of bytes appended
+        """
+        if buffer_database is None:
+            buffer_database = self.buffer_database
+        n_bytes = 0
+        spilled: list[tuple[int, int]] = []
+        with BufferDatabase(buffer_database) as source:
+            for (region_id, x, y, p, channel, extraction_id, end_step,
+                    content, missing) in source.cursor().execute(
+                        _NEW_RECORDINGS, (self.last_extraction_id, )):
+                n_bytes += self.__append(
+                    x, y, p, channel, extraction_id, end_step, content,
+                    missing)
+                spilled.append((region_id, extraction_id))
+            if prune:
+                # Only what the index says is now in the store
+                source.cursor().executemany(_PRUNE_RECORDING, spilled)
+        return n_bytes
+
+    def __append(self, x: int, y: int, p: int, channel: int,
+                 extraction_id: int, end_step: int, content: bytes,
+                 missing: bool) -> int:
+        """
+        Append what a core recorded in a channel in an extraction to its
+        file, and index it.
+
+        :param x: The X coordinate of the chip of the core
+        :param y: The Y coordinate of the chip of the core
+        :param p: The processor ID of the core
+        :param channel: Which recording channel
+        :param extraction_id: Which extraction the data is from
+        :param end_step: The timestep the extraction was made at
+        :param content: What was recorded
+        :param missing: Whether any of it was lost
+        :return: The number of bytes appended
+        """
+        path = os.path.join(self._directory, _file_name(x, y, p, channel))
+        with self._index() as db:
+            # Anything past the end of the index is what was left of an
+            # append that did not finish, and is written over
+            [(offset, )] = db.execute(
+                """
+                SELECT coalesce(max(file_offset + length), 0) FROM chunk
+                WHERE x = ? AND y = ? AND p = ? AND channel = ?
+                """, (x, y, p, channel))
+            with open(path, "ab") as f:
+                f.truncate(offset)
+                f.write(content)
+            with db:
+                db.execute(
+                    """
+                    INSERT INTO chunk(
+                        x, y, p, channel, extraction_id, end_step,
+                        file_offset, length, missing)
+                    VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, (x, y, p, channel, extraction_id, end_step,
+                          offset, len(content), missing))
+        return len(content)
+
+    def describe(self, channels: Iterable[ChannelDescription]) -> None:
+        """
+        Say what is recorded in channels, replacing what was said before.
+
+        :param channels: The descriptions of the channels
+        """
+        with self._index() as db, db:
+            db.executemany(
+                """
+                INSERT OR REPLACE INTO channel(
+                    x, y, p, channel, label, dtype, shape, packed)
+                VALUES(?, ?, ?, ?, ?, ?, ?, ?)
+                """, ((x, y, p, channel, label,
+                       json.dumps(dtype_to_descr(dtype)), json.dumps(shape),
+                       packed)
+                      for x, y, p, channel, label, dtype, shape, packed
+                      in channels))
+
+    def get_descriptions(self) -> list[ChannelDescription]:
+        """
+        Get what is said to be recorded in each channel.
+
+        :return: The descriptions of the channels, by core and channel
+        """
+        with self._index() as db:
+            return [
+                (x, y, p, channel, label,
+                 descr_to_dtype(_descr(json.loads(dtype))),
+                 tuple(json.loads(shape)), bool(packed))
+                for x, y, p, channel, label, dtype, shape, packed
+                in db.execute(
+                    """
+                    SELECT x, y, p, channel, label, dtype, shape, packed
+                    FROM channel ORDER BY x, y, p, channel
+                    """)]
+
+    def get_recording(
+            self, x: int, y: int, p: int,
+            channel: int) -> tuple[memoryview, bool]:
+        """
+        Get all that a core recorded in a channel, without copying it.
+
+        :param x: The X coordinate of the chip of the core
+        :param y: The Y coordinate of the chip of the core
+        :param p: The processor ID of the core
+        :param channel: Which recording channel
+        :return: A read-only view of the data, and whether any was lost
+        :raises LookupError: If the store has nothing from the channel
+        """
+        with self._index() as db:
+            [(end, missing)] = db.execute(
+                """
+                SELECT max(file_offset + length), max(missing) FROM chunk
+                WHERE x = ? AND y = ? AND p = ? AND channel = ?
+                """, (x, y, p, channel))
+        if end is None:
+            raise LookupError(
+                f"Nothing recorded in channel {channel} of core {x}, {y}, "
+                f"{p} is in the store")
+        if end == 0:
+            return memoryview(b""), bool(missing)
+        return memoryview(self.__map((x, y, p, channel), end))[:end], bool(
+            missing)
+
+    def get_extraction(
+            self, x: int, y: int, p: int, channel: int,
+            extraction_id: int) -> tuple[memoryview, bool]:
+        """
+        Get what a core recorded in a channel in one extraction, without
+        copying it.
+
+        :param x: The X coordinate of the chip of the core
+        :param y: The Y coordinate of the chip of the core
+        :param p: The processor ID of the core
+        :param channel: Which recording channel
+        :param extraction_id: Which extraction of the recorded data
+        :return: A read-only view of the data, and whether any was lost
+        :raises LookupError: If the store does not have the extraction
+        """
+        with self._index() as db:
+            rows = list(db.execute(
+                """
+                SELECT file_offset, length, missing,
+                    (SELECT max(file_offset + length) FROM chunk
+                     WHERE x = ? AND y = ? AND p = ? AND channel = ?)
+                FROM chunk
+                WHERE x = ? AND y = ? AND p = ? AND channel = ?
+                    AND extraction_id = ?
+                """, (x, y, p, channel, x, y, p, channel, extraction_id)))
+        if not rows:
+            raise LookupError(
+                f"Extraction {extraction_id} of channel {channel} of core "
+                f"{x}, {y}, {p} is not in the store")
+        [(offset, length, missing, end)] = rows
+        if length == 0:
+            return memoryview(b""), bool(missing)
+        return memoryview(self.__map((x, y, p, channel), end))[
+            offset:offset + length], bool(missing)
+
+    def __map(self, key: tuple[int, int, int, int], end: int) -> mmap.mmap:
+        """
+        Get a channel mapped into memory up to an end, remapping it if it
+        has grown, and unmapping others to stay within the budget.
+
+        :param key: The core and channel
+        :param end: The end of the indexed data of the channel
+        :return: The mapping
+        """
+        with self._lock:
+            mapped = self._mapped.pop(key, None)
+            if mapped is not None:
+                self._n_mapped -= mapped[1]
+                if mapped[1] != end:
+                    mapped = None
+            if mapped is None:
+                with open(os.path.join(
+                        self._directory, _file_name(*key)), "rb") as f:
+                    mapped = (mmap.mmap(f.fileno(), end,
+                                        access=mmap.ACCESS_READ), end)
+            # Dropped rather than closed, as views of them may be in use
+            while self._mapped and (
+                    self._n_mapped + end > self._ram_budget):
+                _, (_, size) = self._mapped.popitem(last=False)
+                self._n_mapped -= size
+            self._mapped[key] = mapped
+            self._n_mapped += end
+            return mapped[0]
+
+
+def _descr(descr: Any) -> Any:
+    """
+    Undo JSON turning the tuples of the fields of a structured dtype into
+    lists.
+
+    :param descr: A dtype description read back from JSON
+    :return: The description as NumPy made it
+    """
+    if not isinstance(descr, list):
+        return descr
+    return [(tuple(name) if isinstance(name, list) else name, _descr(sub),
+             *(tuple(field_shape) for field_shape in field_shapes))
+            for name, sub, *field_shapes in descr]
+
+
+#: The store of the recordings of the current or last run
+_store: RecordingStore | None = None
+
+
+def get_recording_store() -> RecordingStore | None:
+    """
+    :return: The store of the recordings of the current or last run, or
+        `None` if nothing has been extracted since setup; the recordings
+        are only in it if they are spilled
+    """
+    return _store
+
+
+def set_recording_store(store: RecordingStore | None) -> None:
+    """
+    Set the store of the recordings of the current run.
+    Called by the front end.
+
+    :param store: The store, or `None` if there is none yet
+    """
+    # pylint: disable=global-statement
+    global _store
+    if _store is not None and _store is not store:
+        _store.close()
+    _store = store
@@ -0,0 +1,25 @@
+# Copyright (c) 2015 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from spinn_front_end_common.utility_models import (
+    ReverseIpTagMultiCastSource as _RIPTMCS,
+)
+
+
+class ReverseIpTagMultiCastSource(_RIPTMCS):
+    """
+    For full documentation see
+    :py:class:`~spinn_front_end_common.utility_models.ReverseIpTagMultiCastSource`.
+    """
+    __slots__ = ()
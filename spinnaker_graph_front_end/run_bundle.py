@@ -0,0 +1,395 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Run bundles: what a mapped graph loads onto the machine, kept in a
+directory so that a later process can load and run it again without
+building, mapping or generating the data of the graph.
+
+A bundle holds the binaries of the application and the cores they run on,
+the uncompressed routing tables, the IP tags and reverse IP tags, and the
+data specification database of the application cores.
+Tags are kept by the Ethernet chip of their board rather than its IP
+address, so that a bundle can be loaded onto any machine with the same
+shape and the cores it uses.
+"""
+
+import json
+import os
+import shutil
+import sqlite3
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
+
+from spinn_utilities.config_holder import get_config_str_or_none, set_config
+
+from spinn_machine import CoreSubsets, Machine
+from spinn_machine.tags import IPTag, ReverseIPTag
+
+from pacman.model.graphs.machine import SimpleMachineVertex
+from pacman.model.resources import ConstantSDRAM
+from pacman.model.routing_tables import MulticastRoutingTables
+from pacman.model.routing_tables.multicast_routing_tables import (
+    from_json, to_json)
+from pacman.model.tags import Tags
+
+from spinnman.model import ExecutableTargets
+from spinnman.model.enums import ExecutableType
+
+from spinn_front_end_common.data import FecDataView
+from spinn_front_end_common.interface.ds import DsSqlliteDatabase
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+
+from ._version import __version__ as version
+
+#: The version of the layout of a bundle
+BUNDLE_VERSION = 1
+
+#: The name of the description of a bundle in its directory
+MANIFEST = "bundle.json"
+
+#: The name of the data specification database in a bundle
+DS_DATABASE = "ds.sqlite3"
+
+#: The directory of the binaries in a bundle
+_BINARIES = "binaries"
+
+#: Removes what is only about the machine the bundle was made on from the
+#: data specification database; the system cores are only there to support
+#: the run that made it
+_STRIP_DS_DATABASE = """
+    DELETE FROM region WHERE EXISTS (
+        SELECT 1 FROM core
+        WHERE core.x = region.x AND core.y = region.y AND core.p = region.p
+            AND core.is_system);
+    DELETE FROM reference WHERE EXISTS (
+        SELECT 1 FROM core
+        WHERE core.x = reference.x AND core.y = reference.y
+            AND core.p = reference.p AND core.is_system);
+    DELETE FROM core WHERE is_system;
+    DELETE FROM proxy_configuration;
+    UPDATE core SET start_address = NULL, memory_written = NULL;
+    UPDATE region SET pointer = NULL;
+    """
+
+
+#: The settings turned off while a bundle runs, as the bundle has nothing
+#: for them to work with
+_RUN_SETTINGS = (
+    ("Machine", "enable_advanced_monitor_support"),
+    ("Machine", "enable_reinjection"),
+    ("Buffers", "use_auto_pause_and_resume"))
+
+
+def _ethernet_of_board(machine: Machine, board_address: str) -> list[int]:
+    for chip in machine.ethernet_connected_chips:
+        if chip.ip_address == board_address:
+            return [chip.x, chip.y]
+    raise ConfigurationException(
+        f"No board of the machine has the address {board_address}")
+
+
+def _board_of_ethernet(machine: Machine, x: int, y: int) -> str:
+    chip = machine.get_chip_at(x, y)
+    if chip is None or chip.ip_address is None:
+        raise ConfigurationException(
+            f"The run bundle has tags on the board of chip {x}, {y}, "
+            "which is not an Ethernet chip of this machine")
+    return chip.ip_address
+
+
+def export_run_bundle(directory: str) -> None:
+    """
+    Write what the last run loaded onto the machine into a new directory, as
+    a run bundle.
+
+    :param directory: Where to write the bundle; must not already exist
+        or must be empty
+    :raises ConfigurationException: If there is nothing to bundle yet, or
+        the directory is not empty
+    """
+    if not FecDataView.is_ran_ever():
+        raise ConfigurationException(
+            "A run bundle can only be exported after a run")
+    if os.path.isdir(directory) and os.listdir(directory):
+        raise ConfigurationException(
+            f"Not writing a run bundle into {directory} as it is not empty")
+    machine = FecDataView.get_machine()
+    targets = FecDataView.get_executable_targets()
+    os.makedirs(os.path.join(directory, _BINARIES), exist_ok=True)
+
+    executables = []
+    names: set[str] = set()
+    for executable_type in sorted(
+            targets.executable_types_in_binary_set(), key=lambda t: t.name):
+        if executable_type == ExecutableType.SYSTEM:
+            continue
+        for binary in sorted(
+                targets.get_binaries_of_executable_type(executable_type)):
+            name = os.path.basename(binary)
+            # Different binaries with the same name are kept apart
+            while name in names:
+                name = f"_{name}"
+            names.add(name)
+            shutil.copyfile(binary, os.path.join(directory, _BINARIES, name))
+            executables.append({
+                "binary": f"{_BINARIES}/{name}",
+                "type": executable_type.name,
+                "cores": [
+                    [subset.x, subset.y, p]
+                    for subset in targets.get_cores_for_binary(binary)
+                    for p in subset.processor_ids]})
+
+    tags = FecDataView.get_tags()
+    manifest = {
+        "version": BUNDLE_VERSION,
+        "front_end_version": version,
+        "time_step_us": FecDataView.get_simulation_time_step_us(),
+        "time_scale_factor": FecDataView.get_time_scale_factor(),
+        "max_run_time_steps": FecDataView.get_max_run_time_steps(),
+        "width": machine.width,
+        "height": machine.height,
+        "executables": executables,
+        "routing_tables": to_json(FecDataView.get_uncompressed()),
+        "ip_tags": [{
+            "ethernet": _ethernet_of_board(machine, tag.board_address),
+            "tag": tag.tag, "destination": [
+                tag.destination_x, tag.destination_y],
+            "ip_address": tag.ip_address, "port": tag.port,
+            "strip_sdp": tag.strip_sdp,
+            "traffic_identifier": tag.traffic_identifier}
+            for tag in tags.ip_tags],
+        "reverse_ip_tags": [{
+            "ethernet": _ethernet_of_board(machine, tag.board_address),
+            "tag": tag.tag, "port": tag.port, "destination": [
+                tag.destination_x, tag.destination_y, tag.destination_p],
+            "sdp_port": tag.sdp_port}
+            for tag in tags.reverse_ip_tags]}
+
+    ds_path = os.path.join(directory, DS_DATABASE)
+    with closing(sqlite3.connect(FecDataView.get_ds_database_path())) as \
+            source, closing(sqlite3.connect(ds_path)) as target:
+        source.backup(target)
+        target.executescript(_STRIP_DS_DATABASE)
+        target.commit()
+        target.execute("VACUUM")
+
+    # Written last, so that an unfinished bundle cannot be loaded
+    with open(os.path.join(directory, MANIFEST), "w",
+              encoding="utf-8") as f:
+        json.dump(manifest, f)
+
+
+@contextmanager
+def run_bundle_settings() -> Iterator[None]:
+    """
+    Turn off the settings a bundle cannot run with for as long as it runs,
+    and then put them back as they were.
+
+    :return: A context to run the bundle in
+    """
+    saved = [(section, option, get_config_str_or_none(section, option))
+             for section, option in _RUN_SETTINGS]
+    for section, option, _ in saved:
+        set_config(section, option, "False")
+    try:
+        yield
+    finally:
+        for section, option, value in saved:
+            set_config(section, option, value)
+
+
+class RunBundle(object):
+    """
+    A run bundle, as written by :py:func:`export_run_bundle`.
+    """
+
+    __slots__ = ("_directory", "_manifest")
+
+    def __init__(self, directory: str):
+        """
+        :param directory: The directory of the bundle
+        :raises ConfigurationException: If the directory is not a bundle
+            that can be read
+        """
+        self._directory = os.path.abspath(directory)
+        try:
+            with open(os.path.join(directory, MANIFEST),
+                      encoding="utf-8") as f:
+                self._manifest = json.load(f)
+        except (OSError, ValueError) as ex:
+            raise ConfigurationException(
+                f"{directory} is not a run bundle: {ex}") from ex
+        if self._manifest.get("version") != BUNDLE_VERSION:
+            raise ConfigurationException(
+                f"The run bundle in {directory} is version "
+                f"{self._manifest.get('version')} but only version "
+                f"{BUNDLE_VERSION} can be read")
+
+    @property
+    def directory(self) -> str:
+        """
+        The directory of the bundle.
+        """
+        return self._directory
+
+    @property
+    def time_step_us(self) -> int:
+        """
+        The simulation time step the bundle was made with, in microseconds.
+        """
+        return int(self._manifest["time_step_us"])
+
+    @property
+    def time_scale_factor(self) -> float:
+        """
+        The time scale factor the bundle was made with.
+        """
+        return float(self._manifest["time_scale_factor"])
+
+    @property
+    def max_run_time_steps(self) -> int:
+        """
+        The most time steps the bundle can run for, as its recording space
+        was sized for.
+        """
+        return int(self._manifest["max_run_time_steps"])
+
+    @property
+    def n_cores(self) -> int:
+        """
+        The number of application cores the bundle runs on.
+        """
+        return sum(len(executable["cores"])
+                   for executable in self._manifest["executables"])
+
+    def check_machine(self, machine: Machine) -> None:
+        """
+        Check that the bundle can be loaded onto a machine.
+
+        :param machine: The machine to load the bundle onto
+        :raises ConfigurationException: If the machine is a different
+            shape or lacks a chip, core or link the bundle uses
+        """
+        if (machine.width, machine.height) != (
+                self._manifest["width"], self._manifest["height"]):
+            raise ConfigurationException(
+                f"The run bundle needs a {self._manifest['width']} by "
+                f"{self._manifest['height']} machine, not a {machine.width} "
+                f"by {machine.height} one")
+        for executable in self._manifest["executables"]:
+            for x, y, p in executable["cores"]:
+                chip = machine.get_chip_at(x, y)
+                if chip is None or p not in chip.placable_processors_ids:
+                    raise ConfigurationException(
+                        f"The run bundle uses core {x}, {y}, {p}, which "
+                        "this machine does not have")
+        for table in self.routing_tables():
+            chip = machine.get_chip_at(table.x, table.y)
+            if chip is None:
+                raise ConfigurationException(
+                    f"The run bundle routes through chip {table.x}, "
+                    f"{table.y}, which this machine does not have")
+            for entry in table.multicast_routing_entries:
+                for link in entry.link_ids:
+                    if not chip.router.is_link(link):
+                        raise ConfigurationException(
+                            f"The run bundle routes over link {link} of "
+                            f"chip {table.x}, {table.y}, which this "
+                            "machine does not have")
+
+    def executable_targets(self) -> ExecutableTargets:
+        """
+        :return: The binaries of the bundle and the cores they run on
+        """
+        targets = ExecutableTargets()
+        for executable in self._manifest["executables"]:
+            binary = os.path.join(self._directory, executable["binary"])
+            executable_type = ExecutableType[executable["type"]]
+            for x, y, p in executable["cores"]:
+                targets.add_processor(binary, x, y, p, executable_type)
+        return targets
+
+    def executable_types(self) -> dict[ExecutableType, CoreSubsets]:
+        """
+        :return: The cores that run each type of executable
+        """
+        types: dict[ExecutableType, CoreSubsets] = {}
+        for executable in self._manifest["executables"]:
+            cores = types.setdefault(
+                ExecutableType[executable["type"]], CoreSubsets())
+            for x, y, p in executable["cores"]:
+                cores.add_processor(x, y, p)
+        return types
+
+    def routing_tables(self) -> MulticastRoutingTables:
+        """
+        :return: The uncompressed routing tables of the bundle
+        """
+        return from_json(self._manifest["routing_tables"])
+
+    def tags(self) -> Tags:
+        """
+        Get the tags of the bundle on the boards of the machine of this run.
+        As there are no vertices, the tags are all given to one stand-in.
+
+        :return: The IP tags and reverse IP tags of the bundle
+        """
+        machine = FecDataView.get_machine()
+        vertex = SimpleMachineVertex(ConstantSDRAM(0), label="Run bundle")
+        tags = Tags()
+        for tag in self._manifest["ip_tags"]:
+            x, y = tag["destination"]
+            tags.add_ip_tag(IPTag(
+                _board_of_ethernet(machine, *tag["ethernet"]), x, y,
+                tag["tag"], tag["ip_address"], tag["port"],
+                tag["strip_sdp"], tag["traffic_identifier"]), vertex)
+        for tag in self._manifest["reverse_ip_tags"]:
+            x, y, p = tag["destination"]
+            tags.add_reverse_ip_tag(ReverseIPTag(
+                _board_of_ethernet(machine, *tag["ethernet"]), tag["tag"],
+                tag["port"], x, y, p, tag["sdp_port"]), vertex)
+        return tags
+
+    def copy_ds_database(self, path: str) -> int:
+        """
+        Copy the data specification database of the bundle, and bring it up
+        to date with the machine and application ID of this run.
+
+        :param path: Where to copy the database to
+        :return: The number of bytes of region content to load
+        """
+        shutil.copyfile(os.path.join(self._directory, DS_DATABASE), path)
+        machine = FecDataView.get_machine()
+        with DsSqlliteDatabase(path) as db:
+            cursor = db.cursor()
+            ethernets = [
+                (row["ethernet_x"], row["ethernet_y"]) for row in
+                cursor.execute("SELECT ethernet_x, ethernet_y FROM ethernet")]
+            # The addresses must stay unique while they are changed
+            cursor.execute(
+                "UPDATE ethernet SET ip_address = "
+                "'old ' || ethernet_x || ',' || ethernet_y")
+            cursor.executemany(
+                """
+                UPDATE ethernet SET ip_address = ?
+                WHERE ethernet_x = ? AND ethernet_y = ?
+                """, [(_board_of_ethernet(machine, x, y), x, y)
+                      for x, y in ethernets])
+            cursor.execute(
+                "UPDATE info SET app_id = ?", (FecDataView.get_app_id(),))
+            db.write_session_credentials_to_db()
+            n_bytes = sum(
+                size * count for size, count in db.get_content_sizes(False))
+        return n_bytes
@@ -0,0 +1,94 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Running a simulation in the background, so that the caller can carry on
+while it runs.
+"""
+
+import asyncio
+import logging
+import threading
+from collections.abc import Callable, Generator
+from concurrent.futures import Future
+from typing import Any
+
+from spinn_utilities.exceptions import SpiNNUtilsException
+from spinn_utilities.log import FormatAdapter
+from spinn_utilities.overrides import overrides
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+
+class RunFuture(Future[None]):
+    """
+    The future of a run in the background. It finishes when the run does,
+    with the exception of the run if it failed.
+
+    As well as being waited for with :py:meth:`result`, it can be awaited
+    in :py:mod:`asyncio`, where :py:func:`asyncio.wait_for` gives it a
+    timeout.
+    Cancelling it before the run starts stops the run from starting;
+    cancelling it after that stops a run that would otherwise go on
+    forever, as :py:func:`~spinnaker_graph_front_end.stop_run` does, but
+    the future then still finishes when the run does.
+    """
+
+    __slots__ = ("_stop", )
+
+    def __init__(self, stop: Callable[[], None] | None = None):
+        """
+        :param stop: Stops the run, or `None` if it cannot be stopped
+        """
+        super().__init__()
+        self._stop = stop
+
+    @overrides(Future.cancel)
+    def cancel(self) -> bool:
+        if super().cancel():
+            return True
+        if self.running() and self._stop is not None:
+            try:
+                self._stop()
+            except SpiNNUtilsException as ex:
+                logger.warning("The run could not be stopped: {}", ex)
+        return False
+
+    def __await__(self) -> Generator[Any, None, None]:
+        return asyncio.wrap_future(self).__await__()
+
+
+def start_run(run: Callable[[], None],
+              stop: Callable[[], None] | None = None) -> RunFuture:
+    """
+    Start a run in a thread of its own.
+
+    :param run: Does the run; called once, in the thread
+    :param stop: Stops the run, or `None` if it cannot be stopped
+    :return: The future of the run
+    """
+    future = RunFuture(stop)
+
+    def _run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            run()
+        except BaseException as ex:  # pylint: disable=broad-except
+            future.set_exception(ex)
+        else:
+            future.set_result(None)
+
+    threading.Thread(target=_run, name="gfe-run").start()
+    return future
@@ -13,22 +13,75 @@
 # limitations under the License.
 
 import logging
+import os
+import time
+from collections.abc import Iterator
 
-from spinn_utilities.config_holder import is_config_none
+import numpy
+
+from spinn_utilities.config_holder import (
+    get_config_bool, get_config_int, get_config_str, get_config_str_or_none,
+    get_report_path, get_timestamp_path, is_config_none)
 from spinn_utilities.log import FormatAdapter
 from spinn_utilities.overrides import overrides
+from spinn_utilities.typing.coords import XY
+
+from spinn_machine import Machine
+
+from spinnman.spalloc import (
+    MachineAllocationController, SpallocClient, SpallocJob, SpallocState,
+    is_server_address)
+from spinnman.spalloc.spalloc_allocator import (
+    SpallocJobController, spalloc_allocate_job)
+from spinnman.transceiver import (
+    Transceiver, create_transceiver_from_hostname, transceiver_generator)
+
+from pacman.model.graphs.machine import MachineVertex
+from pacman.model.placements import Placements
+from pacman.model.routing_info import RoutingInfo
+from pacman.model.routing_table_by_partition import (
+    MulticastRoutingTableByPartition)
 
 from spinn_front_end_common.data import FecDataView
 from spinn_front_end_common.data.fec_data_writer import FecDataWriter
 from spinn_front_end_common.interface.abstract_spinnaker_base import (
     AbstractSpinnakerBase,
 )
+from spinn_front_end_common.interface.buffer_management import BufferManager
+from spinn_front_end_common.interface.buffer_management.buffer_models import (
+    AbstractReceiveBuffersToHost)
+from spinn_front_end_common.interface.buffer_management.storage_objects \
+    import BufferDatabase
 from spinn_front_end_common.interface.config_setup import (
     add_spinnaker_template,
 )
-from spinn_front_end_common.interface.provenance import GlobalProvenance
+from spinn_front_end_common.interface.ds import DsSqlliteDatabase
+from spinn_front_end_common.interface.interface_functions import (
+    hbp_allocator, spalloc_allocate_job_old)
+from spinn_front_end_common.interface.provenance import (
+    FecTimer, GlobalProvenance, ProvenanceWriter, TimerCategory, TimerWork)
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
 
+from spinnaker_graph_front_end.board_session import (
+    BoardSession, claim_session, destroy_job, keep_job, take_kept_job)
 from spinnaker_graph_front_end.config_setup import GFE_CFG, add_gfe_cfg
+from spinnaker_graph_front_end.host_emulator import HostEmulator
+from spinnaker_graph_front_end.machine_allocation import (
+    AllocatedMachine, BackgroundAllocation)
+from spinnaker_graph_front_end.mapping_cache import (
+    CachedMapping, MappingCache, mapping_fingerprint, mapping_vertices)
+from spinnaker_graph_front_end.parallel_data_specification_writer import (
+    DataSpecificationCache, parallel_data_specification_writer)
+from spinnaker_graph_front_end.phase_timings import (
+    PhaseTimer, write_phase_timings)
+from spinnaker_graph_front_end.recording_store import (
+    ChannelDescription, RecordingStore, get_recording_store,
+    recordings_directory, set_recording_store)
+from spinnaker_graph_front_end.run_bundle import (
+    RunBundle, export_run_bundle, run_bundle_settings)
+from spinnaker_graph_front_end.utilities import SimulatorVertex
+from spinnaker_graph_front_end.utilities.recordings import (
+    extraction_finished)
 
 from ._version import __version__ as version
 
@@ -42,6 +95,68 @@ def _is_allocated_machine() -> bool:
         return True
 
 
+def _is_emulated() -> bool:
+    return (get_config_bool("Machine", "virtual_board") and
+            get_config_bool("Machine", "emulate_virtual_board"))
+
+
+def _recording_channels() -> Iterator[ChannelDescription]:
+    """
+    Describe the channels recorded by each vertex placed, as declared by
+    the vertex if it is a simulator vertex, or as bytes if not.
+    """
+    for placement in FecDataView.iterate_placements_by_vertex_type(
+            AbstractReceiveBuffersToHost):
+        vertex = placement.vertex
+        assert isinstance(vertex, AbstractReceiveBuffersToHost)
+        for channel in vertex.get_recorded_region_ids():
+            if isinstance(vertex, SimulatorVertex):
+                yield (placement.x, placement.y, placement.p, channel,
+                       vertex.label,
+                       vertex.get_recording_channel_dtype(
+                           channel).newbyteorder("<"),
+                       vertex.get_recording_channel_shape(channel),
+                       vertex.is_recording_channel_packed(channel))
+            else:
+                yield (placement.x, placement.y, placement.p, channel,
+                       vertex.label, numpy.dtype(numpy.uint8), (), False)
+
+
+def _mapping_cache_directory() -> str:
+    directory = get_config_str_or_none("Mapping", "mapping_cache_directory")
+    if directory is None:
+        directory = os.path.join(
+            os.path.expanduser("~"), ".cache", "spinnaker_graph_front_end",
+            "mapping")
+    return directory
+
+
+def _session_file() -> str:
+    path = get_config_str_or_none("Machine", "session_file")
+    if path is None:
+        path = os.path.join(
+            os.path.expanduser("~"), ".cache", "spinnaker_graph_front_end",
+            "board_session.json")
+    return path
+
+
+#: The settings that must be the same for a kept job to be reused
+_SESSION_SETTINGS = (
+    "spalloc_server", "spalloc_machine", "spalloc_width", "spalloc_height",
+    "spalloc_triad", "spalloc_physical", "spalloc_ip_address")
+
+
+def _session_request() -> dict[str, str | int | None]:
+    request: dict[str, str | int | None] = {
+        name: get_config_str_or_none("Machine", name)
+        for name in _SESSION_SETTINGS}
+    request["n_boards"] = (FecDataView.get_n_boards_required()
+                           if FecDataView.has_n_boards_required() else None)
+    request["n_chips"] = (FecDataView.get_n_chips_needed()
+                          if FecDataView.has_n_chips_needed() else None)
+    return request
+
+
 class SpiNNaker(AbstractSpinnakerBase):
     """
     The implementation of the SpiNNaker simulation interface.
@@ -51,11 +166,17 @@ class SpiNNaker(AbstractSpinnakerBase):
         Call :py:func:`~spinnaker_graph_front_end.setup` instead.
     """
 
+    __slots__ = ("__allocation", "__cached_mapping", "__emulator",
+                 "__keep_job", "__mapping_cache", "__mapping_key",
+                 "__mapping_vertices", "__recordings_described",
+                 "__run_bundle", "__spec_cache")
+
     def __init__(
             self, n_chips_required: int | None = None,
             n_boards_required: int | None = None,
             time_scale_factor: int | None = None,
-            timestep: int | None = None):
+            timestep: int | None = None,
+            allocate_in_background: bool | None = None):
         """
         :param n_chips_required:
             How many chips are required.
@@ -66,6 +187,9 @@ class SpiNNaker(AbstractSpinnakerBase):
             The time slow-down factor
         :param timestep:
             The size of the machine time step, in microseconds
+        :param allocate_in_background:
+            Whether to start getting a real machine now, in the background;
+            if `None`, the configuration value is used
         """
         # DSG algorithm store for user defined algorithms
 
@@ -75,9 +199,45 @@ class SpiNNaker(AbstractSpinnakerBase):
                          timestep=timestep,
                          time_scale_factor=time_scale_factor)
 
+        self.__mapping_cache: MappingCache | None = None
+        if get_config_bool("Mapping", "mapping_cache"):
+            max_mb = get_config_int("Mapping", "mapping_cache_max_mb")
+            self.__mapping_cache = MappingCache(
+                _mapping_cache_directory(), max_mb * 1024 * 1024)
+        self.__mapping_key: str | None = None
+        self.__mapping_vertices: list[MachineVertex] = []
+        self.__cached_mapping: CachedMapping | None = None
+        self.__spec_cache: DataSpecificationCache | None = None
+        if get_config_bool("Mapping", "incremental_data_specification"):
+            self.__spec_cache = DataSpecificationCache()
+        self.__emulator: HostEmulator | None = None
+        self.__run_bundle: RunBundle | None = None
+        self.__recordings_described = False
+        set_recording_store(None)
+
         with GlobalProvenance() as db:
             db.insert_version("SpiNNakerGraphFrontEnd", version)
 
+        if allocate_in_background is None:
+            allocate_in_background = get_config_bool(
+                "Machine", "allocate_in_background")
+        self.__keep_job = False
+        self.__allocation: BackgroundAllocation[AllocatedMachine] | None = (
+            None)
+        if allocate_in_background and not get_config_bool(
+                "Machine", "virtual_board"):
+            if _is_allocated_machine() and not (
+                    self._data_writer.has_n_boards_required() or
+                    self._data_writer.has_n_chips_needed()):
+                # The size comes from the graph, which is not built yet
+                logger.warning(
+                    "Not allocating the machine in the background as "
+                    "neither n_boards_required nor n_chips_required was "
+                    "given")
+            else:
+                self.__allocation = BackgroundAllocation(
+                    self._allocate_machine)
+
     @overrides(AbstractSpinnakerBase._add_cfg_defaults_and_template)
     def _add_cfg_defaults_and_template(self) -> None:
         add_gfe_cfg()
@@ -93,6 +253,508 @@ class SpiNNaker(AbstractSpinnakerBase):
     def _data_writer_cls(self) -> type[FecDataWriter]:
         return FecDataWriter
 
+    @property
+    def mapping_cache(self) -> MappingCache | None:
+        """
+        The cache of mapping results, or `None` if it is turned off.
+        """
+        return self.__mapping_cache
+
+    @overrides(AbstractSpinnakerBase._execute_application_placer)
+    def _execute_application_placer(
+            self, system_placements: Placements) -> None:
+        self.__mapping_key = None
+        self.__cached_mapping = None
+        if self.__mapping_cache is None:
+            super()._execute_application_placer(system_placements)
+            return
+        with PhaseTimer("Mapping cache lookup", TimerWork.OTHER) as timer:
+            self.__mapping_key = mapping_fingerprint(system_placements)
+            self.__mapping_vertices = mapping_vertices(system_placements)
+            timer.add_objects(len(self.__mapping_vertices))
+            self.__cached_mapping = self.__mapping_cache.load(
+                self.__mapping_key)
+        if self.__cached_mapping is None:
+            super()._execute_application_placer(system_placements)
+            return
+        with PhaseTimer(
+                "Application Placer (cached)", TimerWork.OTHER) as timer:
+            self._data_writer.set_placements(
+                self.__cached_mapping.placements(
+                    self.__mapping_vertices, system_placements))
+            timer.add_objects(self._data_writer.get_n_placements())
+
+    @overrides(AbstractSpinnakerBase._execute_basic_tag_allocator)
+    def _execute_basic_tag_allocator(self) -> None:
+        if self.__cached_mapping is not None:
+            with PhaseTimer(
+                    "Basic tag allocator (cached)", TimerWork.OTHER):
+                self._data_writer.set_tags(
+                    self.__cached_mapping.tags(self.__mapping_vertices))
+            return
+        super()._execute_basic_tag_allocator()
+        if self.__mapping_cache is not None and self.__mapping_key is not None:
+            with PhaseTimer("Mapping cache store", TimerWork.OTHER) as timer:
+                self.__mapping_cache.store(
+                    self.__mapping_key,
+                    CachedMapping.from_data(self.__mapping_vertices))
+                timer.add_objects(len(self.__mapping_vertices))
+
+    @overrides(
+        AbstractSpinnakerBase._execute_graph_data_specification_writer)
+    def _execute_graph_data_specification_writer(self) -> None:
+        n_workers = get_config_int("Mapping", "data_specification_workers")
+        if n_workers <= 1 and self.__spec_cache is None:
+            super()._execute_graph_data_specification_writer()
+            return
+        with PhaseTimer("Parallel graph data specification writer",
+                        TimerWork.OTHER) as timer:
+            path = parallel_data_specification_writer(
+                max(n_workers, 1), self.__spec_cache)
+            self._data_writer.set_ds_database_path(path)
+            timer.add_objects(self._data_writer.get_n_placements())
+            with DsSqlliteDatabase(path) as ds_db:
+                timer.add_bytes(sum(
+                    size * count for is_system in (False, True)
+                    for size, count in ds_db.get_content_sizes(is_system)))
+
+    def load_run_bundle(self, directory: str) -> None:
+        """
+        Run a run bundle instead of a graph; the next run loads what the
+        bundle holds without mapping or generating any data.
+
+        As the bundle has no vertices, nothing it records can be got back
+        through vertices, and advanced monitors and auto pause and resume
+        are turned off while it runs.
+
+        :param directory: The directory of the bundle
+        :raises ConfigurationException:
+            If the graph has vertices or the bundle cannot be read
+        """
+        if self._data_writer.get_n_vertices() > 0:
+            raise ConfigurationException(
+                "A run bundle cannot be loaded into a graph with vertices")
+        bundle = RunBundle(directory)
+        self._data_writer.set_up_timings(
+            bundle.time_step_us, bundle.time_scale_factor)
+        self.__run_bundle = bundle
+
+    def export_run_bundle(self, directory: str) -> None:
+        """
+        Write what the last run loaded onto the machine as a run bundle.
+
+        :param directory: Where to write the bundle; must not already exist
+            or must be empty
+        """
+        export_run_bundle(directory)
+
+    @overrides(AbstractSpinnakerBase._should_run)
+    def _should_run(self) -> bool:
+        return self.__run_bundle is not None or super()._should_run()
+
+    @overrides(AbstractSpinnakerBase._do_mapping)
+    def _do_mapping(self, total_run_time: float | None,
+                    n_machine_time_steps: int | None) -> None:
+        # What is recorded where may change
+        self.__recordings_described = False
+        bundle = self.__run_bundle
+        if bundle is None:
+            super()._do_mapping(total_run_time, n_machine_time_steps)
+            return
+        FecTimer.start_category(TimerCategory.MAPPING)
+        if self._data_writer.is_soft_reset():
+            self._hard_reset()
+        machine = self._get_known_machine(total_run_time)
+        with PhaseTimer("Run bundle reader", TimerWork.OTHER) as timer:
+            bundle.check_machine(machine)
+            # There is nothing placed or routed for what needs it to find
+            self._data_writer.set_placements(Placements())
+            self._data_writer.set_routing_infos(RoutingInfo())
+            self._data_writer.set_routing_table_by_partition(
+                MulticastRoutingTableByPartition())
+            self._data_writer.set_executable_targets(
+                bundle.executable_targets())
+            self._data_writer.set_executable_types(bundle.executable_types())
+            self._data_writer.set_uncompressed(bundle.routing_tables())
+            self._data_writer.set_tags(bundle.tags())
+            timer.add_objects(bundle.n_cores)
+        self._execute_buffer_manager_creator()
+        if (n_machine_time_steps is not None and
+                n_machine_time_steps > bundle.max_run_time_steps):
+            raise ConfigurationException(
+                "The recording space of the run bundle limits the run time "
+                f"to {bundle.max_run_time_steps} time steps")
+        self._data_writer.set_max_run_time_steps(bundle.max_run_time_steps)
+        FecTimer.end_category(TimerCategory.MAPPING)
+
+    @overrides(AbstractSpinnakerBase._do_data_generation)
+    def _do_data_generation(self) -> None:
+        if self.__run_bundle is None:
+            super()._do_data_generation()
+            return
+        with PhaseTimer("Run bundle data specification copier",
+                        TimerWork.OTHER) as timer:
+            path = get_report_path("path_dataspec_database")
+            timer.add_bytes(self.__run_bundle.copy_ds_database(path))
+            self._data_writer.set_ds_database_path(path)
+
+    @overrides(AbstractSpinnakerBase._execute_graph_binary_gatherer)
+    def _execute_graph_binary_gatherer(self) -> None:
+        # The binaries of a run bundle are set when it is read
+        if self.__run_bundle is None:
+            super()._execute_graph_binary_gatherer()
+
+    @property
+    def emulator(self) -> HostEmulator | None:
+        """
+        The emulator running the graph on the host, or `None` if the graph
+        is not being emulated.
+        """
+        return self.__emulator
+
+    @overrides(AbstractSpinnakerBase._execute_runner)
+    def _execute_runner(
+            self, n_sync_steps: int, run_time: float | None) -> None:
+        if not _is_emulated():
+            super()._execute_runner(n_sync_steps, run_time)
+            return
+        end_step = FecDataView.get_current_run_timesteps()
+        if end_step is None and self._run_until_complete:
+            raise ConfigurationException(
+                "A graph emulated on the host cannot be run until complete")
+        with PhaseTimer("Host emulator", TimerWork.RUNNING) as timer:
+            first_step = FecDataView.get_first_machine_time_step()
+            if self.__emulator is None or first_step == 0:
+                self.__emulator = HostEmulator()
+            # A run forever goes on until stop_run is called
+            stopped_at = self.__emulator.run(first_step, end_step)
+            if end_step is None:
+                self._data_writer.set_current_run_timesteps(stopped_at)
+            timer.add_objects(self.__emulator.n_cores)
+
+    @overrides(AbstractSpinnakerBase._execute_buffer_extractor)
+    def _execute_buffer_extractor(self) -> None:
+        if self.__emulator is None or not _is_emulated():
+            super()._execute_buffer_extractor()
+        else:
+            with PhaseTimer("Host emulator recordings",
+                            TimerWork.EXTRACT_DATA) as timer:
+                if not self._data_writer.has_buffer_manager():
+                    self._data_writer.set_buffer_manager(BufferManager())
+                timer.add_bytes(self.__emulator.store_recordings())
+                timer.add_objects(self.__emulator.n_cores)
+        # Nothing is extracted without a buffer manager
+        if self._data_writer.has_buffer_manager():
+            self.__store_recordings()
+            extraction_finished()
+
+    def __store_recordings(self) -> None:
+        """
+        If the recordings of the run are kept, describe what is recorded
+        in the recording store of the run, once per mapping, so that it
+        can be read once the run is over; if recordings are spilled to
+        disk, append what was just extracted to it.
+
+        They are kept if they are spilled, or if the buffer database they
+        are extracted into is kept.
+        """
+        spill = get_config_bool("Buffers", "spill_recordings")
+        if not spill and not get_config_bool(
+                "Reports", "keep_data_database"):
+            return
+        directory = recordings_directory(
+            self._data_writer.get_run_dir_path(),
+            self._data_writer.get_reset_number())
+        store = get_recording_store()
+        if store is None or store.directory != directory:
+            # A new run directory or a reset, which starts them again
+            store = RecordingStore(
+                directory, get_config_int(
+                    "Buffers", "recording_ram_mb") * 1024 * 1024,
+                BufferDatabase.default_database_file())
+            set_recording_store(store)
+            self.__recordings_described = False
+        with PhaseTimer("Recording store spill",
+                        TimerWork.EXTRACT_DATA) as timer:
+            if not self.__recordings_described:
+                channels = list(_recording_channels())
+                store.describe(channels)
+                timer.add_objects(len(channels))
+                self.__recordings_described = True
+            if spill:
+                timer.add_bytes(store.spill(prune=get_config_bool(
+                    "Buffers", "prune_spilled_recordings")))
+
+    def _allocate_machine(self) -> AllocatedMachine:
+        """
+        Get the machine as :py:meth:`_do_machine_by_transciever` would, but
+        without telling the simulation about it, as this is run in a thread
+        of its own.
+
+        :return: The machine got, and how to talk to it
+        """
+        retry = 0
+        while True:
+            try:
+                return self.__allocate()
+            except Exception:  # pylint: disable=broad-except
+                if retry >= get_config_int("Machine", "spalloc_retry"):
+                    raise
+                logger.exception(
+                    "Getting the machine in the background failed; "
+                    "retrying")
+                retry += 1
+
+    def __allocate(self) -> AllocatedMachine:
+        if not is_config_none("Machine", "machine_name"):
+            transceiver = transceiver_generator(
+                get_config_str_or_none("Machine", "bmp_names"),
+                get_config_bool("Machine", "auto_detect_bmp"), None,
+                get_config_bool("Machine", "reset_machine_on_startup"),
+                ensure_board_is_ready=True)
+            return AllocatedMachine(
+                get_config_str("Machine", "machine_name"), transceiver,
+                transceiver.get_machine_details())
+
+        spalloc_server = get_config_str_or_none("Machine", "spalloc_server")
+        controller: MachineAllocationController | None = None
+        connections: dict[XY, str] | None = None
+        try:
+            if spalloc_server is not None and is_server_address(
+                    spalloc_server):
+                reattached = None
+                if get_config_bool("Machine", "keep_session"):
+                    session = claim_session(_session_file())
+                    if session is not None:
+                        reattached = self.__reattach(session, True)
+                if reattached is not None:
+                    transceiver, connections, controller = reattached
+                    ipaddress = connections[0, 0]
+                else:
+                    ipaddress, connections, job_controller = (
+                        spalloc_allocate_job())
+                    controller = job_controller
+                    transceiver = self.__spalloc_transceiver(
+                        job_controller, connections, True)
+            elif spalloc_server is not None:
+                ipaddress, connections, controller = (
+                    spalloc_allocate_job_old())
+                transceiver = create_transceiver_from_hostname(
+                    ipaddress, ensure_board_is_ready=True)
+                transceiver.discover_scamp_connections()
+            else:
+                ipaddress, bmp_details, controller = hbp_allocator(None)
+                transceiver = transceiver_generator(
+                    bmp_details, auto_detect_bmp=False,
+                    scamp_connection_data=None,
+                    reset_machine_on_start_up=False,
+                    ensure_board_is_ready=True)
+            return AllocatedMachine(
+                ipaddress, transceiver, transceiver.get_machine_details(),
+                controller, connections)
+        except Exception:
+            # Nothing else knows of the allocation to release it
+            if controller is not None:
+                controller.close()
+            raise
+
+    @staticmethod
+    def __spalloc_transceiver(
+            controller: SpallocJobController, connections: dict[XY, str],
+            ensure_board_is_ready: bool) -> Transceiver:
+        if controller.can_create_transceiver():
+            return controller.create_transceiver(ensure_board_is_ready)
+        return transceiver_generator(
+            bmp_details=None, auto_detect_bmp=False,
+            scamp_connection_data=connections,
+            reset_machine_on_start_up=False,
+            ensure_board_is_ready=ensure_board_is_ready)
+
+    def __take_allocation(
+            self, ipaddress: str, transceiver: Transceiver,
+            controller: MachineAllocationController | None,
+            connections: dict[XY, str] | None) -> None:
+        """
+        Tell the simulation about a machine got for it.
+        """
+        self._data_writer.set_ipaddress(ipaddress)
+        if controller is not None:
+            self._data_writer.set_allocation_controller(controller)
+        self._data_writer.set_transceiver(transceiver)
+        if connections is not None:
+            with ProvenanceWriter() as db:
+                db.insert_board_provenance(connections)
+
+    def __wait_for_allocation(self) -> None:
+        """
+        Wait for a machine being got in the background, if there is one,
+        and then tell the simulation about it.
+        """
+        if self.__allocation is None:
+            return
+        allocation, self.__allocation = self.__allocation, None
+        with PhaseTimer("Waiting for background allocation",
+                        TimerWork.GET_MACHINE):
+            allocated = allocation.wait()
+        self.__take_allocation(
+            allocated.ipaddress, allocated.transceiver, allocated.controller,
+            allocated.connections)
+        self._data_writer.set_machine(allocated.machine)
+        logger.info(
+            "Getting the machine took {:.1f}s of which {:.1f}s was spent "
+            "waiting for it", allocation.allocation_time,
+            allocation.wait_time)
+
+    def __abandon_allocation(self) -> None:
+        """
+        Wait for a machine being got in the background, so that it can be
+        released, but only log it if getting it went wrong.
+        """
+        try:
+            self.__wait_for_allocation()
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Getting the machine in the background failed")
+
+    @overrides(AbstractSpinnakerBase._get_known_machine)
+    def _get_known_machine(
+            self, total_run_time: float | None = 0.0) -> Machine:
+        self.__wait_for_allocation()
+        return super()._get_known_machine(total_run_time)
+
+    @overrides(AbstractSpinnakerBase._execute_transceiver_by_spalloc)
+    def _execute_transceiver_by_spalloc(
+            self, ensure_board_is_ready: bool
+            ) -> tuple[Transceiver, dict[XY, str]]:
+        if get_config_bool("Machine", "keep_session"):
+            session = claim_session(_session_file())
+            if session is not None:
+                with PhaseTimer("Reattach to kept machine",
+                                TimerWork.GET_MACHINE):
+                    reattached = self.__reattach(
+                        session, ensure_board_is_ready)
+                if reattached is not None:
+                    transceiver, connections, controller = reattached
+                    self.__take_allocation(
+                        connections[0, 0], transceiver, controller,
+                        connections)
+                    return transceiver, connections
+        return super()._execute_transceiver_by_spalloc(ensure_board_is_ready)
+
+    def __reattach(
+            self, session: BoardSession, ensure_board_is_ready: bool
+            ) -> tuple[Transceiver, dict[XY, str],
+                       SpallocJobController] | None:
+        """
+        Reattach to a kept job, if it is what is wanted and still works.
+        Nothing is told to the simulation, so that this can be done in the
+        background.
+
+        :param session: The session of the kept job
+        :param ensure_board_is_ready:
+            Flag to say if ensure_board_is_ready should be run
+        :return: The transceiver, connections and controller of the job, or
+            `None` if a new job must be allocated instead
+        """
+        job: SpallocJob | None = None
+        controller: SpallocJobController | None = None
+        try:
+            if session.request != _session_request():
+                raise ValueError(
+                    "it was allocated for different settings or size")
+            job = take_kept_job(session.token)
+            if job is None:
+                # Kept by another process
+                job = SpallocClient.open_job_from_database(
+                    session.service_url, session.job_url,
+                    session.cookies, session.headers)
+            # Always a new controller, even if this process kept the job,
+            # as the one that kept it no longer watches the job; it owns a
+            # client of its own to close when it is done
+            controller = SpallocJobController(
+                SpallocClient(get_config_str("Machine", "spalloc_server")),
+                job, get_config_bool("Machine", "spalloc_use_proxy"))
+            state = controller.job.get_state()
+            if state != SpallocState.READY:
+                raise ValueError(f"its job is {state.name}")
+            connections = controller.job.get_connections()
+            transceiver = self.__spalloc_transceiver(
+                controller, connections, ensure_board_is_ready)
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.warning(
+                "Not reusing the machine kept at {} as {}; allocating a new "
+                "one", session.job_url, ex)
+            try:
+                if controller is not None:
+                    controller.close()
+                elif job is not None:
+                    job.destroy("not reusable")
+                else:
+                    destroy_job(session, "not reusable")
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Destroying the kept job failed")
+            return None
+        logger.info("Reusing the machine kept at {}", session.job_url)
+        return transceiver, connections, controller
+
+    @overrides(AbstractSpinnakerBase._close_allocation_controller)
+    def _close_allocation_controller(self) -> None:
+        if self.__keep_job and self._data_writer.has_allocation_controller():
+            controller = self._data_writer.get_allocation_controller()
+            if isinstance(controller, SpallocJobController):
+                try:
+                    self.__keep(controller)
+                    self._data_writer.set_allocation_controller(None)
+                    return
+                except Exception:  # pylint: disable=broad-except
+                    logger.exception("Keeping the machine failed")
+        super()._close_allocation_controller()
+
+    def __keep(self, controller: SpallocJobController) -> None:
+        """
+        Keep the job of a controller for the next setup to reuse, and stop
+        controlling it without destroying it.
+
+        :param controller: The controller of the job to keep
+        """
+        credentials = controller.job.get_session_credentials_for_db()
+        session = BoardSession(
+            credentials["SPALLOC", "service uri"],
+            credentials["SPALLOC", "job uri"],
+            {name: value for (kind, name), value in credentials.items()
+             if kind == "COOKIE"},
+            {name: value for (kind, name), value in credentials.items()
+             if kind == "HEADER"},
+            _session_request(),
+            time.time() + get_config_int("Machine", "session_idle_timeout"))
+        keep_job(_session_file(), session, controller.job)
+        # Stops watching the job without destroying it
+        MachineAllocationController.close(controller)
+        logger.info("Keeping the machine at {} for {}s", session.job_url,
+                    get_config_int("Machine", "session_idle_timeout"))
+
+    @overrides(AbstractSpinnakerBase._run)
+    def _run(self, run_time: float | None, sync_time: float) -> None:
+        if self.__run_bundle is None:
+            super()._run(run_time, sync_time)
+        else:
+            with run_bundle_settings():
+                super()._run(run_time, sync_time)
+        if get_config_bool("Reports", "write_phase_timings"):
+            write_phase_timings()
+
+    @overrides(AbstractSpinnakerBase.stop)
+    def stop(self) -> None:
+        self.__abandon_allocation()
+        self.__keep_job = get_config_bool("Machine", "keep_session")
+        # The paths cannot be worked out once the simulation has stopped
+        write_timings = get_config_bool("Reports", "write_phase_timings")
+        if write_timings:
+            path = get_timestamp_path("tpath_phase_timings")
+            database_file = GlobalProvenance.get_global_provenace_path()
+        super().stop()
+        if write_timings:
+            write_phase_timings(path, database_file)
+
     def __repr__(self) -> str:
         if FecDataView.has_ipaddress():
             return (f"SpiNNaker Graph Front End object "
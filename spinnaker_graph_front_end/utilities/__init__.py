@@ -12,6 +12,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .simulator_vertex import SimulatorVertex
+from .array_vertex import (
+    ArrayApplicationVertex, ArrayRegions, ArraySliceVertex,
+    SplitterArrayVertex)
+from .compact_edge_store import CompactEdgeStore
+from .emulated_vertex import AbstractEmulatedVertex, EmulatedCore
+from .indexed_machine_edge import IndexedMachineEdge
+from .lattice import AbstractLatticeVertex, Boundary, Lattice, Neighbourhood
+from .recordings import (
+    RecordingChunk, get_recordings, iter_recordings, stack_recordings)
+from .simulator_vertex import (
+    SimulatorVertex, pack_recording_bits, packed_recording_array,
+    packed_recording_sdram, packed_recording_size, recording_array,
+    recording_region_size)
 
-__all__ = ["SimulatorVertex"]
+__all__ = [
+    "AbstractEmulatedVertex", "AbstractLatticeVertex",
+    "ArrayApplicationVertex", "ArrayRegions", "ArraySliceVertex", "Boundary",
+    "CompactEdgeStore", "EmulatedCore", "IndexedMachineEdge", "Lattice",
+    "Neighbourhood", "RecordingChunk", "SimulatorVertex",
+    "SplitterArrayVertex", "get_recordings", "iter_recordings",
+    "pack_recording_bits", "packed_recording_array",
+    "packed_recording_sdram", "packed_recording_size", "recording_array",
+    "recording_region_size", "stack_recordings"]
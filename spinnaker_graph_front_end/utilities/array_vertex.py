@@ -0,0 +1,400 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Application vertices whose atoms have parameters held in NumPy arrays, and
+are split into cores by the resources each atom needs.
+"""
+
+from collections.abc import Iterable, Mapping
+from enum import IntEnum
+
+import numpy
+from numpy.typing import ArrayLike, NDArray
+
+from spinn_utilities.overrides import overrides
+
+from spinn_machine.tags import IPTag, ReverseIPTag
+
+from pacman.exceptions import (
+    PacmanConfigurationException, PacmanInvalidParameterException)
+from pacman.model.graphs.application import ApplicationVertex
+from pacman.model.graphs.common import Slice
+from pacman.model.graphs.machine import MachineVertex
+from pacman.model.partitioner_splitters import AbstractSplitterCommon
+from pacman.model.placements import Placement
+from pacman.model.resources import AbstractSDRAM, ConstantSDRAM
+from pacman.utilities.utility_objs import ChipCounter
+
+from spinn_front_end_common.abstract_models.impl import (
+    MachineDataSpecableVertex,
+)
+from spinn_front_end_common.data import FecDataView
+from spinn_front_end_common.interface.ds import DataSpecificationGenerator
+from spinn_front_end_common.utilities.constants import (
+    BYTES_PER_KB,
+    BYTES_PER_WORD,
+    CLOCKS_PER_US,
+    SYSTEM_BYTES_REQUIREMENT,
+)
+
+from .simulator_vertex import SimulatorVertex
+
+
+class ArrayRegions(IntEnum):
+    """
+    The regions written by an :py:class:`ArraySliceVertex`.
+    """
+    #: The simulation interface
+    SYSTEM = 0
+    #: The number of atoms, then the slice of each parameter array
+    PARAMETERS = 1
+
+
+def _padded_size(n_bytes: int) -> int:
+    return -(-n_bytes // BYTES_PER_WORD) * BYTES_PER_WORD
+
+
+class ArraySliceVertex(SimulatorVertex, MachineDataSpecableVertex):
+    """
+    A core of an :py:class:`ArrayApplicationVertex`, which writes the
+    parameters of its own atoms into its data specification.
+
+    The parameters region holds the number of atoms, then the slice of
+    each parameter array in the order they were given, as little-endian
+    values, each padded to a whole number of words.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, label: str | None, binary_name: str,
+                 vertex_slice: Slice,
+                 app_vertex: "ArrayApplicationVertex") -> None:
+        """
+        :param label: The label of the vertex
+        :param binary_name: The name of the APLX implementing the vertex
+        :param vertex_slice: The atoms of the application vertex on the core
+        :param app_vertex: The application vertex holding the parameters
+        """
+        super().__init__(label, binary_name, vertex_slice)
+        self._app_vertex = app_vertex
+
+    @property
+    def array_vertex(self) -> "ArrayApplicationVertex":
+        """
+        The application vertex holding the parameters.
+        """
+        assert isinstance(self._app_vertex, ArrayApplicationVertex)
+        return self._app_vertex
+
+    @property
+    def parameters(self) -> dict[str, NDArray]:
+        """
+        The parameters of the atoms on this core; each is a view of the
+        array of the application vertex.
+        """
+        return self.array_vertex.get_parameters_of(self.vertex_slice)
+
+    @property
+    @overrides(MachineVertex.sdram_required)
+    def sdram_required(self) -> AbstractSDRAM:
+        return self.array_vertex.get_sdram_used_by_atoms(self.vertex_slice)
+
+    @overrides(SimulatorVertex.get_data_specification_parameters)
+    def get_data_specification_parameters(self) -> object | None:
+        return tuple((name, array.dtype.str, array.tobytes())
+                     for name, array in self.parameters.items())
+
+    def generate_parameters_region(
+            self, spec: DataSpecificationGenerator,
+            region_id: int = ArrayRegions.PARAMETERS) -> None:
+        """
+        Reserve and write the parameters region.
+
+        :param spec: The data specification being built
+        :param region_id: The region to write the parameters into
+        """
+        parameters = self.parameters
+        spec.reserve_memory_region(
+            region=region_id,
+            size=self.array_vertex.get_parameters_size(
+                self.vertex_slice.n_atoms),
+            label="parameters")
+        spec.switch_write_focus(region_id)
+        spec.write_value(self.vertex_slice.n_atoms)
+        for array in parameters.values():
+            data = array.astype(array.dtype.newbyteorder("<")).tobytes()
+            data += bytes(_padded_size(len(data)) - len(data))
+            if data:
+                spec.write_array(numpy.frombuffer(data, dtype="<u4"))
+
+    @overrides(MachineDataSpecableVertex.generate_machine_data_specification)
+    def generate_machine_data_specification(
+            self, spec: DataSpecificationGenerator, placement: Placement,
+            iptags: Iterable[IPTag] | None,
+            reverse_iptags: Iterable[ReverseIPTag] | None) -> None:
+        # pylint: disable=arguments-differ
+        self.generate_system_region(spec, ArrayRegions.SYSTEM)
+        self.generate_parameters_region(spec, ArrayRegions.PARAMETERS)
+        spec.end_specification()
+
+
+class ArrayApplicationVertex(ApplicationVertex[ArraySliceVertex]):
+    """
+    An application vertex of many similar atoms, with the parameters of
+    each atom held in NumPy arrays rather than in a vertex per atom.
+
+    The atoms are split into :py:class:`ArraySliceVertex` cores by
+    :py:class:`SplitterArrayVertex`, with as many atoms on each as fit the
+    SDRAM, DTCM and CPU time of a core.  Override
+    :py:meth:`get_sdram_used_by_atoms`, :py:attr:`dtcm_per_atom`,
+    :py:attr:`cpu_cycles_per_atom` or :py:meth:`create_machine_vertex` to
+    describe a binary that needs more than its parameters.
+    """
+
+    __slots__ = ("_binary_name", "_n_atoms", "_parameters")
+
+    #: DTCM of each core to leave for the stack and the simulation interface
+    DTCM_RESERVED = 8 * BYTES_PER_KB
+
+    def __init__(self, binary_name: str,
+                 parameters: Mapping[str, ArrayLike],
+                 label: str | None = None,
+                 max_atoms_per_core: int | None = None) -> None:
+        """
+        :param binary_name: The name of the APLX implementing each core
+        :param parameters:
+            The parameters of the atoms, by name; the first dimension of
+            each array is the atom
+        :param label: The label of the vertex
+        :param max_atoms_per_core:
+            The most atoms to put on a core, whatever the resources allow
+        :raises PacmanInvalidParameterException:
+            If there are no parameters, or they are not all for the same
+            number of atoms
+        """
+        arrays = {name: numpy.asarray(array)
+                  for name, array in parameters.items()}
+        if not arrays:
+            raise PacmanInvalidParameterException(
+                "parameters", "{}", "There must be at least one parameter")
+        lengths = {name: array.shape[0] if array.ndim else None
+                   for name, array in arrays.items()}
+        if len(set(lengths.values())) != 1 or None in lengths.values():
+            raise PacmanInvalidParameterException(
+                "parameters", str(lengths),
+                "Each parameter must be an array with one row per atom")
+        super().__init__(label, max_atoms_per_core, SplitterArrayVertex())
+        self._binary_name = binary_name
+        self._parameters = arrays
+        self._n_atoms = int(next(iter(lengths.values())) or 0)
+
+    @property
+    @overrides(ApplicationVertex.n_atoms)
+    def n_atoms(self) -> int:
+        return self._n_atoms
+
+    @property
+    def binary_name(self) -> str:
+        """
+        The name of the APLX implementing each core.
+        """
+        return self._binary_name
+
+    @property
+    def parameters(self) -> Mapping[str, NDArray]:
+        """
+        The parameter arrays, by name.
+        """
+        return self._parameters
+
+    def get_parameters_of(self, vertex_slice: Slice) -> dict[str, NDArray]:
+        """
+        Get the parameters of some of the atoms.
+
+        :param vertex_slice: The atoms to get the parameters of
+        :return: A view of each parameter array for the atoms
+        """
+        atoms = vertex_slice.as_slice()
+        return {name: array[atoms]
+                for name, array in self._parameters.items()}
+
+    def get_parameters_size(self, n_atoms: int) -> int:
+        """
+        Get the size of the parameters region of a core.
+
+        :param n_atoms: The number of atoms on the core
+        :return: The size in bytes
+        """
+        return BYTES_PER_WORD + sum(
+            _padded_size(n_atoms * array[:1].nbytes)
+            for array in self._parameters.values())
+
+    def get_sdram_used_by_atoms(self, vertex_slice: Slice) -> AbstractSDRAM:
+        """
+        Get the SDRAM needed by a core for some atoms.  By default this is
+        the system and parameters regions.
+
+        :param vertex_slice: The atoms on the core
+        :return: The SDRAM needed
+        """
+        return ConstantSDRAM(
+            SYSTEM_BYTES_REQUIREMENT +
+            self.get_parameters_size(vertex_slice.n_atoms))
+
+    @property
+    def dtcm_per_atom(self) -> int:
+        """
+        The DTCM needed by each atom on a core.  By default this is the
+        size of its parameters, as if the binary keeps them all in DTCM.
+        """
+        return sum(array[:1].nbytes for array in self._parameters.values())
+
+    @property
+    def cpu_cycles_per_atom(self) -> int:
+        """
+        The CPU cycles each atom needs each timestep, or 0 (the default)
+        if the time it takes does not limit the atoms on a core.
+        """
+        return 0
+
+    def create_machine_vertex(
+            self, vertex_slice: Slice, label: str) -> ArraySliceVertex:
+        """
+        Create the vertex for a core.
+
+        :param vertex_slice: The atoms on the core
+        :param label: The label of the vertex
+        :return: The vertex of the core
+        """
+        return ArraySliceVertex(label, self._binary_name, vertex_slice, self)
+
+
+class SplitterArrayVertex(AbstractSplitterCommon[ArrayApplicationVertex]):
+    """
+    Splits an :py:class:`ArrayApplicationVertex` into cores of as many
+    atoms as fit in the SDRAM, DTCM and CPU time of a core.
+    """
+
+    __slots__ = ("__slices", )
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.__slices: list[Slice] | None = None
+
+    @overrides(AbstractSplitterCommon.set_governed_app_vertex)
+    def set_governed_app_vertex(
+            self, app_vertex: ArrayApplicationVertex) -> None:
+        if not isinstance(app_vertex, ArrayApplicationVertex):
+            raise PacmanConfigurationException(
+                f"{self} can only split an ArrayApplicationVertex")
+        super().set_governed_app_vertex(app_vertex)
+
+    def _fits_sdram(self, n_atoms: int, sdram_per_core: int) -> bool:
+        sdram = self.governed_app_vertex.get_sdram_used_by_atoms(
+            Slice(0, n_atoms - 1))
+        return sdram.get_total_sdram(
+            FecDataView.get_plan_n_timestep()) <= sdram_per_core
+
+    def get_max_atoms_per_core(self) -> int:
+        """
+        Work out the most atoms that fit on a core.
+
+        :return: The number of atoms
+        :raises PacmanConfigurationException:
+            If not even one atom fits on a core
+        """
+        app_vertex = self.governed_app_vertex
+        version = FecDataView.get_machine_version()
+        n_atoms = min(app_vertex.get_max_atoms_per_core(), app_vertex.n_atoms)
+
+        # Only limit by the DTCM and CPU time if the atoms need any
+        if app_vertex.dtcm_per_atom:
+            n_atoms = min(n_atoms, (
+                version.dtcm_bytes - app_vertex.DTCM_RESERVED) //
+                app_vertex.dtcm_per_atom)
+        if app_vertex.cpu_cycles_per_atom:
+            cycles_per_step = int(
+                CLOCKS_PER_US * FecDataView.get_hardware_time_step_us())
+            n_atoms = min(
+                n_atoms, cycles_per_step // app_vertex.cpu_cycles_per_atom)
+
+        # Share the SDRAM of a chip between its cores; the cost of a core
+        # only grows with its atoms, so search for the most that fit
+        n_cores = (version.max_cores_per_chip - version.n_scamp_cores -
+                   FecDataView.get_all_monitor_cores())
+        sdram_per_core = (
+            version.max_sdram_per_chip -
+            FecDataView.get_all_monitor_sdram().get_total_sdram(
+                FecDataView.get_plan_n_timestep())) // max(n_cores, 1)
+        if n_atoms > 0 and not self._fits_sdram(n_atoms, sdram_per_core):
+            low, high = 0, n_atoms
+            while high - low > 1:
+                middle = (low + high) // 2
+                if self._fits_sdram(middle, sdram_per_core):
+                    low = middle
+                else:
+                    high = middle
+            n_atoms = low
+
+        if n_atoms < 1 and app_vertex.n_atoms:
+            raise PacmanConfigurationException(
+                f"Not even one atom of {app_vertex} fits on a core")
+        return n_atoms
+
+    @property
+    def __fixed_slices(self) -> list[Slice]:
+        if self.__slices is None:
+            n_atoms = self.governed_app_vertex.n_atoms
+            per_core = self.get_max_atoms_per_core() if n_atoms else 1
+            self.__slices = [
+                Slice(lo_atom, min(lo_atom + per_core, n_atoms) - 1)
+                for lo_atom in range(0, n_atoms, per_core)]
+        return self.__slices
+
+    @overrides(AbstractSplitterCommon.create_machine_vertices)
+    def create_machine_vertices(self, chip_counter: ChipCounter) -> None:
+        app_vertex = self.governed_app_vertex
+        for vertex_slice in self.__fixed_slices:
+            machine_vertex = app_vertex.create_machine_vertex(
+                vertex_slice, f"{app_vertex.label}{vertex_slice}")
+            chip_counter.add_core(machine_vertex.sdram_required)
+            app_vertex.remember_machine_vertex(machine_vertex)
+
+    @overrides(AbstractSplitterCommon.get_out_going_vertices)
+    def get_out_going_vertices(
+            self, partition_id: str) -> list[ArraySliceVertex]:
+        return list(self.governed_app_vertex.machine_vertices)
+
+    @overrides(AbstractSplitterCommon.get_in_coming_vertices)
+    def get_in_coming_vertices(
+            self, partition_id: str) -> list[ArraySliceVertex]:
+        return list(self.governed_app_vertex.machine_vertices)
+
+    @overrides(AbstractSplitterCommon.machine_vertices_for_recording)
+    def machine_vertices_for_recording(
+            self, variable_to_record: str) -> list[ArraySliceVertex]:
+        return list(self.governed_app_vertex.machine_vertices)
+
+    @overrides(AbstractSplitterCommon.get_out_going_slices)
+    def get_out_going_slices(self) -> list[Slice]:
+        return self.__fixed_slices
+
+    @overrides(AbstractSplitterCommon.get_in_coming_slices)
+    def get_in_coming_slices(self) -> list[Slice]:
+        return self.__fixed_slices
+
+    @overrides(AbstractSplitterCommon.reset_called)
+    def reset_called(self) -> None:
+        self.__slices = None
@@ -0,0 +1,264 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+
+import numpy
+from numpy.typing import ArrayLike, NDArray
+
+from pacman.exceptions import (
+    PacmanAlreadyExistsException,
+    PacmanInvalidParameterException,
+)
+from pacman.model.graphs.machine import MachineVertex
+
+from .indexed_machine_edge import IndexedMachineEdge
+
+#: The type used to hold vertex indices
+INDEX_TYPE = numpy.uint32
+
+# The number of edges to make space for when a partition is first used
+_INITIAL_CAPACITY = 64
+
+
+def check_edge_indices(
+        n_vertices: int, pre_indices: ArrayLike, post_indices: ArrayLike
+        ) -> tuple[NDArray[numpy.intp], NDArray[numpy.intp]]:
+    """
+    Check that two arrays of vertex indices describe a batch of edges.
+
+    :param n_vertices: The number of vertices the indices may refer to
+    :param pre_indices: The indices of the vertices at the edge starts
+    :param post_indices: The indices of the vertices at the edge ends
+    :return: The two arrays of indices, as flat arrays of intp
+    :raises ~pacman.exceptions.PacmanInvalidParameterException:
+        If the indices are not integers, are out of range or the two arrays
+        are different lengths
+    """
+    checked = list()
+    for name, indices in (("pre_indices", pre_indices),
+                          ("post_indices", post_indices)):
+        array = numpy.asarray(indices)
+        if array.size and not numpy.issubdtype(array.dtype, numpy.integer):
+            raise PacmanInvalidParameterException(
+                name, str(array.dtype), "Indices must be integers")
+        array = array.astype(numpy.intp).ravel()
+        if array.size and (array.min() < 0 or array.max() >= n_vertices):
+            raise PacmanInvalidParameterException(
+                name, f"{array.min()}..{array.max()}",
+                f"Indices must be in the range 0..{n_vertices - 1}")
+        checked.append(array)
+    pre, post = checked
+    if len(pre) != len(post):
+        raise PacmanInvalidParameterException(
+            "post_indices", len(post),
+            f"There must be one per pre-index, and there are {len(pre)}")
+    return pre, post
+
+
+class _PartitionArrays(object):
+    """
+    The growable index arrays of the edges of one outgoing partition.
+    """
+
+    __slots__ = ("labeller", "n_edges", "post", "pre")
+
+    def __init__(self) -> None:
+        self.pre: NDArray[numpy.uint32] = numpy.empty(
+            _INITIAL_CAPACITY, dtype=INDEX_TYPE)
+        self.post: NDArray[numpy.uint32] = numpy.empty(
+            _INITIAL_CAPACITY, dtype=INDEX_TYPE)
+        self.n_edges = 0
+        self.labeller: Callable[[int], str] | None = None
+
+    def append(self, pre: NDArray[numpy.intp],
+               post: NDArray[numpy.intp]) -> None:
+        """
+        Add edges to the end of the arrays, growing them if needed.
+
+        :param pre: The indices of the vertices at the edge starts
+        :param post: The indices of the vertices at the edge ends
+        """
+        end = self.n_edges + len(pre)
+        if end > len(self.pre):
+            capacity = max(end, 2 * len(self.pre))
+            self.pre = numpy.resize(self.pre, capacity)
+            self.post = numpy.resize(self.post, capacity)
+        self.pre[self.n_edges:end] = pre
+        self.post[self.n_edges:end] = post
+        self.n_edges = end
+
+
+class CompactEdgeStore(object):
+    """
+    Holds machine edges as arrays of vertex indices, one pair of arrays per
+    outgoing partition, instead of one Python object per edge.
+
+    Each edge costs two 32-bit integers. A
+    :py:class:`~spinnaker_graph_front_end.utilities.IndexedMachineEdge`
+    view of an edge is only made when it is asked for, and is not kept.
+    Adding the edges to the graph, with
+    :py:func:`~spinnaker_graph_front_end.add_compact_edges`, makes an
+    object of each of them that the graph keeps, so the peak memory use
+    of mapping the graph is no lower than if the edges were made as
+    objects in the first place.
+    """
+
+    __slots__ = ("_partitions", "_vertex_index", "_vertices")
+
+    def __init__(self) -> None:
+        self._vertices: list[MachineVertex] = list()
+        self._vertex_index: dict[MachineVertex, int] = dict()
+        self._partitions: dict[str, _PartitionArrays] = dict()
+
+    def add_vertices(self, vertices: Iterable[MachineVertex]) -> range:
+        """
+        Add vertices that edges may then refer to by index.
+
+        :param vertices: The vertices to add
+        :return: The indices given to the vertices
+        :raises ~pacman.exceptions.PacmanAlreadyExistsException:
+            If a vertex is already in the store
+        """
+        start = len(self._vertices)
+        for vertex in vertices:
+            if vertex in self._vertex_index:
+                raise PacmanAlreadyExistsException("vertex", vertex.label)
+            self._vertex_index[vertex] = len(self._vertices)
+            self._vertices.append(vertex)
+        return range(start, len(self._vertices))
+
+    @property
+    def vertices(self) -> Sequence[MachineVertex]:
+        """
+        The vertices that the edge indices refer to.
+        """
+        return self._vertices
+
+    def index_of(self, vertex: MachineVertex) -> int:
+        """
+        :param vertex: A vertex in the store
+        :return: The index of the vertex
+        """
+        return self._vertex_index[vertex]
+
+    def add_edges(
+            self, partition_id: str, pre_indices: ArrayLike,
+            post_indices: ArrayLike,
+            labeller: Callable[[int], str] | None = None) -> None:
+        """
+        Add edges to a partition.
+
+        :param partition_id: The ID of the partition the edges belong to
+        :param pre_indices: For each edge, the index of its start vertex
+        :param post_indices: For each edge, the index of its end vertex
+        :param labeller:
+            Makes the label of an edge from its index in the partition;
+            replaces any labeller previously given for the partition.
+        :raises ~pacman.exceptions.PacmanInvalidParameterException:
+            If the indices are not valid
+        """
+        pre, post = check_edge_indices(
+            len(self._vertices), pre_indices, post_indices)
+        arrays = self._partitions.get(partition_id)
+        if arrays is None:
+            arrays = _PartitionArrays()
+            self._partitions[partition_id] = arrays
+        arrays.append(pre, post)
+        if labeller is not None:
+            arrays.labeller = labeller
+
+    @property
+    def partition_ids(self) -> Iterable[str]:
+        """
+        The IDs of the partitions that have edges.
+        """
+        return self._partitions.keys()
+
+    def n_edges(self, partition_id: str | None = None) -> int:
+        """
+        :param partition_id:
+            The partition to count, or `None` to count all partitions
+        :return: The number of edges stored
+        """
+        if partition_id is None:
+            return sum(arrays.n_edges for arrays in self._partitions.values())
+        return self._partitions[partition_id].n_edges
+
+    def pre_indices(self, partition_id: str) -> NDArray[numpy.uint32]:
+        """
+        :param partition_id: The partition to get the indices of
+        :return: A read-only view of the start vertex index of each edge
+        """
+        arrays = self._partitions[partition_id]
+        view = arrays.pre[:arrays.n_edges]
+        view.flags.writeable = False
+        return view
+
+    def post_indices(self, partition_id: str) -> NDArray[numpy.uint32]:
+        """
+        :param partition_id: The partition to get the indices of
+        :return: A read-only view of the end vertex index of each edge
+        """
+        arrays = self._partitions[partition_id]
+        view = arrays.post[:arrays.n_edges]
+        view.flags.writeable = False
+        return view
+
+    def get_edge(self, partition_id: str, index: int) -> IndexedMachineEdge:
+        """
+        :param partition_id: The partition containing the edge
+        :param index: The index of the edge within its partition
+        :return: A view of a single edge
+        """
+        arrays = self._partitions[partition_id]
+        if not 0 <= index < arrays.n_edges:
+            raise IndexError(f"No edge {index} in partition {partition_id}")
+        return IndexedMachineEdge(
+            self._vertices[arrays.pre[index]],
+            self._vertices[arrays.post[index]], index, arrays.labeller)
+
+    def iterate_edges(self, partition_id: str) -> Iterator[IndexedMachineEdge]:
+        """
+        :param partition_id: The partition to iterate over
+        :return: Views of each edge in the partition, made as needed
+        """
+        arrays = self._partitions[partition_id]
+        vertices = self._vertices
+        n_edges = arrays.n_edges
+        for index, (pre, post) in enumerate(zip(
+                arrays.pre[:n_edges].tolist(),
+                arrays.post[:n_edges].tolist())):
+            yield IndexedMachineEdge(
+                vertices[pre], vertices[post], index, arrays.labeller)
+
+    def post_vertices_of(
+            self, partition_id: str, vertex: MachineVertex) -> list[int]:
+        """
+        :param partition_id: The partition to look in
+        :param vertex: The vertex at the start of the edges
+        :return: The indices of the vertices the given vertex has edges to
+        """
+        arrays = self._partitions[partition_id]
+        n_edges = arrays.n_edges
+        mask = arrays.pre[:n_edges] == self._vertex_index[vertex]
+        return arrays.post[:n_edges][mask].tolist()
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The number of bytes used by the edge index arrays.
+        """
+        return sum(arrays.pre.nbytes + arrays.post.nbytes
+                   for arrays in self._partitions.values())
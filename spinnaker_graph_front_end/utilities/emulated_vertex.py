@@ -0,0 +1,175 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Running vertices on the host instead of on SpiNNaker.
+"""
+
+from collections import defaultdict
+
+import numpy
+from numpy.typing import ArrayLike, NDArray
+
+from spinn_utilities.abstract_base import AbstractBase, abstractmethod
+
+from pacman.model.placements import Placement
+
+from .simulator_vertex import SimulatorVertex, pack_recording_bits
+
+#: The type of the keys and payloads of packets: words, as on SpiNNaker
+WORD = numpy.dtype("<u4")
+
+
+class EmulatedCore(object):
+    """
+    What a vertex emulated on the host can do in place of the binary on its
+    core: send multicast packets and record data.
+    """
+
+    __slots__ = ("_placement", "_records", "_sent_keys", "_sent_payloads")
+
+    def __init__(self, placement: Placement):
+        """
+        :param placement: Where the vertex is placed
+        """
+        self._placement = placement
+        self._sent_keys: list[NDArray[numpy.uint32]] = []
+        self._sent_payloads: list[NDArray[numpy.uint32]] = []
+        self._records: dict[int, list[bytes]] = defaultdict(list)
+
+    @property
+    def placement(self) -> Placement:
+        """
+        Where the vertex is placed.
+        """
+        return self._placement
+
+    def send(self, keys: ArrayLike, payloads: ArrayLike = 0) -> None:
+        """
+        Send multicast packets. They are received on the next timestep.
+
+        :param keys: The key of each packet
+        :param payloads:
+            The payload of each packet, or one payload for all of them
+        """
+        key_array = numpy.atleast_1d(numpy.asarray(keys, dtype=WORD))
+        self._sent_keys.append(key_array)
+        self._sent_payloads.append(numpy.broadcast_to(
+            numpy.asarray(payloads, dtype=WORD), key_array.shape))
+
+    def record(self, recording_id: int, data: ArrayLike) -> None:
+        """
+        Record data in a channel, as the binary would with
+        ``recording_record``.
+
+        The values are recorded little-endian, as SpiNNaker would record
+        them, in the dtype declared for the channel, or if it is a
+        packed-bit channel, as one bit each.
+
+        :param recording_id: Which recording channel to record in
+        :param data: The values to record
+        """
+        vertex = self._placement.vertex
+        if not isinstance(vertex, SimulatorVertex):
+            array = numpy.asarray(data)
+            self._records[recording_id].append(array.astype(
+                array.dtype.newbyteorder("<")).tobytes())
+        elif vertex.is_recording_channel_packed(recording_id):
+            self._records[recording_id].append(
+                numpy.asarray(data, dtype=numpy.bool_).tobytes())
+        else:
+            dtype = vertex.get_recording_channel_dtype(recording_id)
+            self._records[recording_id].append(numpy.asarray(
+                data, dtype=dtype.newbyteorder("<")).tobytes())
+
+    def take_sent(self) -> tuple[NDArray[numpy.uint32],
+                                 NDArray[numpy.uint32]]:
+        """
+        Take the packets sent since this was last called.
+
+        :return: The keys and payloads of the packets
+        """
+        if not self._sent_keys:
+            empty = numpy.zeros(0, dtype=WORD)
+            return empty, empty
+        keys = numpy.concatenate(self._sent_keys)
+        payloads = numpy.concatenate(self._sent_payloads)
+        self._sent_keys.clear()
+        self._sent_payloads.clear()
+        return keys, payloads
+
+    def take_recordings(self) -> dict[int, bytes]:
+        """
+        Take the data recorded since this was last called, which is the end
+        of a run, in the form the binary would have recorded it.
+
+        :return: The data recorded in each channel
+        """
+        vertex = self._placement.vertex
+        recordings = {}
+        for recording_id, records in self._records.items():
+            if (isinstance(vertex, SimulatorVertex) and
+                    vertex.is_recording_channel_packed(recording_id)):
+                recordings[recording_id] = pack_recording_bits(
+                    numpy.frombuffer(b"".join(records), dtype=numpy.bool_))
+            else:
+                recordings[recording_id] = b"".join(records)
+        self._records.clear()
+        return recordings
+
+
+class AbstractEmulatedVertex(object, metaclass=AbstractBase):
+    """
+    A vertex that can be run on the host, one timestep at a time, when the
+    ``emulate_virtual_board`` option is on with a virtual board.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def emulation_start(self, core: EmulatedCore) -> None:
+        """
+        Set up the state of the vertex at the start of the simulation, as
+        the binary would when it is loaded; this is called again after a
+        reset.
+
+        :param core: The core the vertex is emulated on
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def emulation_step(
+            self, core: EmulatedCore, timestep: int,
+            keys: NDArray[numpy.uint32],
+            payloads: NDArray[numpy.uint32]) -> None:
+        """
+        Do the work of one timestep, as the binary would in its timer
+        callback.
+
+        :param core: The core the vertex is emulated on
+        :param timestep: The timestep, counting from the start of the
+            simulation
+        :param keys: The keys of the packets received since the last
+            timestep, in the order of the placements of their senders
+        :param payloads: The payloads of those packets
+        """
+        raise NotImplementedError
+
+    def emulation_pause(self, core: EmulatedCore) -> None:
+        """
+        Do whatever the binary does when the simulation pauses at the end of
+        a run.  Does nothing by default.
+
+        :param core: The core the vertex is emulated on
+        """
@@ -0,0 +1,56 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Callable
+
+from spinn_utilities.overrides import overrides
+
+from pacman.model.graphs.machine import MachineEdge, MachineVertex
+
+
+class IndexedMachineEdge(MachineEdge):
+    """
+    A machine edge created as one of a batch, which only works out its
+    label if and when the label is asked for.
+    """
+
+    __slots__ = ("_index", "_labeller")
+
+    def __init__(self, pre_vertex: MachineVertex, post_vertex: MachineVertex,
+                 index: int, labeller: Callable[[int], str] | None = None):
+        """
+        :param pre_vertex: The vertex at the start of the edge.
+        :param post_vertex: The vertex at the end of the edge.
+        :param index: The position of the edge within its batch.
+        :param labeller:
+            Makes the label of the edge from its index, or `None` if the
+            edge has no label.
+        """
+        super().__init__(pre_vertex, post_vertex)
+        self._index = index
+        self._labeller = labeller
+
+    @property
+    def index(self) -> int:
+        """
+        The position of the edge within the batch it was created in.
+        """
+        return self._index
+
+    @property
+    @overrides(MachineEdge.label)
+    def label(self) -> str | None:
+        if self._labeller is None:
+            return None
+        return self._labeller(self._index)
@@ -0,0 +1,250 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Vectorised construction of 2D lattice (stencil) graphs.
+"""
+
+from collections.abc import Callable, Sequence
+from enum import Enum
+from typing import Generic, TypeVar
+
+import numpy
+from numpy.typing import ArrayLike, NDArray
+
+from spinn_utilities.abstract_base import AbstractBase, abstractmethod
+
+from pacman.exceptions import PacmanInvalidParameterException
+from pacman.model.graphs.machine import MachineVertex
+
+#: Type of the vertices in a lattice
+V = TypeVar("V", bound=MachineVertex)
+
+
+class Neighbourhood(Enum):
+    """
+    The standard shapes of neighbourhood of a cell in a lattice.
+    """
+    #: The 8 cells around a cell, including the diagonals
+    MOORE = ((0, 1), (1, 1), (1, 0), (1, -1),
+             (0, -1), (-1, -1), (-1, 0), (-1, 1))
+    #: The 4 cells next to a cell, excluding the diagonals
+    VON_NEUMANN = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+
+class Boundary(Enum):
+    """
+    What happens to a neighbour that falls outside the lattice.
+    """
+    #: The lattice wraps around in both dimensions (a torus)
+    WRAP = 0
+    #: Neighbours outside the lattice are left out
+    CLIP = 1
+
+
+class AbstractLatticeVertex(object, metaclass=AbstractBase):
+    """
+    A vertex that wants to be told which vertices send to it when it is
+    built into a lattice.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def set_lattice_neighbours(
+            self, neighbours: Sequence[MachineVertex]) -> None:
+        """
+        Set the vertices which have edges to this vertex in the lattice.
+
+        :param neighbours: The neighbours, in the order of the offsets
+        """
+        raise NotImplementedError
+
+
+def lattice_offsets(
+        neighbourhood: Neighbourhood | ArrayLike) -> NDArray[numpy.intp]:
+    """
+    Get the neighbour offsets of a neighbourhood as an array.
+
+    :param neighbourhood:
+        A standard neighbourhood, or a sequence of (dx, dy) offsets
+    :return: An array of shape (n_offsets, 2)
+    :raises ~pacman.exceptions.PacmanInvalidParameterException:
+        If the offsets are not pairs of integers
+    """
+    if isinstance(neighbourhood, Neighbourhood):
+        neighbourhood = neighbourhood.value
+    offsets = numpy.asarray(neighbourhood)
+    if (offsets.ndim != 2 or offsets.shape[1] != 2 or
+            not numpy.issubdtype(offsets.dtype, numpy.integer)):
+        raise PacmanInvalidParameterException(
+            "neighbourhood", str(neighbourhood),
+            "Must be a Neighbourhood or a sequence of integer (dx, dy) pairs")
+    return offsets.astype(numpy.intp)
+
+
+def lattice_edge_indices(
+        shape: tuple[int, int], offsets: NDArray[numpy.intp],
+        boundary: Boundary) -> tuple[NDArray[numpy.intp], NDArray[numpy.intp]]:
+    """
+    Work out the edges of a lattice as pairs of cell indices.
+
+    The cell at (x, y) has index ``x * shape[1] + y``.
+    There is an edge from each cell to the cell at each offset from it.
+    The edges are grouped by offset, and in cell order within each group.
+    Edges from a cell to itself are left out, as are edges that an earlier
+    offset already gave, such as when offsets in opposite directions wrap
+    to the same cell of a lattice only two cells wide.
+
+    :param shape: The (width, height) of the lattice
+    :param offsets: The neighbour offsets, as from :py:func:`lattice_offsets`
+    :param boundary: What to do at the edges of the lattice
+    :return: The source and target cell index of each edge
+    """
+    width, height = shape
+    xs, ys = numpy.divmod(numpy.arange(width * height), height)
+    post_x = xs[numpy.newaxis, :] + offsets[:, 0, numpy.newaxis]
+    post_y = ys[numpy.newaxis, :] + offsets[:, 1, numpy.newaxis]
+    pre = numpy.broadcast_to(xs * height + ys, post_x.shape)
+    if boundary == Boundary.WRAP:
+        post = (post_x % width) * height + (post_y % height)
+        keep = post != pre
+    else:
+        keep = ((post_x >= 0) & (post_x < width) &
+                (post_y >= 0) & (post_y < height))
+        post = post_x * height + post_y
+        keep &= post != pre
+    pre, post = pre[keep], post[keep]
+    _, first = numpy.unique(pre * (width * height) + post, return_index=True)
+    if len(first) < len(pre):
+        first.sort()
+        pre, post = pre[first], post[first]
+    return pre, post
+
+
+class Lattice(Generic[V]):
+    """
+    The vertices and edges of a 2D lattice graph.
+    """
+
+    __slots__ = ("_post", "_pre", "_shape", "_vertices")
+
+    def __init__(self, shape: tuple[int, int], vertices: Sequence[V],
+                 pre_indices: NDArray[numpy.intp],
+                 post_indices: NDArray[numpy.intp]):
+        """
+        :param shape: The (width, height) of the lattice
+        :param vertices: The vertices in index order
+        :param pre_indices: The index of the source of each edge
+        :param post_indices: The index of the target of each edge
+        """
+        self._shape = shape
+        self._vertices = vertices
+        self._pre = pre_indices
+        self._post = post_indices
+
+    @classmethod
+    def build(cls, vertex_factory: Callable[[int, int], V],
+              shape: tuple[int, int],
+              neighbourhood: Neighbourhood | ArrayLike = Neighbourhood.MOORE,
+              boundary: Boundary = Boundary.WRAP) -> "Lattice[V]":
+        """
+        Make the vertices of a lattice and work out its edges.
+
+        Nothing is added to the graph; see
+        :py:func:`spinnaker_graph_front_end.add_lattice` for that.
+
+        :param vertex_factory: Makes the vertex for the cell at (x, y)
+        :param shape: The (width, height) of the lattice
+        :param neighbourhood:
+            A standard neighbourhood, or a sequence of (dx, dy) offsets
+        :param boundary: What to do at the edges of the lattice
+        :return: The lattice
+        """
+        width, height = shape
+        if width <= 0 or height <= 0:
+            raise PacmanInvalidParameterException(
+                "shape", str(shape), "Both dimensions must be positive")
+        vertices = [vertex_factory(x, y)
+                    for x in range(width) for y in range(height)]
+        pre, post = lattice_edge_indices(
+            shape, lattice_offsets(neighbourhood), boundary)
+        return cls(shape, vertices, pre, post)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """
+        The (width, height) of the lattice.
+        """
+        return self._shape
+
+    @property
+    def vertices(self) -> Sequence[V]:
+        """
+        The vertices, in cell index order.
+        """
+        return self._vertices
+
+    @property
+    def pre_indices(self) -> NDArray[numpy.intp]:
+        """
+        The cell index of the source of each edge.
+        """
+        return self._pre
+
+    @property
+    def post_indices(self) -> NDArray[numpy.intp]:
+        """
+        The cell index of the target of each edge.
+        """
+        return self._post
+
+    def index_of(self, x: int, y: int) -> int:
+        """
+        :param x: The X coordinate of the cell
+        :param y: The Y coordinate of the cell
+        :return: The index of the cell
+        """
+        return x * self._shape[1] + y
+
+    def vertex_at(self, x: int, y: int) -> V:
+        """
+        :param x: The X coordinate of the cell
+        :param y: The Y coordinate of the cell
+        :return: The vertex of the cell
+        """
+        return self._vertices[self.index_of(x, y)]
+
+    def incoming_neighbours(self) -> list[list[V]]:
+        """
+        Group the edges by target.
+
+        :return: For each cell index, the vertices with edges to that cell
+        """
+        order = numpy.argsort(self._post, kind="stable")
+        counts = numpy.bincount(self._post, minlength=len(self._vertices))
+        groups = numpy.split(self._pre[order], numpy.cumsum(counts)[:-1])
+        vertices = self._vertices
+        return [[vertices[index] for index in group.tolist()]
+                for group in groups]
+
+    def set_neighbours(self) -> None:
+        """
+        Tell each vertex that is an :py:class:`AbstractLatticeVertex`
+        which vertices send to it.
+        """
+        for vertex, neighbours in zip(
+                self._vertices, self.incoming_neighbours()):
+            if isinstance(vertex, AbstractLatticeVertex):
+                vertex.set_lattice_neighbours(neighbours)
@@ -0,0 +1,376 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Fetching of the recordings of many vertices at once, either all at once or
+as each extraction of the recorded data finishes.
+"""
+
+import os
+import threading
+import weakref
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Future
+
+import numpy
+from numpy.typing import NDArray
+
+from pacman.model.graphs.machine import MachineVertex
+from pacman.model.placements import Placement
+
+from spinn_front_end_common.data import FecDataView
+from spinn_front_end_common.interface.buffer_management.storage_objects \
+    import BufferDatabase
+
+from .simulator_vertex import SimulatorVertex, recording_array
+
+#: The database of the recorded data and the last extraction into it that
+#: has finished, as told by :py:func:`extraction_finished`
+_extracted: tuple[str, int] | None = None
+_extracted_condition = threading.Condition()
+#: The runs that already tell those waiting on the condition when they finish
+_followed_runs: "weakref.WeakSet[Future]" = weakref.WeakSet()
+
+
+def _read_placements(placements: list[Placement],
+                     recording_id: int) -> list[tuple[memoryview, bool]]:
+    """
+    Read the recordings of placements, using one connection to the buffer
+    database.
+
+    :param placements: The placements to read the recordings of
+    :param recording_id: Which recording channel to read
+    :return: The data of each placement and whether any was lost
+    """
+    # pylint: disable=import-outside-toplevel
+    from spinnaker_graph_front_end.recording_store import (
+        get_recording_store)
+    store = get_recording_store()
+    if store is not None and not store.last_extraction_id:
+        # Nothing spilled, so all still in the buffer database
+        store = None
+    results = []
+    with BufferDatabase() as db:
+        for placement in placements:
+            if store is not None:
+                try:
+                    # Spilled, so no longer in the buffer database
+                    results.append(store.get_recording(
+                        placement.x, placement.y, placement.p,
+                        recording_id))
+                    continue
+                except LookupError:
+                    pass
+            try:
+                results.append(db.get_recording(
+                    placement.x, placement.y, placement.p, recording_id))
+            except LookupError:
+                # Let the buffer manager report it as it normally would
+                data, missing = FecDataView.get_buffer_manager(
+                    ).get_recording(placement, recording_id)
+                results.append((memoryview(data), missing))
+    return results
+
+
+def _as_array(vertex: MachineVertex, recording_id: int,
+              data: memoryview) -> NDArray:
+    if isinstance(vertex, SimulatorVertex):
+        return vertex.convert_recording_channel_data(recording_id, data)
+    return recording_array(data, numpy.dtype(numpy.uint8))
+
+
+def get_recordings(
+        vertices: Sequence[MachineVertex], recording_id: int
+        ) -> tuple[dict[MachineVertex, NDArray], list[MachineVertex]]:
+    """
+    Get the data of a recording channel of many vertices.
+
+    The recordings have already been extracted from the machine to local
+    files, so they are all read in one pass, in order of core, over one
+    connection to the recorded data.
+
+    The data of a
+    :py:class:`~spinnaker_graph_front_end.utilities.SimulatorVertex` is
+    typed as declared for the channel; the data of any other vertex is
+    bytes.
+
+    :param vertices: The vertices to get the recordings of
+    :param recording_id: Which recording channel to fetch
+    :return: The data of each vertex, and the vertices for which some
+        data was lost
+    """
+    placements = sorted(
+        {vertex: FecDataView.get_placement_of_vertex(vertex)
+         for vertex in vertices}.values(),
+        key=lambda pl: (pl.x, pl.y, pl.p))
+    if not placements:
+        return {}, []
+
+    data: dict[MachineVertex, NDArray] = {}
+    missing = []
+    for placement, (raw, lost) in zip(
+            placements, _read_placements(placements, recording_id)):
+        data[placement.vertex] = _as_array(
+            placement.vertex, recording_id, raw)
+        if lost:
+            missing.append(placement.vertex)
+    return {vertex: data[vertex] for vertex in vertices}, missing
+
+
+def stack_recordings(
+        vertices: Sequence[MachineVertex],
+        recordings: dict[MachineVertex, NDArray]) -> NDArray:
+    """
+    Stack the recordings of vertices into one array.
+
+    :param vertices: The vertices, in the order to stack them
+    :param recordings: The recordings, as from :py:func:`get_recordings`
+    :return: An array with the recording of each vertex along the first
+        axis
+    :raises ValueError:
+        If there are no vertices, or the recordings are not all the same
+        shape
+    """
+    if not vertices:
+        raise ValueError(
+            "No vertices to stack the recordings of; the shape of the "
+            "stacked array would not be known")
+    arrays = [recordings[vertex] for vertex in vertices]
+    shapes = {array.shape for array in arrays}
+    if len(shapes) > 1:
+        raise ValueError(
+            f"Recordings of different shapes cannot be stacked: {shapes}")
+    return numpy.stack(arrays)
+
+
+class RecordingChunk(object):
+    """
+    What a vertex recorded in a channel in the timesteps between two
+    extractions of the recorded data.
+    """
+
+    __slots__ = ("_data", "_end_step", "_missing", "_start_step")
+
+    def __init__(self, start_step: int, end_step: int, data: NDArray,
+                 missing: bool):
+        """
+        :param start_step: The first timestep of the chunk
+        :param end_step: The timestep after the last of the chunk
+        :param data: What was recorded, with one row per record
+        :param missing: Whether any of the data was lost
+        """
+        self._start_step = start_step
+        self._end_step = end_step
+        self._data = data
+        self._missing = missing
+
+    @property
+    def start_step(self) -> int:
+        """
+        The first timestep of the chunk.
+        """
+        return self._start_step
+
+    @property
+    def end_step(self) -> int:
+        """
+        The timestep after the last of the chunk.
+        """
+        return self._end_step
+
+    @property
+    def data(self) -> NDArray:
+        """
+        What was recorded, with one row per record.
+        """
+        return self._data
+
+    @property
+    def missing(self) -> bool:
+        """
+        Whether any of the data was lost.
+        """
+        return self._missing
+
+    def __repr__(self) -> str:
+        return (f"RecordingChunk({self._start_step}, {self._end_step}, "
+                f"{len(self._data)} records)")
+
+
+def _last_extraction() -> tuple[str, int] | None:
+    """
+    :return: The database of the recorded data and its last extraction,
+        or `None` if nothing has been extracted
+    """
+    path = BufferDatabase.default_database_file()
+    with BufferDatabase(path) as db:
+        last_id = db.get_last_extraction_id()
+    return None if last_id is None else (path, last_id)
+
+
+def extraction_finished() -> None:
+    """
+    Tell those iterating over recordings with :py:func:`iter_recordings`
+    that an extraction of the recorded data has finished.
+    The front end calls this after each extraction.
+    """
+    # pylint: disable=global-statement
+    global _extracted
+    extracted = _last_extraction()
+    with _extracted_condition:
+        if extracted is not None:
+            _extracted = extracted
+        _extracted_condition.notify_all()
+
+
+def _notify_run_done(_run: Future) -> None:
+    with _extracted_condition:
+        _extracted_condition.notify_all()
+
+
+def _follow_run(run: Future) -> None:
+    """
+    Have a run tell those waiting for extractions when it finishes; each
+    run is only told to once, however often it is followed.
+
+    :param run: The future of the run
+    """
+    with _extracted_condition:
+        if run in _followed_runs:
+            return
+        _followed_runs.add(run)
+    run.add_done_callback(_notify_run_done)
+
+
+def _read_extractions(
+        path: str, placements: list[Placement], recording_id: int,
+        after_id: int, last_id: int) -> Iterator[tuple[int, int, list[
+            tuple[memoryview, bool]]]]:
+    """
+    Read what was recorded in a channel in some extractions, one
+    extraction at a time.
+
+    :param path: The database of the recorded data
+    :param placements: The placements to read the recordings of
+    :param recording_id: Which recording channel to read
+    :param after_id: The extraction before the first to read
+    :param last_id: The last extraction to read
+    :return: The ID and timestep of each extraction, with the data of each
+        placement in it and whether any was lost
+    """
+    # pylint: disable=import-outside-toplevel
+    from spinnaker_graph_front_end.recording_store import (
+        get_recording_store)
+    store = get_recording_store()
+    if store is not None and (
+            not store.last_extraction_id or
+            store.buffer_database is None or os.path.abspath(
+                store.buffer_database) != os.path.abspath(path)):
+        # Nothing spilled, or left from before the last setup or reset
+        store = None
+    with BufferDatabase(path) as db:
+        extractions = [
+            (row["extraction_id"], row["run_timestep"])
+            for row in db.cursor().execute(
+                """
+                SELECT extraction_id, run_timestep FROM extraction
+                WHERE extraction_id > ? AND extraction_id <= ?
+                ORDER BY extraction_id
+                """, (after_id, last_id))]
+    for extraction_id, run_step in extractions:
+        # Not held open while the caller works on the extraction
+        with BufferDatabase(path) as db:
+            results = []
+            for placement in placements:
+                if store is not None:
+                    try:
+                        # Spilled, so no longer in the buffer database
+                        results.append(store.get_extraction(
+                            placement.x, placement.y, placement.p,
+                            recording_id, extraction_id))
+                        continue
+                    except LookupError:
+                        pass
+                results.append(db.get_recording_by_extraction_id(
+                    placement.x, placement.y, placement.p, recording_id,
+                    extraction_id))
+        yield extraction_id, run_step, results
+
+
+def iter_recordings(
+        vertices: Sequence[MachineVertex], recording_id: int,
+        run: Future | None = None
+        ) -> Iterator[dict[MachineVertex, RecordingChunk]]:
+    """
+    Iterate over the data of a recording channel of many vertices, one
+    extraction of the recorded data at a time, so that only one chunk of
+    each vertex has to be held at once.
+
+    Without a run, this gives what has been extracted so far. With the
+    future of a run going on in the background, as from
+    :py:func:`~spinnaker_graph_front_end.run_async`, each extraction is
+    given as soon as it finishes, until the run does; a run split up by
+    auto pause and resume is extracted after each part of it. A run for
+    ever is only extracted once it is stopped.
+
+    The data of a
+    :py:class:`~spinnaker_graph_front_end.utilities.SimulatorVertex` is
+    typed as declared for the channel; the data of any other vertex is
+    bytes.
+
+    :param vertices: The vertices to get the recordings of
+    :param recording_id: Which recording channel to fetch
+    :param run: The future of a run to follow until it finishes
+    :return: The chunk of each vertex in each extraction, in order
+    """
+    placements = [FecDataView.get_placement_of_vertex(vertex)
+                  for vertex in vertices]
+    if run is not None:
+        _follow_run(run)
+    path: str | None = None
+    seen_id = 0
+    end_step = 0
+    while True:
+        done = run is None or run.done()
+        with _extracted_condition:
+            notified = _extracted
+        if done:
+            # Every extraction has finished by now
+            extracted = _last_extraction()
+        elif notified is not None and (
+                notified[0] == BufferDatabase.default_database_file()):
+            extracted = notified
+        else:
+            # Nothing yet, or left from before the last setup or reset
+            extracted = None
+        if extracted is not None:
+            if extracted[0] != path:
+                # A new database, as after a reset
+                path, seen_id, end_step = extracted[0], 0, 0
+            for extraction_id, run_step, results in _read_extractions(
+                    path, placements, recording_id, seen_id, extracted[1]):
+                seen_id = extraction_id
+                start_step = end_step if run_step >= end_step else 0
+                end_step = run_step
+                yield {
+                    placement.vertex: RecordingChunk(
+                        start_step, end_step,
+                        _as_array(placement.vertex, recording_id, raw), lost)
+                    for placement, (raw, lost) in zip(placements, results)}
+        if done:
+            return
+        assert run is not None
+        with _extracted_condition:
+            _extracted_condition.wait_for(
+                lambda: _extracted != notified or run.done())
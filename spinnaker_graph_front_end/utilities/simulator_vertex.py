@@ -12,8 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import logging
+import math
 import sys
+from collections.abc import Iterator
+from concurrent.futures import Future
 from types import ModuleType
+from typing import TYPE_CHECKING
+
+import numpy
+from numpy.typing import ArrayLike, NDArray
 
 from spinn_utilities.abstract_base import abstractmethod
 from spinn_utilities.log import FormatAdapter
@@ -24,7 +31,7 @@ from spinnman.model.enums import ExecutableType
 from pacman.model.graphs.common import Slice
 from pacman.model.graphs.machine import MachineVertex
 from pacman.model.placements import Placement
-from pacman.model.resources import AbstractSDRAM
+from pacman.model.resources import AbstractSDRAM, VariableSDRAM
 
 from spinn_front_end_common.abstract_models import AbstractHasAssociatedBinary
 from spinn_front_end_common.data import FecDataView
@@ -32,12 +39,145 @@ from spinn_front_end_common.interface.buffer_management import (
     recording_utilities,
 )
 from spinn_front_end_common.interface.ds import DataSpecificationGenerator
+from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 from spinn_front_end_common.utilities.data_utils import (
     generate_system_data_region,
 )
 
+if TYPE_CHECKING:
+    from .recordings import RecordingChunk
+
 log = FormatAdapter(logging.getLogger(__file__))
 
+# The interval and whether windowed, for each channel
+_RATE_WORDS = 2
+
+
+def recording_array(
+        data: memoryview | bytes, dtype: numpy.dtype,
+        shape: tuple[int, ...] = ()) -> NDArray:
+    """
+    View recorded bytes as an array of records without copying them.
+    The values are read little-endian, as SpiNNaker records them, whatever
+    the byte order of the dtype.
+
+    :param data: The recorded bytes
+    :param dtype: The type of each value
+    :param shape: The shape of one record
+    :return: An array of shape ``(n_records, *shape)``; read-only if the
+        data is
+    """
+    n_values = math.prod(shape)
+    record_bytes = dtype.itemsize * n_values
+    n_records = len(data) // record_bytes if record_bytes else 0
+    array = numpy.frombuffer(
+        data, dtype=dtype.newbyteorder("<"), count=n_records * n_values)
+    return array.reshape((n_records, *shape))
+
+
+def packed_recording_size(n_steps: int, bits_per_step: int = 1) -> int:
+    """
+    Get the size of the data recorded in a packed-bit channel over a run.
+
+    A packed-bit channel records ``bits_per_step`` bits on each timestep,
+    packed into words starting from the least significant bit. When the
+    simulation pauses, any partly filled word is recorded, followed by a
+    word giving the number of bits recorded since the last pause.
+
+    :param n_steps:
+        The number of timesteps in the run, or if the channel is not
+        recorded on every timestep, the number of records
+    :param bits_per_step: The number of bits recorded on each timestep
+    :return: The size in bytes
+    """
+    n_words = -(-(n_steps * bits_per_step) // 32)
+    return (n_words + 1) * BYTES_PER_WORD
+
+
+def packed_recording_sdram(
+        bits_per_step: int = 1, interval: int = 1) -> VariableSDRAM:
+    """
+    Get the SDRAM needed to buffer a packed-bit recording channel.
+
+    Nothing is recorded for the part of an interval left at the end of a
+    run; the interval carries on into the next run.
+
+    :param bits_per_step: The number of bits recorded on each timestep
+    :param interval: How many timesteps there are per record
+    :return: The SDRAM needed, to add to that of the vertex
+    """
+    # The partly filled word and the count recorded when the binary pauses,
+    # and one more record, as a run may start part way through an interval
+    return VariableSDRAM(
+        2 * BYTES_PER_WORD + -(-bits_per_step // 8),
+        bits_per_step / 8 / interval)
+
+
+def pack_recording_bits(bits: ArrayLike) -> bytes:
+    """
+    Pack the bits recorded in a packed-bit channel over a run, as the
+    binary would record them.
+
+    :param bits: The values recorded, in order
+    :return: The recorded bytes, including the count at the end
+    """
+    bit_array = numpy.asarray(bits, dtype=numpy.bool_).ravel()
+    packed = numpy.packbits(bit_array, bitorder="little")
+    words = numpy.zeros(-(-len(packed) // BYTES_PER_WORD) + 1, dtype="<u4")
+    words.view(numpy.uint8)[:len(packed)] = packed
+    words[-1] = len(bit_array)
+    return words.tobytes()
+
+
+def recording_region_size(n_channels: int, write_rates: bool = False) -> int:
+    """
+    Get the size of the recording region made by
+    :py:meth:`SimulatorVertex.generate_recording_region`.
+
+    :param n_channels: The number of recording channels
+    :param write_rates: Whether the rates of the channels are written too
+    :return: The size in bytes
+    """
+    size = recording_utilities.get_recording_header_size(n_channels)
+    if write_rates:
+        size += _RATE_WORDS * BYTES_PER_WORD * n_channels
+    return size
+
+
+def packed_recording_array(
+        data: memoryview | bytes,
+        shape: tuple[int, ...] = ()) -> NDArray[numpy.bool_]:
+    """
+    Unpack the data recorded in a packed-bit channel.
+
+    :param data: The recorded bytes
+    :param shape: The shape of the bits recorded on one timestep
+    :return: An array of shape ``(n_records, *shape)``
+    :raises ValueError: If the data is not that of a packed-bit channel
+    """
+    n_values = math.prod(shape)
+    words = numpy.frombuffer(
+        data, dtype="<u4", count=len(data) // BYTES_PER_WORD)
+    runs: list[NDArray[numpy.uint8]] = []
+    # Each run ends with its count, so work back from the end
+    end = len(words)
+    while end > 0:
+        n_bits = int(words[end - 1])
+        start = end - 1 - (-(-n_bits // 32))
+        if start < 0:
+            raise ValueError(
+                f"Packed recording claims {n_bits} bits but has only "
+                f"{end - 1} words before the count")
+        runs.append(numpy.unpackbits(
+            words[start:end - 1].view(numpy.uint8), count=n_bits,
+            bitorder="little"))
+        end = start
+    bits = numpy.concatenate(runs[::-1]) if runs else numpy.zeros(
+        0, dtype=numpy.uint8)
+    n_records = len(bits) // n_values if n_values else 0
+    return bits[:n_records * n_values].view(numpy.bool_).reshape(
+        (n_records, *shape))
+
 
 class SimulatorVertex(MachineVertex, AbstractHasAssociatedBinary):
     """
@@ -97,6 +237,21 @@ class SimulatorVertex(MachineVertex, AbstractHasAssociatedBinary):
         """
         return FecDataView.get_placement_of_vertex(self)
 
+    def get_data_specification_parameters(self) -> object | None:
+        """
+        Get the parameters of this vertex that its data specification is
+        made from, other than its placement, routing keys, tags and the
+        simulation timing.
+
+        If the ``incremental_data_specification`` option is on, the data
+        specification is only generated again when the `repr` of these (or
+        any of the other inputs) changes.
+
+        :return: The parameters, or `None` (the default) if the data
+            specification must always be generated again
+        """
+        return None
+
     def get_recording_channel_data(
             self, recording_id: int) -> tuple[memoryview, bool]:
         """
@@ -104,12 +259,185 @@ class SimulatorVertex(MachineVertex, AbstractHasAssociatedBinary):
         :py:func:`spinnaker_graph_front_end.run` before this will work,
         and the vertex must set up the recording region beforehand.
 
+        If the ``spill_recordings`` option is on, the data is a read-only
+        view of the file it was spilled to, and can still be got after
+        :py:func:`spinnaker_graph_front_end.stop`.
+
         :param recording_id:
             Which recording channel to fetch
         :return: the data, and whether any data was lost
         """
+        # pylint: disable=import-outside-toplevel
+        from spinnaker_graph_front_end.recording_store import (
+            get_recording_store)
+        placement = self.placement
+        store = get_recording_store()
+        if store is not None:
+            try:
+                return store.get_recording(
+                    placement.x, placement.y, placement.p, recording_id)
+            except LookupError:
+                # Let the buffer manager report it as it normally would
+                pass
         buffer_manager = FecDataView.get_buffer_manager()
-        return buffer_manager.get_recording(self.placement, recording_id)
+        data, missing = buffer_manager.get_recording(placement, recording_id)
+        return memoryview(data), missing
+
+    def get_recording_channel_dtype(self, recording_id: int) -> numpy.dtype:
+        """
+        Get the type of each value recorded in a channel.
+        Override this to describe what the binary records.
+
+        This is not used for packed-bit channels.
+
+        :param recording_id: Which recording channel
+        :return: The NumPy dtype of the values; bytes by default
+        """
+        return numpy.dtype(numpy.uint8)
+
+    def is_recording_channel_packed(self, recording_id: int) -> bool:
+        """
+        Get whether a channel records bits packed into words, as described
+        by :py:func:`packed_recording_size`.
+        Override this to describe what the binary records.
+
+        :param recording_id: Which recording channel
+        :return: Whether the channel is packed; not by default
+        """
+        return False
+
+    def get_recording_channel_shape(
+            self, recording_id: int) -> tuple[int, ...]:
+        """
+        Get the shape of what is recorded in a channel on each timestep.
+        For a packed-bit channel, this is the shape of the bits.
+        Override this to describe what the binary records.
+
+        :param recording_id: Which recording channel
+        :return: The shape of one record; one value (``()``) by default
+        """
+        return ()
+
+    def get_recording_channel_interval(self, recording_id: int) -> int:
+        """
+        Get how many timesteps there are per record of a channel.
+        Override this to record less often than on every timestep.
+
+        The binary records on each timestep that is a multiple of the
+        interval, counting from the start of the simulation, or if the
+        channel is windowed, on the last timestep of each interval.
+
+        :param recording_id: Which recording channel
+        :return: The interval in timesteps; 1 by default
+        """
+        return 1
+
+    def is_recording_channel_windowed(self, recording_id: int) -> bool:
+        """
+        Get whether each record of a channel summarises the timesteps of
+        its interval, rather than being a sample of the first of them.
+        How they are summarised is up to the binary.
+
+        :param recording_id: Which recording channel
+        :return: Whether the channel is windowed; not by default
+        """
+        return False
+
+    def get_recording_channel_n_records(
+            self, recording_id: int, n_steps: int) -> int:
+        """
+        Get the most records that a channel can make in a run.
+
+        :param recording_id: Which recording channel
+        :param n_steps: The number of timesteps in the run
+        :return: The number of records
+        """
+        return -(-n_steps // self.get_recording_channel_interval(
+            recording_id))
+
+    def get_recording_channel_sdram(
+            self, recording_id: int, record_size: int) -> VariableSDRAM:
+        """
+        Get the SDRAM needed to buffer a recording channel, taking account of
+        its interval.  For packed-bit channels, use
+        :py:func:`packed_recording_sdram` instead.
+
+        :param recording_id: Which recording channel
+        :param record_size: The size of each record in bytes
+        :return: The SDRAM needed, to add to that of the vertex
+        """
+        # A run may start part way through an interval
+        return VariableSDRAM(record_size, record_size / (
+            self.get_recording_channel_interval(recording_id)))
+
+    def get_recording_channel_timesteps(
+            self, recording_id: int, n_records: int) -> NDArray[numpy.int64]:
+        """
+        Get the timesteps of the records of a channel; for a windowed
+        channel, the first timestep of each window.
+
+        :param recording_id: Which recording channel
+        :param n_records: The number of records
+        :return: The timestep of each record
+        """
+        return numpy.arange(n_records, dtype=numpy.int64) * (
+            self.get_recording_channel_interval(recording_id))
+
+    def get_recording_channel_array(
+            self, recording_id: int) -> tuple[NDArray, bool]:
+        """
+        Get the data from a recording channel as a NumPy array, using the
+        dtype and shape declared for the channel.
+
+        :param recording_id:
+            Which recording channel to fetch
+        :return: the data, with one row per record, and whether any data
+            was lost
+        """
+        data, missing = self.get_recording_channel_data(recording_id)
+        return self.convert_recording_channel_data(recording_id, data), missing
+
+    def iter_recording_channel_chunks(
+            self, recording_id: int,
+            run: Future | None = None) -> Iterator["RecordingChunk"]:
+        """
+        Iterate over the data from a recording channel one extraction of
+        the recorded data at a time, as NumPy arrays typed as declared for
+        the channel. With the future of a run going on in the background,
+        each chunk is given as soon as it is extracted, until the run
+        finishes; see
+        :py:func:`~spinnaker_graph_front_end.utilities.iter_recordings`.
+
+        :param recording_id:
+            Which recording channel to fetch
+        :param run: The future of a run to follow until it finishes
+        :return: The chunks of data, in order
+        """
+        # pylint: disable=import-outside-toplevel
+        from .recordings import iter_recordings
+        for chunks in iter_recordings([self], recording_id, run):
+            yield chunks[self]
+
+    def convert_recording_channel_data(
+            self, recording_id: int, data: memoryview | bytes) -> NDArray:
+        """
+        Convert the data recorded in a channel to a NumPy array, using the
+        dtype and shape declared for the channel.
+        Unless the channel is packed, the array is a view of the recorded
+        bytes; nothing is copied.
+
+        Any bytes at the end that do not make up a whole record are left
+        out.
+
+        :param recording_id: Which recording channel the data is from
+        :param data: The recorded bytes
+        :return: The data, with one row per record
+        """
+        shape = self.get_recording_channel_shape(recording_id)
+        if self.is_recording_channel_packed(recording_id):
+            return packed_recording_array(data, shape)
+        return recording_array(
+            data, self.get_recording_channel_dtype(recording_id), shape)
 
     def generate_system_region(self, spec: DataSpecificationGenerator,
                                region_id: int = 0) -> None:
@@ -129,7 +457,7 @@ class SimulatorVertex(MachineVertex, AbstractHasAssociatedBinary):
 
     def generate_recording_region(
             self, spec: DataSpecificationGenerator, region_id: int,
-            channel_sizes: list[int]) -> None:
+            channel_sizes: list[int], write_rates: bool = False) -> None:
         """
         Generate the recording region for the data specification.
 
@@ -137,13 +465,25 @@ class SimulatorVertex(MachineVertex, AbstractHasAssociatedBinary):
         :param region_id:
             Which region is the recording region.
         :param channel_sizes: List of int being the number of regions
-            and then for each region its size then two zeros
+            and then for each region its size then two zeros.
+            Use :py:meth:`get_recording_channel_n_records` for the number of
+            records in a channel, and :py:func:`packed_recording_size` for
+            the size of a packed-bit channel.
+        :param write_rates:
+            Whether to write, after the header, the interval of each
+            channel and whether it is windowed, for the binary to read.
+            The region is then :py:func:`recording_region_size` bytes.
         """
         spec.reserve_memory_region(
             region=region_id,
-            size=recording_utilities.get_recording_header_size(
-                len(channel_sizes)),
+            size=recording_region_size(len(channel_sizes), write_rates),
             label="Recording")
         spec.switch_write_focus(region_id)
         spec.write_array(recording_utilities.get_recording_header_array(
             channel_sizes))
+        if write_rates:
+            for recording_id in range(len(channel_sizes)):
+                spec.write_value(
+                    self.get_recording_channel_interval(recording_id))
+                spec.write_value(
+                    int(self.is_recording_channel_windowed(recording_id)))
@@ -0,0 +1,145 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+import unittest
+
+import numpy
+
+from spinn_utilities.config_holder import set_config
+from spinn_utilities.overrides import overrides
+
+from pacman.exceptions import (
+    PacmanConfigurationException, PacmanInvalidParameterException)
+from pacman.utilities.utility_objs import ChipCounter
+
+from spinn_front_end_common.data.fec_data_writer import FecDataWriter
+from spinn_front_end_common.interface.ds import (
+    DataSpecificationGenerator,
+    DsSqlliteDatabase,
+)
+
+from spinnaker_graph_front_end.config_setup import unittest_setup
+from spinnaker_graph_front_end.utilities import (
+    ArrayApplicationVertex, ArrayRegions, ArraySliceVertex,
+    SplitterArrayVertex)
+
+
+def _zeros(shape: tuple[int, int]) -> numpy.ndarray:
+    # A big array without the memory of one
+    return numpy.broadcast_to(numpy.zeros(1, numpy.uint8), shape)
+
+
+def _max_atoms(vertex: ArrayApplicationVertex) -> int:
+    splitter = vertex.splitter
+    assert isinstance(splitter, SplitterArrayVertex)
+    return splitter.get_max_atoms_per_core()
+
+
+class _SlowVertex(ArrayApplicationVertex):
+
+    @property
+    @overrides(ArrayApplicationVertex.cpu_cycles_per_atom)
+    def cpu_cycles_per_atom(self) -> int:
+        return 10000
+
+
+class _NoDtcmVertex(ArrayApplicationVertex):
+
+    @property
+    @overrides(ArrayApplicationVertex.dtcm_per_atom)
+    def dtcm_per_atom(self) -> int:
+        return 0
+
+
+class TestArrayVertex(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        set_config("Machine", "version", "5")
+        set_config("Reports", "write_text_specs", "False")
+        self.writer = FecDataWriter.mock()
+        self.writer.set_up_timings(1000, 1)
+        self.writer.set_plan_n_timesteps(10)
+
+    def _split(self, vertex: ArrayApplicationVertex
+               ) -> list[ArraySliceVertex]:
+        vertex.splitter.create_machine_vertices(ChipCounter())
+        return list(vertex.machine_vertices)
+
+    def test_max_atoms_per_core(self) -> None:
+        vertex = ArrayApplicationVertex(
+            "test.aplx", {"a": numpy.arange(10), "b": numpy.ones((10, 3))},
+            label="array", max_atoms_per_core=4)
+        cores = self._split(vertex)
+        self.assertEqual([4, 4, 2], [c.vertex_slice.n_atoms for c in cores])
+        self.assertEqual([8, 9], cores[2].parameters["a"].tolist())
+        self.assertEqual((2, 3), cores[2].parameters["b"].shape)
+        self.assertEqual(
+            [c.vertex_slice for c in cores],
+            vertex.splitter.get_out_going_slices())
+
+    def test_dtcm_and_cpu(self) -> None:
+        # 8000 bytes an atom, so only 7 fit in the DTCM
+        vertex = ArrayApplicationVertex(
+            "test.aplx", {"a": numpy.zeros((20, 1000))})
+        self.assertEqual(7, _max_atoms(vertex))
+
+        # 200000 cycles a timestep, so 20 atoms of 10000 cycles each
+        slow = _SlowVertex("test.aplx", {"a": numpy.zeros(100, "uint8")})
+        self.assertEqual(20, _max_atoms(slow))
+        self.assertEqual(5, len(self._split(slow)))
+
+    def test_sdram(self) -> None:
+        # A million bytes an atom only fits in the DTCM if it is not there
+        vertex = _NoDtcmVertex(
+            "test.aplx", {"a": _zeros((200, 1000000))})
+        n_atoms = _max_atoms(vertex)
+        self.assertLess(0, n_atoms)
+        self.assertLess(n_atoms, 200)
+
+        huge = _NoDtcmVertex(
+            "test.aplx", {"a": _zeros((1, 1 << 30))})
+        with self.assertRaises(PacmanConfigurationException):
+            _max_atoms(huge)
+
+    def test_parameters_region(self) -> None:
+        vertex = ArrayApplicationVertex(
+            "test.aplx", {
+                "weight": numpy.array([1.5, 2.5, 3.5], "<f4"),
+                "flag": numpy.array([1, 0, 1], "uint8")},
+            max_atoms_per_core=2)
+        cores = self._split(vertex)
+        with DsSqlliteDatabase() as ds_db:
+            spec = DataSpecificationGenerator(0, 0, 2, cores[1], ds_db)
+            cores[1].generate_parameters_region(spec)
+            spec.end_specification()
+            regions = {region: content for region, _, content
+                       in ds_db.get_regions_content(0, 0, 2)}
+        content = regions[ArrayRegions.PARAMETERS]
+        self.assertEqual(vertex.get_parameters_size(1), len(content))
+        self.assertEqual((1, 3.5, 1), struct.unpack("<IfB3x", content))
+        self.assertIsNotNone(cores[0].get_data_specification_parameters())
+        self.assertNotEqual(
+            cores[0].get_data_specification_parameters(),
+            cores[1].get_data_specification_parameters())
+
+    def test_bad_parameters(self) -> None:
+        with self.assertRaises(PacmanInvalidParameterException):
+            ArrayApplicationVertex("test.aplx", {})
+        with self.assertRaises(PacmanInvalidParameterException):
+            ArrayApplicationVertex(
+                "test.aplx", {"a": numpy.zeros(3), "b": numpy.zeros(4)})
+        with self.assertRaises(PacmanInvalidParameterException):
+            ArrayApplicationVertex("test.aplx", {"a": 1})
@@ -0,0 +1,119 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import multiprocessing
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+from spinn_utilities.config_holder import set_config
+
+from pacman.model.graphs.machine import SimpleMachineVertex
+from pacman.model.resources import ConstantSDRAM
+from pacman.utilities.utility_objs import ChipCounter
+
+from spinn_front_end_common.data import FecDataView
+from spinn_front_end_common.data.fec_data_writer import FecDataWriter
+
+import spinnaker_graph_front_end as front_end
+from spinnaker_graph_front_end.config_setup import unittest_setup
+
+from gfe_benchmarks.benchmark_history import PEAK_RSS, BenchmarkHistory
+from gfe_benchmarks.compact_edge_memory import measure
+from gfe_benchmarks.scaling_graphs import (
+    PIPELINE_SDRAM, PipelineSplitter, PipelineVertex)
+
+
+class TestBenchmarkHistory(unittest.TestCase):
+
+    def test_compare(self) -> None:
+        with BenchmarkHistory(":memory:") as history:
+            for mapping_ms in (100.0, 120.0, 110.0):
+                run_id = history.start_run()
+                history.add_results(run_id, "lattice", 100, {
+                    "Mapping Stage": mapping_ms, PEAK_RSS: 100000.0})
+            self.assertEqual([], history.compare(run_id))
+
+            run_id = history.start_run("slower")
+            history.add_results(run_id, "lattice", 100, {
+                "Mapping Stage": 300.0, PEAK_RSS: 101000.0})
+            history.add_results(run_id, "fan_in", 100, {
+                "Mapping Stage": 1000.0})
+            self.assertEqual(3, len(history.get_results(run_id)))
+            regression, = history.compare(run_id)
+            self.assertEqual(("lattice", 100, "Mapping Stage"), (
+                regression.graph, regression.size, regression.measure))
+            self.assertEqual(110.0, regression.previous)
+            self.assertAlmostEqual(300.0 / 110.0, regression.ratio)
+
+            # Nothing to compare with, or too small a difference
+            self.assertEqual([], history.compare(run_id, n_previous=0))
+            self.assertEqual(
+                [], history.compare(run_id, min_difference=500.0))
+
+
+class TestPipelineSplitter(unittest.TestCase):
+
+    def test_pipeline(self) -> None:
+        unittest_setup()
+        set_config("Machine", "version", "5")
+        FecDataWriter.mock()
+        pipeline = PipelineVertex(3, label="pipe")
+        splitter = pipeline.splitter
+        assert isinstance(splitter, PipelineSplitter)
+        chip_counter = ChipCounter()
+        splitter.create_machine_vertices(chip_counter)
+        first, middle, last = pipeline.machine_vertices
+        self.assertEqual(2, len(splitter.get_internal_sdram_partitions()))
+        self.assertEqual([first], splitter.get_in_coming_vertices("x"))
+        self.assertEqual([last], splitter.get_out_going_vertices("x"))
+        self.assertEqual(
+            PIPELINE_SDRAM, first.sdram_required.get_total_sdram(0) -
+            last.sdram_required.get_total_sdram(0))
+        self.assertEqual(
+            first.sdram_required.get_total_sdram(0),
+            middle.sdram_required.get_total_sdram(0))
+        self.assertEqual(1, chip_counter.n_chips)
+
+        splitter.reset_called()
+        self.assertEqual([], splitter.get_internal_sdram_partitions())
+
+
+class TestBulkVertexRegistration(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+
+    def test_batches_do_not_scan_graph(self) -> None:
+        # The graph already in place is not looked at to check a batch
+        front_end.add_machine_vertex_instances(
+            SimpleMachineVertex(ConstantSDRAM(0)) for _ in range(100))
+        with mock.patch.object(
+                FecDataView, "iterate_machine_vertices") as iterate:
+            front_end.add_machine_vertex_instances(
+                SimpleMachineVertex(ConstantSDRAM(0)) for _ in range(10))
+        iterate.assert_not_called()
+        self.assertEqual(110, FecDataView.get_n_vertices())
+
+
+class TestCompactEdgeMemory(unittest.TestCase):
+
+    def test_store_uses_less_memory(self) -> None:
+        # Each in a fresh process, so that the peak RSS is its own
+        grown = dict()
+        context = multiprocessing.get_context("spawn")
+        for way in ("store", "objects"):
+            with ProcessPoolExecutor(1, mp_context=context) as executor:
+                grown[way] = executor.submit(measure, way, 200_000).result()
+        self.assertLess(grown["store"] * 4, grown["objects"])
@@ -0,0 +1,257 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from spinnman.spalloc import SpallocClient, SpallocJob
+
+from spinnaker_graph_front_end.board_session import (
+    BoardSession, claim_session, destroy_job, keep_job, read_session,
+    save_session, take_kept_job)
+
+
+class SpallocServer(ThreadingHTTPServer):
+    """
+    A stand-in spalloc server with one job on one board, which only
+    answers requests from the session the job was made in, which anyone can
+    log in to.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _SpallocHandler)
+        self.state = "READY"
+        self.n_keepalives = 0
+        self.n_logins = 0
+        self.destroy_reason: str | None = None
+        self.destroyed = threading.Event()
+
+    @property
+    def service_url(self) -> str:
+        """
+        The URL of the service.
+        """
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}/spalloc/"
+
+    @property
+    def job_url(self) -> str:
+        """
+        The URL of the job.
+        """
+        return self.service_url + "jobs/1/"
+
+
+class _SpallocHandler(BaseHTTPRequestHandler):
+    server: SpallocServer
+
+    def __authorised(self) -> bool:
+        # Only what changes things needs the CSRF token
+        if self.headers["Cookie"] == "JSESSIONID=abc" and (
+                self.command == "GET" or
+                self.headers["X-CSRF-TOKEN"] == "def"):
+            return True
+        self.send_error(401)
+        return False
+
+    def __reply(self, body: bytes = b"") -> None:
+        self.send_response(200 if body else 204)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def __reply_session(self, cookie: str) -> None:
+        self.send_response(302)
+        self.send_header("Set-Cookie", f"JSESSIONID={cookie}; Path=/")
+        self.send_header("Location", self.server.service_url)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        url = urlparse(self.path)
+        if url.path.endswith("/system/login.html"):
+            body = b'<input type="hidden" name="_csrf" value="login" />'
+            self.send_response(200)
+            self.send_header("Set-Cookie", "JSESSIONID=login; Path=/")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        if not self.__authorised():
+            return
+        if url.path.endswith("/srv/spalloc/"):
+            self.__reply(json.dumps({
+                "csrf-header": "X-CSRF-TOKEN", "csrf-token": "def",
+                "version": {"major-version": 1, "minor-version": 0,
+                            "revision": 0},
+                "machines-ref": self.server.service_url + "machines",
+                "jobs-ref": self.server.service_url + "jobs"}).encode())
+            return
+        if url.path.endswith("/machine"):
+            self.__reply(json.dumps({
+                "width": 8, "height": 8,
+                "connections": [[[0, 0], "127.0.0.1"]]}).encode())
+            return
+        if "wait" in parse_qs(url.query):
+            # Waiting for the state to change, which it only does once
+            self.server.destroyed.wait(1)
+        self.__reply(json.dumps({"state": self.server.state}).encode())
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        self.rfile.read(int(self.headers["Content-Length"]))
+        if self.path.endswith("/system/perform_login"):
+            self.server.n_logins += 1
+            self.__reply_session("abc")
+        else:
+            self.send_error(404)
+
+    def do_PUT(self) -> None:  # pylint: disable=invalid-name
+        self.rfile.read(int(self.headers["Content-Length"]))
+        if self.__authorised() and self.path.endswith("/keepalive"):
+            self.server.n_keepalives += 1
+            self.__reply()
+
+    def do_DELETE(self) -> None:  # pylint: disable=invalid-name
+        if self.__authorised():
+            # Changed before replying, as the reply lets the client carry on
+            self.server.state = "DESTROYED"
+            self.server.destroy_reason = parse_qs(
+                urlparse(self.path).query)["reason"][0]
+            self.server.destroyed.set()
+            self.__reply()
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+class TestBoardSession(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.server = SpallocServer()
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "session.json")
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        self.directory.cleanup()
+
+    def _session(self, idle_timeout: float) -> BoardSession:
+        return BoardSession(
+            self.server.service_url, self.server.job_url,
+            {"JSESSIONID": "abc"}, {"X-CSRF-TOKEN": "def"},
+            {"spalloc_server": "http://127.0.0.1/spalloc/", "n_boards": 1,
+             "n_chips": None}, time.time() + idle_timeout)
+
+    def test_save_and_claim(self) -> None:
+        session = self._session(60)
+        save_session(self.path, session)
+        self.assertEqual(0o600, os.stat(self.path).st_mode & 0o777)
+        read = read_session(self.path)
+        assert read is not None
+        self.assertEqual(session.token, read.token)
+
+        claimed = claim_session(self.path)
+        assert claimed is not None
+        self.assertEqual(session.to_json(), claimed.to_json())
+        self.assertEqual(
+            {"spalloc_server": "http://127.0.0.1/spalloc/", "n_boards": 1,
+             "n_chips": None}, claimed.request)
+        # Only one can claim it
+        self.assertIsNone(claim_session(self.path))
+        self.assertEqual([], os.listdir(self.directory.name))
+
+    def test_claim_expired(self) -> None:
+        save_session(self.path, self._session(-1))
+        self.assertIsNone(claim_session(self.path))
+        self.assertEqual("DESTROYED", self.server.state)
+        self.assertEqual("idle timeout", self.server.destroy_reason)
+
+    def test_not_a_session(self) -> None:
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("{}")
+        self.assertIsNone(read_session(self.path))
+        self.assertIsNone(claim_session(self.path))
+
+    def _job(self) -> SpallocJob:
+        return SpallocClient.open_job_from_database(
+            self.server.service_url, self.server.job_url,
+            {"JSESSIONID": "abc"}, {"X-CSRF-TOKEN": "def"})
+
+    def test_log_in(self) -> None:
+        client = SpallocClient(self.server.service_url)
+        self.assertEqual(1, self.server.n_logins)
+        client.close()
+
+    def test_keep_until_idle_timeout(self) -> None:
+        session = self._session(0.2)
+        keep_job(self.path, session, self._job())
+        self.assertTrue(self.server.destroyed.wait(10))
+        self.assertEqual("idle timeout", self.server.destroy_reason)
+        # Kept alive by spinnman until then
+        self.assertGreaterEqual(self.server.n_keepalives, 1)
+        self.assertFalse(os.path.exists(self.path))
+        self.assertIsNone(take_kept_job(session.token))
+
+    def test_take_kept_job(self) -> None:
+        session = self._session(0.2)
+        job = self._job()
+        keep_job(self.path, session, job)
+        self.assertIs(job, take_kept_job(session.token))
+        self.assertIsNone(take_kept_job(session.token))
+        # Taken back before the idle timeout, so not destroyed
+        self.assertFalse(self.server.destroyed.wait(0.5))
+        self.assertEqual("READY", self.server.state)
+
+    def test_claimed_before_idle_timeout(self) -> None:
+        session = self._session(0.2)
+        keep_job(self.path, session, self._job())
+        # As another process would; it now looks after the job
+        self.assertIsNotNone(claim_session(self.path))
+        self.assertFalse(self.server.destroyed.wait(0.5))
+        self.assertEqual("READY", self.server.state)
+
+    def test_replaced_before_idle_timeout(self) -> None:
+        session = self._session(0.2)
+        keep_job(self.path, session, self._job())
+        replacement = self._session(60)
+        save_session(self.path, replacement)
+        # No one else can reuse the job, so it is destroyed anyway
+        self.assertTrue(self.server.destroyed.wait(10))
+        kept = read_session(self.path)
+        assert kept is not None
+        self.assertEqual(replacement.token, kept.token)
+
+    def test_destroy_kept_job(self) -> None:
+        session = self._session(60)
+        keep_job(self.path, session, self._job())
+        destroy_job(session, "gone")
+        self.assertEqual("gone", self.server.destroy_reason)
+        self.assertIsNone(take_kept_job(session.token))
+
+    def test_destroy_unreachable(self) -> None:
+        session = self._session(60)
+        self.server.shutdown()
+        self.server.server_close()
+        with self.assertLogs("spinnaker_graph_front_end.board_session"):
+            destroy_job(session, "gone")
@@ -0,0 +1,85 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy
+
+from pacman.exceptions import PacmanInvalidParameterException
+from pacman.model.graphs.machine import SimpleMachineVertex
+from pacman.model.resources import ConstantSDRAM
+
+from spinn_front_end_common.data import FecDataView
+
+import spinnaker_graph_front_end as front_end
+from spinnaker_graph_front_end.config_setup import unittest_setup
+from spinnaker_graph_front_end.utilities import IndexedMachineEdge
+
+
+class TestBulkEdges(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        self.vertices = [
+            SimpleMachineVertex(ConstantSDRAM(0), label=f"v{i}")
+            for i in range(4)]
+        front_end.add_machine_vertex_instances(self.vertices)
+
+    def test_labels_are_lazy(self) -> None:
+        calls: list[int] = []
+
+        def labeller(index: int) -> str:
+            calls.append(index)
+            return f"edge {index}"
+
+        edge = IndexedMachineEdge(
+            self.vertices[0], self.vertices[1], 7, labeller)
+        self.assertEqual([], calls)
+        self.assertEqual("edge 7", edge.label)
+        self.assertEqual([7], calls)
+        self.assertIsNone(
+            IndexedMachineEdge(self.vertices[0], self.vertices[1], 0).label)
+
+    def test_add_machine_edges(self) -> None:
+        v = self.vertices
+        front_end.add_machine_edges(
+            v, numpy.array([0, 1, 2, 0]), numpy.array([1, 2, 3, 3]),
+            "STATE")
+        front_end.add_machine_edges(v, [3], [0], "CONTROL")
+        partitions = list(FecDataView.iterate_partitions())
+        self.assertEqual(
+            [(v[0], "STATE"), (v[1], "STATE"), (v[2], "STATE"),
+             (v[3], "CONTROL")],
+            [(partition.pre_vertex, partition.identifier)
+             for partition in partitions])
+        # Edges keep the order of the arrays, and their place in them
+        self.assertEqual(
+            [[(v[0], v[1], 0), (v[0], v[3], 3)], [(v[1], v[2], 1)],
+             [(v[2], v[3], 2)], [(v[3], v[0], 0)]],
+            [[(edge.pre_vertex, edge.post_vertex, edge.index)
+              for edge in partition.edges] for partition in partitions])
+
+    def test_bad_indices(self) -> None:
+        with self.assertRaises(PacmanInvalidParameterException):
+            front_end.add_machine_edges(
+                self.vertices, [0, 1], [1, 4], "STATE")
+        with self.assertRaises(PacmanInvalidParameterException):
+            front_end.add_machine_edges(
+                self.vertices, [0, -1], [1, 2], "STATE")
+        with self.assertRaises(PacmanInvalidParameterException):
+            front_end.add_machine_edges(
+                self.vertices, [0, 1, 2], [1, 2], "STATE")
+        with self.assertRaises(PacmanInvalidParameterException):
+            front_end.add_machine_edges(
+                self.vertices, [0.5], [1], "STATE")
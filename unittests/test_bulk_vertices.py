@@ -0,0 +1,64 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from pacman.exceptions import (
+    PacmanAlreadyExistsException,
+    PacmanInvalidParameterException,
+)
+from pacman.model.graphs.machine import SimpleMachineVertex
+from pacman.model.resources import ConstantSDRAM
+
+from spinn_front_end_common.data import FecDataView
+
+import spinnaker_graph_front_end as front_end
+from spinnaker_graph_front_end.config_setup import unittest_setup
+
+
+class TestBulkVertices(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+
+    def test_add_machine_vertex_instances(self) -> None:
+        vertices = [SimpleMachineVertex(ConstantSDRAM(0), label=f"v{i}")
+                    for i in range(10)]
+        front_end.add_machine_vertex_instances(iter(vertices))
+        self.assertEqual(10, FecDataView.get_n_vertices())
+        self.assertEqual(
+            vertices, list(FecDataView.iterate_machine_vertices()))
+
+    def test_bad_vertex_adds_nothing(self) -> None:
+        vertex = SimpleMachineVertex(ConstantSDRAM(0))
+        with self.assertRaises(PacmanInvalidParameterException):
+            front_end.add_machine_vertex_instances(
+                [vertex, "bad"])  # type: ignore[list-item]
+        self.assertEqual(0, FecDataView.get_n_vertices())
+
+    def test_repeated_vertex_adds_nothing(self) -> None:
+        vertex = SimpleMachineVertex(ConstantSDRAM(0), label="twice")
+        with self.assertRaises(PacmanAlreadyExistsException):
+            front_end.add_machine_vertex_instances([vertex, vertex])
+        self.assertEqual(0, FecDataView.get_n_vertices())
+
+    def test_vertex_in_graph_adds_nothing(self) -> None:
+        vertex = SimpleMachineVertex(ConstantSDRAM(0), label="first")
+        front_end.add_machine_vertex_instance(vertex)
+        with self.assertRaises(PacmanAlreadyExistsException):
+            front_end.add_machine_vertex_instances([
+                SimpleMachineVertex(ConstantSDRAM(0), label="second"),
+                vertex])
+        self.assertEqual(
+            [vertex], list(FecDataView.iterate_machine_vertices()))
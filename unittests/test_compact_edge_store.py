@@ -0,0 +1,81 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy
+
+from pacman.exceptions import (
+    PacmanAlreadyExistsException,
+    PacmanInvalidParameterException,
+)
+from pacman.model.graphs.machine import SimpleMachineVertex
+from pacman.model.resources import ConstantSDRAM
+
+from spinnaker_graph_front_end.config_setup import unittest_setup
+from spinnaker_graph_front_end.utilities import CompactEdgeStore
+
+
+class TestCompactEdgeStore(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        self.vertices = [
+            SimpleMachineVertex(ConstantSDRAM(0), label=f"v{i}")
+            for i in range(5)]
+        self.store = CompactEdgeStore()
+        self.store.add_vertices(self.vertices)
+
+    def test_edges(self) -> None:
+        self.store.add_edges("A", [0, 0, 1], [1, 2, 3])
+        self.store.add_edges("A", numpy.array([4]), numpy.array([0]),
+                             labeller=lambda i: f"A{i}")
+        self.store.add_edges("B", [2], [2])
+        self.assertEqual(4, self.store.n_edges("A"))
+        self.assertEqual(5, self.store.n_edges())
+        self.assertEqual([0, 0, 1, 4], self.store.pre_indices("A").tolist())
+        self.assertEqual([1, 2, 3, 0], self.store.post_indices("A").tolist())
+        edges = list(self.store.iterate_edges("A"))
+        self.assertEqual(4, len(edges))
+        self.assertIs(self.vertices[4], edges[3].pre_vertex)
+        self.assertIs(self.vertices[0], edges[3].post_vertex)
+        self.assertEqual("A3", edges[3].label)
+        edge = self.store.get_edge("B", 0)
+        self.assertIs(self.vertices[2], edge.pre_vertex)
+        self.assertIsNone(edge.label)
+        self.assertEqual(
+            [1, 2], self.store.post_vertices_of("A", self.vertices[0]))
+        with self.assertRaises(IndexError):
+            self.store.get_edge("B", 1)
+
+    def test_growth(self) -> None:
+        pre = numpy.arange(1000) % 5
+        post = (pre + 1) % 5
+        for _ in range(10):
+            self.store.add_edges("A", pre, post)
+        self.assertEqual(10000, self.store.n_edges("A"))
+        self.assertEqual(numpy.tile(post, 10).tolist(),
+                         self.store.post_indices("A").tolist())
+        self.assertGreaterEqual(self.store.nbytes, 10000 * 8)
+
+    def test_read_only_views(self) -> None:
+        self.store.add_edges("A", [0], [1])
+        with self.assertRaises(ValueError):
+            self.store.pre_indices("A")[0] = 3
+
+    def test_bad(self) -> None:
+        with self.assertRaises(PacmanInvalidParameterException):
+            self.store.add_edges("A", [0], [5])
+        with self.assertRaises(PacmanAlreadyExistsException):
+            self.store.add_vertices(self.vertices[:1])
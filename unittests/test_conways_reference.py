@@ -0,0 +1,67 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy
+
+from spinnaker_graph_front_end.config_setup import unittest_setup
+from spinnaker_graph_front_end.utilities import Boundary
+
+from gfe_examples.Conways.conways_reference import (
+    diff_states, expected_states, host_cell_updates_per_second,
+    initial_board, life_step, neighbour_counts)
+
+GLIDER = [(2, 2), (3, 2), (3, 3), (4, 3), (2, 4)]
+
+
+class TestConwaysReference(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+
+    def test_blinker(self) -> None:
+        board = initial_board((5, 5), [(1, 2), (2, 2), (3, 2)])
+        states = expected_states(board, 4)
+        self.assertEqual([(2, 1), (2, 2), (2, 3)],
+                         [tuple(xy) for xy in numpy.argwhere(states[0])])
+        self.assertTrue((states[1] == board).all())
+        self.assertTrue((states[3] == board).all())
+
+    def test_glider_wraps(self) -> None:
+        # A glider moves one cell diagonally every 4 steps
+        board = initial_board((7, 7), GLIDER)
+        states = expected_states(board, 28)
+        self.assertTrue((states[27] == board).all())
+        self.assertEqual(5, int(states.sum(axis=(1, 2)).min()))
+
+    def test_boundaries(self) -> None:
+        board = initial_board((4, 4), [(0, 0), (0, 3), (3, 0)])
+        self.assertEqual(3, neighbour_counts(board)[3, 3])
+        self.assertEqual(0, neighbour_counts(board, Boundary.CLIP)[3, 3])
+        self.assertTrue(life_step(board)[3, 3])
+        self.assertFalse(life_step(board, Boundary.CLIP)[3, 3])
+
+    def test_diff(self) -> None:
+        expected = expected_states(initial_board((7, 7), GLIDER), 5)
+        recorded = expected.copy()
+        recorded[3, 1, 6] = not recorded[3, 1, 6]
+        self.assertEqual([[3, 1, 6]],
+                         diff_states(expected, recorded).tolist())
+        with self.assertRaises(ValueError):
+            diff_states(expected, recorded[:4])
+
+    def test_throughput(self) -> None:
+        self.assertGreater(host_cell_updates_per_second(
+            initial_board((16, 16), GLIDER), 10), 0)
@@ -0,0 +1,111 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy
+
+from spinn_utilities.config_holder import set_config
+
+from pacman.exceptions import PacmanInvalidParameterException
+from pacman.model.graphs.application import ApplicationEdge
+from pacman.model.placements import Placement, Placements
+from pacman.model.routing_info import (
+    BaseKeyAndMask, MachineVertexRoutingInfo, RoutingInfo)
+from pacman.utilities.utility_objs import ChipCounter
+
+from spinn_front_end_common.data.fec_data_writer import FecDataWriter
+
+from spinnaker_graph_front_end.config_setup import unittest_setup
+from spinnaker_graph_front_end.host_emulator import HostEmulator
+
+from gfe_examples.Conways.conways_reference import (
+    expected_states, initial_board)
+from gfe_examples.Conways.partitioned_example_c_tiles.conways_board import (
+    ConwayBoard)
+from gfe_examples.Conways.partitioned_example_c_tiles.conways_tile import (
+    ConwayTile)
+
+GLIDERS = [(x + dx, y + dy)
+           for x, y in [(1, 1), (6, 3)]
+           for dx, dy in [(0, 0), (1, 0), (1, 1), (2, 1), (0, 2)]]
+
+
+class TestConwaysTiles(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        set_config("Machine", "version", "5")
+        self.writer = FecDataWriter.mock()
+        self.writer.set_up_timings(1000, 1)
+
+    def _run(self, initial: numpy.ndarray, tile_shape: tuple[int, int],
+             n_steps: int) -> ConwayBoard:
+        board = ConwayBoard(initial, tile_shape, label="board")
+        self.writer.add_vertex(board)
+        self.writer.add_edge(
+            ApplicationEdge(board, board), ConwayTile.PARTITION_ID)
+        self.writer.set_plan_n_timesteps(n_steps)
+        self.writer.set_max_run_time_steps(n_steps)
+        board.splitter.create_machine_vertices(ChipCounter())
+        tiles = list(board.machine_vertices)
+
+        routing_info = RoutingInfo()
+        for i, tile in enumerate(tiles):
+            routing_info.add_routing_info(MachineVertexRoutingInfo(
+                BaseKeyAndMask(i << 4, 0xFFFFFFF0), ConwayTile.PARTITION_ID,
+                tile, i))
+        self.writer.set_routing_infos(routing_info)
+        self.writer.set_placements(Placements(
+            Placement(tile, 0, 0, i + 1) for i, tile in enumerate(tiles)))
+
+        emulator = HostEmulator()
+        emulator.run(0, n_steps)
+        emulator.store_recordings()
+        self.assertEqual(0, emulator.n_dropped)
+        return board
+
+    def test_tiles(self) -> None:
+        initial = initial_board((12, 12), GLIDERS)
+        board = self._run(initial, (4, 4), 20)
+        self.assertEqual(9, len(board.machine_vertices))
+        tile = next(iter(board.machine_vertices))
+        self.assertEqual((4, 4), tile.vertex_slice.shape)
+        self.assertEqual(4, tile.n_packets)
+        self.assertEqual(8, len(tile.neighbours))
+
+        states, missing = board.get_states()
+        self.assertEqual([], missing)
+        self.assertTrue((expected_states(initial, 20) == states).all())
+
+    def test_wide_tile(self) -> None:
+        # One tile across, so it is its own left and right neighbour, with
+        # rows that take more than one word
+        initial = initial_board((40, 6), GLIDERS)
+        board = self._run(initial, (40, 3), 15)
+        tile = next(iter(board.machine_vertices))
+        self.assertEqual(2, tile.n_row_words)
+        self.assertEqual(2, len(tile.neighbours))
+
+        states, _ = board.get_states()
+        self.assertTrue((expected_states(initial, 15) == states).all())
+
+    def test_bad_tiles(self) -> None:
+        initial = initial_board((12, 62), [])
+        with self.assertRaises(PacmanInvalidParameterException):
+            ConwayBoard(initial, (4, 31))
+        with self.assertRaises(PacmanInvalidParameterException):
+            ConwayBoard(initial, (5, 2))
+        with self.assertRaises(PacmanInvalidParameterException):
+            ConwayBoard(numpy.zeros(12), (4, 2))
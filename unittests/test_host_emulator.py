@@ -0,0 +1,169 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy
+from numpy.typing import NDArray
+
+from spinn_utilities.config_holder import set_config
+from spinn_utilities.overrides import overrides
+
+from pacman.model.graphs.application import ApplicationEdge
+from pacman.model.graphs.application.abstract import (
+    AbstractOneAppOneMachineVertex)
+from pacman.model.partitioner_splitters import SplitterOneAppOneMachine
+from pacman.model.placements import Placement, Placements
+from pacman.model.resources import AbstractSDRAM, ConstantSDRAM
+from pacman.model.routing_info import (
+    BaseKeyAndMask, MachineVertexRoutingInfo, RoutingInfo)
+
+from spinn_front_end_common.data.fec_data_writer import FecDataWriter
+
+from spinnaker_graph_front_end.config_setup import unittest_setup
+from spinnaker_graph_front_end.host_emulator import HostEmulator
+from spinnaker_graph_front_end.utilities import (
+    AbstractEmulatedVertex, EmulatedCore, SimulatorVertex, get_recordings,
+    packed_recording_array)
+
+PARTITION = "DATA"
+
+
+class _Vertex(SimulatorVertex, AbstractEmulatedVertex):
+    """
+    Sends its value plus the timestep, and records the sum of what it
+    receives.
+    """
+
+    def __init__(self, value: int) -> None:
+        super().__init__(None, "test.aplx")
+        self.value = value
+        self.n_starts = 0
+
+    @property
+    @overrides(SimulatorVertex.sdram_required)
+    def sdram_required(self) -> AbstractSDRAM:
+        return ConstantSDRAM(0)
+
+    @overrides(SimulatorVertex.get_recording_channel_dtype)
+    def get_recording_channel_dtype(self, recording_id: int) -> numpy.dtype:
+        return numpy.dtype("<u4")
+
+    @overrides(AbstractEmulatedVertex.emulation_start)
+    def emulation_start(self, core: EmulatedCore) -> None:
+        self.n_starts += 1
+
+    @overrides(AbstractEmulatedVertex.emulation_step)
+    def emulation_step(
+            self, core: EmulatedCore, timestep: int,
+            keys: NDArray[numpy.uint32],
+            payloads: NDArray[numpy.uint32]) -> None:
+        # The lowest 8 bits say which vertex sent it
+        core.send([self.value << 8, (self.value << 8) + 1],
+                  self.value + timestep)
+        core.record(0, payloads[keys & 0xFF == 0].sum())
+
+
+class _BigEndianVertex(_Vertex):
+
+    @overrides(SimulatorVertex.get_recording_channel_dtype)
+    def get_recording_channel_dtype(self, recording_id: int) -> numpy.dtype:
+        return numpy.dtype(">u4")
+
+
+class _PackedVertex(_Vertex):
+
+    @overrides(SimulatorVertex.is_recording_channel_packed)
+    def is_recording_channel_packed(self, recording_id: int) -> bool:
+        return True
+
+
+class TestHostEmulator(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        set_config("Machine", "version", "5")
+        self.writer = FecDataWriter.mock()
+        self.writer.set_max_run_time_steps(10)
+        self.writer.set_up_timings(1000, 1)
+
+    def _graph(self, values: list[int],
+               edges: list[tuple[int, int]]) -> list[_Vertex]:
+        vertices = [_Vertex(value) for value in values]
+        app_vertices = []
+        for vertex in vertices:
+            app_vertex = AbstractOneAppOneMachineVertex(vertex, None)
+            app_vertex.splitter = SplitterOneAppOneMachine()
+            self.writer.add_vertex(app_vertex)
+            app_vertices.append(app_vertex)
+        for pre, post in edges:
+            self.writer.add_edge(ApplicationEdge(
+                app_vertices[pre], app_vertices[post]), PARTITION)
+        routing_info = RoutingInfo()
+        for vertex in vertices:
+            routing_info.add_routing_info(MachineVertexRoutingInfo(
+                BaseKeyAndMask(vertex.value << 8, 0xFFFFFF00), PARTITION,
+                vertex, 0))
+        self.writer.set_routing_infos(routing_info)
+        self.writer.set_placements(Placements(
+            Placement(vertex, 0, 0, i + 1)
+            for i, vertex in enumerate(vertices)))
+        return vertices
+
+    def test_packets_and_recordings(self) -> None:
+        # 1 and 2 send to 3, which sends to nothing
+        vertices = self._graph([1, 2, 3], [(0, 2), (1, 2)])
+        emulator = HostEmulator()
+        self.assertEqual([1, 1, 1], [v.n_starts for v in vertices])
+        emulator.run(0, 3)
+        emulator.store_recordings()
+        emulator.run(3, 5)
+        emulator.store_recordings()
+        self.assertEqual(5 * 2, emulator.n_dropped)
+
+        recordings, missing = get_recordings(vertices, 0)
+        self.assertEqual([], missing)
+        self.assertEqual([0] * 5, recordings[vertices[0]].tolist())
+        # On step t, what 1 and 2 sent on step t - 1
+        self.assertEqual([0] + [(1 + t) + (2 + t) for t in range(4)],
+                         recordings[vertices[2]].tolist())
+
+    def test_send_shapes(self) -> None:
+        core = EmulatedCore(Placement(_Vertex(1), 0, 0, 1))
+        core.send(5)
+        core.send(numpy.array([6, 7]), [8, 9])
+        keys, payloads = core.take_sent()
+        self.assertEqual([5, 6, 7], keys.tolist())
+        self.assertEqual([0, 8, 9], payloads.tolist())
+        keys, _ = core.take_sent()
+        self.assertEqual(0, len(keys))
+
+    def test_little_endian(self) -> None:
+        core = EmulatedCore(Placement(_BigEndianVertex(1), 0, 0, 1))
+        core.send(0x01020304, 5)
+        keys, payloads = core.take_sent()
+        self.assertEqual("<u4", keys.dtype.str)
+        self.assertEqual("<u4", payloads.dtype.str)
+        self.assertEqual(b"\x04\x03\x02\x01", keys.tobytes())
+        core.record(0, 0x01020304)
+        self.assertEqual(b"\x04\x03\x02\x01", core.take_recordings()[0])
+
+    def test_packed_recording(self) -> None:
+        core = EmulatedCore(Placement(_PackedVertex(1), 0, 0, 1))
+        bits = [i % 3 == 0 for i in range(40)]
+        for bit in bits:
+            core.record(0, bit)
+        data = core.take_recordings()[0]
+        self.assertEqual(bits, packed_recording_array(data).tolist())
+        self.assertEqual({}, core.take_recordings())
@@ -0,0 +1,66 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import subprocess
+import sys
+import unittest
+
+#: Packages that must not be imported until they are needed
+DEFERRED = ("numpy", "pacman", "spinn_front_end_common", "spinn_machine",
+            "spinnman")
+
+_SCRIPT = """
+import json
+import sys
+import spinnaker_graph_front_end
+{then}
+print(json.dumps(sorted(
+    name for name in sys.modules if name.split(".")[0] in {deferred})))
+"""
+
+
+def _imported_in_new_process(then: str = "") -> list[str]:
+    """
+    Import the front end in a new interpreter, then run some code.
+
+    :param then: The code to run after importing the front end
+    :return: The modules of the deferred packages that were imported
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", _SCRIPT.format(then=then, deferred=DEFERRED)],
+        check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_nothing_heavy_imported(self) -> None:
+        self.assertEqual([], _imported_in_new_process())
+
+    def test_imported_when_needed(self) -> None:
+        modules = _imported_in_new_process(
+            "spinnaker_graph_front_end.is_allocated_machine()")
+        self.assertIn("spinn_front_end_common.data", modules)
+
+    def test_lazy_attributes(self) -> None:
+        import spinnaker_graph_front_end as front_end
+        from spinnaker_graph_front_end.utilities import recordings
+        self.assertIs(recordings.get_recordings, front_end.get_recordings)
+        self.assertIn("ReverseIpTagMultiCastSource", dir(front_end))
+        self.assertTrue(hasattr(front_end, "ReverseIpTagMultiCastSource"))
+        self.assertIn("SpiNNaker", dir(front_end))
+        self.assertIn("gfe_file", dir(front_end))
+        with self.assertRaises(AttributeError):
+            _ = front_end.no_such_attribute  # type: ignore[attr-defined]
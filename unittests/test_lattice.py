@@ -0,0 +1,113 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Sequence
+import unittest
+
+import numpy
+
+from spinn_utilities.overrides import overrides
+
+from pacman.exceptions import PacmanInvalidParameterException
+from pacman.model.graphs.machine import MachineVertex, SimpleMachineVertex
+from pacman.model.resources import ConstantSDRAM
+
+from spinnaker_graph_front_end.config_setup import unittest_setup
+from spinnaker_graph_front_end.utilities import (
+    AbstractLatticeVertex,
+    Boundary,
+    Lattice,
+    Neighbourhood,
+)
+
+
+class _Cell(SimpleMachineVertex, AbstractLatticeVertex):
+
+    def __init__(self, x: int, y: int):
+        super().__init__(ConstantSDRAM(0), label=f"{x},{y}")
+        self.neighbours: Sequence[MachineVertex] = []
+
+    @overrides(AbstractLatticeVertex.set_lattice_neighbours)
+    def set_lattice_neighbours(
+            self, neighbours: Sequence[MachineVertex]) -> None:
+        self.neighbours = neighbours
+
+
+class TestLattice(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+
+    def test_moore_wrap(self) -> None:
+        lattice = Lattice.build(_Cell, (4, 5))
+        self.assertEqual(4 * 5 * 8, len(lattice.pre_indices))
+        lattice.set_neighbours()
+        cell = lattice.vertex_at(0, 0)
+        self.assertEqual("0,0", cell.label)
+        labels = {n.label for n in cell.neighbours}
+        self.assertEqual(
+            {"0,1", "1,1", "1,0", "1,4", "0,4", "3,4", "3,0", "3,1"}, labels)
+
+    def test_wrap_two_by_two(self) -> None:
+        # Opposite offsets wrap to the same cell, which is one edge
+        lattice = Lattice.build(_Cell, (2, 2))
+        edges = list(zip(
+            lattice.pre_indices.tolist(), lattice.post_indices.tolist()))
+        self.assertEqual(4 * 3, len(edges))
+        self.assertEqual(len(edges), len(set(edges)))
+        lattice.set_neighbours()
+        self.assertEqual(
+            ["0,1", "1,1", "1,0"],
+            [n.label for n in lattice.vertex_at(0, 0).neighbours])
+
+    def test_matches_loops(self) -> None:
+        width, height = 6, 3
+        lattice = Lattice.build(_Cell, (width, height))
+        expected = set()
+        for x in range(width):
+            for y in range(height):
+                for dx, dy in Neighbourhood.MOORE.value:
+                    expected.add((x * height + y,
+                                  ((x + dx) % width) * height +
+                                  (y + dy) % height))
+        self.assertEqual(expected, set(zip(
+            lattice.pre_indices.tolist(), lattice.post_indices.tolist())))
+
+    def test_von_neumann_clip(self) -> None:
+        lattice = Lattice.build(
+            _Cell, (3, 3), Neighbourhood.VON_NEUMANN, Boundary.CLIP)
+        # 4 corners with 2, 4 sides with 3, 1 middle with 4
+        self.assertEqual(4 * 2 + 4 * 3 + 4, len(lattice.pre_indices))
+        counts = numpy.bincount(lattice.post_indices, minlength=9)
+        self.assertEqual(2, counts[lattice.index_of(0, 0)])
+        self.assertEqual(4, counts[lattice.index_of(1, 1)])
+
+    def test_custom_offsets(self) -> None:
+        lattice = Lattice.build(_Cell, (5, 1), [(1, 0), (2, 0)])
+        lattice.set_neighbours()
+        self.assertEqual(
+            ["4,0", "3,0"],
+            [n.label for n in lattice.vertex_at(0, 0).neighbours])
+
+    def test_no_self_edges(self) -> None:
+        lattice = Lattice.build(_Cell, (1, 1))
+        self.assertEqual(0, len(lattice.pre_indices))
+
+    def test_bad(self) -> None:
+        with self.assertRaises(PacmanInvalidParameterException):
+            Lattice.build(_Cell, (2, 2), [(1, 0, 0)])
+        with self.assertRaises(PacmanInvalidParameterException):
+            Lattice.build(_Cell, (2, 2), [(0.5, 0)])
+        with self.assertRaises(PacmanInvalidParameterException):
+            Lattice.build(_Cell, (0, 2))
@@ -0,0 +1,110 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import threading
+import unittest
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import HTTPError
+
+from spinnaker_graph_front_end.machine_allocation import BackgroundAllocation
+
+
+class _AllocationServer(ThreadingHTTPServer):
+    """
+    A stand-in allocation server, which only answers a request for a
+    machine once it is told the machine is ready.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _AllocationHandler)
+        self.requested = threading.Event()
+        self.ready = threading.Event()
+        self.fail = False
+        self.n_requests = 0
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}/job"
+
+
+class _AllocationHandler(BaseHTTPRequestHandler):
+    server: _AllocationServer
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        self.server.n_requests += 1
+        self.server.requested.set()
+        self.server.ready.wait(10)
+        if self.server.fail:
+            self.send_error(503, "No boards free")
+            return
+        body = json.dumps({"ip_address": "10.0.0.1", "boards": 1}).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+class TestBackgroundAllocation(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.server = _AllocationServer()
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+
+    def tearDown(self) -> None:
+        self.server.ready.set()
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    def _allocate(self) -> dict[str, object]:
+        with urllib.request.urlopen(self.server.url) as response:
+            job: dict[str, object] = json.load(response)
+        return job
+
+    def test_overlap(self) -> None:
+        allocation = BackgroundAllocation(self._allocate)
+        # The server is asked while the caller carries on, and cannot
+        # answer until the caller says so
+        self.assertTrue(self.server.requested.wait(10))
+        self.assertFalse(allocation.done)
+        self.assertIsNone(allocation.allocation_time)
+        with self.assertRaises(TimeoutError):
+            allocation.wait(0.01)
+
+        self.server.ready.set()
+        job = allocation.wait()
+        self.assertEqual("10.0.0.1", job["ip_address"])
+        self.assertTrue(allocation.done)
+        self.assertEqual(1, self.server.n_requests)
+        self.assertIsNotNone(allocation.allocation_time)
+
+        # Waiting again does not allocate again
+        self.assertIs(job, allocation.wait())
+        self.assertEqual(1, self.server.n_requests)
+
+    def test_failure(self) -> None:
+        self.server.fail = True
+        self.server.ready.set()
+        allocation = BackgroundAllocation(self._allocate)
+        with self.assertRaises(HTTPError):
+            allocation.wait()
+        self.assertTrue(allocation.done)
+        self.assertIsNotNone(allocation.allocation_time)
@@ -0,0 +1,155 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import time
+import unittest
+
+from spinn_utilities.config_holder import set_config
+
+from pacman.model.graphs.application import ApplicationEdge
+from pacman.model.graphs.machine import SimpleMachineVertex
+from pacman.model.placements import Placement, Placements
+from pacman.model.resources import ConstantSDRAM
+
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+
+from pacman_test_objects import SimpleTestVertex
+
+import spinnaker_graph_front_end as front_end
+from spinnaker_graph_front_end.config_setup import unittest_setup
+from spinnaker_graph_front_end.mapping_cache import (
+    CachedMapping, MappingCache, mapping_fingerprint)
+
+
+class TestMappingCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        self.temp = tempfile.TemporaryDirectory()
+        self.vertices = [
+            SimpleMachineVertex(ConstantSDRAM(0), label=f"v{i}")
+            for i in range(3)]
+        self.entry = CachedMapping(
+            [(0, 0, 0, 1), (1, 0, 0, 2)],
+            [(0, ("127.0.0.1", 0, 0, 1, "localhost", 17895, True,
+                  "DEFAULT"))],
+            [(1, ("127.0.0.1", 2, 12345, 0, 0, 2, 1))])
+
+    def tearDown(self) -> None:
+        self.temp.cleanup()
+
+    def test_hit_and_miss(self) -> None:
+        cache = MappingCache(self.temp.name, 1024 * 1024)
+        self.assertIsNone(cache.load("abc"))
+        cache.store("abc", self.entry)
+        entry = cache.load("abc")
+        assert entry is not None
+        self.assertEqual((1, 1, 0), (cache.hits, cache.misses,
+                                     cache.evictions))
+
+        system = Placements([Placement(self.vertices[2], 0, 0, 3)])
+        placements = entry.placements(self.vertices, system)
+        self.assertEqual(3, placements.n_placements_on_chip((0, 0)))
+        self.assertEqual(2, placements.get_placement_of_vertex(
+            self.vertices[1]).p)
+
+        tags = entry.tags(self.vertices)
+        [ip_tag] = tags.get_ip_tags_for_vertex(self.vertices[0]) or []
+        self.assertEqual(17895, ip_tag.port)
+        [r_tag] = tags.get_reverse_ip_tags_for_vertex(self.vertices[1]) or []
+        self.assertEqual(12345, r_tag.port)
+
+    def test_unreadable_entry_is_a_miss(self) -> None:
+        cache = MappingCache(self.temp.name, 1024 * 1024)
+        with open(os.path.join(self.temp.name, "bad.mapping"), "wb") as f:
+            f.write(b"not a pickle")
+        self.assertIsNone(cache.load("bad"))
+        self.assertEqual(1, cache.misses)
+
+    def test_eviction(self) -> None:
+        cache = MappingCache(self.temp.name, 1024 * 1024)
+        for key in ("a", "b", "c"):
+            cache.store(key, self.entry)
+        old = time.time() - 100
+        for key, age in (("a", 1), ("b", 3), ("c", 2)):
+            os.utime(os.path.join(self.temp.name, f"{key}.mapping"),
+                     (old - age, old - age))
+        size = os.path.getsize(os.path.join(self.temp.name, "a.mapping"))
+
+        cache = MappingCache(self.temp.name, 2 * size)
+        self.assertEqual(1, cache.evict())
+        self.assertIsNone(cache.load("b"))
+        self.assertIsNotNone(cache.load("c"))
+        cache.store("d", self.entry)
+        # c was used more recently than a, so a goes
+        self.assertIsNone(cache.load("a"))
+        self.assertIsNotNone(cache.load("c"))
+        self.assertEqual(2, cache.evictions)
+
+        cache.clear()
+        self.assertEqual([], os.listdir(self.temp.name))
+
+    @unittest.skipUnless(hasattr(os, "getuid"), "No file owners to check")
+    def test_shared_directory_refused(self) -> None:
+        shared = os.path.join(self.temp.name, "shared")
+        os.makedirs(shared)
+        os.chmod(shared, 0o777)
+        with self.assertRaises(ConfigurationException):
+            MappingCache(shared, 1024)
+        # Made private if it is made by the cache
+        MappingCache(os.path.join(self.temp.name, "private"), 1024)
+
+    def _fingerprint(self, labels: list[str | None],
+                     edges: list[tuple[int, int]]) -> str:
+        unittest_setup()
+        set_config("Machine", "version", "5")
+        vertices = [SimpleMachineVertex(ConstantSDRAM(0), label=label)
+                    for label in labels]
+        front_end.add_machine_vertex_instances(vertices)
+        front_end.add_machine_edges(
+            vertices, [pre for pre, _ in edges], [post for _, post in edges],
+            "STATE")
+        return mapping_fingerprint(Placements())
+
+    def test_fingerprint_by_index(self) -> None:
+        ring = [(0, 1), (1, 2), (2, 0)]
+        backwards = [(0, 2), (2, 1), (1, 0)]
+        unlabelled = self._fingerprint([None, None, None], ring)
+        # Labels make no difference
+        self.assertEqual(
+            unlabelled, self._fingerprint(["a", "b", "c"], ring))
+        # A different graph with the same labels does
+        self.assertNotEqual(
+            unlabelled, self._fingerprint([None, None, None], backwards))
+        self.assertNotEqual(
+            self._fingerprint(["x", "x", "x"], ring),
+            self._fingerprint(["x", "x", "x"], backwards))
+
+    def _app_fingerprint(self, edges: list[tuple[int, int]]) -> str:
+        unittest_setup()
+        set_config("Machine", "version", "5")
+        vertices = [SimpleTestVertex(10, label=f"app{i}") for i in range(3)]
+        front_end.add_vertex_instances(vertices)
+        for pre, post in edges:
+            front_end.add_edge_instance(
+                ApplicationEdge(vertices[pre], vertices[post]), "STATE")
+        return mapping_fingerprint(Placements())
+
+    def test_fingerprint_application_graph(self) -> None:
+        ring = self._app_fingerprint([(0, 1), (1, 2), (2, 0)])
+        self.assertEqual(ring, self._app_fingerprint([(0, 1), (1, 2), (2, 0)]))
+        self.assertNotEqual(
+            ring, self._app_fingerprint([(0, 2), (2, 1), (1, 0)]))
@@ -0,0 +1,220 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import struct
+import threading
+import unittest
+from unittest import mock
+
+from spinn_utilities.config_holder import set_config
+from spinn_utilities.overrides import overrides
+
+from spinnman.model.enums import ExecutableType
+
+from pacman.model.graphs.machine import SimpleMachineVertex
+from pacman.model.placements import Placement, Placements
+from pacman.model.resources import AbstractSDRAM, ConstantSDRAM
+from pacman.model.routing_info import RoutingInfo
+from pacman.model.tags import Tags
+
+from spinn_front_end_common.abstract_models import (
+    AbstractGeneratesDataSpecification,
+    AbstractHasAssociatedBinary,
+)
+from spinn_front_end_common.data import FecDataView
+from spinn_front_end_common.data.fec_data_writer import FecDataWriter
+from spinn_front_end_common.interface.ds import (
+    DataSpecificationGenerator,
+    DsSqlliteDatabase,
+)
+from spinn_front_end_common.interface.interface_functions import (
+    graph_data_specification_writer)
+
+from spinnaker_graph_front_end.config_setup import unittest_setup
+from spinnaker_graph_front_end.parallel_data_specification_writer import (
+    TIMINGS_REPORT, DataSpecificationCache,
+    parallel_data_specification_writer)
+from spinnaker_graph_front_end.utilities import SimulatorVertex
+
+
+class _Vertex(SimpleMachineVertex, AbstractGeneratesDataSpecification,
+              AbstractHasAssociatedBinary):
+
+    def __init__(self, sdram: int = 8) -> None:
+        super().__init__(ConstantSDRAM(sdram))
+
+    @overrides(AbstractGeneratesDataSpecification.generate_data_specification)
+    def generate_data_specification(
+            self, spec: DataSpecificationGenerator,
+            placement: Placement) -> None:
+        spec.reserve_memory_region(0, 8)
+        spec.switch_write_focus(0)
+        spec.write_value(placement.x * 100 + placement.y)
+        spec.write_value(placement.p)
+        spec.end_specification()
+
+    @overrides(AbstractHasAssociatedBinary.get_binary_file_name)
+    def get_binary_file_name(self) -> str:
+        return "test.aplx"
+
+    @overrides(AbstractHasAssociatedBinary.get_binary_start_type)
+    def get_binary_start_type(self) -> ExecutableType:
+        return ExecutableType.USES_SIMULATION_INTERFACE
+
+
+class _SimVertex(SimulatorVertex, AbstractGeneratesDataSpecification):
+
+    def __init__(self, value: int) -> None:
+        super().__init__(None, "test.aplx")
+        self.value = value
+        self.n_generated = 0
+
+    @property
+    @overrides(SimulatorVertex.sdram_required)
+    def sdram_required(self) -> AbstractSDRAM:
+        return ConstantSDRAM(4)
+
+    @overrides(SimulatorVertex.get_data_specification_parameters)
+    def get_data_specification_parameters(self) -> object | None:
+        return self.value
+
+    @overrides(AbstractGeneratesDataSpecification.generate_data_specification)
+    def generate_data_specification(
+            self, spec: DataSpecificationGenerator,
+            placement: Placement) -> None:
+        self.n_generated += 1
+        spec.reserve_memory_region(0, 4)
+        spec.switch_write_focus(0)
+        spec.write_value(self.value)
+        spec.end_specification()
+
+
+class TestParallelDataSpecificationWriter(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        set_config("Machine", "version", "5")
+        set_config("Reports", "write_text_specs", "False")
+        self.writer = FecDataWriter.mock()
+        self.writer.set_max_run_time_steps(10)
+
+    def _place(self, vertices: list[_Vertex]) -> list[Placement]:
+        cores = [(1, 0, 3), (0, 0, 1), (1, 1, 2), (0, 0, 2), (1, 0, 1)]
+        placements = [Placement(vertex, x, y, p)
+                      for vertex, (x, y, p) in zip(vertices, cores)]
+        self.writer.set_placements(Placements(placements))
+        return placements
+
+    def _n_workers(self) -> int:
+        with open(os.path.join(FecDataView.get_run_dir_path(),
+                               TIMINGS_REPORT), encoding="utf-8") as f:
+            return int(f.readline().split(" workers")[0].split()[-1])
+
+    def test_content(self) -> None:
+        placements = self._place([_Vertex() for _ in range(5)])
+
+        path = parallel_data_specification_writer(3)
+        with DsSqlliteDatabase(path) as ds_db:
+            cores = list(ds_db.get_ds_cores())
+            self.assertEqual(
+                {(pl.x, pl.y, pl.p) for pl in placements}, set(cores))
+            for x, y, p in cores:
+                [(region, _, content)] = ds_db.get_regions_content(x, y, p)
+                self.assertEqual(0, region)
+                self.assertEqual((x * 100 + y, p),
+                                 struct.unpack("<II", content))
+        self.assertEqual(3, self._n_workers())
+
+    def test_same_as_serial(self) -> None:
+        self._place([_Vertex() for _ in range(5)])
+        serial = os.path.join(self.writer.get_run_dir_path(), "serial.sqlite3")
+        os.rename(graph_data_specification_writer(), serial)
+
+        path = parallel_data_specification_writer(2)
+        with DsSqlliteDatabase(serial) as expected, \
+                DsSqlliteDatabase(path) as ds_db:
+            cores = list(expected.get_ds_cores())
+            self.assertEqual(cores, list(ds_db.get_ds_cores()))
+            for x, y, p in cores:
+                self.assertEqual(expected.get_region_sizes(x, y, p),
+                                 ds_db.get_region_sizes(x, y, p))
+                self.assertEqual(list(expected.get_regions_content(x, y, p)),
+                                 list(ds_db.get_regions_content(x, y, p)))
+
+    def test_checked_as_serial(self) -> None:
+        # Writes 8 bytes where it said it would use 4
+        self._place([_Vertex(), _Vertex(sdram=4)])
+        with self.assertRaises(ValueError):
+            graph_data_specification_writer()
+        with self.assertRaises(ValueError):
+            parallel_data_specification_writer(2)
+
+    def test_forked_with_threads(self) -> None:
+        placements = self._place([_Vertex() for _ in range(5)])
+        done = threading.Event()
+        thread = threading.Thread(target=done.wait)
+        thread.start()
+        try:
+            path = parallel_data_specification_writer(3)
+        finally:
+            done.set()
+            thread.join()
+        self.assertEqual(3, self._n_workers())
+        with DsSqlliteDatabase(path) as ds_db:
+            self.assertEqual({(pl.x, pl.y, pl.p) for pl in placements},
+                             set(ds_db.get_ds_cores()))
+
+    def test_not_forked(self) -> None:
+        self._place([_Vertex() for _ in range(5)])
+        with mock.patch("multiprocessing.get_all_start_methods",
+                        return_value=["spawn"]), \
+                self.assertLogs(level="WARNING"):
+            parallel_data_specification_writer(3)
+        self.assertEqual(1, self._n_workers())
+
+    def test_shard_database_removed(self) -> None:
+        self._place([_Vertex() for _ in range(5)])
+        path = parallel_data_specification_writer(2)
+        self.assertEqual([os.path.basename(path)], [
+            name for name in os.listdir(os.path.dirname(path))
+            if name.startswith("ds")])
+
+    def test_incremental(self) -> None:
+        self.writer.set_up_timings(1000, 1)
+        self.writer.set_routing_infos(RoutingInfo())
+        self.writer.set_tags(Tags())
+        vertices = [_SimVertex(i) for i in range(4)]
+        self.writer.set_placements(Placements(
+            Placement(vertex, x, 0, p)
+            for vertex, (x, p) in zip(vertices, [(0, 1), (1, 1), (1, 2),
+                                                 (2, 1)])))
+        cache = DataSpecificationCache()
+
+        # Each run after a reset has its own database
+        os.remove(parallel_data_specification_writer(1, cache))
+        self.assertEqual(0, cache.n_reused)
+        vertices[1].value = 7
+        path = parallel_data_specification_writer(1, cache)
+        # The whole chip of the changed vertex is generated again
+        self.assertEqual(2, cache.n_reused)
+        self.assertEqual([1, 2, 2, 1], [v.n_generated for v in vertices])
+        with DsSqlliteDatabase(path) as ds_db:
+            [(_, _, content)] = ds_db.get_regions_content(1, 0, 1)
+            self.assertEqual((7, ), struct.unpack("<I", content))
+        os.remove(path)
+
+        self.writer.set_max_run_time_steps(20)
+        parallel_data_specification_writer(1, cache)
+        self.assertEqual(0, cache.n_reused)
@@ -0,0 +1,105 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import unittest
+
+from spinn_front_end_common.data.fec_data_writer import FecDataWriter
+from spinn_front_end_common.interface.provenance import (
+    FecTimer, GlobalProvenance, TimerCategory, TimerWork)
+
+from spinnaker_graph_front_end.config_setup import unittest_setup
+from spinnaker_graph_front_end.phase_timings import (
+    PhaseTimer, get_phase_timings, get_phase_totals, write_phase_timings)
+
+
+class TestPhaseTimings(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        FecDataWriter.mock()
+        with GlobalProvenance() as db:
+            db.insert_run_reset_mapping()
+
+    def tearDown(self) -> None:
+        FecTimer.stop_category_timing()
+
+    def test_measures(self) -> None:
+        FecTimer.start_category(TimerCategory.MAPPING, False)
+        with PhaseTimer("counted", TimerWork.OTHER) as timer:
+            timer.add_bytes(100)
+            timer.add_bytes(28)
+            timer.add_objects(3)
+        with FecTimer("plain", TimerWork.OTHER):
+            pass
+        with PhaseTimer("skipped", TimerWork.LOADING) as timer:
+            timer.skip("not needed")
+
+        counted, plain, skipped = get_phase_timings()
+        self.assertEqual("counted", counted.algorithm)
+        self.assertEqual(TimerCategory.MAPPING.category_name,
+                         counted.category)
+        self.assertEqual(128, counted.n_bytes)
+        self.assertEqual(3, counted.n_objects)
+        self.assertIsNotNone(counted.cpu_time_ms)
+        self.assertLessEqual(0, counted.wall_time_ms)
+
+        self.assertEqual("plain", plain.algorithm)
+        self.assertIsNone(plain.cpu_time_ms)
+        self.assertIsNone(plain.n_bytes)
+
+        self.assertEqual("not needed", skipped.skip_reason)
+        self.assertIsNone(skipped.n_objects)
+        self.assertIsNotNone(skipped.cpu_time_ms)
+
+    def test_read_only(self) -> None:
+        FecTimer.start_category(TimerCategory.MAPPING, False)
+        with FecTimer("plain", TimerWork.OTHER):
+            pass
+        [plain] = get_phase_timings()
+        self.assertIsNone(plain.cpu_time_ms)
+        # Reading makes no table of measures
+        with GlobalProvenance() as db:
+            self.assertEqual([], db.run_query(
+                "SELECT name FROM sqlite_master "
+                "WHERE name = 'gfe_timer_measures'"))
+
+    def test_no_category(self) -> None:
+        # Outside a category nothing is recorded, as with FecTimer
+        with PhaseTimer("uncounted", TimerWork.OTHER) as timer:
+            timer.add_objects(1)
+        self.assertEqual([], get_phase_timings())
+
+    def test_write(self) -> None:
+        FecTimer.start_category(TimerCategory.MAPPING, False)
+        with PhaseTimer("first", TimerWork.OTHER) as timer:
+            timer.add_objects(2)
+        FecTimer.start_category(TimerCategory.LOADING)
+        with PhaseTimer("second", TimerWork.LOADING):
+            pass
+        timings = get_phase_timings()
+        totals = get_phase_totals(timings)
+
+        path = write_phase_timings()
+        with open(path, encoding="utf-8") as f:
+            written = json.load(f)
+        self.assertEqual(totals, written["totals_ms"])
+        self.assertEqual(
+            [timing.as_dict() for timing in timings], written["timings"])
+        first, second = written["timings"]
+        self.assertEqual(2, first["n_objects"])
+        self.assertEqual(TimerCategory.MAPPING.category_name,
+                         first["category"])
+        self.assertEqual(TimerCategory.LOADING.category_name,
+                         second["category"])
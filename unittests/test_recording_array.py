@@ -0,0 +1,201 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+import unittest
+
+import numpy
+
+from spinn_utilities.config_holder import set_config
+from spinn_utilities.overrides import overrides
+
+from pacman.model.placements import Placement
+from pacman.model.resources import AbstractSDRAM, ConstantSDRAM
+
+from spinn_front_end_common.abstract_models import (
+    AbstractGeneratesDataSpecification,
+)
+from spinn_front_end_common.data.fec_data_writer import FecDataWriter
+from spinn_front_end_common.interface.ds import (
+    DataSpecificationGenerator,
+    DsSqlliteDatabase,
+)
+
+from spinnaker_graph_front_end.config_setup import unittest_setup
+from spinnaker_graph_front_end.utilities import (
+    SimulatorVertex, packed_recording_array, packed_recording_sdram,
+    packed_recording_size, recording_array, recording_region_size)
+
+
+class _Vertex(SimulatorVertex):
+
+    def __init__(self, data: bytes):
+        super().__init__(None, "test.aplx")
+        self.data = data
+
+    @property
+    @overrides(SimulatorVertex.sdram_required)
+    def sdram_required(self) -> AbstractSDRAM:
+        return ConstantSDRAM(0)
+
+    @overrides(SimulatorVertex.get_recording_channel_data)
+    def get_recording_channel_data(
+            self, recording_id: int) -> tuple[memoryview, bool]:
+        return memoryview(self.data), False
+
+    @overrides(SimulatorVertex.get_recording_channel_dtype)
+    def get_recording_channel_dtype(self, recording_id: int) -> numpy.dtype:
+        return numpy.dtype("<u2") if recording_id else numpy.dtype("<i4")
+
+    @overrides(SimulatorVertex.get_recording_channel_shape)
+    def get_recording_channel_shape(
+            self, recording_id: int) -> tuple[int, ...]:
+        return (3, ) if recording_id else ()
+
+
+class _PackedVertex(_Vertex):
+
+    @overrides(SimulatorVertex.is_recording_channel_packed)
+    def is_recording_channel_packed(self, recording_id: int) -> bool:
+        return True
+
+
+class _DecimatedVertex(_Vertex, AbstractGeneratesDataSpecification):
+
+    @overrides(SimulatorVertex.get_recording_channel_interval)
+    def get_recording_channel_interval(self, recording_id: int) -> int:
+        return 5 if recording_id else 1
+
+    @overrides(SimulatorVertex.is_recording_channel_windowed)
+    def is_recording_channel_windowed(self, recording_id: int) -> bool:
+        return bool(recording_id)
+
+    @overrides(AbstractGeneratesDataSpecification.generate_data_specification)
+    def generate_data_specification(
+            self, spec: DataSpecificationGenerator,
+            placement: Placement) -> None:
+        self.generate_recording_region(spec, 2, [40, 8], write_rates=True)
+        spec.end_specification()
+
+
+def _pack(runs: list[list[bool]]) -> bytes:
+    # As recorded by the binary: the words of each run then its length
+    data = b""
+    for bits in runs:
+        words = numpy.packbits(
+            numpy.array(bits, dtype=numpy.uint8), bitorder="little")
+        words.resize(-(-len(words) // 4) * 4)
+        data += words.tobytes() + numpy.uint32(len(bits)).tobytes()
+    return data
+
+
+class TestRecordingArray(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+
+    def test_no_copy(self) -> None:
+        data = numpy.arange(6, dtype="<i4").tobytes()
+        array = recording_array(data, numpy.dtype("<i4"))
+        self.assertEqual(list(range(6)), array.tolist())
+        self.assertFalse(array.flags.writeable)
+        self.assertFalse(array.flags.owndata)
+
+    def test_channels(self) -> None:
+        # 2 whole records of 3 uint16 and a partial one
+        vertex = _Vertex(numpy.arange(8, dtype="<u2").tobytes())
+        array, missing = vertex.get_recording_channel_array(1)
+        self.assertFalse(missing)
+        self.assertEqual((2, 3), array.shape)
+        self.assertEqual([[0, 1, 2], [3, 4, 5]], array.tolist())
+        array, _ = vertex.get_recording_channel_array(0)
+        self.assertEqual((4, ), array.shape)
+        self.assertEqual(numpy.dtype("<i4"), array.dtype)
+
+    def test_little_endian(self) -> None:
+        array = recording_array(b"\x01\x02", numpy.dtype(">u2"))
+        self.assertEqual([0x0201], array.tolist())
+
+    def test_empty(self) -> None:
+        self.assertEqual(
+            (0, 2), recording_array(b"", numpy.dtype("u1"), (2, )).shape)
+
+    def test_packed(self) -> None:
+        first = [i % 3 == 0 for i in range(40)]
+        second = [i % 2 == 0 for i in range(5)]
+        data = _pack([first, [], second])
+        self.assertEqual(len(_pack([first])), packed_recording_size(40))
+        self.assertEqual(first + second,
+                         packed_recording_array(data).tolist())
+
+        vertex = _PackedVertex(data)
+        array, _ = vertex.get_recording_channel_array(1)
+        self.assertEqual(numpy.dtype(numpy.bool_), array.dtype)
+        self.assertEqual((15, 3), array.shape)
+        self.assertEqual(first + second, array.ravel().tolist())
+
+    def test_packed_sizes(self) -> None:
+        for n_steps in range(70):
+            for bits in (1, 3, 32):
+                self.assertLessEqual(
+                    packed_recording_size(n_steps, bits),
+                    packed_recording_sdram(bits).get_total_sdram(n_steps))
+
+    def test_packed_sizes_decimated(self) -> None:
+        # A run of n_steps from any first step records on each step that
+        # ends an interval, as the binary does when windowed
+        for interval in (2, 3, 5, 32):
+            for first in range(interval):
+                for n_steps in range(70):
+                    n_records = sum(
+                        1 for step in range(first, first + n_steps)
+                        if step % interval == interval - 1)
+                    for bits in (1, 3, 32, 100):
+                        self.assertLessEqual(
+                            packed_recording_size(n_records, bits),
+                            packed_recording_sdram(
+                                bits, interval).get_total_sdram(n_steps))
+
+    def test_packed_bad(self) -> None:
+        with self.assertRaises(ValueError):
+            packed_recording_array(numpy.uint32(33).tobytes())
+
+    def test_decimated(self) -> None:
+        vertex = _DecimatedVertex(b"")
+        self.assertEqual(12, vertex.get_recording_channel_n_records(0, 12))
+        self.assertEqual(3, vertex.get_recording_channel_n_records(1, 12))
+        self.assertEqual([0, 5, 10], vertex.get_recording_channel_timesteps(
+            1, 3).tolist())
+        sdram = vertex.get_recording_channel_sdram(1, 8)
+        # A run of 12 steps starting at step 4 ends windows at 4, 9 and 14
+        self.assertLessEqual(3 * 8, sdram.get_total_sdram(12))
+        self.assertLessEqual(
+            packed_recording_size(vertex.get_recording_channel_n_records(
+                1, 12), 3),
+            packed_recording_sdram(3, 5).get_total_sdram(12))
+
+    def test_recording_region_rates(self) -> None:
+        set_config("Machine", "version", "5")
+        set_config("Reports", "write_text_specs", "False")
+        FecDataWriter.mock()
+        vertex = _DecimatedVertex(b"")
+        with DsSqlliteDatabase() as ds_db:
+            vertex.generate_data_specification(
+                DataSpecificationGenerator(0, 0, 1, vertex, ds_db),
+                Placement(vertex, 0, 0, 1))
+            [(region, _, content)] = ds_db.get_regions_content(0, 0, 1)
+        self.assertEqual(2, region)
+        self.assertEqual(recording_region_size(2, True), len(content))
+        self.assertEqual((2, 40, 0, 0, 8, 0, 0, 1, 0, 5, 1), struct.unpack(
+            "<11I", content))
@@ -0,0 +1,171 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+from spinn_utilities.config_holder import set_config
+
+from spinn_front_end_common.data.fec_data_writer import FecDataWriter
+from spinn_front_end_common.interface.buffer_management.storage_objects \
+    import BufferDatabase
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+
+from spinnaker_graph_front_end.config_setup import unittest_setup
+from spinnaker_graph_front_end.recording_reader import (
+    RunRecordings, open_recordings)
+from spinnaker_graph_front_end.recording_store import (
+    RecordingStore, recordings_directory)
+from spinnaker_graph_front_end.utilities import pack_recording_bits
+
+_POINT = numpy.dtype([("x", "<i2"), ("y", "<i2")])
+
+
+class TestRecordingReader(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        set_config("Machine", "version", "5")
+        self.writer = FecDataWriter.mock()
+        self.writer.set_up_timings(1000, 1)
+        self.temp = tempfile.TemporaryDirectory()
+        self.run_dir = os.path.join(self.temp.name, "run")
+        self.buffer_database = os.path.join(self.run_dir, "data.sqlite3")
+        os.makedirs(self.run_dir)
+
+    def tearDown(self) -> None:
+        self.temp.cleanup()
+
+    def _run(self, reset_number: int = 0) -> RecordingStore:
+        """
+        Record as a run would, without spilling the recordings.
+        """
+        store = RecordingStore(
+            recordings_directory(self.run_dir, reset_number), 1024,
+            self.buffer_database)
+        store.describe([
+            (0, 0, 1, 0, "points", _POINT, (2, ), False),
+            (0, 0, 1, 1, "points", numpy.dtype("<u4"), (), False),
+            (0, 0, 2, 0, "spikes", numpy.dtype(numpy.bool_), (3, ), True),
+            (1, 0, 1, 0, "twin", numpy.dtype("<u4"), (), False),
+            (1, 0, 2, 0, "twin", numpy.dtype("<u4"), (), False)])
+        points = numpy.arange(16, dtype="<i2").view(_POINT)
+        with BufferDatabase(self.buffer_database) as db:
+            db.start_new_extraction()
+            db.store_recording(0, 0, 1, 0, False, points[:4].tobytes())
+            db.store_recording(0, 0, 2, 0, True, pack_recording_bits(
+                [True, False, True, False, False, True]))
+            db.start_new_extraction()
+            db.store_recording(0, 0, 1, 0, False, points[4:].tobytes())
+        return store
+
+    def test_read(self) -> None:
+        self._run()
+        recordings = open_recordings(self.run_dir)
+        self.assertEqual(["points", "spikes", "twin"], recordings.labels)
+        self.assertEqual([0, 1], recordings.get_channels(0, 0, 1))
+
+        data, missing = recordings.get("points", 0)
+        self.assertFalse(missing)
+        self.assertEqual((4, 2), data.shape)
+        self.assertEqual(_POINT, data.dtype)
+        self.assertEqual([0, 4, 8, 12], data["x"][:, 0].tolist())
+
+        data, missing = recordings.get("spikes", 0)
+        self.assertTrue(missing)
+        self.assertEqual([[True, False, True], [False, False, True]],
+                         data.tolist())
+
+        # Described but nothing extracted
+        data, _ = recordings.get("points", 1)
+        self.assertEqual((0, ), data.shape)
+
+        with self.assertRaises(ConfigurationException):
+            recordings.get("twin", 0)
+        self.assertEqual([(1, 0, 1), (1, 0, 2)], recordings.get_cores("twin"))
+        with self.assertRaises(KeyError):
+            recordings.get("nothing", 0)
+        with self.assertRaises(KeyError):
+            recordings.get_on_core(0, 0, 3, 0)
+
+    def _files(self) -> dict[str, tuple[int, int]]:
+        """
+        :return: The size and time of change of each file of the run
+        """
+        files = {}
+        for directory, _, names in os.walk(self.run_dir):
+            for name in names:
+                stat = os.stat(os.path.join(directory, name))
+                files[os.path.join(directory, name)] = (
+                    stat.st_size, stat.st_mtime_ns)
+        return files
+
+    def test_not_spilled(self) -> None:
+        store = self._run()
+        files = self._files()
+        recordings = RunRecordings(store.directory)
+        data, _ = recordings.get_on_core(0, 0, 1, 0)
+        self.assertEqual(4, len(data))
+        # Read from the buffer database, without changing the run
+        self.assertEqual(0, store.last_extraction_id)
+        self.assertEqual(files, self._files())
+
+    def test_buffer_database_gone(self) -> None:
+        self._run()
+        os.remove(self.buffer_database)
+        data, missing = open_recordings(self.run_dir).get_on_core(0, 0, 1, 0)
+        # Neither spilled nor kept, so lost rather than empty
+        self.assertTrue(missing)
+        self.assertEqual(0, len(data))
+
+    def test_spilled(self) -> None:
+        store = self._run()
+        store.spill()
+        points = numpy.arange(16, 20, dtype="<i2").view(_POINT)
+        with BufferDatabase(self.buffer_database) as db:
+            db.start_new_extraction()
+            db.store_recording(0, 0, 1, 0, True, points.tobytes())
+        # Spilled, and then what was extracted after
+        data, missing = open_recordings(self.run_dir).get_on_core(0, 0, 1, 0)
+        self.assertTrue(missing)
+        self.assertEqual([0, 4, 8, 12, 16], data["x"][:, 0].tolist())
+
+        # Readable without the buffer database, from wherever it is moved
+        os.remove(self.buffer_database)
+        moved = os.path.join(self.temp.name, "moved")
+        shutil.move(self.run_dir, moved)
+        data, missing = open_recordings(moved).get_on_core(0, 0, 1, 0)
+        self.assertFalse(missing)
+        self.assertEqual(4, len(data))
+        self.assertFalse(data.flags.writeable)
+
+    def test_resets(self) -> None:
+        self._run()
+        self._run(reset_number=2)
+        self.assertEqual(
+            recordings_directory(self.run_dir, 2),
+            open_recordings(self.run_dir).directory)
+        self.assertEqual(
+            recordings_directory(self.run_dir),
+            open_recordings(self.run_dir, reset_number=0).directory)
+
+    def test_no_recordings(self) -> None:
+        with self.assertRaises(ConfigurationException):
+            open_recordings(self.run_dir)
+        with self.assertRaises(ConfigurationException):
+            open_recordings(self.run_dir, reset_number=1)
@@ -0,0 +1,212 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import numpy
+
+from spinn_utilities.config_holder import set_config
+from spinn_utilities.overrides import overrides
+
+from pacman.model.placements import Placement, Placements
+from pacman.model.resources import AbstractSDRAM, ConstantSDRAM
+
+from spinn_front_end_common.data.fec_data_writer import FecDataWriter
+from spinn_front_end_common.interface.buffer_management.storage_objects \
+    import BufferDatabase
+
+from spinnaker_graph_front_end.config_setup import unittest_setup
+from spinnaker_graph_front_end.recording_store import (
+    RecordingStore, set_recording_store)
+from spinnaker_graph_front_end.utilities import (
+    SimulatorVertex, get_recordings, iter_recordings)
+
+CORES = [(0, 0, 1), (0, 0, 2), (1, 0, 1)]
+
+
+class _Vertex(SimulatorVertex):
+
+    def __init__(self) -> None:
+        super().__init__(None, "test.aplx")
+
+    @property
+    @overrides(SimulatorVertex.sdram_required)
+    def sdram_required(self) -> AbstractSDRAM:
+        return ConstantSDRAM(0)
+
+    @overrides(SimulatorVertex.get_recording_channel_dtype)
+    def get_recording_channel_dtype(self, recording_id: int) -> numpy.dtype:
+        return numpy.dtype("<u4")
+
+
+class TestRecordingStore(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        set_config("Machine", "version", "5")
+        self.writer = FecDataWriter.mock()
+        self.writer.set_up_timings(1000, 1)
+        self.temp = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.temp.name, "recordings")
+
+    def tearDown(self) -> None:
+        set_recording_store(None)
+        self.temp.cleanup()
+
+    def _extract(self, n_steps: int, value: int) -> None:
+        self.writer.increment_current_run_timesteps(n_steps)
+        with BufferDatabase() as db:
+            db.start_new_extraction()
+            for i, (x, y, p) in enumerate(CORES):
+                db.store_recording(
+                    x, y, p, 0, i == 2,
+                    numpy.full(n_steps, value + i, dtype="<u4").tobytes())
+
+    def test_spill_and_read(self) -> None:
+        store = RecordingStore(self.directory, 1024 * 1024)
+        self._extract(3, 10)
+        self.assertEqual(3 * 3 * 4, store.spill())
+        # Nothing new to spill
+        self.assertEqual(0, store.spill())
+        self._extract(2, 20)
+        self.assertEqual(3 * 2 * 4, store.spill())
+        self.assertEqual(2, store.last_extraction_id)
+
+        data, missing = store.get_recording(0, 0, 2, 0)
+        self.assertFalse(missing)
+        self.assertTrue(data.readonly)
+        self.assertEqual([11] * 3 + [21] * 2,
+                         numpy.frombuffer(data, dtype="<u4").tolist())
+        _, missing = store.get_recording(1, 0, 1, 0)
+        self.assertTrue(missing)
+        with self.assertRaises(LookupError):
+            store.get_recording(0, 0, 1, 1)
+
+        # Readable by a store of its own, as another process would have
+        other = RecordingStore(self.directory, 1024 * 1024)
+        data, _ = other.get_recording(0, 0, 1, 0)
+        self.assertEqual(5 * 4, len(data))
+
+    def test_pruned(self) -> None:
+        store = RecordingStore(self.directory, 1024)
+        self._extract(3, 10)
+        store.spill()
+        # Left alone unless asked
+        with BufferDatabase() as db:
+            data, _ = db.get_recording(0, 0, 2, 0)
+        self.assertEqual(3 * 4, len(data))
+
+        self._extract(2, 20)
+        store.spill(prune=True)
+        self._extract(1, 30)
+        with BufferDatabase() as db:
+            # Only what is in the store is emptied out
+            self.assertEqual(0, len(db.get_recording_by_extraction_id(
+                0, 0, 2, 0, 2)[0]))
+            self.assertEqual(4, len(db.get_recording_by_extraction_id(
+                0, 0, 2, 0, 3)[0]))
+        data, _ = store.get_recording(0, 0, 2, 0)
+        self.assertEqual([11] * 3 + [21] * 2,
+                         numpy.frombuffer(data, dtype="<u4").tolist())
+        data, missing = store.get_extraction(0, 0, 2, 0, 2)
+        self.assertFalse(missing)
+        self.assertEqual([21] * 2,
+                         numpy.frombuffer(data, dtype="<u4").tolist())
+        with self.assertRaises(LookupError):
+            store.get_extraction(0, 0, 2, 0, 3)
+
+    def test_pruned_read_through_store(self) -> None:
+        vertex = _Vertex()
+        self.writer.set_placements(Placements([Placement(vertex, 0, 0, 2)]))
+        store = RecordingStore(
+            self.directory, 1024, BufferDatabase.default_database_file())
+        self._extract(2, 10)
+        self._extract(1, 20)
+        store.spill(prune=True)
+        set_recording_store(store)
+        recordings, _ = get_recordings([vertex], 0)
+        self.assertEqual([11, 11, 21], recordings[vertex].tolist())
+        self.assertEqual(
+            [[11, 11], [21]],
+            [chunks[vertex].data.tolist()
+             for chunks in iter_recordings([vertex], 0)])
+
+    def test_read_in_subprocess(self) -> None:
+        store = RecordingStore(self.directory, 1024)
+        self._extract(3, 10)
+        store.spill()
+        result = subprocess.run(
+            [sys.executable, "-c",
+             "import sys\n"
+             "from spinnaker_graph_front_end.recording_store import "
+             "RecordingStore\n"
+             "data, missing = RecordingStore(sys.argv[1], 1024)"
+             ".get_recording(0, 0, 2, 0)\n"
+             "print(bytes(data).hex(), missing)",
+             self.directory],
+            capture_output=True, text=True, check=True, timeout=60)
+        self.assertEqual(
+            f"{numpy.full(3, 11, dtype='<u4').tobytes().hex()} False",
+            result.stdout.strip())
+
+    def test_grown_and_evicted(self) -> None:
+        store = RecordingStore(self.directory, 30)
+        self._extract(3, 10)
+        store.spill()
+        first, _ = store.get_recording(0, 0, 1, 0)
+        self.assertEqual(12, store.n_mapped)
+        store.get_recording(0, 0, 2, 0)
+        self.assertEqual(24, store.n_mapped)
+
+        self._extract(3, 20)
+        store.spill()
+        # Grown, so mapped again; the least recently read is unmapped to
+        # stay within the budget
+        data, _ = store.get_recording(0, 0, 2, 0)
+        self.assertEqual(24, len(data))
+        self.assertEqual(24, store.n_mapped)
+        # A view handed out before stays usable
+        self.assertEqual([10] * 3,
+                         numpy.frombuffer(first, dtype="<u4").tolist())
+
+    def test_unfinished_append(self) -> None:
+        store = RecordingStore(self.directory, 1024)
+        self._extract(1, 10)
+        store.spill()
+        # As if a spill stopped after writing but before indexing
+        with open(os.path.join(self.directory, "0_0_1_0.dat"), "ab") as f:
+            f.write(b"junk")
+        self._extract(1, 20)
+        store.spill()
+        data, _ = store.get_recording(0, 0, 1, 0)
+        self.assertEqual([10, 20],
+                         numpy.frombuffer(data, dtype="<u4").tolist())
+
+    def test_vertex_reads_store(self) -> None:
+        vertex = _Vertex()
+        self.writer.set_placements(Placements([Placement(vertex, 0, 0, 2)]))
+        store = RecordingStore(self.directory, 1024)
+        self._extract(2, 10)
+        store.spill()
+        set_recording_store(store)
+        data, missing = vertex.get_recording_channel_array(0)
+        self.assertFalse(missing)
+        self.assertEqual([11, 11], data.tolist())
+        # A view of the file, not a copy
+        self.assertFalse(data.flags.writeable)
+        self.assertFalse(data.flags.owndata)
@@ -0,0 +1,161 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import unittest
+from concurrent.futures import Future
+from unittest.mock import patch
+
+import numpy
+
+from spinn_utilities.config_holder import set_config
+from spinn_utilities.overrides import overrides
+
+from pacman.model.graphs.machine import SimpleMachineVertex
+from pacman.model.placements import Placement, Placements
+from pacman.model.resources import AbstractSDRAM, ConstantSDRAM
+
+from spinn_front_end_common.data.fec_data_writer import FecDataWriter
+from spinn_front_end_common.interface.buffer_management.storage_objects \
+    import BufferDatabase
+
+from spinnaker_graph_front_end.config_setup import unittest_setup
+from spinnaker_graph_front_end.utilities import (
+    SimulatorVertex, get_recordings, iter_recordings, stack_recordings)
+from spinnaker_graph_front_end.utilities.recordings import (
+    extraction_finished)
+
+
+class _Vertex(SimulatorVertex):
+
+    def __init__(self) -> None:
+        super().__init__(None, "test.aplx")
+
+    @property
+    @overrides(SimulatorVertex.sdram_required)
+    def sdram_required(self) -> AbstractSDRAM:
+        return ConstantSDRAM(0)
+
+    @overrides(SimulatorVertex.get_recording_channel_dtype)
+    def get_recording_channel_dtype(self, recording_id: int) -> numpy.dtype:
+        return numpy.dtype("<u4")
+
+
+class TestRecordings(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        set_config("Machine", "version", "5")
+        self.writer = writer = FecDataWriter.mock()
+        writer.set_up_timings(1000, 1)
+        self.vertices = [_Vertex() for _ in range(4)]
+        self.other = SimpleMachineVertex(ConstantSDRAM(0))
+        cores = [(4, 4, 1), (0, 0, 2), (0, 0, 1), (1, 0, 3), (4, 4, 2)]
+        writer.set_placements(Placements(
+            Placement(vertex, x, y, p) for vertex, (x, y, p) in zip(
+                [*self.vertices, self.other], cores)))
+        # The first extraction is of a run of 3 timesteps
+        writer.increment_current_run_timesteps(3)
+        with BufferDatabase() as db:
+            db.start_new_extraction()
+            for i, (x, y, p) in enumerate(cores):
+                db.store_recording(
+                    x, y, p, 0, i == 1,
+                    numpy.arange(3, dtype="<u4").tobytes() * (i + 1)
+                    if i < 4 else b"abc")
+
+    def test_get_recordings(self) -> None:
+        recordings, missing = get_recordings(
+            [*self.vertices, self.other], 0)
+        self.assertEqual([self.vertices[1]], missing)
+        self.assertEqual([*self.vertices, self.other], list(recordings))
+        self.assertEqual([0, 1, 2, 0, 1, 2],
+                         recordings[self.vertices[1]].tolist())
+        self.assertEqual(b"abc", recordings[self.other].tobytes())
+
+    def test_stack(self) -> None:
+        vertices = [self.vertices[0], self.vertices[0]]
+        recordings, _ = get_recordings(vertices, 0)
+        self.assertEqual((2, 3), stack_recordings(
+            vertices, recordings).shape)
+        recordings, _ = get_recordings(self.vertices, 0)
+        with self.assertRaises(ValueError):
+            stack_recordings(self.vertices, recordings)
+        with self.assertRaisesRegex(ValueError, "No vertices"):
+            stack_recordings([], recordings)
+
+    def _extract(self, n_steps: int, value: int) -> None:
+        """
+        Store what a run of some more timesteps recorded, as the buffer
+        manager would.
+        """
+        self.writer.increment_current_run_timesteps(n_steps)
+        with BufferDatabase() as db:
+            db.start_new_extraction()
+            for vertex in self.vertices:
+                placement = self.writer.get_placement_of_vertex(vertex)
+                db.store_recording(
+                    placement.x, placement.y, placement.p, 0, False,
+                    numpy.full(n_steps, value, dtype="<u4").tobytes())
+        extraction_finished()
+
+    def test_iter_recordings(self) -> None:
+        self._extract(4, 7)
+        chunks = list(iter_recordings(self.vertices, 0))
+        self.assertEqual(2, len(chunks))
+        self.assertEqual([self.vertices[1]], [
+            vertex for vertex, chunk in chunks[0].items() if chunk.missing])
+        chunk = chunks[1][self.vertices[2]]
+        self.assertEqual((3, 7), (chunk.start_step, chunk.end_step))
+        self.assertEqual([7] * 4, chunk.data.tolist())
+
+        vertex = self.vertices[0]
+        self.assertEqual(
+            [[0, 1, 2], [7] * 4],
+            [chunk.data.tolist()
+             for chunk in vertex.iter_recording_channel_chunks(0)])
+
+    def test_follow_run(self) -> None:
+        run: Future[None] = Future()
+        run.set_running_or_notify_cancel()
+        extracted = threading.Event()
+        vertex = self.vertices[0]
+
+        def _run() -> None:
+            for value in range(1, 4):
+                self._extract(2, value)
+                # Each chunk is given before the run goes on
+                extracted.wait(10)
+                extracted.clear()
+            run.set_result(None)
+
+        thread = threading.Thread(target=_run)
+        thread.start()
+        ranges = []
+        for chunk in vertex.iter_recording_channel_chunks(0, run):
+            ranges.append((chunk.start_step, chunk.end_step))
+            extracted.set()
+        thread.join()
+        self.assertEqual([(0, 3), (3, 5), (5, 7), (7, 9)], ranges)
+
+    def test_follow_run_once(self) -> None:
+        run: Future[None] = Future()
+        run.set_result(None)
+        with patch.object(run, "add_done_callback",
+                          wraps=run.add_done_callback) as add:
+            for _ in range(3):
+                self.assertEqual(1, len(list(
+                    iter_recordings(self.vertices, 0, run))))
+        # Not one more callback on the run each time it is followed
+        add.assert_called_once()
@@ -0,0 +1,243 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+from contextlib import closing
+
+from spinn_utilities.config_holder import get_config_bool, set_config
+from spinn_utilities.overrides import overrides
+
+from spinn_machine import MulticastRoutingEntry, RoutingEntry
+from spinn_machine.tags import IPTag, ReverseIPTag
+from spinn_machine.virtual_machine import virtual_machine_by_boards
+
+from spinnman.model import ExecutableTargets
+from spinnman.model.enums import ExecutableType
+
+from pacman.model.graphs.machine import SimpleMachineVertex
+from pacman.model.resources import ConstantSDRAM
+from pacman.model.routing_tables import (
+    MulticastRoutingTables, UnCompressedMulticastRoutingTable)
+from pacman.model.tags import Tags
+
+from spinn_front_end_common.abstract_models import AbstractHasAssociatedBinary
+from spinn_front_end_common.data import FecDataView
+from spinn_front_end_common.data.fec_data_writer import FecDataWriter
+from spinn_front_end_common.interface.ds import DsSqlliteDatabase
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+
+from spinnaker_graph_front_end.config_setup import unittest_setup
+from spinnaker_graph_front_end.run_bundle import (
+    DS_DATABASE, MANIFEST, RunBundle, export_run_bundle, run_bundle_settings)
+
+
+class _Vertex(SimpleMachineVertex, AbstractHasAssociatedBinary):
+
+    def __init__(self, executable_type: ExecutableType) -> None:
+        super().__init__(ConstantSDRAM(0))
+        self._executable_type = executable_type
+
+    @overrides(AbstractHasAssociatedBinary.get_binary_file_name)
+    def get_binary_file_name(self) -> str:
+        return "test.aplx"
+
+    @overrides(AbstractHasAssociatedBinary.get_binary_start_type)
+    def get_binary_start_type(self) -> ExecutableType:
+        return self._executable_type
+
+
+class TestRunBundle(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        set_config("Machine", "version", "5")
+        self.temp = tempfile.TemporaryDirectory()
+        set_config("Reports", "default_report_file_path", self.temp.name)
+        self.bundle = os.path.join(self.temp.name, "bundle")
+
+    def tearDown(self) -> None:
+        # Stop the reports of the test being written to after it is gone
+        unittest_setup()
+        self.temp.cleanup()
+
+    def _run(self) -> None:
+        """
+        Set up the data as a run onto two boards would leave it.
+        """
+        writer = FecDataWriter.setup()
+        writer.set_machine(virtual_machine_by_boards(2))
+        writer.set_up_timings(500, 2)
+        writer.set_max_run_time_steps(1000)
+        binary = os.path.join(self.temp.name, "test.aplx")
+        system = os.path.join(self.temp.name, "system.aplx")
+        for path in (binary, system):
+            with open(path, "wb") as f:
+                f.write(b"binary")
+        targets = ExecutableTargets()
+        targets.add_processor(
+            binary, 0, 0, 2, ExecutableType.USES_SIMULATION_INTERFACE)
+        targets.add_processor(
+            binary, 1, 0, 3, ExecutableType.USES_SIMULATION_INTERFACE)
+        targets.add_processor(system, 0, 0, 1, ExecutableType.SYSTEM)
+        writer.set_executable_targets(targets)
+
+        table = UnCompressedMulticastRoutingTable(0, 0)
+        table.add_multicast_routing_entry(MulticastRoutingEntry(
+            0x10000, 0xFFFF0000, RoutingEntry(
+                processor_ids=[2], link_ids=[0])))
+        writer.set_uncompressed(MulticastRoutingTables([table]))
+
+        machine = writer.get_machine()
+        addresses = [
+            chip.ip_address for chip in sorted(
+                machine.ethernet_connected_chips, key=lambda c: (c.x, c.y))
+            if chip.ip_address is not None]
+        vertex = SimpleMachineVertex(ConstantSDRAM(0))
+        tags = Tags()
+        tags.add_ip_tag(IPTag(
+            addresses[-1], 0, 0, 1, "localhost", 17895, True, "DEFAULT"),
+            vertex)
+        tags.add_reverse_ip_tag(ReverseIPTag(
+            addresses[0], 2, 12345, 1, 0, 3, 1), vertex)
+        writer.set_tags(tags)
+
+        ds_path = os.path.join(self.temp.name, "ds.sqlite3")
+        with DsSqlliteDatabase(ds_path) as db:
+            db.set_info()
+            for (x, y, p), executable_type in [
+                    ((0, 0, 1), ExecutableType.SYSTEM),
+                    ((0, 0, 2), ExecutableType.USES_SIMULATION_INTERFACE),
+                    ((1, 0, 3), ExecutableType.USES_SIMULATION_INTERFACE)]:
+                db.set_core(x, y, p, _Vertex(executable_type))
+                db.set_memory_region(x, y, p, 0, 8, None, None)
+                db.set_region_content(x, y, p, 0, bytes(8), None)
+                db.set_start_address(x, y, p, 0x60000000)
+        writer.set_ds_database_path(ds_path)
+        writer.start_run()
+        writer.finish_run()
+
+    def test_round_trip(self) -> None:
+        self._run()
+        export_run_bundle(self.bundle)
+        with self.assertRaises(ConfigurationException):
+            export_run_bundle(self.bundle)
+        self.assertEqual(
+            ["test.aplx"], os.listdir(os.path.join(self.bundle, "binaries")))
+        with closing(sqlite3.connect(
+                os.path.join(self.bundle, DS_DATABASE))) as db:
+            self.assertEqual(
+                [(0, 0, 2, None), (1, 0, 3, None)], db.execute(
+                    "SELECT x, y, p, start_address FROM core "
+                    "ORDER BY x, y, p").fetchall())
+
+        bundle = RunBundle(self.bundle)
+        self.assertEqual(500, bundle.time_step_us)
+        self.assertEqual(2, bundle.time_scale_factor)
+        self.assertEqual(1000, bundle.max_run_time_steps)
+        self.assertEqual(2, bundle.n_cores)
+        bundle.check_machine(FecDataView.get_machine())
+
+        targets = bundle.executable_targets()
+        [binary] = targets.binaries
+        self.assertEqual(os.path.join(bundle.directory, "binaries",
+                                      "test.aplx"), binary)
+        self.assertEqual(2, targets.total_processors)
+        types = bundle.executable_types()
+        self.assertEqual([ExecutableType.USES_SIMULATION_INTERFACE],
+                         list(types))
+        [table] = bundle.routing_tables().routing_tables
+        self.assertEqual((0, 0, 1), (
+            table.x, table.y, table.number_of_entries))
+
+        tags = bundle.tags()
+        [ip_tag] = tags.ip_tags
+        [reverse_ip_tag] = tags.reverse_ip_tags
+        [original] = FecDataView.get_tags().ip_tags
+        self.assertEqual(original.board_address, ip_tag.board_address)
+        self.assertEqual(17895, ip_tag.port)
+        self.assertEqual((12345, 1, 0, 3), (
+            reverse_ip_tag.port, reverse_ip_tag.destination_x,
+            reverse_ip_tag.destination_y, reverse_ip_tag.destination_p))
+
+    def test_copy_ds_database(self) -> None:
+        self._run()
+        export_run_bundle(self.bundle)
+        # As if made on boards with other addresses
+        with closing(sqlite3.connect(
+                os.path.join(self.bundle, DS_DATABASE))) as db:
+            db.execute("UPDATE ethernet SET ip_address = "
+                       "'10.0.' || ethernet_x || '.' || ethernet_y")
+            db.execute("UPDATE info SET app_id = 99")
+            db.commit()
+
+        path = os.path.join(self.temp.name, "copy.sqlite3")
+        self.assertEqual(16, RunBundle(self.bundle).copy_ds_database(path))
+        with closing(sqlite3.connect(path)) as db:
+            self.assertEqual(
+                {(chip.x, chip.y): chip.ip_address for chip in
+                 FecDataView.get_machine().ethernet_connected_chips},
+                {(x, y): ip for x, y, ip in db.execute(
+                    "SELECT ethernet_x, ethernet_y, ip_address "
+                    "FROM ethernet")})
+            [(app_id, )] = db.execute("SELECT app_id FROM info")
+            self.assertEqual(FecDataView.get_app_id(), app_id)
+
+    def test_wrong_machine(self) -> None:
+        self._run()
+        export_run_bundle(self.bundle)
+        with self.assertRaises(ConfigurationException):
+            RunBundle(self.bundle).check_machine(virtual_machine_by_boards(1))
+
+        # A core the machine cannot run an application on
+        manifest_path = os.path.join(self.bundle, MANIFEST)
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+        manifest["executables"][0]["cores"].append([0, 0, 0])
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        with self.assertRaises(ConfigurationException):
+            RunBundle(self.bundle).check_machine(FecDataView.get_machine())
+
+    def test_not_a_bundle(self) -> None:
+        os.makedirs(self.bundle)
+        with self.assertRaises(ConfigurationException):
+            RunBundle(self.bundle)
+        with open(os.path.join(self.bundle, MANIFEST), "w",
+                  encoding="utf-8") as f:
+            json.dump({"version": 0}, f)
+        with self.assertRaises(ConfigurationException):
+            RunBundle(self.bundle)
+        FecDataWriter.setup()
+        with self.assertRaises(ConfigurationException):
+            export_run_bundle(os.path.join(self.temp.name, "other"))
+
+    def test_run_bundle_settings(self) -> None:
+        set_config("Machine", "enable_advanced_monitor_support", "True")
+        set_config("Buffers", "use_auto_pause_and_resume", "True")
+        with self.assertRaises(ValueError):
+            with run_bundle_settings():
+                self.assertFalse(get_config_bool(
+                    "Machine", "enable_advanced_monitor_support"))
+                self.assertFalse(get_config_bool(
+                    "Buffers", "use_auto_pause_and_resume"))
+                raise ValueError("The run failed")
+        # Put back, even though the run failed
+        self.assertTrue(get_config_bool(
+            "Machine", "enable_advanced_monitor_support"))
+        self.assertTrue(get_config_bool(
+            "Buffers", "use_auto_pause_and_resume"))
@@ -0,0 +1,86 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+import unittest
+from concurrent.futures import CancelledError, TimeoutError
+
+from spinnaker_graph_front_end.run_future import RunFuture, start_run
+
+
+class _Run(object):
+    """
+    A stand-in run for ever, which goes on until it is stopped.
+    """
+
+    def __init__(self) -> None:
+        self.started = threading.Event()
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        self.started.set()
+        if not self.stopped.wait(10):
+            raise RuntimeError("Not stopped")
+
+    def stop(self) -> None:
+        self.stopped.set()
+
+
+class TestRunFuture(unittest.TestCase):
+
+    def test_result(self) -> None:
+        ran = []
+        future = start_run(lambda: ran.append(True))
+        self.assertIsNone(future.result(10))
+        self.assertEqual([True], ran)
+
+    def test_exception(self) -> None:
+        def fail() -> None:
+            raise ValueError("core in RTE")
+
+        future = start_run(fail)
+        with self.assertRaises(ValueError):
+            future.result(10)
+
+    def test_timeout_and_stop(self) -> None:
+        run = _Run()
+        future = start_run(run.run, run.stop)
+        with self.assertRaises(TimeoutError):
+            future.result(0.01)
+        self.assertTrue(run.started.wait(10))
+        # A started run is stopped, and then finishes as usual
+        self.assertFalse(future.cancel())
+        self.assertIsNone(future.result(10))
+        self.assertFalse(future.cancelled())
+
+    def test_cancel_before_start(self) -> None:
+        future = RunFuture()
+        self.assertTrue(future.cancel())
+        self.assertFalse(future.set_running_or_notify_cancel())
+        with self.assertRaises(CancelledError):
+            future.result()
+
+    def test_await(self) -> None:
+        async def main() -> None:
+            await start_run(lambda: None)
+            run = _Run()
+            future = start_run(run.run, run.stop)
+            self.assertTrue(run.started.wait(10))
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(future, 0.05)
+            # The timeout stopped the run
+            self.assertTrue(run.stopped.wait(10))
+
+        asyncio.run(main())
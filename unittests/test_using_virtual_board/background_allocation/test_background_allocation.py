@@ -0,0 +1,133 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from unittest.mock import patch
+
+from spinn_utilities.overrides import overrides
+
+from spinn_machine import Machine
+from spinn_machine.virtual_machine import virtual_machine_by_boards
+
+from spinnman.transceiver import MockableTransceiver
+
+from spinnaker_testbase import BaseTestCase
+
+from spinn_front_end_common.data import FecDataView
+
+import spinnaker_graph_front_end as front_end
+from spinnaker_graph_front_end.machine_allocation import AllocatedMachine
+from spinnaker_graph_front_end.spinnaker import SpiNNaker
+
+
+class _Transceiver(MockableTransceiver):
+    """
+    Records the applications it was told to stop.
+    """
+
+    __slots__ = ("stopped", )
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.stopped: list[int] = []
+
+    @overrides(MockableTransceiver.stop_application)
+    def stop_application(self, app_id: int) -> None:
+        self.stopped.append(app_id)
+
+
+class _Allocation(object):
+    """
+    Stands in for getting a real machine; it gets a virtual one, but only
+    once told to.
+    """
+
+    def __init__(self, fail: bool = False) -> None:
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.fail = fail
+        self.thread: threading.Thread | None = None
+        self.transceiver = _Transceiver()
+        self.machine: Machine | None = None
+
+    def __call__(self) -> AllocatedMachine:
+        self.thread = threading.current_thread()
+        self.started.set()
+        self.release.wait(10)
+        if self.fail:
+            raise ValueError("No boards free")
+        self.machine = virtual_machine_by_boards(1)
+        return AllocatedMachine("stand-in", self.transceiver, self.machine)
+
+    def setup(self) -> None:
+        """
+        Set up the simulation, getting the machine with this.
+        """
+        with patch.object(SpiNNaker, "_allocate_machine", self):
+            front_end.setup(allocate_in_background=True)
+        assert self.started.wait(10)
+
+    def finish(self) -> None:
+        """
+        Let the machine be got, and wait until it has been.
+        """
+        self.release.set()
+        assert self.thread is not None
+        self.thread.join(10)
+
+
+class TestBackgroundAllocation(BaseTestCase):
+
+    # NO unittest_setup() as sim.setup is called
+
+    def test_taken_on_when_needed(self) -> None:
+        allocation = _Allocation()
+        allocation.setup()
+        self.assertIsNot(threading.main_thread(), allocation.thread)
+        allocation.finish()
+        # Got, but the simulation is only told once it needs the machine
+        self.assertFalse(front_end.is_allocated_machine())
+        self.assertFalse(FecDataView.has_transceiver())
+
+        machine = front_end.machine()
+        self.assertIs(allocation.machine, machine)
+        self.assertIs(allocation.transceiver, FecDataView.get_transceiver())
+        self.assertEqual("stand-in", FecDataView.get_ipaddress())
+        front_end.stop()
+        self.assertEqual(1, len(allocation.transceiver.stopped))
+
+    def test_stop_waits(self) -> None:
+        allocation = _Allocation()
+        allocation.setup()
+        allocation.release.set()
+        front_end.stop()
+        # Stopping took the machine on, so that it could let it go
+        self.assertEqual(1, len(allocation.transceiver.stopped))
+
+    def test_failure(self) -> None:
+        allocation = _Allocation(fail=True)
+        allocation.setup()
+        allocation.finish()
+        with self.assertRaises(ValueError):
+            front_end.machine()
+        self.assertFalse(front_end.is_allocated_machine())
+        front_end.stop()
+
+    def test_failure_at_stop(self) -> None:
+        allocation = _Allocation(fail=True)
+        allocation.setup()
+        allocation.release.set()
+        # Only logged, as the machine was never needed
+        front_end.stop()
+        self.assertEqual([], allocation.transceiver.stopped)
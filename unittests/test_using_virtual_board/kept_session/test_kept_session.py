@@ -0,0 +1,135 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import threading
+import time
+from unittest.mock import patch
+
+from spinn_utilities.config_holder import set_config
+from spinn_utilities.overrides import overrides
+
+from spinn_machine import Machine
+from spinn_machine.virtual_machine import virtual_machine_by_boards
+
+from spinnman.spalloc import MachineAllocationController
+from spinnman.spalloc.spalloc_allocator import SpallocJobController
+from spinnman.transceiver import MockableTransceiver, Transceiver
+
+from spinnaker_testbase import BaseTestCase
+
+from spinn_front_end_common.data import FecDataView
+
+import spinnaker_graph_front_end as front_end
+from spinnaker_graph_front_end.board_session import (
+    BoardSession, read_session, save_session)
+from spinnaker_graph_front_end.spinnaker import _session_request
+from unittests.test_board_session import SpallocServer
+
+
+class _Transceiver(MockableTransceiver):
+    """
+    Talks to the boards of the stand-in spalloc server, which are virtual.
+    """
+
+    @overrides(MockableTransceiver.get_machine_details)
+    def get_machine_details(self) -> Machine:
+        return virtual_machine_by_boards(1)
+
+
+def _transceiver_generator(*_args: object, **_kwargs: object) -> Transceiver:
+    return _Transceiver()
+
+
+class TestKeptSession(BaseTestCase):
+
+    # NO unittest_setup() as sim.setup is called
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.server = SpallocServer()
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "session.json")
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        self.directory.cleanup()
+
+    def _set_up_simulation(self) -> None:
+        front_end.setup(n_boards_required=1)
+        set_config("Machine", "spalloc_server", self.server.service_url)
+        set_config("Machine", "session_file", self.path)
+
+    def _machine(self) -> MachineAllocationController:
+        with patch("spinnaker_graph_front_end.spinnaker.transceiver_generator",
+                   _transceiver_generator):
+            front_end.machine()
+        return FecDataView.get_allocation_controller()
+
+    def test_setup_stop_setup(self) -> None:
+        self._set_up_simulation()
+        # As if kept by an earlier process
+        save_session(self.path, BoardSession(
+            self.server.service_url, self.server.job_url,
+            {"JSESSIONID": "abc"}, {"X-CSRF-TOKEN": "def"},
+            _session_request(), time.time() + 60))
+        first = self._machine()
+        assert isinstance(first, SpallocJobController)
+        self.assertEqual(1, self.server.n_logins)
+        self.assertFalse(os.path.exists(self.path))
+
+        front_end.stop()
+        # Kept for the next setup rather than destroyed
+        self.assertIsNone(self.server.destroy_reason)
+        kept = read_session(self.path)
+        assert kept is not None
+        self.assertEqual(self.server.job_url, kept.job_url)
+
+        self._set_up_simulation()
+        second = self._machine()
+        # Not the controller that stopped watching the job when it was kept,
+        # but the job this process kept
+        assert isinstance(second, SpallocJobController)
+        self.assertIsNot(first, second)
+        self.assertIs(first.job, second.job)
+        self.assertFalse(os.path.exists(self.path))
+
+        set_config("Machine", "keep_session", "False")
+        front_end.stop()
+        self.assertEqual("finished", self.server.destroy_reason)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_not_reusable(self) -> None:
+        self._set_up_simulation()
+        request = _session_request()
+        request["n_boards"] = 2
+        save_session(self.path, BoardSession(
+            self.server.service_url, self.server.job_url,
+            {"JSESSIONID": "abc"}, {"X-CSRF-TOKEN": "def"},
+            request, time.time() + 60))
+        # Allocating a new job instead is as far as this goes
+        failed = RuntimeError("no new job here")
+        with patch("spinnaker_graph_front_end.spinnaker."
+                   "spalloc_allocate_job", side_effect=failed), \
+                patch("spinnman.spinnman_simulation.spalloc_allocate_job",
+                      side_effect=failed):
+            with self.assertRaises(RuntimeError):
+                self._machine()
+        self.assertEqual("not reusable", self.server.destroy_reason)
+        self.assertFalse(os.path.exists(self.path))
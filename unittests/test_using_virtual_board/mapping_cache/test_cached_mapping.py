@@ -0,0 +1,85 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+
+from spinnaker_testbase import BaseTestCase
+
+from spinn_front_end_common.data import FecDataView
+
+import spinnaker_graph_front_end as front_end
+from gfe_examples.hello_world.hello_world_vertex import HelloWorldVertex
+
+#: Where the configuration of this directory keeps the cache
+CACHE = "mapping_cache"
+
+RING = [(0, 1), (1, 2), (2, 3), (3, 0)]
+
+
+class TestCachedMapping(BaseTestCase):
+
+    # NO unittest_setup() as sim.setup is called
+
+    def setUp(self) -> None:
+        super().setUp()
+        shutil.rmtree(CACHE, ignore_errors=True)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(CACHE, ignore_errors=True)
+
+    def _run(self, edges: list[tuple[int, int]]) -> tuple[
+            list[tuple[int, int, int]], tuple[int, int], list[str]]:
+        """
+        Map and run a graph of four vertices.
+
+        :return: Where each vertex was placed, the cache hits and misses,
+            and the algorithms timed
+        """
+        front_end.setup(
+            n_chips_required=1,
+            model_binary_folder=os.path.dirname(__file__))
+        vertices = [HelloWorldVertex(n_hellos=1) for _ in range(4)]
+        front_end.add_machine_vertex_instances(vertices)
+        front_end.add_machine_edges(
+            vertices, [pre for pre, _ in edges], [post for _, post in edges],
+            "STATE")
+        front_end.run(1)
+        placements = []
+        for vertex in vertices:
+            placement = FecDataView.get_placement_of_vertex(vertex)
+            placements.append((placement.x, placement.y, placement.p))
+        cache = front_end.mapping_cache()
+        assert cache is not None
+        counts = (cache.hits, cache.misses)
+        algorithms = [timing.algorithm for timing in front_end.phase_timings()]
+        front_end.stop()
+        return placements, counts, algorithms
+
+    def test_hit_and_miss(self) -> None:
+        placements, counts, algorithms = self._run(RING)
+        self.assertEqual((0, 1), counts)
+        self.assertIn("Mapping cache store", algorithms)
+
+        cached, counts, algorithms = self._run(RING)
+        self.assertEqual((1, 0), counts)
+        self.assertIn("Application Placer (cached)", algorithms)
+        self.assertIn("Basic tag allocator (cached)", algorithms)
+        self.assertEqual(placements, cached)
+
+        # The same unlabelled vertices joined up differently
+        _, counts, algorithms = self._run([(post, pre) for pre, post in RING])
+        self.assertEqual((0, 1), counts)
+        self.assertNotIn("Application Placer (cached)", algorithms)
+        self.assertEqual(2, len(os.listdir(CACHE)))
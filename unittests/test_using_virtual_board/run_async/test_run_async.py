@@ -0,0 +1,119 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+import numpy
+from numpy.typing import NDArray
+
+from spinn_utilities.overrides import overrides
+
+from spinnaker_testbase import BaseTestCase
+
+from spinn_front_end_common.data import FecDataView
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+
+import spinnaker_graph_front_end as front_end
+from spinnaker_graph_front_end.utilities import EmulatedCore
+from gfe_examples.Conways.partitioned_example_b_no_vis_buffer \
+    .conways_basic_cell import ConwayBasicCell
+
+ACTIVE = [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)]
+
+
+class _Cell(ConwayBasicCell):
+    """
+    A cell that says when it has been stepped past the first timestep.
+    """
+
+    def __init__(self, label: str, state: bool,
+                 stepped: threading.Event) -> None:
+        super().__init__(label, state)
+        self.stepped = stepped
+
+    @overrides(ConwayBasicCell.emulation_step)
+    def emulation_step(
+            self, core: EmulatedCore, timestep: int,
+            keys: NDArray[numpy.uint32],
+            payloads: NDArray[numpy.uint32]) -> None:
+        super().emulation_step(core, timestep, keys, payloads)
+        if timestep > 0:
+            self.stepped.set()
+
+
+class TestRunAsync(BaseTestCase):
+
+    # NO unittest_setup() as sim.setup is called
+
+    def _set_up_simulation(self) -> threading.Event:
+        stepped = threading.Event()
+        front_end.setup()
+        front_end.add_lattice(
+            lambda x, y: _Cell(f"cell{x},{y}", (x, y) in ACTIVE, stepped),
+            (4, 4), ConwayBasicCell.PARTITION_ID)
+        return stepped
+
+    def test_result(self) -> None:
+        self._set_up_simulation()
+        future = front_end.run_async(5)
+        self.assertIsNone(future.result(60))
+        self.assertTrue(front_end.has_ran())
+        self.assertEqual(5, FecDataView.get_current_run_timesteps())
+        # Another can be started once it is over
+        self.assertIsNone(front_end.run_async(5).result(60))
+        self.assertEqual(10, FecDataView.get_current_run_timesteps())
+        front_end.stop()
+
+    def test_exception(self) -> None:
+        self._set_up_simulation()
+        future = front_end.run_until_complete_async()
+        # Raised in the thread of the run, and again when asked for
+        with self.assertRaises(ConfigurationException):
+            future.result(60)
+        self.assertIsInstance(future.exception(), ConfigurationException)
+
+    def test_cancel_run_forever(self) -> None:
+        stepped = self._set_up_simulation()
+        future = front_end.run_async()
+        self.assertTrue(stepped.wait(60))
+        self.assertTrue(future.running())
+
+        # Nothing that needs the simulation can be done while it runs
+        with self.assertRaises(ConfigurationException):
+            front_end.run(5)
+        with self.assertRaises(ConfigurationException):
+            front_end.run_until_complete(5)
+        with self.assertRaises(ConfigurationException):
+            front_end.run_async(5)
+        with self.assertRaises(ConfigurationException):
+            front_end.reset()
+        with self.assertRaises(ConfigurationException):
+            front_end.add_machine_vertex_instance(
+                ConwayBasicCell("extra", False))
+        with self.assertRaises(ConfigurationException):
+            front_end.stop()
+
+        # Running, so it is stopped rather than cancelled
+        self.assertFalse(future.cancel())
+        self.assertIsNone(future.result(60))
+        self.assertFalse(future.cancelled())
+        n_steps = FecDataView.get_current_run_timesteps()
+        assert n_steps is not None
+        self.assertGreater(n_steps, 1)
+
+        # The simulation can be used again once the run is over
+        front_end.reset()
+        front_end.run(5)
+        self.assertEqual(5, FecDataView.get_current_run_timesteps())
+        front_end.stop()
@@ -0,0 +1,78 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+
+from spinn_utilities.config_holder import get_config_bool
+
+from spinnaker_testbase import BaseTestCase
+
+from spinn_front_end_common.data import FecDataView
+
+import spinnaker_graph_front_end as front_end
+from gfe_examples.Conways.partitioned_example_b_no_vis_buffer \
+    .conways_basic_cell import ConwayBasicCell
+
+ACTIVE = [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)]
+
+#: The settings a bundle cannot run with
+SETTINGS = [("Machine", "enable_advanced_monitor_support"),
+            ("Machine", "enable_reinjection"),
+            ("Buffers", "use_auto_pause_and_resume")]
+
+
+class TestRunBundleRun(BaseTestCase):
+
+    # NO unittest_setup() as sim.setup is called
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp = tempfile.TemporaryDirectory()
+        # A virtual board has no binaries to run, but the bundle copies them
+        with open(os.path.join(self.temp.name, "conways_cell.aplx"), "wb"):
+            pass
+        self.bundle = os.path.join(self.temp.name, "bundle")
+
+    def tearDown(self) -> None:
+        self.temp.cleanup()
+
+    def test_export_load_and_run(self) -> None:
+        front_end.setup(model_binary_folder=self.temp.name)
+        front_end.add_lattice(
+            lambda x, y: ConwayBasicCell(f"cell{x},{y}", (x, y) in ACTIVE),
+            (4, 4), ConwayBasicCell.PARTITION_ID)
+        front_end.run(5)
+        n_placements = FecDataView.get_n_placements()
+        front_end.export_run_bundle(self.bundle)
+        front_end.stop()
+
+        front_end.setup(model_binary_folder=self.temp.name)
+        settings = [get_config_bool(section, option)
+                    for section, option in SETTINGS]
+        self.assertIn(True, settings)
+        front_end.load_run_bundle(self.bundle)
+        front_end.run(5)
+        # Nothing is placed, as the bundle has no vertices
+        self.assertGreater(n_placements, 0)
+        self.assertEqual(0, FecDataView.get_n_placements())
+        front_end.run(5)
+        algorithms = [timing.algorithm for timing in front_end.phase_timings()]
+        self.assertEqual(1, algorithms.count("Run bundle reader"))
+        self.assertEqual(2, algorithms.count("Host emulator"))
+        self.assertNotIn("Application Placer", algorithms)
+        front_end.stop()
+        # Only turned off while the bundle ran
+        self.assertEqual(settings, [get_config_bool(section, option)
+                                    for section, option in SETTINGS])
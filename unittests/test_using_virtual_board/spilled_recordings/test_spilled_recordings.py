@@ -0,0 +1,139 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from unittest.mock import patch
+
+from numpy.typing import NDArray
+
+from spinn_utilities.config_holder import set_config
+
+from spinnaker_testbase import BaseTestCase
+
+from spinn_front_end_common.data import FecDataView
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+
+import spinnaker_graph_front_end as front_end
+from spinnaker_graph_front_end.recording_store import (
+    RecordingStore, get_recording_store)
+from gfe_examples.Conways.partitioned_example_b_no_vis_buffer \
+    .conways_basic_cell import Channels, ConwayBasicCell
+
+ACTIVE = [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)]
+POSITIONS = [(x, y) for x in range(4) for y in range(4)]
+
+
+class TestSpilledRecordings(BaseTestCase):
+
+    # NO unittest_setup() as sim.setup is called
+
+    def _set_up_simulation(self) -> list[ConwayBasicCell]:
+        front_end.setup()
+        lattice = front_end.add_lattice(
+            lambda x, y: ConwayBasicCell(f"cell{x},{y}", (x, y) in ACTIVE),
+            (4, 4), ConwayBasicCell.PARTITION_ID)
+        return [lattice.vertex_at(x, y) for x, y in POSITIONS]
+
+    @staticmethod
+    def _states(cells: list[ConwayBasicCell]) -> list[NDArray]:
+        return [cell.get_recording_channel_array(Channels.STATE_LOG)[0]
+                for cell in cells]
+
+    def _store(self) -> RecordingStore:
+        store = get_recording_store()
+        assert store is not None
+        return store
+
+    def test_read_after_stop(self) -> None:
+        cells = self._set_up_simulation()
+        front_end.run(5)
+        states = self._states(cells)
+        self.assertEqual([5] * len(cells), [len(state) for state in states])
+        front_end.stop()
+
+        # Read from the store, which outlives the simulation
+        self.assertEqual([state.tolist() for state in states],
+                         [state.tolist() for state in self._states(cells)])
+
+    def test_reset(self) -> None:
+        cells = self._set_up_simulation()
+        front_end.run(3)
+        first_states = self._states(cells)
+        first = self._store().directory
+        self.assertEqual("recordings", os.path.basename(first))
+
+        front_end.reset()
+        front_end.run(4)
+        # Recorded again from the start, into a store of its own
+        second = self._store().directory
+        self.assertEqual("recordings1", os.path.basename(second))
+        states = self._states(cells)
+        self.assertEqual([4] * len(cells), [len(state) for state in states])
+        self.assertEqual([state.tolist() for state in first_states],
+                         [state[:3].tolist() for state in states])
+
+        # What was recorded before the reset is still in its store
+        before = RecordingStore(first, 1024 * 1024)
+        cell = cells[0]
+        data, _ = before.get_recording(
+            cell.placement.x, cell.placement.y, cell.placement.p,
+            Channels.STATE_LOG)
+        self.assertEqual(
+            first_states[0].tolist(), cell.convert_recording_channel_data(
+                Channels.STATE_LOG, data).tolist())
+        front_end.stop()
+
+    def test_described_once(self) -> None:
+        self._set_up_simulation()
+        with patch.object(RecordingStore, "describe", autospec=True,
+                          side_effect=RecordingStore.describe) as describe:
+            front_end.run(3)
+            front_end.run(2)
+        # Nothing was mapped again for the second run
+        describe.assert_called_once()
+        front_end.stop()
+
+    def test_not_spilled(self) -> None:
+        cells = self._set_up_simulation()
+        set_config("Buffers", "spill_recordings", "False")
+        set_config("Reports", "keep_data_database", "True")
+        front_end.run(3)
+        states = self._states(cells)
+        # Kept, but only described
+        self.assertEqual(0, self._store().last_extraction_id)
+        run_dir = FecDataView.get_run_dir_path()
+        front_end.stop()
+
+        recordings = front_end.open_recordings(run_dir)
+        self.assertEqual(
+            [state.tolist() for state in states],
+            [recordings.get(f"cell{x},{y}", Channels.STATE_LOG)[0].tolist()
+             for x, y in POSITIONS])
+
+    def test_not_kept(self) -> None:
+        cells = self._set_up_simulation()
+        set_config("Buffers", "spill_recordings", "False")
+        set_config("Reports", "keep_data_database", "False")
+        front_end.run(3)
+        # Read from the buffer database while the simulation is there
+        self.assertEqual([3] * len(cells),
+                         [len(state) for state in self._states(cells)])
+        self.assertIsNone(get_recording_store())
+        run_dir = FecDataView.get_run_dir_path()
+        front_end.stop()
+
+        # Nothing was written to read once it is over
+        self.assertFalse(os.path.exists(os.path.join(run_dir, "recordings")))
+        with self.assertRaises(ConfigurationException):
+            front_end.open_recordings(run_dir)